@@ -2,12 +2,15 @@ import random
 import time
 import requests
 import os
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 load_dotenv()
 
 BASE_URL = os.getenv("BASE_URL", "http://localhost:8000")
+# Seconds between two polls of the live room supervisor status
+STATUS_INTERVAL = 5
 
 
 class TikTokStream:
@@ -15,6 +18,10 @@ class TikTokStream:
         self.username = username
         self.user_id = user_id
         self.is_streaming = False
+        self.start_time = None
+        self.first_event_latency = None
+        self.events_received = 0
+        self.failed = False
 
     def start_streaming(self):
         """Start streaming and print received comments."""
@@ -23,6 +30,7 @@ class TikTokStream:
 
         try:
             print(f"Starting stream for {self.username} ({self.user_id})...")
+            self.start_time = time.time()
             response = requests.post(url, params=params, stream=True, verify=False)
 
             if response.status_code == 200:
@@ -34,21 +42,26 @@ class TikTokStream:
                 try:
                     for line in response.iter_lines():
                         if line:
+                            if self.first_event_latency is None:
+                                self.first_event_latency = time.time() - self.start_time
+                            self.events_received += 1
                             print(
                                 f"Comment retrieved for {self.username} ({self.user_id})"
                             )
                 except Exception:
                     print("\nStream interrupted and stopped.")
             else:
+                self.failed = True
                 print(
                     f"Failed to start stream for {self.username} ({self.user_id}). Status code: {response.status_code}"
                 )
                 print(response.text)
         except requests.exceptions.RequestException as e:
+            self.failed = True
             print(f"Error starting stream for {self.username} ({self.user_id}): {e}")
 
     def stop_streaming(self):
-        """Stop streaming after 20 seconds."""
+        """Stop streaming."""
         url = f"{BASE_URL}/tiktok/live/comments/stop-streaming"
         params = {"username": self.username, "user_id": self.user_id}
 
@@ -71,39 +84,106 @@ def start_stream_thread(streamer):
     streamer.start_streaming()
 
 
-def stop_stream_thread(streamer):
-    time.sleep(20)
+def stop_stream_thread(streamer, stream_duration):
+    time.sleep(stream_duration)
     streamer.stop_streaming()
 
 
-def run_load_test(username, num_users):
-    """Run load testing for multiple users, where each user has two threads (start and stop)."""
-    with ThreadPoolExecutor(max_workers=num_users * 2) as executor:
+def poll_supervisor_status(stop_event, samples):
+    """Poll the live room supervisor status until the load test ends."""
+    url = f"{BASE_URL}/tiktok/live/comments/supervisor-status"
+
+    while not stop_event.is_set():
+        try:
+            status = requests.get(url, verify=False).json()
+            samples.append(status)
+            print(
+                f"Supervisor: {status['rooms']}/{status['max_rooms']} rooms, "
+                f"states: {status['states']}, comments: {status['comments_received']}"
+            )
+        except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+            print(f"Error polling supervisor status: {e}")
+        stop_event.wait(STATUS_INTERVAL)
+
+
+def print_summary(streamers, samples):
+    started = [streamer for streamer in streamers if not streamer.failed]
+    latencies = sorted(
+        streamer.first_event_latency
+        for streamer in started
+        if streamer.first_event_latency is not None
+    )
+
+    print(f"Streams started: {len(started)}/{len(streamers)}")
+    print(f"Events received: {sum(streamer.events_received for streamer in started)}")
+    if latencies:
+        print(
+            f"First event latency: p50 {latencies[len(latencies) // 2]:.2f}s, "
+            f"max {latencies[-1]:.2f}s"
+        )
+    if samples:
+        print(f"Max supervised rooms: {max(sample['rooms'] for sample in samples)}")
+        print(
+            "Max reconnecting rooms: "
+            f"{max(sample['states'].get('reconnecting', 0) for sample in samples)}"
+        )
+
+
+def run_load_test(usernames, num_users, stream_duration=20):
+    """Run load testing for multiple users on each live room, where each user has two threads (start and stop)."""
+    streamers = []
+    samples = []
+    stop_event = threading.Event()
+    status_thread = threading.Thread(
+        target=poll_supervisor_status, args=(stop_event, samples), daemon=True
+    )
+    status_thread.start()
+
+    with ThreadPoolExecutor(max_workers=len(usernames) * num_users * 2) as executor:
         start_threads = []
         stop_threads = []
 
-        for _ in range(num_users):
-            streamer = TikTokStream(username, f"user_id_{random.randint(1000, 9999)}")
+        for username in usernames:
+            for _ in range(num_users):
+                streamer = TikTokStream(
+                    username, f"user_id_{random.randint(1000, 9999)}"
+                )
+                streamers.append(streamer)
 
-            start_thread = executor.submit(start_stream_thread, streamer)
-            start_threads.append(start_thread)
+                start_thread = executor.submit(start_stream_thread, streamer)
+                start_threads.append(start_thread)
 
-            stop_thread = executor.submit(stop_stream_thread, streamer)
-            stop_threads.append(stop_thread)
+                stop_thread = executor.submit(
+                    stop_stream_thread, streamer, stream_duration
+                )
+                stop_threads.append(stop_thread)
 
         for start_thread, stop_thread in zip(start_threads, stop_threads):
             start_thread.result()
             stop_thread.result()
 
+    stop_event.set()
+    status_thread.join()
+
     print("Load test complete.")
+    print_summary(streamers, samples)
 
 
 if __name__ == "__main__":
-    username = str(input("Enter the TikTok username: "))
-    num_users = int(input("Enter the number of users: "))
+    usernames = [
+        username.strip()
+        for username in input("Enter the TikTok usernames (comma separated): ").split(
+            ","
+        )
+        if username.strip()
+    ]
+    num_users = int(input("Enter the number of users per live room: "))
+    stream_duration = int(input("Enter the streaming duration in seconds: ") or 20)
 
     start_time = time.time()
-    run_load_test(username, num_users)
+    run_load_test(usernames, num_users, stream_duration)
     total_time = time.time() - start_time
 
-    print(f"Total inference time for {num_users} users: {total_time:.2f} seconds")
+    print(
+        f"Total inference time for {len(usernames) * num_users} users: {total_time:.2f} seconds"
+    )
@@ -21,6 +21,9 @@ from src.modules.instagram_content_crawler import (
 )
 from src.modules.facebook_crawler import router as facebook_crawler_router
 from contextlib import asynccontextmanager
+from src.database import close_mongo_client
+from src.utils import close_media_transfer_stage
+from src.tiktok_comment_recorder import close_live_room_supervisor
 from src.modules.tiktok_crawler import router as tiktok_router
 
 TAGS_METADATA: List[dict] = [
@@ -65,6 +68,9 @@ async def lifespan(app: FastAPI):
     yield
     close_video_channel()
     close_comment_channel()
+    close_live_room_supervisor()
+    close_media_transfer_stage()
+    close_mongo_client()
 
 
 app = FastAPI(
@@ -1,13 +1,19 @@
-import time
 import os
 
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Dict, List
 from dotenv import load_dotenv
+from pymongo import ASCENDING
+from pymongo.errors import BulkWriteError, PyMongoError
 from pytz import timezone
 from ..database.connection import MongoDBClient
-from ..utils import send_api_request, Logger, helpers, get_env_variable
+from ..utils import (
+    send_api_request,
+    Logger,
+    get_env_variable,
+    get_media_transfer_stage,
+)
 
 load_dotenv()
 
@@ -21,15 +27,78 @@ MYT = timezone(os.getenv("TIMEZONE"))
 
 log = Logger(name="BaseCrawlers")
 
-# Set how many times to fetch videos
-# if API hasMore flag is True
-FETCH_NUM = 1
+# Set the maximum number of times to fetch more videos
+# if API hasMore flag is True, the pagination stops earlier
+# once the requested count of videos is fetched
+FETCH_NUM = int(os.getenv("CRAWL_MAX_FETCH_NUM", "10"))
 
 bucket_name: str = get_env_variable(
     "AWS_BUCKET_NAME", "AWS_BUCKET_NAME is not provided!"
 )
 
 
+# Whether the unique index of the video collection was checked by this process
+_video_index_ready = False
+
+
+def ensure_video_index(db) -> None:
+    """Create the unique (video_id, request_id) index of the video collection once."""
+    global _video_index_ready
+
+    if _video_index_ready:
+        return
+
+    try:
+        db["video"].create_index(
+            [("video_id", ASCENDING), ("request_id", ASCENDING)],
+            unique=True,
+            name="video_id_request_id_unique",
+        )
+    except PyMongoError as e:
+        # e.g. duplicates stored before the index existed, inserts still work
+        log.error(f"Failed to create the video_id/request_id index: {e}")
+    _video_index_ready = True
+
+
+def insert_new_videos(db, videos: List[Dict]) -> int:
+    """
+    Insert videos with one unordered bulk insert, skipping duplicates.
+
+    Args:
+        db: MongoDB database.
+        videos (List[Dict]): Videos to insert.
+
+    Returns:
+        int: Number of videos inserted.
+    """
+    if not videos:
+        return 0
+
+    failed_indexes = set()
+    try:
+        db["video"].insert_many(videos, ordered=False)
+    except BulkWriteError as e:
+        for error in e.details["writeErrors"]:
+            failed_indexes.add(error["index"])
+            if error["code"] == 11000:
+                # Video stored meanwhile by another crawl of the same request
+                log.info(
+                    f"Video ID: {videos[error['index']]['video_id']} already exists. Skipping..."
+                )
+            else:
+                log.error(
+                    f"Video ID: {videos[error['index']]['video_id']} not stored: {error['errmsg']}"
+                )
+
+    for index, video in enumerate(videos):
+        if index not in failed_indexes:
+            log.info(
+                f"Video ID: {video['video_id']} stored as a new data in the database with location: {video['location']}"
+            )
+
+    return len(videos) - len(failed_indexes)
+
+
 class Crawler(ABC):
     def __init__(self) -> None:
         self.headers = {
@@ -54,7 +123,7 @@ class VideoCrawler(Crawler):
     def fetch_videos(self, url, **kwargs) -> List[Dict]:
         querystring = self._choose_querystring(**kwargs)
         tmp_video_list: list = []
-        time.sleep(3)  # Be respectful of API rate limits
+        # send_api_request is rate limited per API host
         response: dict = send_api_request(
             url=url, headers=self.headers, params=querystring
         )
@@ -115,7 +184,14 @@ class VideoCrawler(Crawler):
     def _fetch_more_videos(
         self, response: dict, url: str, querystring: dict, tmp_video_list: list
     ) -> List[Dict]:
+        """
+        Fetch the next pages while the API has more videos.
+
+        Stops when hasMore is False, when a page has no videos, once the
+        requested count of videos is fetched or after FETCH_NUM pages.
+        """
         fetch_count = 0
+        requested_count = int(querystring.get("count") or 0)
 
         if "data" not in response or not isinstance(response["data"], dict):
             return []
@@ -123,9 +199,11 @@ class VideoCrawler(Crawler):
         response_data: dict = response["data"]
 
         while response_data.get("hasMore", False) and fetch_count < self.FETCH_NUM:
+            if requested_count and len(tmp_video_list) >= requested_count:
+                break
+
             print("Fetching more videos...")
             log.info("Fetching more videos...")
-            time.sleep(3)  # Be respectful of API rate limits
 
             querystring["cursor"] = response_data.get("cursor", "")
             response = send_api_request(
@@ -161,6 +239,9 @@ class VideoCrawler(Crawler):
             tmp_video_list.extend(videos)
             fetch_count += 1
 
+            if not videos:
+                break
+
         return tmp_video_list
 
     def save_videos_to_db(
@@ -169,24 +250,54 @@ class VideoCrawler(Crawler):
         """
         Save videos to MongoDB and update timestamps, including location information.
 
+        The videos already stored for the request are found with one query, the
+        videos and covers of the new ones are streamed to S3 concurrently and the
+        uploaded videos are stored with one unordered bulk insert.
+
         Args:
             video_list (List[Dict]): List of video dictionaries to be saved.
             video_type (str): Type of the video source.
             request_id (int): ID associated with the request.
         """
-        video_count = 0
+        now = datetime.now(MYT).strftime("%Y-%m-%d %H:%M:%S")
+        # Split datetime into date, month, year
+        year, month, day = now.split(" ")[0].split("-")
+
+        # Keep the first video of each video_id from Malaysia
+        videos: Dict[str, Dict] = {}
+        for video in video_list:
+            if video["region"] != "MY":
+                continue
+
+            if "video_id" not in video:
+                video["video_id"] = video["id"]
+
+            videos.setdefault(video["video_id"], video)
+
+        new_videos: List[Dict] = []
         with MongoDBClient() as db:
-            for video in video_list:
-                if video["region"] != "MY":
-                    continue
+            ensure_video_index(db)
 
-                if "video_id" not in video:
-                    video["video_id"] = video["id"]
+            # Check for existing videos with the same video_id and request_id
+            existing_video_ids = set(
+                db["video"].distinct(
+                    "video_id",
+                    {"video_id": {"$in": list(videos)}, "request_id": request_id},
+                )
+            )
 
-                now = datetime.now(MYT).strftime("%Y-%m-%d %H:%M:%S")
-                video["updated_at"] = now
-                video["request_id"] = request_id  # Associate with request_id
+            # Stream the videos and covers to S3 concurrently
+            media_transfer = get_media_transfer_stage()
+            transfers = []
+            for video_id, video in videos.items():
+                if video_id in existing_video_ids:
+                    log.info(
+                        f"Video ID: {video_id} already exists for request ID {request_id}. Skipping..."
+                    )
+                    continue  # Skip to the next video
 
+                video["updated_at"] = now  # Always update the timestamp
+                video["request_id"] = request_id  # Associate with request_id
                 video["created_at"] = now
                 video["is_flagged"] = False
                 video["video_source"] = video_type
@@ -196,57 +307,45 @@ class VideoCrawler(Crawler):
                     "location", "Unknown"
                 )  # Default to 'Unknown' if no location provided
 
-                # Check for existing video with the same video_id and request_id
-                existing_video = db["video"].find_one(
-                    {"video_id": video["video_id"], "request_id": request_id}
-                )
-
-                if existing_video:
-                    log.info(
-                        f"Video ID: {video['video_id']} already exists for request ID {request_id}. Skipping..."
-                    )
-                    continue  # Skip to the next video
-
-                # Split datetime into date, month, year
-                year, month, day = video["created_at"].split(" ")[0].split("-")
                 video["year"] = int(year)
                 video["month"] = int(month)
                 video["day"] = int(day)
 
-                # Storing video into Azure Blob and set blob URL
-                video_data = helpers.download_file(video["play"])
-                if not video_data:
-                    raise RuntimeError("Video data download failed!")
-
-                video["play"] = helpers.upload_s3_file(
+                play_transfer = media_transfer.submit(
+                    video["play"],
                     bucket_name=bucket_name,
-                    filename=video["video_id"],
-                    data=video_data,
+                    filename=video_id,
                     extension="mp4",
                     folder="videos",
                 )
-
-                # Storing video cover into Azure Blob and set blob URL
-                video_cover = helpers.download_file(video["cover"])
-
-                if not video_cover:
-                    raise RuntimeError("Video cover download failed!")
-
-                video["cover"] = helpers.upload_s3_file(
+                cover_transfer = media_transfer.submit(
+                    video["cover"],
                     bucket_name=bucket_name,
-                    filename=video["video_id"],
-                    data=video_cover,
+                    filename=video_id,
                     extension="jpg",
                     folder="video-covers",
                 )
+                transfers.append((video, play_transfer, cover_transfer))
+
+            failed_transfers = 0
+            for video, play_transfer, cover_transfer in transfers:
+                try:
+                    video["play"] = play_transfer.result()
+                    video["cover"] = cover_transfer.result()
+                except RuntimeError as e:
+                    log.error(f"Video ID: {video['video_id']} not stored: {e}")
+                    failed_transfers += 1
+                    continue
 
-                video_count += 1
+                new_videos.append(video)
 
-                video["updated_at"] = now  # Always update the timestamp
-                db["video"].insert_one(video)
-                log.info(
-                    f"Video ID: {video['video_id']} stored as a new data in the database with location: {video['location']}"
-                )
+            # Store the uploaded videos even if other transfers failed
+            video_count = insert_new_videos(db, new_videos)
+
+        log.info(f"Media transfer stats: {media_transfer.stats()}")
 
         print(f"{video_count} videos stored in the database")
         log.info(f"Total {video_count} videos stored in the database")
+
+        if failed_transfers:
+            raise RuntimeError(f"{failed_transfers} video transfers failed!")
@@ -1,4 +1,3 @@
-import time
 from .base import Crawler
 from termcolor import cprint
 from typing import Optional, List, Dict
@@ -60,7 +59,6 @@ class CommentCrawler(Crawler):
         self._save_comments_to_db(comment_list, request_id=request_id)
 
     def _fetch_comments(self, url: str, params: Dict) -> Optional[List[Dict]]:
-        time.sleep(3)
         response: dict = send_api_request(url=url, headers=self.headers, params=params)
         if "error" in response:
             print(response["error"])
@@ -1,4 +1,3 @@
-import time
 from typing import Optional, List, Dict
 from .base import Crawler
 from ..utils import send_api_request, Logger
@@ -34,7 +33,6 @@ class ReplyCrawler(Crawler):
         return comment_reply_list
 
     def _fetch_reply_comments(self, url: str, params: Dict) -> List[Dict]:
-        time.sleep(3)
         response: dict = send_api_request(url=url, headers=self.headers, params=params)
 
         if "error" in response:
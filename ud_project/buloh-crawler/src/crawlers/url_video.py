@@ -3,7 +3,7 @@ from .base import VideoCrawler
 from .profile import ProfileCrawler
 from .comment import CommentCrawler
 from typing import List
-from ..utils import Logger
+from ..utils import Logger, get_rate_limiter
 
 log = Logger(name="VideoURLCrawler")
 
@@ -17,6 +17,7 @@ class URLVideoCrawler(VideoCrawler):
         url = "https://tiktok-scraper7.p.rapidapi.com/"
         for video_url in urls:
             querystring = {"url": video_url, "hd": "1"}
+            get_rate_limiter(url).acquire()
             response = httpx.get(url, headers=self.headers, params=querystring).json()
 
             # Fetch author's profile
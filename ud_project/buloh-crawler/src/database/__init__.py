@@ -1,5 +1,7 @@
-from .connection import MongoDBClient
+from .connection import MongoDBClient, get_mongo_client, close_mongo_client
 
 __all__ = [
     "MongoDBClient",
+    "get_mongo_client",
+    "close_mongo_client",
 ]
@@ -1,6 +1,7 @@
 from pymongo.mongo_client import MongoClient
 from pymongo.server_api import ServerApi
 import os
+import threading
 import mysql.connector
 from mysql.connector import Error
 from dotenv import load_dotenv
@@ -21,17 +22,19 @@ if not all([MONGODB_USERNAME, MONGODB_PASSWORD, MONGODB_HOST, MONGODB_DATABASE])
 uri = f"mongodb://{MONGODB_USERNAME}:{MONGODB_PASSWORD}@{MONGODB_HOST}/?authSource=admin&retryWrites=true&w=majority"
 
 
-class MongoDBClient:
-    def __init__(self, test=False):
-        self.uri = uri
-        self.client = None
-        self.test = test
+# Process-wide MongoDB client, its connection pool is shared by all the calls
+_mongo_client: MongoClient | None = None
+_mongo_client_lock = threading.Lock()
 
-    def __enter__(self):
-        try:
-            # Establish the MongoDB connection with connection parameters
-            self.client = MongoClient(
-                self.uri,
+
+def get_mongo_client() -> MongoClient:
+    """Get the process-wide MongoDB client, connecting on the first call."""
+    global _mongo_client
+
+    with _mongo_client_lock:
+        if _mongo_client is None:
+            client: MongoClient = MongoClient(
+                uri,
                 server_api=ServerApi("1"),
                 minPoolSize=10,
                 maxPoolSize=100,
@@ -41,8 +44,33 @@ class MongoDBClient:
                 connectTimeoutMS=15000,
             )
             # Ping the server to check the connection
-            self.client.admin.command("ping")
+            client.admin.command("ping")
             print("Pinged your deployment. You successfully connected to MongoDB!")
+            _mongo_client = client
+
+        return _mongo_client
+
+
+def close_mongo_client() -> None:
+    """Close the process-wide MongoDB client."""
+    global _mongo_client
+
+    with _mongo_client_lock:
+        if _mongo_client is not None:
+            _mongo_client.close()
+            _mongo_client = None
+
+
+class MongoDBClient:
+    def __init__(self, test=False):
+        self.uri = uri
+        self.client = None
+        self.test = test
+
+    def __enter__(self):
+        try:
+            # Reuse the connection pool of the process-wide client
+            self.client = get_mongo_client()
 
             # Select the correct database (test or production)
             if self.test:
@@ -56,8 +84,8 @@ class MongoDBClient:
             raise
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.client:
-            self.client.close()
+        # The process-wide client stays open, see close_mongo_client
+        pass
 
 
 # Example usage:
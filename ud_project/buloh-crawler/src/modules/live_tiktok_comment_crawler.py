@@ -7,8 +7,9 @@ from dotenv import load_dotenv
 from ..tiktok_comment_recorder import (
     create_tiktok_client,
     setup_client_events,
-    run_client_in_thread,
+    supervise_client,
     comment_stream,
+    get_live_room_supervisor,
 )
 from ..tiktok_live_recorder import is_user_in_live, get_room_id_from_user
 from ..modules.live_tiktok_video_crawler import redis_client
@@ -179,7 +180,15 @@ def start_live_comment_streaming(username: str, user_id: str):
     setup_client_events(
         client, comments, user_id, username, room_id, active_comment_sessions
     )
-    run_client_in_thread(client, user_id, username, active_comment_sessions)
+
+    try:
+        supervise_client(client, user_id, username, room_id)
+    except RuntimeError as e:
+        logger.error(str(e))
+        active_comment_sessions[user_id].remove(username)
+        if not active_comment_sessions[user_id]:
+            del active_comment_sessions[user_id]
+        raise HTTPException(status_code=503, detail=str(e))
 
     return StreamingResponse(
         comment_stream(
@@ -195,6 +204,12 @@ def start_live_comment_streaming(username: str, user_id: str):
     )
 
 
+@router.get("/live/comments/supervisor-status")
+def get_live_comment_supervisor_status():
+    """Connection state and comments received of the live rooms of this replica."""
+    return get_live_room_supervisor().status()
+
+
 @router.post("/live/comments/stop-streaming")
 def stop_live_comment_streaming(username: str, user_id: str):
     """Stop the TikTokLiveClient stream for a specific username and user_id"""
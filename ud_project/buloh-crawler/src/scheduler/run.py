@@ -1,7 +1,8 @@
 import os
 import httpx
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from time import sleep
+from typing import Callable, Dict, List
 from dotenv import load_dotenv
 from ..utils import Logger
 from ..crawlers.user_video import UserVideoCrawler
@@ -11,9 +12,17 @@ from ..crawlers.url_video import URLVideoCrawler
 
 load_dotenv()
 
+# Number of keywords or usernames crawled at the same time, the API requests
+# of all the crawls share the rate limiter of the API host
+CRAWL_CONCURRENCY = int(os.getenv("CRAWL_CONCURRENCY", "4"))
 
-def trigger_fastapi(url: str):
-    """Trigger the FastAPI endpoint to start a process."""
+
+def trigger_fastapi(url: str) -> bool:
+    """Trigger the FastAPI endpoint to start a process.
+
+    Returns:
+        bool: Whether the endpoint accepted the trigger.
+    """
     log = Logger(name="FastAPI Trigger")
     try:
         log.info(f"Triggering FastAPI endpoint: {url}")
@@ -23,29 +32,127 @@ def trigger_fastapi(url: str):
         if response.status_code == 200:
             log.info(f"Successfully triggered FastAPI endpoint: {url}")
             log.info(f"Response: {response.json()}")
-        else:
-            log.warning(
-                f"FastAPI endpoint responded with status code: {response.status_code}. Response: {response.text}"
-            )
+            return True
+
+        log.warning(
+            f"FastAPI endpoint responded with status code: {response.status_code}. Response: {response.text}"
+        )
     except Exception as e:
         log.error(f"Failed to trigger FastAPI endpoint: {url}. Error: {str(e)}")
+    return False
 
 
 def reconnect_and_trigger_haraz(url: str, retries: int = 3, delay: int = 60):
     """Attempt to reconnect and trigger FastAPI endpoint for 'haraz' with retries and 5-minute intervals."""
     log = Logger(name="Reconnection Handler")
     for attempt in range(retries):
-        try:
-            trigger_fastapi(url)
+        if trigger_fastapi(url):
             break  # Exit loop if the trigger is successful
-        except Exception:
-            log.error(
-                f"Attempt {attempt + 1} failed to trigger FastAPI. Retrying in {delay} seconds..."
+
+        log.error(
+            f"Attempt {attempt + 1} failed to trigger FastAPI. Retrying in {delay} seconds..."
+        )
+        if attempt < retries - 1:  # Don't sleep after last attempt
+            sleep(delay)  # 5-minute delay for retrying
+        else:
+            log.error("All attempts to trigger FastAPI have failed.")
+
+
+def trigger_downstream_processes() -> None:
+    """
+    Trigger Transcription, Description and Haraz for the crawled videos.
+
+    Each endpoint is triggered once the previous trigger completed.
+    """
+    log = Logger(name="CrawlerRun")
+
+    # Trigger Transcription for 10 videos
+    log.info("Triggering Transcription videos...")
+    trigger_fastapi(f"{os.getenv('TRANSCRIPTION_URL')}/trigger/")  # Transcription
+
+    # Trigger Description for 10 videos
+    log.info("Triggering Description videos...")
+    trigger_fastapi(f"{os.getenv('DESCRIPTION_URL')}/trigger/")  # Description
+
+    # Trigger Haraz for 10 videos (with reconnect mechanism, retry every 5 minutes)
+    log.info("Triggering Haraz for videos...")
+    reconnect_and_trigger_haraz(f"{os.getenv('HARAZ_URL')}/Haraz")
+
+
+def crawl_username(username: str, request_id: int) -> List[Dict]:
+    return UserVideoCrawler().crawl(
+        type="username",
+        username=username,
+        count="100",  # Ensure only 100 videos are crawled
+        cursor="0",
+        request_id=request_id,
+    )
+
+
+def crawl_keyword(keyword: str, request_id: int) -> List[Dict]:
+    return KeywordVideoCrawler().crawl(
+        type="keyword",
+        keyword=keyword,
+        region="MY",
+        count="100",  # Ensure only 100 videos are crawled
+        cursor="0",
+        request_id=request_id,
+    )
+
+
+def crawl_concurrently(
+    crawl: Callable[[str, int], List[Dict]],
+    inputs: List[str],
+    request_id: int,
+    max_workers: int = CRAWL_CONCURRENCY,
+) -> List[Dict]:
+    """
+    Crawl the keywords or usernames concurrently.
+
+    A failed crawl does not stop the other ones, the first error is raised
+    once all the crawls completed.
+
+    Args:
+        crawl (Callable[[str, int], List[Dict]]): Crawl of one input.
+        inputs (List[str]): Keywords or usernames.
+        request_id (int): ID associated with the request.
+        max_workers (int): Maximum number of concurrent crawls.
+
+    Returns:
+        List[Dict]: Crawled videos of all the inputs.
+    """
+    log = Logger(name="CrawlerRun")
+    crawled_videos: List[Dict] = []
+    errors: List[Exception] = []
+
+    if not inputs:
+        return crawled_videos
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(inputs)), thread_name_prefix="crawl"
+    ) as executor:
+        futures = {
+            executor.submit(crawl, crawl_input, request_id): crawl_input
+            for crawl_input in inputs
+        }
+        for future in as_completed(futures):
+            crawl_input = futures[future]
+            try:
+                videos = future.result() or []
+            except Exception as e:
+                log.error(f"Crawl failed for {crawl_input}: {str(e)}")
+                errors.append(e)
+                continue
+
+            log.info(
+                f"Completed crawl for {crawl_input}, Crawled videos: {len(videos)}"
             )
-            if attempt < retries - 1:  # Don't sleep after last attempt
-                sleep(delay)  # 5-minute delay for retrying
-            else:
-                log.error("All attempts to trigger FastAPI have failed.")
+            crawled_videos.extend(videos)
+
+    if errors:
+        raise errors[0]
+
+    return crawled_videos
 
 
 def start_crawl(type: str, inputs: list, request_id: int, tiktok: bool = True):
@@ -61,39 +168,17 @@ def start_crawl(type: str, inputs: list, request_id: int, tiktok: bool = True):
                 username.strip() for username in inputs if isinstance(username, str)
             ]
             all_usernames = [
-                u for usernames in all_usernames for u in usernames.split(",")
+                u.strip() for usernames in all_usernames for u in usernames.split(",")
             ]
 
-            for username in all_usernames:
-                log.info(f"Starting crawl for username: {username}")
-                uvc = UserVideoCrawler()
-                crawled_video_ids = uvc.crawl(
-                    type="username",
-                    username=username,
-                    count="100",  # Ensure only 10 videos are crawled
-                    cursor="0",
-                    request_id=request_id,
-                )
-                log.info(
-                    f"Completed crawl for username: {username}, Crawled video IDs: {crawled_video_ids}"
-                )
-                break  # Stop after crawling 10 videos
+            log.info(f"Starting crawl for usernames: {all_usernames}")
+            crawled_video_ids = crawl_concurrently(
+                crawl_username, all_usernames, request_id
+            )
 
         elif type == "keyword":
-            for keyword in inputs:
-                log.info(f"Starting crawl for keyword: {keyword}")
-                kwv = KeywordVideoCrawler()
-                crawled_video_ids = kwv.crawl(
-                    type="keyword",
-                    keyword=keyword,
-                    region="MY",
-                    count="100",  # Ensure only 100 videos are crawled
-                    cursor="0",
-                    request_id=request_id,
-                )
-                log.info(
-                    f"Completed crawl for keyword: {keyword}, Crawled video IDs: {crawled_video_ids}"
-                )
+            log.info(f"Starting crawl for keywords: {inputs}")
+            crawled_video_ids = crawl_concurrently(crawl_keyword, inputs, request_id)
 
         elif type == "trending":
             log.info("Starting crawl for trending videos")
@@ -124,21 +209,7 @@ def start_crawl(type: str, inputs: list, request_id: int, tiktok: bool = True):
         log.info("Crawl completed for the requset")
         log.info("Crawl completed, triggering FastAPI endpoints now...")
 
-        # Trigger Transcription for 10 videos
-        log.info("Triggering Transcription videos...")
-        trigger_fastapi(f"{os.getenv('TRANSCRIPTION_URL')}/trigger/")  # Transcription
-        time.sleep(
-            5
-        )  # Optional delay to ensure the system doesn't trigger requests too fast
-
-        # Trigger Description for 10 videos
-        log.info("Triggering Description videos...")
-        trigger_fastapi(f"{os.getenv('DESCRIPTION_URL')}/trigger/")  # Description
-        time.sleep(2)  # Optional delay
-
-        # Trigger Haraz for 10 videos (with reconnect mechanism, retry every 5 minutes)
-        log.info("Triggering Haraz for videos...")
-        reconnect_and_trigger_haraz(f"{os.getenv('HARAZ_URL')}/Haraz")
+        trigger_downstream_processes()
 
     except Exception as e:
         log.error(f"Error occurred during crawl: {str(e)}")
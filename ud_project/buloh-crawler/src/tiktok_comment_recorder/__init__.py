@@ -1,17 +1,28 @@
 from .base import (
     create_tiktok_client,
     setup_client_events,
-    run_client_in_thread,
+    supervise_client,
     disconnect_client_sync,
     comment_stream,
+)
+from .live_status import (
     is_user_in_live,
+    acquire_live_monitor,
+    release_live_monitor,
+    is_room_live,
 )
+from .supervisor import get_live_room_supervisor, close_live_room_supervisor
 
 __all__ = [
     "create_tiktok_client",
     "setup_client_events",
-    "run_client_in_thread",
+    "supervise_client",
     "disconnect_client_sync",
     "comment_stream",
     "is_user_in_live",
+    "acquire_live_monitor",
+    "release_live_monitor",
+    "is_room_live",
+    "get_live_room_supervisor",
+    "close_live_room_supervisor",
 ]
@@ -1,19 +1,22 @@
 import asyncio
-import threading
 import logging
-import time
 import warnings
 import json
 import os
 
 from TikTokLive.client.client import TikTokLiveClient
 from TikTokLive.client.web.web_settings import WebDefaults
-from TikTokLive.events import ConnectEvent, CommentEvent
-from TikTokLive.client.errors import UserOfflineError
-from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
+from TikTokLive.events import ConnectEvent, CommentEvent, DisconnectEvent, LiveEndEvent
+from websockets.exceptions import ConnectionClosedOK
 from datetime import datetime
 from dotenv import load_dotenv
-from ..tiktok_live_recorder import is_user_in_live
+from .supervisor import get_live_room_supervisor
+from .live_status import (
+    acquire_live_monitor,
+    get_live_monitor,
+    is_room_live,
+    release_live_monitor,
+)
 
 logger = logging.getLogger(__name__)
 warnings.filterwarnings(
@@ -24,6 +27,9 @@ load_dotenv()
 
 WebDefaults.tiktok_sign_api_key = os.getenv("SIGN_API_KEY")
 
+# Maximum number of comments sent to the client in one chunk
+COMMENT_BATCH_SIZE = int(os.getenv("COMMENT_BATCH_SIZE", "100"))
+
 
 def create_tiktok_client(username: str) -> TikTokLiveClient:
     """Create a new TikTok Live client instance."""
@@ -41,12 +47,28 @@ def setup_client_events(
     async def on_connect(event: ConnectEvent):
         logger.info(f"Connected to @{event.unique_id} (Room ID: {client.room_id})")
 
+    @client.on(LiveEndEvent)
+    async def on_live_end(event: LiveEndEvent):
+        logger.info(f"Live of @{username} ended (Room ID: {room_id})")
+        monitor = get_live_monitor(room_id)
+        if monitor is not None:
+            monitor.mark_ended()
+        await comments.put({"stop": True})
+
+    @client.on(DisconnectEvent)
+    async def on_disconnect(event: DisconnectEvent):
+        # Check now if the live ended instead of waiting for the next check
+        monitor = get_live_monitor(room_id)
+        if monitor is not None:
+            monitor.request_check()
+
     @client.on(CommentEvent)
     async def on_comment(event: CommentEvent):
+        # Cached live state, kept up to date by the room monitor
         if (
             user_id not in active_comment_sessions
             or username not in active_comment_sessions[user_id]
-            or not is_user_in_live(room_id)
+            or not is_room_live(room_id)
         ):
             await comments.put({"stop": True})
             return
@@ -95,44 +117,13 @@ def setup_client_events(
             logger.error(f"Error putting comment in queue: {str(e)}")
 
 
-def run_client_in_thread(client, user_id, username, active_comment_sessions):
-    """Run the TikTok Live client in a separate thread."""
+def supervise_client(client, user_id, username, room_id):
+    """Run the TikTok Live client on the live room supervisor.
 
-    def run_client():
-        try:
-            client.run(process_connect_events=False)
-        except UserOfflineError:
-            logger.error(f"User '{username}' is offline.")
-            raise RuntimeError(
-                status_code=400,
-                detail=f"TikTok user '{username}' is offline or not found",
-            )
-        except (ConnectionClosedError, ConnectionClosedOK):
-            logger.warning("Connection closed unexpectedly")
-            try:
-                logger.info("Attempting to reconnect...")
-                time.sleep(5)
-                run_client()
-            except Exception as e:
-                logger.error(f"Error during reconnection attempt: {str(e)}")
-                if (
-                    user_id in active_comment_sessions
-                    and username in active_comment_sessions[user_id]
-                ):
-                    active_comment_sessions[user_id].remove(username)
-
-                    if not active_comment_sessions[user_id]:
-                        del active_comment_sessions[user_id]
-                        logger.info(
-                            f"No active recordings left for user ID '{user_id}'."
-                        )
-        except Exception as e:
-            logger.error(f"Error in client run: {str(e)}")
-            raise
-
-    client_thread = threading.Thread(target=run_client)
-    client_thread.daemon = True
-    client_thread.start()
+    Raises:
+        RuntimeError: If the supervisor cannot take another room
+    """
+    return get_live_room_supervisor().add_room(client, user_id, username, room_id)
 
 
 def disconnect_client_sync(client):
@@ -150,7 +141,14 @@ def disconnect_client_sync(client):
 async def disconnect_client(client):
     """Safely disconnect the TikTok Live client."""
     try:
-        await asyncio.wait_for(client.disconnect(), timeout=10.0)
+        supervisor = get_live_room_supervisor()
+        if supervisor.is_supervised(client):
+            # The client runs on the loop of the supervisor
+            await asyncio.wait_for(
+                asyncio.wrap_future(supervisor.remove_client(client)), timeout=10.0
+            )
+        else:
+            await asyncio.wait_for(client.disconnect(), timeout=10.0)
         logger.info("Client disconnected")
     except asyncio.TimeoutError:
         logger.warning("Disconnect timed out.")
@@ -161,7 +159,13 @@ async def disconnect_client(client):
 async def comment_stream(
     client, comments, user_id, username, room_id, active_comment_sessions, start_time
 ):
-    """Handle the streaming of comments."""
+    """Handle the streaming of comments.
+
+    The live state is read from the room monitor, and the comments waiting in
+    the queue are sent to the client in chunks of up to COMMENT_BATCH_SIZE.
+    """
+
+    monitor = await asyncio.to_thread(acquire_live_monitor, room_id)
 
     try:
         while True:
@@ -177,7 +181,7 @@ async def comment_stream(
                 }
                 yield f"data: {json.dumps(data)}\n\n"
                 break
-            if not is_user_in_live(room_id):
+            if not monitor.is_live:
                 logger.info(
                     f"User {username} has ended the live session. Stopping recording."
                 )
@@ -188,7 +192,7 @@ async def comment_stream(
             try:
                 data = await asyncio.wait_for(comments.get(), timeout=5.0)
             except asyncio.TimeoutError:
-                if not is_user_in_live(room_id):
+                if not monitor.is_live:
                     logger.info(
                         f"User {username} has ended the live session. Stopping recording."
                     )
@@ -201,7 +205,23 @@ async def comment_stream(
                     )
                     continue
 
-            if data.get("stop"):
+            # Take the other comments already waiting in the queue
+            batch = [data]
+            while len(batch) < COMMENT_BATCH_SIZE and not batch[-1].get("stop"):
+                try:
+                    batch.append(comments.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            comment_events = "".join(
+                f"data: {json.dumps(data)}\n\n"
+                for data in batch
+                if data and not data.get("stop")
+            )
+            if comment_events:
+                yield comment_events
+
+            if batch[-1].get("stop"):
                 logger.info(
                     f"User {username} has ended the live session. Stopping recording."
                 )
@@ -209,13 +229,11 @@ async def comment_stream(
                 yield f"data: {json.dumps(data)}\n\n"
                 break
 
-            if data:
-                yield f"data: {json.dumps(data)}\n\n"
-
     except Exception as e:
         if not isinstance(e, ConnectionClosedOK):
             logger.error(f"Error in comment stream: {str(e)}")
     finally:
+        release_live_monitor(room_id)
         await disconnect_client(client)
 
         data = {
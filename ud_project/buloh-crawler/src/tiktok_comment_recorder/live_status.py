@@ -0,0 +1,148 @@
+import os
+import threading
+import logging
+from typing import Dict, Optional
+from dotenv import load_dotenv
+from ..tiktok_live_recorder import is_user_in_live
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+# Seconds between two checks of whether a monitored room is still live
+LIVE_CHECK_INTERVAL = float(os.getenv("LIVE_CHECK_INTERVAL", "10"))
+# Consecutive failed checks after which a room is considered ended
+LIVE_CHECK_MAX_FAILURES = int(os.getenv("LIVE_CHECK_MAX_FAILURES", "3"))
+
+
+class LiveStatusMonitor:
+    """
+    Cache whether a room is live, checking it in a background thread.
+
+    The webcast API is called every `interval` seconds, or right away when
+    `request_check` is called, instead of once per comment. The room stays
+    ended once the API reports the live ended, or after `max_failures`
+    consecutive failed checks; a single failed check keeps the cached state.
+    """
+
+    def __init__(
+        self,
+        room_id: str,
+        interval: float = LIVE_CHECK_INTERVAL,
+        max_failures: int = LIVE_CHECK_MAX_FAILURES,
+    ) -> None:
+        self.room_id = room_id
+        self.interval = interval
+        self.max_failures = max_failures
+        self.is_live = True
+        self.failed_checks = 0
+
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def check(self) -> bool:
+        """Check whether the room is live and cache the result."""
+        try:
+            is_live = bool(is_user_in_live(self.room_id))
+        except Exception as e:
+            self.failed_checks += 1
+            logger.error(
+                f"Error checking if room {self.room_id} is live "
+                f"({self.failed_checks}/{self.max_failures}): {str(e)}"
+            )
+            if self.failed_checks >= self.max_failures:
+                self.is_live = False
+            return self.is_live
+
+        self.failed_checks = 0
+        self.is_live = is_live
+        return self.is_live
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _run(self) -> None:
+        while self.is_live and not self._stop.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            self.check()
+
+    def request_check(self) -> None:
+        """Check the room now instead of waiting for the next interval."""
+        self._wake.set()
+
+    def mark_ended(self) -> None:
+        """Mark the room as ended, e.g. on a live end event."""
+        self.is_live = False
+        self._wake.set()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+
+_monitors: Dict[str, LiveStatusMonitor] = {}
+_monitor_refs: Dict[str, int] = {}
+_monitors_lock = threading.Lock()
+
+
+def acquire_live_monitor(room_id: str) -> LiveStatusMonitor:
+    """
+    Get the monitor of a room, starting it for the first recording of the room.
+
+    The first call checks the room before returning. Every call must be
+    followed by a call to `release_live_monitor`.
+    """
+    with _monitors_lock:
+        monitor = _monitors.get(room_id)
+        if monitor is not None:
+            _monitor_refs[room_id] += 1
+            return monitor
+
+    # Checked outside of the lock, so that slow checks of new rooms do not
+    # block the recordings of the other rooms
+    new_monitor = LiveStatusMonitor(room_id)
+    new_monitor.check()
+
+    with _monitors_lock:
+        monitor = _monitors.get(room_id)
+        if monitor is not None:
+            # Another recording of the room registered its monitor meanwhile
+            _monitor_refs[room_id] += 1
+            return monitor
+
+        new_monitor.start()
+        _monitors[room_id] = new_monitor
+        _monitor_refs[room_id] = 1
+        return new_monitor
+
+
+def release_live_monitor(room_id: str) -> None:
+    """Stop monitoring a room once the last recording of the room ended."""
+    with _monitors_lock:
+        if room_id not in _monitors:
+            return
+
+        _monitor_refs[room_id] -= 1
+        if _monitor_refs[room_id] == 0:
+            _monitors.pop(room_id).stop()
+            del _monitor_refs[room_id]
+
+
+def get_live_monitor(room_id: str) -> Optional[LiveStatusMonitor]:
+    """Get the monitor of a room if the room is being monitored."""
+    return _monitors.get(room_id)
+
+
+def is_room_live(room_id: str) -> bool:
+    """
+    Cached live state of a room.
+
+    Rooms which are not monitored are considered live, comment_stream
+    monitors the room for the whole recording.
+    """
+    monitor = _monitors.get(room_id)
+    return monitor is None or monitor.is_live
@@ -0,0 +1,275 @@
+import asyncio
+import os
+import random
+import threading
+import time
+import logging
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+from TikTokLive.client.client import TikTokLiveClient
+from TikTokLive.client.errors import UserOfflineError
+from TikTokLive.events import CommentEvent, ConnectEvent
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+# Maximum number of live rooms supervised by this process
+MAX_LIVE_ROOMS = int(os.getenv("MAX_LIVE_ROOMS", "500"))
+# Reconnections of a room, with exponential backoff between base and max seconds
+LIVE_MAX_RECONNECTS = int(os.getenv("LIVE_MAX_RECONNECTS", "10"))
+LIVE_RECONNECT_BACKOFF = float(os.getenv("LIVE_RECONNECT_BACKOFF", "2"))
+LIVE_RECONNECT_BACKOFF_MAX = float(os.getenv("LIVE_RECONNECT_BACKOFF_MAX", "60"))
+
+
+class LiveRoom:
+    """Connection state and resource accounting of a supervised live room."""
+
+    def __init__(
+        self, client: TikTokLiveClient, user_id: str, username: str, room_id: str
+    ) -> None:
+        self.client = client
+        self.user_id = user_id
+        self.username = username
+        self.room_id = room_id
+        self.state = "connecting"
+        self.started_at = time.time()
+        self.connected_at: Optional[float] = None
+        self.last_event_at: Optional[float] = None
+        self.comments_received = 0
+        self.reconnects = 0
+        self.last_error: Optional[str] = None
+        self.stopping = False
+        self.task: Optional[asyncio.Task] = None
+
+    def status(self) -> Dict:
+        return {
+            "user_id": self.user_id,
+            "username": self.username,
+            "room_id": self.room_id,
+            "state": self.state,
+            "started_at": self.started_at,
+            "connected_at": self.connected_at,
+            "last_event_at": self.last_event_at,
+            "comments_received": self.comments_received,
+            "reconnects": self.reconnects,
+            "last_error": self.last_error,
+        }
+
+
+class LiveRoomSupervisor:
+    """
+    Run the TikTok Live clients of many rooms on one asyncio loop.
+
+    The loop runs in a single background thread. Each room is a task that
+    connects its client and reconnects it with a bounded exponential backoff,
+    until the room is removed, the user goes offline or the reconnections
+    are exhausted.
+    """
+
+    def __init__(
+        self,
+        max_rooms: int = MAX_LIVE_ROOMS,
+        max_reconnects: int = LIVE_MAX_RECONNECTS,
+        backoff: float = LIVE_RECONNECT_BACKOFF,
+        backoff_max: float = LIVE_RECONNECT_BACKOFF_MAX,
+    ) -> None:
+        self.max_rooms = max_rooms
+        self.max_reconnects = max_reconnects
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+
+        self.rooms: Dict[Tuple[str, str], LiveRoom] = {}
+        self._lock = threading.Lock()
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="live-room-supervisor", daemon=True
+        )
+        self._thread.start()
+
+    def add_room(
+        self, client: TikTokLiveClient, user_id: str, username: str, room_id: str
+    ) -> LiveRoom:
+        """
+        Start supervising the client of a room.
+
+        Raises:
+            RuntimeError: If the supervisor is full or the room is already supervised
+        """
+        with self._lock:
+            if (user_id, username) in self.rooms:
+                raise RuntimeError(
+                    f"Live room of '{username}' is already supervised for user ID '{user_id}'."
+                )
+            if len(self.rooms) >= self.max_rooms:
+                raise RuntimeError(
+                    f"Live room supervisor is full ({self.max_rooms} rooms)."
+                )
+
+            room = LiveRoom(client, user_id, username, room_id)
+            self.rooms[(user_id, username)] = room
+
+        self._track_events(room)
+        asyncio.run_coroutine_threadsafe(self._start_room(room), self.loop)
+        return room
+
+    def _track_events(self, room: LiveRoom) -> None:
+        @room.client.on(ConnectEvent)
+        async def on_connect(event: ConnectEvent):
+            room.state = "connected"
+            room.connected_at = time.time()
+            room.last_event_at = room.connected_at
+
+        @room.client.on(CommentEvent)
+        async def on_comment(event: CommentEvent):
+            room.comments_received += 1
+            room.last_event_at = time.time()
+
+    async def _start_room(self, room: LiveRoom) -> None:
+        room.task = asyncio.current_task()
+        await self._run_room(room)
+
+    def _get_backoff(self, attempt: int) -> float:
+        backoff = min(self.backoff_max, self.backoff * 2**attempt)
+        # Jitter, rooms dropped together do not reconnect together
+        return backoff * random.uniform(0.5, 1.0)
+
+    async def _run_room(self, room: LiveRoom) -> None:
+        attempt = 0
+        try:
+            while not room.stopping:
+                connect_time = time.time()
+                try:
+                    room.state = "connecting"
+                    # The known room ID skips scraping the live page on every connection
+                    await room.client.connect(
+                        process_connect_events=False,
+                        room_id=int(room.room_id) if room.room_id else None,
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except UserOfflineError:
+                    logger.error(f"User '{room.username}' is offline.")
+                    room.last_error = "User is offline"
+                    break
+                except Exception as e:
+                    logger.warning(
+                        f"Connection of the live room of '{room.username}' closed: {str(e)}"
+                    )
+                    room.last_error = str(e)
+
+                if room.stopping:
+                    break
+
+                # A connection which lasted resets the backoff
+                if time.time() - connect_time > self.backoff_max:
+                    attempt = 0
+                if attempt >= self.max_reconnects:
+                    logger.error(
+                        f"Live room of '{room.username}' reconnected {attempt} times, giving up."
+                    )
+                    break
+
+                room.state = "reconnecting"
+                backoff = self._get_backoff(attempt)
+                logger.info(
+                    f"Reconnecting to the live room of '{room.username}' in {backoff:.1f} seconds..."
+                )
+                await asyncio.sleep(backoff)
+                attempt += 1
+                room.reconnects += 1
+        finally:
+            room.state = "stopped"
+            with self._lock:
+                if self.rooms.get((room.user_id, room.username)) is room:
+                    del self.rooms[(room.user_id, room.username)]
+
+    def is_supervised(self, client: TikTokLiveClient) -> bool:
+        with self._lock:
+            return any(room.client is client for room in self.rooms.values())
+
+    async def _stop_room(self, room: LiveRoom) -> None:
+        room.stopping = True
+        try:
+            if room.client.connected:
+                await room.client.disconnect()
+        except Exception as e:
+            logger.error(f"Error disconnecting client: {str(e)}")
+        finally:
+            if room.task is not None and not room.task.done():
+                room.task.cancel()
+
+    def remove_client(self, client: TikTokLiveClient) -> Future:
+        """
+        Disconnect a client and stop supervising its room.
+
+        Returns:
+            Future: Completed once the client is disconnected
+        """
+        with self._lock:
+            rooms = [room for room in self.rooms.values() if room.client is client]
+
+        future: Future = Future()
+        if not rooms:
+            future.set_result(None)
+            return future
+        return asyncio.run_coroutine_threadsafe(self._stop_room(rooms[0]), self.loop)
+
+    def status(self) -> Dict:
+        """Number of rooms by state and status of every room."""
+        with self._lock:
+            rooms: List[Dict] = [room.status() for room in self.rooms.values()]
+
+        states: Dict[str, int] = {}
+        for room in rooms:
+            states[room["state"]] = states.get(room["state"], 0) + 1
+
+        return {
+            "rooms": len(rooms),
+            "max_rooms": self.max_rooms,
+            "states": states,
+            "comments_received": sum(room["comments_received"] for room in rooms),
+            "live_rooms": rooms,
+        }
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """Disconnect all the clients and stop the loop."""
+        with self._lock:
+            rooms = list(self.rooms.values())
+
+        for room in rooms:
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self._stop_room(room), self.loop
+                ).result(timeout=timeout)
+            except Exception as e:
+                logger.error(f"Error stopping live room of '{room.username}': {str(e)}")
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=timeout)
+
+
+_supervisor: Optional[LiveRoomSupervisor] = None
+_supervisor_lock = threading.Lock()
+
+
+def get_live_room_supervisor() -> LiveRoomSupervisor:
+    """Get the process-wide live room supervisor, started on the first call."""
+    global _supervisor
+
+    with _supervisor_lock:
+        if _supervisor is None:
+            _supervisor = LiveRoomSupervisor()
+        return _supervisor
+
+
+def close_live_room_supervisor() -> None:
+    """Stop the process-wide live room supervisor."""
+    global _supervisor
+
+    with _supervisor_lock:
+        if _supervisor is not None:
+            _supervisor.shutdown()
+            _supervisor = None
@@ -2,16 +2,15 @@ import re
 import json
 import time
 import os
-import ffmpeg
 import logging
 import threading
 from fastapi import Request
 from datetime import datetime
-from io import BytesIO
 from dotenv import load_dotenv
 from .http_client import HttpClient
 from ..utils import helpers, read_cookies, Logger, get_env_variable
 from .combine_files import concatenate_videos, add_metadata_to_video, create_empty_mp4
+from .segmenter import StreamSegmenter, read_file_chunks
 
 load_dotenv()
 
@@ -25,6 +24,9 @@ bucket_name: str = get_env_variable(
     "AWS_BUCKET_NAME", "AWS_BUCKET_NAME is not provided!"
 )
 
+# Size of the chunks read from the live stream
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 def get_live_url(room_id):
     """
@@ -135,7 +137,11 @@ def start_recording(
     start_recording_time: str,
 ):
     """
-    Start recording tiktok live streams and continuously retrieve video chunks and convert them using FFmpeg.
+    Start recording tiktok live streams and yield the video segments as FFmpeg closes them.
+
+    The stream is never held in memory: it is written to FFmpeg as it is
+    received, the segments are read back in pieces and the full video is
+    uploaded from disk.
     """
     try:
         count = 1
@@ -155,66 +161,70 @@ def start_recording(
             ):
                 logger.info("Stop Recording...")
                 break
+
+            segmenter = None
             try:
                 response = http_client.get(live_url, stream=True)
 
-                output = os.path.join(output_dir, f"{username}_vid{count}.mp4")
-
-                # Input directly from in-memory stream
-                stream = ffmpeg.input("pipe:0")
+                # One FFmpeg process per connection to the stream
+                segmenter = StreamSegmenter(
+                    output_dir, f"{username}_vid", duration, start_number=count
+                )
+                check_time = time.time()
 
-                if count == 1:
-                    start_time = time.time()
-                    chunk_data = b""
-
-                for chunk in response.iter_content(chunk_size=4096):
-                    chunk_data += chunk
-                    elapsed_time = time.time() - start_time
-
-                    if elapsed_time >= duration:
-                        chunk_file = output.replace("_flv.mp4", ".mp4")
-                        stream = ffmpeg.output(stream, chunk_file, c="copy", t=duration)
-                        ffmpeg.run(stream, input=chunk_data, quiet=True)
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    segmenter.write(chunk)
 
+                    for chunk_file in segmenter.pop_closed_segments():
                         logger.info(
-                            f"Video {count} processed and saved as {output.replace('_flv.mp4', '.mp4')}"
+                            f"Video {count} processed and saved as {chunk_file}"
                         )
-
-                        with open(chunk_file, "rb") as f:
-                            file_content = f.read()
-                            yield file_content
-
+                        yield from read_file_chunks(chunk_file)
                         chunk_files.append(chunk_file)
-
-                        start_time = time.time()
-                        chunk_data = b""
                         count += 1
-                        break
+
+                    # Check if the recording should stop every segment duration
+                    if time.time() - check_time >= duration:
+                        check_time = time.time()
+                        if (
+                            user_id not in active_video_sessions
+                            or username not in active_video_sessions[user_id]
+                            or not is_user_in_live(room_id)
+                        ):
+                            break
+
+                # Close the last segment, even if it is shorter than duration
+                last_chunk_files = segmenter.close()
+                segmenter = None
+                for chunk_file in last_chunk_files:
+                    logger.info(f"Video {count} processed and saved as {chunk_file}")
+                    yield from read_file_chunks(chunk_file)
+                    chunk_files.append(chunk_file)
+                    count += 1
 
             except Exception as e:
                 logger.error(f"Error retrieving or processing chunk: {e}")
                 raise RuntimeError(f"Error retrieving or processing chunk: {e}")
 
+            finally:
+                # Stop FFmpeg on errors and client disconnections
+                if segmenter is not None:
+                    segmenter.close()
+
         logger.info("Recording session ended, concatenating chunks...")
 
         logger.info(f"Chunks to concatenate: {chunk_files}")
         concatenate_videos(chunk_files, full_video_output)
 
-        with open(full_video_output, "rb") as f:
-            full_video_content = f.read()
-
-        full_video_bytesio = BytesIO(full_video_content)
-
-        if full_video_bytesio is None:
-            raise RuntimeError("Fail to convert video data to bytesio.")
-
-        full_video_url = helpers.upload_s3_file(
-            bucket_name=bucket_name,
-            filename=full_video_output.replace(".mp4", ""),
-            data=full_video_bytesio,
-            extension="mp4",
-            folder="live-tiktok-recordings",
-        )
+        # Uploaded from disk, in multipart parts for long recordings
+        with open(full_video_output, "rb") as full_video_file:
+            full_video_url = helpers.upload_s3_file(
+                bucket_name=bucket_name,
+                filename=full_video_output.replace(".mp4", ""),
+                data=full_video_file,
+                extension="mp4",
+                folder="live-tiktok-recordings",
+            )
 
         logger.info(f"Full video blob url: {full_video_url}")
 
@@ -232,9 +242,7 @@ def start_recording(
         temp_file_with_metadata = add_metadata_to_video(temp_file, data)
         logger.info(f"Temporary file with metadata: {temp_file_with_metadata}")
 
-        with open(temp_file_with_metadata, "rb") as f:
-            file_content = f.read()
-            yield file_content
+        yield from read_file_chunks(temp_file_with_metadata)
 
         all_files_to_remove = [
             full_video_output,
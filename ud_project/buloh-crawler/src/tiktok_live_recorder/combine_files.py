@@ -14,7 +14,8 @@ def create_file_list(input_files, list_file_path):
     """
     with open(list_file_path, "w") as f:
         for file in input_files:
-            f.write(f"file '{file}'\n")
+            # FFmpeg resolves relative paths from the directory of the list
+            f.write(f"file '{os.path.abspath(file)}'\n")
 
 
 def concatenate_videos(input_files, output_file):
@@ -25,7 +26,8 @@ def concatenate_videos(input_files, output_file):
         print("No MP4 files to concatenate.")
         return
 
-    list_file_path = "file_list.txt"
+    # Next to the output, concurrent recordings must not share the list
+    list_file_path = f"{output_file}.txt"
     create_file_list(input_files, list_file_path)
 
     command = [
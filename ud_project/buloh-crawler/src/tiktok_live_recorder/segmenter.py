@@ -0,0 +1,101 @@
+import os
+import queue
+import threading
+import ffmpeg
+import logging
+from typing import Iterator, List
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Size of the pieces the segment files are read and yielded in
+SEGMENT_READ_SIZE = 1024 * 1024
+
+
+class StreamSegmenter:
+    """
+    Pipe a live stream into one FFmpeg segment muxer process.
+
+    The stream is copied into MP4 segments of about `segment_time` seconds,
+    named `{prefix}{number}.mp4`, and FFmpeg lists every segment on stdout once
+    it is closed.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        prefix: str,
+        segment_time: int,
+        start_number: int = 1,
+    ) -> None:
+        self.output_dir = output_dir
+        self.closed_segments: "queue.Queue[str]" = queue.Queue()
+
+        stream = ffmpeg.input("pipe:0")
+        stream = ffmpeg.output(
+            stream,
+            os.path.join(output_dir, f"{prefix}%d.mp4"),
+            c="copy",
+            f="segment",
+            segment_time=segment_time,
+            segment_format="mp4",
+            segment_start_number=start_number,
+            segment_list="pipe:1",
+            segment_list_type="flat",
+            reset_timestamps=1,
+        ).global_args("-loglevel", "error")
+        self.process = stream.run_async(pipe_stdin=True, pipe_stdout=True)
+
+        self._reader = threading.Thread(target=self._read_segment_list, daemon=True)
+        self._reader.start()
+
+    def _read_segment_list(self) -> None:
+        for line in self.process.stdout:
+            segment = line.decode().strip()
+            if segment:
+                self.closed_segments.put(os.path.join(self.output_dir, segment))
+
+    def write(self, chunk: bytes) -> None:
+        """Write a chunk of the stream to FFmpeg."""
+        try:
+            self.process.stdin.write(chunk)
+        except (BrokenPipeError, ValueError) as e:
+            raise RuntimeError(f"FFmpeg segmenter stopped: {e}")
+
+    def pop_closed_segments(self) -> List[str]:
+        """Get the segments closed since the last call."""
+        segments = []
+        while True:
+            try:
+                segments.append(self.closed_segments.get_nowait())
+            except queue.Empty:
+                return segments
+
+    def close(self) -> List[str]:
+        """
+        End the stream, wait for FFmpeg to close the last segment.
+
+        Returns:
+            List[str]: Segments closed since the last pop_closed_segments call.
+        """
+        try:
+            self.process.stdin.close()
+        except BrokenPipeError:
+            pass
+
+        return_code = self.process.wait()
+        self._reader.join()
+        if return_code != 0:
+            logger.error(f"FFmpeg segmenter exited with code {return_code}")
+
+        return self.pop_closed_segments()
+
+
+def read_file_chunks(file_path: str) -> Iterator[bytes]:
+    """Read a file in pieces of SEGMENT_READ_SIZE bytes."""
+    with open(file_path, "rb") as f:
+        while True:
+            data = f.read(SEGMENT_READ_SIZE)
+            if not data:
+                return
+            yield data
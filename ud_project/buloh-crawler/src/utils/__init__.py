@@ -6,8 +6,11 @@ from .helpers import (
     is_curr_year_video,
     download_file,
     upload_s3_file,
+    stream_url_to_s3,
 )
 from .logger import Logger
+from .rate_limiter import get_rate_limiter
+from .media_transfer import get_media_transfer_stage, close_media_transfer_stage
 
 __all__ = [
     "read_cookies",
@@ -16,6 +19,10 @@ __all__ = [
     "is_curr_year_video",
     "download_file",
     "upload_s3_file",
+    "stream_url_to_s3",
+    "get_rate_limiter",
+    "get_media_transfer_stage",
+    "close_media_transfer_stage",
     "Logger",
     "get_env_variable",
 ]
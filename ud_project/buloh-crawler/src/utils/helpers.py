@@ -1,16 +1,20 @@
 import httpx
 import os
+import threading
 import boto3
 
-from typing import Dict, Union
+from typing import Callable, Dict, Iterator, Union
 from datetime import datetime
 from termcolor import cprint
-from io import BytesIO
+from io import BytesIO, IOBase
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 from typing import Optional
 from .logger import Logger
 from .exceptions import http_exception_msg
+from .rate_limiter import get_rate_limiter
 
 load_dotenv()
 
@@ -22,6 +26,22 @@ AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
 AWS_BUCKET_NAME = os.getenv("AWS_BUCKET_NAME")
 AWS_REGION = os.getenv("AWS_REGION")
 
+# Concurrent media transfers, and size of the parts of the multipart S3 uploads
+MEDIA_TRANSFER_CONCURRENCY = int(os.getenv("MEDIA_TRANSFER_CONCURRENCY", "8"))
+S3_MULTIPART_CHUNKSIZE = int(os.getenv("S3_MULTIPART_CHUNKSIZE", str(8 * 1024 * 1024)))
+
+# Process-wide S3 client, boto3 clients are thread safe
+_s3_client = None
+_s3_client_lock = threading.Lock()
+# Buckets checked or created by this process
+_ready_buckets: set = set()
+
+s3_transfer_config = TransferConfig(
+    multipart_threshold=S3_MULTIPART_CHUNKSIZE,
+    multipart_chunksize=S3_MULTIPART_CHUNKSIZE,
+    max_concurrency=2,
+)
+
 
 def send_api_request(
     url: str, headers: Dict[str, str], params: Dict[str, str]
@@ -33,10 +53,13 @@ def send_api_request(
         headers (Dict[str, str]): The request headers.
         params (Dict[str, str]): The query parameters for the request.
 
+    The requests to each host are rate limited by a shared token bucket.
+
     Returns:
         Dict[str, Union[Dict, str]]: The API response or an error message.
     """
     try:
+        get_rate_limiter(url).acquire()
         cprint("Sending API request...", "blue")
         response = httpx.get(url, headers=headers, params=params, timeout=30)
         if response.status_code == 200:
@@ -134,10 +157,160 @@ def generate_presigned_url(bucket_name, object_key, expiration=3600):
         return None
 
 
+def get_s3_client():
+    """Get the process-wide S3 client, created on the first call."""
+    global _s3_client
+
+    with _s3_client_lock:
+        if _s3_client is None:
+            _s3_client = boto3.client(
+                "s3",
+                aws_access_key_id=AWS_ACCESS_KEY,
+                aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+                region_name=AWS_REGION,
+                config=Config(
+                    max_pool_connections=MEDIA_TRANSFER_CONCURRENCY
+                    * s3_transfer_config.max_concurrency,
+                ),
+            )
+        return _s3_client
+
+
+def ensure_s3_bucket(s3_client, bucket_name: str) -> None:
+    """
+    Check the bucket exists, creating it if needed, once per process.
+
+    Raises:
+        RuntimeError: If the bucket cannot be accessed or created
+    """
+    if bucket_name in _ready_buckets:
+        return
+
+    try:
+        s3_client.head_bucket(Bucket=bucket_name)
+    except ClientError as e:
+        error_code = int(e.response["Error"]["Code"])
+        if error_code == 404:
+            try:
+                s3_client.create_bucket(
+                    Bucket=bucket_name,
+                    CreateBucketConfiguration={"LocationConstraint": AWS_REGION},
+                )
+                print(f"Bucket '{bucket_name}' created successfully.")
+            except ClientError as create_error:
+                raise RuntimeError(f"Failed to create bucket: {str(create_error)}")
+        else:
+            raise RuntimeError(f"Error accessing bucket: {str(e)}")
+
+    _ready_buckets.add(bucket_name)
+
+
+def get_s3_key(filename: str, extension: str, folder: Optional[str] = None) -> str:
+    # Construct S3 key
+    s3_key = f"{folder}/{filename}.{extension}" if folder else f"{filename}.{extension}"
+    return s3_key.lstrip("/")  # Remove leading slash if present
+
+
+class ResponseStream:
+    """Read-only file object over the chunks of a streamed HTTP response."""
+
+    def __init__(
+        self,
+        chunks: Iterator[bytes],
+        on_read: Optional[Callable[[int], None]] = None,
+    ) -> None:
+        self.chunks = chunks
+        self.on_read = on_read
+        self.buffer = bytearray()
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self.buffer) < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            self.buffer += chunk
+
+        if size < 0 or size >= len(self.buffer):
+            data = bytes(self.buffer)
+            self.buffer.clear()
+        else:
+            data = bytes(self.buffer[:size])
+            # Drops the read bytes in place, without copying the rest of the buffer
+            del self.buffer[:size]
+
+        if self.on_read is not None:
+            self.on_read(len(data))
+        return data
+
+
+def stream_url_to_s3(
+    url: str,
+    bucket_name: str,
+    filename: str,
+    extension: str,
+    folder: Optional[str] = None,
+    on_read: Optional[Callable[[int], None]] = None,
+) -> str:
+    """
+    Stream a file from a URL to S3 bucket without holding it in memory.
+
+    The response is uploaded as it is downloaded, in multipart parts of
+    S3_MULTIPART_CHUNKSIZE bytes.
+
+    Args:
+        url: URL of the file to download
+        bucket_name: Name of the S3 bucket
+        filename: Name of the file without extension
+        extension: File extension without dot
+        folder: Optional folder path within bucket
+        on_read: Optional callback receiving the number of bytes read
+
+    Returns:
+        str: URL of the uploaded file
+
+    Raises:
+        httpx.HTTPError: If the download fails
+        RuntimeError: If the upload fails
+        ValueError: If input parameters are invalid
+    """
+    # Input validation
+    if not bucket_name or not filename or not extension:
+        raise ValueError("bucket_name, filename, and extension are required")
+
+    s3_client = get_s3_client()
+    ensure_s3_bucket(s3_client, bucket_name)
+    s3_key = get_s3_key(filename, extension, folder)
+
+    with httpx.stream("GET", url, timeout=30) as response:
+        response.raise_for_status()  # Raise an HTTPError for bad responses (4xx, 5xx)
+
+        try:
+            s3_client.upload_fileobj(
+                ResponseStream(response.iter_bytes(), on_read),
+                bucket_name,
+                s3_key,
+                ExtraArgs={
+                    "ContentType": f"application/{extension}"
+                },  # Set appropriate content type
+                Config=s3_transfer_config,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to upload file to S3: {str(e)}")
+
+    log.info(f"File uploaded successfully to S3: {bucket_name}/{s3_key}")
+
+    # Generate URL
+    return s3_client.generate_presigned_url(
+        "get_object",
+        Params={"Bucket": bucket_name, "Key": s3_key},
+        ExpiresIn=3600,  # URL expires in 1 hour
+    )
+
+
 def upload_s3_file(
     bucket_name: str,
     filename: str,
-    data: Union[BytesIO, bytes, str],
+    data: Union[IOBase, bytes, str],
     extension: str,
     folder: Optional[str] = None,
 ) -> str:
@@ -147,7 +320,9 @@ def upload_s3_file(
     Args:
         bucket_name: Name of the S3 bucket
         filename: Name of the file without extension
-        data: File data as BytesIO, bytes, or string
+        data: File data as a binary file object (BytesIO or a file opened
+            in "rb" mode), bytes, or string. Large files are uploaded in
+            multipart parts.
         extension: File extension without dot
         folder: Optional folder path within bucket
 
@@ -163,44 +338,24 @@ def upload_s3_file(
         raise ValueError("bucket_name, filename, and extension are required")
 
     # Convert data to BytesIO if needed
+    file_obj: IOBase
     if isinstance(data, str):
         file_obj = BytesIO(data.encode("utf-8"))
     elif isinstance(data, bytes):
         file_obj = BytesIO(data)
-    elif isinstance(data, BytesIO):
+    elif isinstance(data, IOBase):
         file_obj = data
         file_obj.seek(0)  # Reset file pointer to beginning
     else:
-        raise ValueError("data must be BytesIO, bytes, or str")
-
-    # Initialize S3 client
-    s3_client = boto3.client(
-        "s3",
-        aws_access_key_id=AWS_ACCESS_KEY,
-        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-        region_name=AWS_REGION,
-    )
+        raise ValueError("data must be a binary file object, bytes, or str")
+
+    # Reuse the process-wide S3 client
+    s3_client = get_s3_client()
 
     # Check/create bucket
-    try:
-        s3_client.head_bucket(Bucket=bucket_name)
-    except ClientError as e:
-        error_code = int(e.response["Error"]["Code"])
-        if error_code == 404:
-            try:
-                s3_client.create_bucket(
-                    Bucket=bucket_name,
-                    CreateBucketConfiguration={"LocationConstraint": AWS_REGION},
-                )
-                print(f"Bucket '{bucket_name}' created successfully.")
-            except ClientError as create_error:
-                raise RuntimeError(f"Failed to create bucket: {str(create_error)}")
-        else:
-            raise RuntimeError(f"Error accessing bucket: {str(e)}")
+    ensure_s3_bucket(s3_client, bucket_name)
 
-    # Construct S3 key
-    s3_key = f"{folder}/{filename}.{extension}" if folder else f"{filename}.{extension}"
-    s3_key = s3_key.lstrip("/")  # Remove leading slash if present
+    s3_key = get_s3_key(filename, extension, folder)
 
     # Upload file
     try:
@@ -211,6 +366,7 @@ def upload_s3_file(
             ExtraArgs={
                 "ContentType": f"application/{extension}"
             },  # Set appropriate content type
+            Config=s3_transfer_config,
         )
         log.info(f"File uploaded successfully to S3: {bucket_name}/{s3_key}")
 
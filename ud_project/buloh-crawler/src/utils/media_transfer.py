@@ -0,0 +1,183 @@
+import os
+import threading
+import time
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
+from dotenv import load_dotenv
+from . import helpers
+from .logger import Logger
+
+load_dotenv()
+
+log = Logger(name="MediaTransfer")
+
+# Attempts of each transfer after the first one, and backoff between attempts
+MEDIA_TRANSFER_RETRIES = int(os.getenv("MEDIA_TRANSFER_RETRIES", "2"))
+MEDIA_TRANSFER_BACKOFF = float(os.getenv("MEDIA_TRANSFER_BACKOFF", "1"))
+
+
+class MediaTransferStage:
+    """
+    Stream media files from URLs to S3 on a bounded thread pool.
+
+    Each transfer is retried with exponential backoff, the stage keeps the
+    throughput and queue depth of the transfers for monitoring.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = helpers.MEDIA_TRANSFER_CONCURRENCY,
+        retries: int = MEDIA_TRANSFER_RETRIES,
+        backoff: float = MEDIA_TRANSFER_BACKOFF,
+    ) -> None:
+        self.retries = retries
+        self.backoff = backoff
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="media-transfer"
+        )
+
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._bytes_transferred = 0
+        # Seconds with at least one transfer in flight
+        self._busy_seconds = 0.0
+        self._busy_since: Optional[float] = None
+
+    def submit(
+        self,
+        url: str,
+        bucket_name: str,
+        filename: str,
+        extension: str,
+        folder: Optional[str] = None,
+    ) -> Future:
+        """
+        Queue the transfer of a file from a URL to S3.
+
+        Returns:
+            Future: Future of the URL of the uploaded file, raising RuntimeError
+                if all the attempts failed
+        """
+        with self._lock:
+            self._queued += 1
+        return self.executor.submit(
+            self._transfer, url, bucket_name, filename, extension, folder
+        )
+
+    def _add_bytes(self, n_bytes: int) -> None:
+        with self._lock:
+            self._bytes_transferred += n_bytes
+
+    def _start(self) -> None:
+        with self._lock:
+            self._queued -= 1
+            self._in_flight += 1
+            if self._busy_since is None:
+                self._busy_since = time.monotonic()
+
+    def _finish(self, success: bool) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if success:
+                self._completed += 1
+            else:
+                self._failed += 1
+            if self._in_flight == 0 and self._busy_since is not None:
+                self._busy_seconds += time.monotonic() - self._busy_since
+                self._busy_since = None
+
+    def _transfer(
+        self,
+        url: str,
+        bucket_name: str,
+        filename: str,
+        extension: str,
+        folder: Optional[str],
+    ) -> str:
+        self._start()
+        success = False
+        try:
+            for attempt in range(self.retries + 1):
+                # Only the bytes of the successful attempt are counted as transferred
+                attempt_bytes = 0
+
+                def on_read(n_bytes: int) -> None:
+                    nonlocal attempt_bytes
+                    attempt_bytes += n_bytes
+
+                try:
+                    s3_url = helpers.stream_url_to_s3(
+                        url,
+                        bucket_name=bucket_name,
+                        filename=filename,
+                        extension=extension,
+                        folder=folder,
+                        on_read=on_read,
+                    )
+                except Exception as e:
+                    error = e
+                    if attempt < self.retries:
+                        log.warning(
+                            f"Transfer of {folder}/{filename}.{extension} failed "
+                            f"(attempt {attempt + 1}): {str(e)}. Retrying..."
+                        )
+                        time.sleep(self.backoff * 2**attempt)
+                else:
+                    self._add_bytes(attempt_bytes)
+                    success = True
+                    return s3_url
+
+            raise RuntimeError(
+                f"Failed to transfer {folder}/{filename}.{extension}: {str(error)}"
+            )
+        finally:
+            self._finish(success)
+
+    def stats(self) -> Dict:
+        """Throughput and queue depth of the transfers."""
+        with self._lock:
+            busy_seconds = self._busy_seconds
+            if self._busy_since is not None:
+                busy_seconds += time.monotonic() - self._busy_since
+
+            return {
+                "queue_depth": self._queued,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "failed": self._failed,
+                "bytes_transferred": self._bytes_transferred,
+                "bytes_per_second": (
+                    self._bytes_transferred / busy_seconds if busy_seconds else 0.0
+                ),
+            }
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True)
+
+
+_media_transfer_stage: Optional[MediaTransferStage] = None
+_media_transfer_stage_lock = threading.Lock()
+
+
+def get_media_transfer_stage() -> MediaTransferStage:
+    """Get the process-wide media transfer stage, created on the first call."""
+    global _media_transfer_stage
+
+    with _media_transfer_stage_lock:
+        if _media_transfer_stage is None:
+            _media_transfer_stage = MediaTransferStage()
+        return _media_transfer_stage
+
+
+def close_media_transfer_stage() -> None:
+    """Wait for the queued transfers and stop the process-wide stage."""
+    global _media_transfer_stage
+
+    with _media_transfer_stage_lock:
+        if _media_transfer_stage is not None:
+            _media_transfer_stage.shutdown()
+            _media_transfer_stage = None
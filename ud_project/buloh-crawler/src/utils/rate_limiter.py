@@ -0,0 +1,69 @@
+import os
+import threading
+import time
+
+from typing import Dict
+from urllib.parse import urlparse
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Requests per second allowed to each API host, and burst of requests allowed at once
+API_REQUESTS_PER_SECOND = float(os.getenv("API_REQUESTS_PER_SECOND", "2"))
+API_REQUESTS_BURST = float(os.getenv("API_REQUESTS_BURST", "4"))
+
+
+class TokenBucket:
+    """
+    Thread safe token bucket rate limiter.
+
+    Tokens are added at `rate` per second up to `capacity`. A caller takes its
+    tokens right away and waits for them if the bucket is short, so the callers
+    are served in the order they arrived.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Wait until the tokens are available.
+
+        Returns:
+            float: Seconds waited
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= tokens
+            wait = max(0.0, -self._tokens / self.rate)
+
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+_rate_limiters: Dict[str, TokenBucket] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(url: str) -> TokenBucket:
+    """Get the rate limiter shared by all the requests to the host of url."""
+    host = urlparse(url).netloc or url
+
+    with _rate_limiters_lock:
+        rate_limiter = _rate_limiters.get(host)
+        if rate_limiter is None:
+            rate_limiter = TokenBucket(API_REQUESTS_PER_SECOND, API_REQUESTS_BURST)
+            _rate_limiters[host] = rate_limiter
+        return rate_limiter
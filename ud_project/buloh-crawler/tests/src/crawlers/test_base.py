@@ -149,18 +149,18 @@ class TestVideoCrawler:
         mock_send_api_request.assert_called_once()
 
     @patch("src.crawlers.base.MongoDBClient")  # Replace with actual import path
-    @patch("src.crawlers.base.helpers.download_file")  # Replace with actual import path
+    @patch("src.utils.helpers.stream_url_to_s3")
     def test_save_videos_to_db(
-        self, mock_download_file, mock_mongodb_client, video_crawler
+        self, mock_stream_url_to_s3, mock_mongodb_client, video_crawler
     ):
         """Test save_videos_to_db method"""
         # Mock MongoDB client and its methods
         mock_db = MagicMock()
         mock_mongodb_client.return_value.__enter__.return_value = mock_db
-        mock_db["video"].find_one.return_value = None  # No existing video
+        mock_db["video"].distinct.return_value = []  # No existing video
 
-        # Mock file download and upload
-        mock_download_file.return_value = b"test_video_data"
+        # Mock streamed upload
+        mock_stream_url_to_s3.side_effect = lambda url, **kwargs: f"s3_{url}"
 
         # Prepare video list
         video_list = [
@@ -179,8 +179,72 @@ class TestVideoCrawler:
             video_crawler.save_videos_to_db(video_list, "test_type", 1)
 
         # Assertions
-        mock_db["video"].insert_one.assert_called_once()
-        mock_download_file.assert_called()
+        mock_db["video"].insert_many.assert_called_once()
+        assert mock_db["video"].insert_many.call_args.kwargs == {"ordered": False}
+        inserted_video = mock_db["video"].insert_many.call_args.args[0][0]
+        assert inserted_video["play"] == "s3_video_url"
+        assert inserted_video["cover"] == "s3_cover_url"
+        assert mock_stream_url_to_s3.call_count == 2
+
+    @patch("src.crawlers.base.MongoDBClient")
+    @patch("src.utils.helpers.stream_url_to_s3")
+    def test_save_videos_to_db_skips_existing_videos(
+        self, mock_stream_url_to_s3, mock_mongodb_client, video_crawler
+    ):
+        """Test save_videos_to_db prefetches existing videos with one query"""
+        mock_db = MagicMock()
+        mock_mongodb_client.return_value.__enter__.return_value = mock_db
+        mock_db["video"].distinct.return_value = ["video_1"]
+        mock_stream_url_to_s3.return_value = "s3_url"
+
+        video_list = [
+            {"id": video_id, "region": region, "play": "url", "cover": "url"}
+            for video_id, region in [
+                ("video_1", "MY"),
+                ("video_2", "MY"),
+                ("video_2", "MY"),
+                ("video_3", "US"),
+            ]
+        ]
+
+        with patch("builtins.print"), patch("src.crawlers.base.log.info"):
+            video_crawler.save_videos_to_db(video_list, "test_type", 1)
+
+        mock_db["video"].distinct.assert_called_once_with(
+            "video_id", {"video_id": {"$in": ["video_1", "video_2"]}, "request_id": 1}
+        )
+        inserted_videos = mock_db["video"].insert_many.call_args.args[0]
+        assert [video["video_id"] for video in inserted_videos] == ["video_2"]
+
+    @patch("src.utils.media_transfer.time.sleep")
+    @patch("src.crawlers.base.MongoDBClient")
+    @patch("src.utils.helpers.stream_url_to_s3")
+    def test_save_videos_to_db_stores_uploaded_videos_on_failure(
+        self, mock_stream_url_to_s3, mock_mongodb_client, mock_sleep, video_crawler
+    ):
+        """Test save_videos_to_db stores the other videos when a transfer fails"""
+        mock_db = MagicMock()
+        mock_mongodb_client.return_value.__enter__.return_value = mock_db
+        mock_db["video"].distinct.return_value = []
+
+        def stream_url_to_s3(url, **kwargs):
+            if url == "broken_url":
+                raise RuntimeError("Download failed")
+            return f"s3_{url}"
+
+        mock_stream_url_to_s3.side_effect = stream_url_to_s3
+
+        video_list = [
+            {"id": "video_1", "region": "MY", "play": "broken_url", "cover": "url"},
+            {"id": "video_2", "region": "MY", "play": "url", "cover": "url"},
+        ]
+
+        with patch("builtins.print"), patch("src.crawlers.base.log"):
+            with pytest.raises(RuntimeError, match="1 video transfers failed"):
+                video_crawler.save_videos_to_db(video_list, "test_type", 1)
+
+        inserted_videos = mock_db["video"].insert_many.call_args.args[0]
+        assert [video["video_id"] for video in inserted_videos] == ["video_2"]
 
     def test_headers_initialization(self, video_crawler):
         """Test headers initialization"""
@@ -60,7 +60,7 @@ def mock_setup_events():
 
 @pytest.fixture
 def mock_run_client():
-    with patch("src.modules.live_tiktok_comment_crawler.run_client_in_thread") as mock:
+    with patch("src.modules.live_tiktok_comment_crawler.supervise_client") as mock:
         yield mock
 
 
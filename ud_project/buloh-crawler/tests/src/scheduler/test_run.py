@@ -0,0 +1,54 @@
+import threading
+import pytest
+
+from unittest.mock import patch
+from src.scheduler.run import crawl_concurrently, start_crawl
+
+
+def test_crawl_concurrently_runs_inputs_in_parallel():
+    """Test crawl_concurrently crawls the inputs at the same time."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def crawl(keyword, request_id):
+        barrier.wait()  # Only passes if the 3 crawls run concurrently
+        return [{"video_id": f"{keyword}_{request_id}"}]
+
+    videos = crawl_concurrently(crawl, ["a", "b", "c"], 1, max_workers=3)
+
+    assert sorted(video["video_id"] for video in videos) == ["a_1", "b_1", "c_1"]
+
+
+def test_crawl_concurrently_raises_after_other_crawls():
+    """Test a failed crawl does not stop the other crawls."""
+    crawled = []
+
+    def crawl(keyword, request_id):
+        if keyword == "broken":
+            raise RuntimeError("API down")
+        crawled.append(keyword)
+        return []
+
+    with patch("src.scheduler.run.Logger"):
+        with pytest.raises(RuntimeError, match="API down"):
+            crawl_concurrently(crawl, ["broken", "a", "b"], 1, max_workers=1)
+
+    assert crawled == ["a", "b"]
+
+
+@patch("src.scheduler.run.trigger_fastapi", return_value=True)
+@patch("src.scheduler.run.crawl_username")
+def test_start_crawl_triggers_after_all_usernames(
+    mock_crawl_username, mock_trigger_fastapi
+):
+    """Test start_crawl crawls every username, then triggers the processes."""
+    mock_crawl_username.return_value = []
+
+    with patch("src.scheduler.run.Logger"):
+        start_crawl("username", ["user_1, user_2", "user_3"], request_id=1)
+
+    crawled_usernames = sorted(
+        call.args[0] for call in mock_crawl_username.call_args_list
+    )
+    assert crawled_usernames == ["user_1", "user_2", "user_3"]
+    assert mock_trigger_fastapi.call_count == 3
+    assert mock_trigger_fastapi.call_args_list[-1].args[0].endswith("/Haraz")
@@ -102,13 +102,13 @@ mocked_comment_data_3 = {
 @patch("src.modules.live_tiktok_comment_crawler.is_user_in_live")
 @patch("src.modules.live_tiktok_comment_crawler.create_tiktok_client")
 @patch("src.modules.live_tiktok_comment_crawler.setup_client_events")
-@patch("src.modules.live_tiktok_comment_crawler.run_client_in_thread")
+@patch("src.modules.live_tiktok_comment_crawler.supervise_client")
 @patch("src.modules.live_tiktok_comment_crawler.comment_stream")
 @patch("asyncio.Queue")
 def test_start_live_comment_streaming_success(
     mock_Queue,
     mock_comment_stream,
-    mock_run_client_in_thread,
+    mock_supervise_client,
     mock_setup_client_events,
     mock_create_tiktok_client,
     mock_is_user_in_live,
@@ -152,8 +152,8 @@ def test_start_live_comment_streaming_success(
         room_id,
         active_comment_sessions,
     )
-    mock_run_client_in_thread.assert_called_once_with(
-        mock_tiktok_client, user_id, username, active_comment_sessions
+    mock_supervise_client.assert_called_once_with(
+        mock_tiktok_client, user_id, username, room_id
     )
     mock_comment_stream.assert_called_once()
 
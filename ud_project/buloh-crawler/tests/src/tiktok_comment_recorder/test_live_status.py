@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+from unittest.mock import AsyncMock, patch
+from src.tiktok_comment_recorder import live_status
+from src.tiktok_comment_recorder.base import comment_stream
+from src.tiktok_comment_recorder.live_status import (
+    LiveStatusMonitor,
+    acquire_live_monitor,
+    release_live_monitor,
+    is_room_live,
+)
+
+
+@patch("src.tiktok_comment_recorder.live_status.is_user_in_live", return_value=True)
+def test_live_monitor_is_shared_and_checked_once(mock_is_user_in_live):
+    """Test the rooms are checked by one monitor, not on every read."""
+    monitor = acquire_live_monitor("room_1")
+    assert acquire_live_monitor("room_1") is monitor
+
+    assert all(is_room_live("room_1") for _ in range(100))
+    mock_is_user_in_live.assert_called_once_with("room_1")
+
+    monitor.mark_ended()
+    assert not is_room_live("room_1")
+
+    release_live_monitor("room_1")
+    release_live_monitor("room_1")
+    # Rooms which are not monitored are considered live
+    assert is_room_live("room_1")
+
+
+@patch(
+    "src.tiktok_comment_recorder.live_status.is_user_in_live",
+    side_effect=RuntimeError("Webcast API down"),
+)
+def test_live_monitor_ends_after_consecutive_failed_checks(mock_is_user_in_live):
+    """Test a room only ends after max_failures consecutive failed checks."""
+    monitor = LiveStatusMonitor("room_2", max_failures=3)
+
+    assert monitor.check() is True
+    mock_is_user_in_live.side_effect = None
+    mock_is_user_in_live.return_value = True
+    assert monitor.check() is True
+    assert monitor.failed_checks == 0
+
+    mock_is_user_in_live.side_effect = RuntimeError("Webcast API down")
+    assert [monitor.check() for _ in range(3)] == [True, True, False]
+    assert monitor.is_live is False
+
+
+@patch(
+    "src.tiktok_comment_recorder.live_status.is_user_in_live",
+    side_effect=lambda room_id: not live_status._monitors_lock.locked(),
+)
+def test_live_monitor_first_check_runs_outside_lock(mock_is_user_in_live):
+    """Test the first check of a room does not hold the lock of the monitors."""
+    monitor = acquire_live_monitor("room_4")
+    release_live_monitor("room_4")
+
+    assert monitor.is_live is True
+
+
+@patch("src.tiktok_comment_recorder.base.disconnect_client", new_callable=AsyncMock)
+@patch("src.tiktok_comment_recorder.live_status.is_user_in_live", return_value=True)
+def test_comment_stream_sends_comments_in_batches(
+    mock_is_user_in_live, mock_disconnect_client
+):
+    """Test the waiting comments are sent in one chunk, then the stream stops."""
+    sessions = {"user_1": ["username_1"]}
+
+    async def collect_chunks():
+        comments = asyncio.Queue()
+        for comment_id in range(3):
+            comments.put_nowait({"id": comment_id})
+        comments.put_nowait({"stop": True})
+
+        return [
+            chunk
+            async for chunk in comment_stream(
+                None, comments, "user_1", "username_1", "room_3", sessions, "start"
+            )
+        ]
+
+    chunks = asyncio.run(collect_chunks())
+
+    assert chunks[0] == "".join(
+        f"data: {json.dumps({'id': comment_id})}\n\n" for comment_id in range(3)
+    )
+    assert (
+        chunks[1] == f"data: {json.dumps({'message': 'Live session has ended.'})}\n\n"
+    )
+    assert "Stream comments stopped successfully" in chunks[2]
+    mock_is_user_in_live.assert_called_once_with("room_3")
+    mock_disconnect_client.assert_awaited_once()
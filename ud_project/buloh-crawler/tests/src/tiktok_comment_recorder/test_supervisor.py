@@ -0,0 +1,90 @@
+import asyncio
+import time
+from typing import Callable, Dict
+import pytest
+
+from src.tiktok_comment_recorder.supervisor import LiveRoomSupervisor
+
+
+class FakeLiveClient:
+    """Client failing its first connections, then connected until disconnected."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.connections = 0
+        self.connected = False
+        self.handlers: Dict[type, Callable] = {}
+        self._disconnected = None
+
+    def on(self, event):
+        def decorator(handler):
+            self.handlers[event] = handler
+            return handler
+
+        return decorator
+
+    async def connect(self, **kwargs):
+        self.connections += 1
+        if self.connections <= self.failures:
+            raise ConnectionError("Connection closed unexpectedly")
+
+        self.connected = True
+        self._disconnected = asyncio.Event()
+        await self._disconnected.wait()
+
+    async def disconnect(self):
+        self.connected = False
+        self._disconnected.set()
+
+
+def wait_until(condition, timeout: float = 5.0) -> None:
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "Condition not met in time"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def supervisor():
+    supervisor = LiveRoomSupervisor(max_rooms=2, max_reconnects=3, backoff=0.01)
+    yield supervisor
+    supervisor.shutdown()
+
+
+def test_supervisor_reconnects_with_backoff(supervisor):
+    """Test a room is reconnected after failed connections."""
+    client = FakeLiveClient(failures=2)
+    supervisor.add_room(client, "user_1", "username_1", "1001")
+
+    wait_until(lambda: client.connected)
+
+    status = supervisor.status()
+    assert status["rooms"] == 1
+    assert status["live_rooms"][0]["reconnects"] == 2
+    assert status["live_rooms"][0]["last_error"] == "Connection closed unexpectedly"
+
+
+def test_supervisor_gives_up_after_max_reconnects(supervisor):
+    """Test a room failing every connection is stopped."""
+    client = FakeLiveClient(failures=100)
+    supervisor.add_room(client, "user_1", "username_1", "1001")
+
+    wait_until(lambda: supervisor.status()["rooms"] == 0)
+    assert client.connections == 4  # First connection and 3 reconnections
+
+
+def test_supervisor_limits_rooms_and_removes_clients(supervisor):
+    """Test the supervisor capacity and the removal of a room."""
+    clients = [FakeLiveClient() for _ in range(2)]
+    for idx, client in enumerate(clients):
+        supervisor.add_room(client, "user_1", f"username_{idx}", str(idx))
+
+    with pytest.raises(RuntimeError, match="full"):
+        supervisor.add_room(FakeLiveClient(), "user_1", "username_2", "2")
+
+    wait_until(lambda: clients[0].connected)
+    supervisor.remove_client(clients[0]).result(timeout=5)
+
+    wait_until(lambda: not supervisor.is_supervised(clients[0]))
+    assert clients[0].connections == 1
+    assert supervisor.status()["rooms"] == 1
@@ -0,0 +1,53 @@
+import shutil
+import subprocess
+import pytest
+
+from src.tiktok_live_recorder.segmenter import StreamSegmenter, read_file_chunks
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None, reason="FFmpeg is not installed"
+)
+
+
+@pytest.fixture
+def flv_stream(tmp_path):
+    """7 seconds of FLV with a keyframe every second."""
+    flv_file = tmp_path / "stream.flv"
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-loglevel",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            "testsrc=size=320x240:rate=25",
+            "-t",
+            "7",
+            "-c:v",
+            "libx264",
+            "-g",
+            "25",
+            "-f",
+            "flv",
+            str(flv_file),
+        ],
+        check=True,
+    )
+    return flv_file.read_bytes()
+
+
+def test_stream_segmenter_yields_segments_as_they_close(tmp_path, flv_stream):
+    """Test StreamSegmenter lists the segments while the stream is written."""
+    segmenter = StreamSegmenter(str(tmp_path), "user_vid", 2, start_number=3)
+
+    closed_while_streaming = []
+    for i in range(0, len(flv_stream), 4096):
+        segmenter.write(flv_stream[i : i + 4096])
+        closed_while_streaming += segmenter.pop_closed_segments()
+    segments = closed_while_streaming + segmenter.close()
+
+    assert segments == [
+        str(tmp_path / f"user_vid{number}.mp4") for number in range(3, 7)
+    ]
+    assert all(b"".join(read_file_chunks(segment)) for segment in segments)
@@ -0,0 +1,153 @@
+import boto3
+import pytest
+
+from unittest.mock import patch, MagicMock
+from moto import mock_aws
+from src.utils import helpers
+from src.utils.helpers import ResponseStream, stream_url_to_s3
+from src.utils.media_transfer import MediaTransferStage
+
+
+@pytest.fixture
+def s3_bucket(monkeypatch):
+    """Empty S3 bucket mocked with moto, used through a new shared client."""
+    monkeypatch.setattr(helpers, "AWS_REGION", "ap-southeast-1")
+    monkeypatch.setattr(helpers, "AWS_ACCESS_KEY", "testing")
+    monkeypatch.setattr(helpers, "AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setattr(helpers, "_s3_client", None)
+    monkeypatch.setattr(helpers, "_ready_buckets", set())
+
+    with mock_aws():
+        yield boto3.client(
+            "s3",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+            region_name="ap-southeast-1",
+        )
+
+
+def mock_stream_response(chunks):
+    """Mock of the context manager returned by httpx.stream."""
+    mock_response = MagicMock()
+    mock_response.iter_bytes.return_value = iter(chunks)
+    mock_stream = MagicMock()
+    mock_stream.__enter__.return_value = mock_response
+    return mock_stream
+
+
+def test_stream_url_to_s3_multipart_upload(s3_bucket, monkeypatch):
+    """Test stream_url_to_s3 uploads the streamed chunks in multipart parts."""
+    chunk_size = 5 * 1024 * 1024  # Minimum size of S3 parts
+    chunks = [b"a" * (1024 * 1024)] * 11
+    monkeypatch.setattr(
+        helpers,
+        "s3_transfer_config",
+        helpers.TransferConfig(
+            multipart_threshold=chunk_size, multipart_chunksize=chunk_size
+        ),
+    )
+    read_bytes = []
+
+    with patch(
+        "src.utils.helpers.httpx.stream", return_value=mock_stream_response(chunks)
+    ):
+        url = stream_url_to_s3(
+            "https://example.com/video",
+            bucket_name="test-bucket",
+            filename="video_1",
+            extension="mp4",
+            folder="videos",
+            on_read=read_bytes.append,
+        )
+
+    obj = s3_bucket.get_object(Bucket="test-bucket", Key="videos/video_1.mp4")
+    assert obj["Body"].read() == b"".join(chunks)
+    assert obj["ContentType"] == "application/mp4"
+    # Uploaded in 3 parts
+    assert obj["ETag"].strip('"').endswith("-3")
+    assert sum(read_bytes) == 11 * 1024 * 1024
+    assert "videos/video_1.mp4" in url
+
+
+def test_response_stream_read():
+    """Test ResponseStream reads the chunks by size, across chunk boundaries."""
+    read_bytes = []
+    stream = ResponseStream(iter([b"abc", b"defg", b"h"]), on_read=read_bytes.append)
+
+    assert stream.read(2) == b"ab"
+    assert stream.read(4) == b"cdef"
+    assert stream.read() == b"gh"
+    assert stream.read(1) == b""
+    assert read_bytes == [2, 4, 2, 0]
+
+
+def test_media_transfer_stage_retries_failed_transfers(s3_bucket):
+    """Test MediaTransferStage retries a transfer and records its stats."""
+    responses = [
+        RuntimeError("Connection reset"),
+        mock_stream_response([b"cover", b"data"]),
+    ]
+
+    def stream(*args, **kwargs):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    stage = MediaTransferStage(max_workers=2, retries=1, backoff=0)
+    with patch("src.utils.helpers.httpx.stream", side_effect=stream):
+        stage.submit(
+            "https://example.com/cover", "test-bucket", "video_1", "jpg", "covers"
+        ).result()
+    stage.shutdown()
+
+    obj = s3_bucket.get_object(Bucket="test-bucket", Key="covers/video_1.jpg")
+    assert obj["Body"].read() == b"coverdata"
+
+    stats = stage.stats()
+    assert stats["completed"] == 1
+    assert stats["failed"] == 0
+    assert stats["queue_depth"] == 0
+    assert stats["in_flight"] == 0
+    assert stats["bytes_transferred"] == len(b"coverdata")
+
+
+def test_media_transfer_stage_counts_bytes_of_successful_attempt():
+    """Test the bytes read by an interrupted attempt are not counted as transferred."""
+    attempts = []
+
+    def stream_url_to_s3(url, on_read, **kwargs):
+        attempts.append(url)
+        on_read(7)
+        if len(attempts) == 1:
+            raise RuntimeError("Connection reset")
+        on_read(2)
+        return "https://bucket/video_1.mp4"
+
+    stage = MediaTransferStage(max_workers=1, retries=1, backoff=0)
+    with patch(
+        "src.utils.media_transfer.helpers.stream_url_to_s3",
+        side_effect=stream_url_to_s3,
+    ):
+        stage.submit("https://example.com/video", "bucket", "video_1", "mp4").result()
+    stage.shutdown()
+
+    assert len(attempts) == 2
+    assert stage.stats()["bytes_transferred"] == 9
+
+
+def test_media_transfer_stage_raises_after_retries():
+    """Test MediaTransferStage raises RuntimeError once all attempts failed."""
+    stage = MediaTransferStage(max_workers=1, retries=2, backoff=0)
+
+    with patch(
+        "src.utils.media_transfer.helpers.stream_url_to_s3",
+        side_effect=RuntimeError("Download failed"),
+    ) as mock_stream_url_to_s3:
+        future = stage.submit("https://example.com/video", "bucket", "video_1", "mp4")
+        with pytest.raises(RuntimeError, match="Failed to transfer"):
+            future.result()
+    stage.shutdown()
+
+    assert mock_stream_url_to_s3.call_count == 3
+    assert stage.stats()["failed"] == 1
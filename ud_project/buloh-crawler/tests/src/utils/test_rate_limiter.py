@@ -0,0 +1,38 @@
+from unittest.mock import patch
+from src.utils.rate_limiter import TokenBucket, get_rate_limiter
+
+
+def test_token_bucket_allows_burst_then_waits():
+    """Test TokenBucket lets the burst through and spaces later requests."""
+    with patch("src.utils.rate_limiter.time.monotonic", return_value=100.0), patch(
+        "src.utils.rate_limiter.time.sleep"
+    ) as mock_sleep:
+        bucket = TokenBucket(rate=2, capacity=2)
+        waits = [bucket.acquire() for _ in range(4)]
+
+    assert waits == [0.0, 0.0, 0.5, 1.0]
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+
+
+def test_token_bucket_refills_over_time():
+    """Test TokenBucket refills up to its capacity."""
+    with patch("src.utils.rate_limiter.time.monotonic") as mock_monotonic, patch(
+        "src.utils.rate_limiter.time.sleep"
+    ):
+        mock_monotonic.return_value = 0.0
+        bucket = TokenBucket(rate=1, capacity=2)
+        bucket.acquire(2)
+
+        mock_monotonic.return_value = 10.0
+        assert bucket.acquire(2) == 0.0
+        assert bucket.acquire() == 1.0
+
+
+def test_get_rate_limiter_is_shared_per_host():
+    """Test the requests to one host share a rate limiter."""
+    limiter = get_rate_limiter("https://tiktok-scraper7.p.rapidapi.com/feed/search")
+
+    assert limiter is get_rate_limiter(
+        "https://tiktok-scraper7.p.rapidapi.com/user/posts"
+    )
+    assert limiter is not get_rate_limiter("https://example.com/api")
@@ -1,10 +1,13 @@
 """Agent endpoint module."""
 
-from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.api.endpoints.functions import agent_function
+from app.core.constants import DEFAULT_CONTENT_PAGE_SIZE, MAX_CONTENT_PAGE_SIZE
 from app.core.dependencies import get_db
+from app.enums.content_sort import ContentSort
+from app.enums.sort_order import SortOrder
 from app.models.schemas.agent_schema import AgentCreate
 from app.models.schemas.start_agent_builder_schema import StartAgentBuilderSchema
 from app.models.update_model.agent_update import AgentUpdate
@@ -45,9 +48,27 @@ def get_agent_crawler_preview(agent_id: int, db: Session = Depends(get_db)) -> d
 
 
 @agent_module.get("/{agent_id}/content-list")
-def get_agent_content_list(agent_id: int, db: Session = Depends(get_db)) -> dict:
-    """Get content list of a specific agent by ID."""
-    return agent_function.get_agent_content_list(agent_id=agent_id, db=db)
+def get_agent_content_list(  # noqa: PLR0913
+    agent_id: int,
+    cursor: str | None = None,  # noqa: FA102
+    limit: int = Query(DEFAULT_CONTENT_PAGE_SIZE, ge=1, le=MAX_CONTENT_PAGE_SIZE),
+    sort: ContentSort = ContentSort.DATE,
+    order: SortOrder = SortOrder.DESC,
+    risk: str | None = None,  # noqa: FA102
+    social_media: str | None = None,  # noqa: FA102
+    db: Session = Depends(get_db),
+) -> dict:
+    """Get a page of the content list of a specific agent by ID."""
+    return agent_function.get_agent_content_list(
+        agent_id=agent_id,
+        db=db,
+        cursor=cursor,
+        limit=limit,
+        sort=sort,
+        order=order,
+        risk=risk,
+        social_media=social_media,
+    )
 
 
 @agent_module.post("/{agent_id}/start-agent-builder")
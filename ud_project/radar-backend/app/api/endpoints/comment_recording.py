@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from app.api.endpoints.functions.comment_recording_function import (
+    get_comment_buffer_status,
     start_comment_recording,
     stop_comment_recording,
 )
@@ -31,3 +32,9 @@ async def stop_comments(
 ) -> dict:
     """Stop recording comments for a live stream."""
     return await stop_comment_recording(username, user_id, live_db)
+
+
+@comment_router.get("/buffer_status/")
+async def get_buffer_status() -> dict:
+    """Get the ingest and flush metrics of the comments buffered per stream and in total."""
+    return get_comment_buffer_status()
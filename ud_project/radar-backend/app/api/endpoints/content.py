@@ -1,9 +1,11 @@
 """Content endpoints."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api.endpoints.functions import content_function
+from app.core.constants import MAX_CONTENT_PAGE_SIZE
 from app.core.dependencies import get_db
 
 content_module = APIRouter()
@@ -20,7 +22,11 @@ def get_content_details(
 
 @content_module.get("/all")
 def get_all_content_details(
-    db: Session = Depends(get_db),
-) -> dict:
-    """Retrieve all content details."""
-    return content_function.get_all_content_details(db)
+    cursor: int | None = None,  # noqa: FA102
+    limit: int | None = Query(None, ge=1, le=MAX_CONTENT_PAGE_SIZE),  # noqa: FA102
+) -> StreamingResponse:
+    """Stream a page of the content details, or every content details without a limit."""
+    return StreamingResponse(
+        content_function.stream_all_content_details(cursor=cursor, limit=limit),
+        media_type="application/json",
+    )
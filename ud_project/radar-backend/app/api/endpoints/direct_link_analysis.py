@@ -4,13 +4,21 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
 from app.api.endpoints.functions import direct_link_analysis_function
+from app.core.constants import (
+    DEFAULT_CONTENT_PAGE_SIZE,
+    DEFAULT_SIMILAR_CONTENT_LIMIT,
+    MAX_CONTENT_PAGE_SIZE,
+    MAX_SIMILAR_CONTENT_LIMIT,
+)
 from app.core.dependencies import get_db
+from app.enums.content_sort import ContentSort
+from app.enums.sort_order import SortOrder
 from app.models.schemas.direct_link_analysis_schema import DirectLinkAnalysisRequest  # noqa: TCH001
 
 direct_link_analysis_module = APIRouter()
@@ -55,14 +63,26 @@ def get_content_details(db: Session = Depends(get_db)) -> dict:
 
 
 @direct_link_analysis_module.get("/agent-content-list/{agent_name}")
-def get_agent_content_list(
+def get_agent_content_list(  # noqa: PLR0913
     agent_name: str = "",
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_CONTENT_PAGE_SIZE, ge=1, le=MAX_CONTENT_PAGE_SIZE),
+    sort: ContentSort = ContentSort.DATE,
+    order: SortOrder = SortOrder.DESC,
+    risk: str | None = None,
+    social_media: str | None = None,
     db: Session = Depends(get_db),
 ) -> dict:
-    """Retrieve a list of content associated with a specific agent.
+    """Retrieve a page of the content associated with a specific agent.
 
     Args:
         agent_name (str): The name of the agent for which to retrieve the content list.
+        cursor (str | None): The next_cursor of the previous page, None for the first page.
+        limit (int): The number of content in the page.
+        sort (ContentSort): The field to sort the content by.
+        order (SortOrder): The sort order.
+        risk (str | None): The risk status to filter the content by.
+        social_media (str | None): The social media to filter the content by.
         db (Session): The database session dependency.
 
     Returns:
@@ -72,21 +92,52 @@ def get_agent_content_list(
     return direct_link_analysis_function.get_agent_content_list(
         agent_name=agent_name,
         db=db,
+        cursor=cursor,
+        limit=limit,
+        sort=sort,
+        order=order,
+        risk=risk,
+        social_media=social_media,
     )
 
 
 @direct_link_analysis_module.get("/content-list")
-def get_content_list(db: Session = Depends(get_db)) -> dict:
-    """Retrieve a list of content from the database.
+def get_content_list(  # noqa: PLR0913
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_CONTENT_PAGE_SIZE, ge=1, le=MAX_CONTENT_PAGE_SIZE),
+    sort: ContentSort = ContentSort.DATE,
+    order: SortOrder = SortOrder.DESC,
+    risk: str | None = None,
+    status: str | None = None,
+    social_media: str | None = None,
+    db: Session = Depends(get_db),
+) -> dict:
+    """Retrieve a page of the content from the database.
 
     Args:
+        cursor (str | None): The next_cursor of the previous page, None for the first page.
+        limit (int): The number of content in the page.
+        sort (ContentSort): The field to sort the content by.
+        order (SortOrder): The sort order.
+        risk (str | None): The risk status to filter the content by.
+        status (str | None): The direct link analysis status to filter the content by.
+        social_media (str | None): The social media to filter the content by.
         db (Session): The database session dependency.
 
     Returns:
         dict: A dictionary containing the list of content.
 
     """
-    return direct_link_analysis_function.get_content_list(db=db)
+    return direct_link_analysis_function.get_content_list(
+        db=db,
+        cursor=cursor,
+        limit=limit,
+        sort=sort,
+        order=order,
+        risk=risk,
+        status=status,
+        social_media=social_media,
+    )
 
 
 @direct_link_analysis_module.get("/agent-list")
@@ -106,12 +157,18 @@ def get_agent_list(db: Session = Depends(get_db)) -> list:
 @direct_link_analysis_module.get("/similar-content/{case_id}")
 def get_similar_content(
     case_id: str,
+    limit: int = Query(
+        DEFAULT_SIMILAR_CONTENT_LIMIT,
+        ge=1,
+        le=MAX_SIMILAR_CONTENT_LIMIT,
+    ),
     db: Session = Depends(get_db),
 ) -> dict:
     """Retrieve similar content for a given case ID.
 
     Args:
         case_id (str): The unique identifier of the case for which similar content is to be retrieved.
+        limit (int): The number of similar content to retrieve.
         db (Session): The database session dependency.
 
     Returns:
@@ -121,4 +178,5 @@ def get_similar_content(
     return direct_link_analysis_function.get_similar_content(
         identification_id=case_id,
         db=db,
+        limit=limit,
     )
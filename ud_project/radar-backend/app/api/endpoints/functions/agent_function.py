@@ -9,10 +9,22 @@ from fastapi import BackgroundTasks, HTTPException
 from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 
+from app.api.endpoints.functions.content_list_function import (
+    content_filters,
+    first_topic_name,
+    mapped_content_query,
+    paginate_content,
+)
 from app.api.endpoints.functions.preprocessed_data_function import get_preprocessed_data
-from app.core.constants import DEFAULT_CRAWLER_URL_FOR_AI_AGENT, SUCCESS_CODE
+from app.core.constants import (
+    DEFAULT_CONTENT_PAGE_SIZE,
+    DEFAULT_CRAWLER_URL_FOR_AI_AGENT,
+    SUCCESS_CODE,
+)
 from app.core.dependencies import get_db
 from app.enums.agent_status import AgentStatus
+from app.enums.content_sort import ContentSort
+from app.enums.sort_order import SortOrder
 from app.models.agent_table import Agent
 from app.models.analysis_output_table import AnalysisOutput
 from app.models.category_table import Category
@@ -25,8 +37,6 @@ from app.models.schemas.agent_schema import AgentCreate
 from app.models.schemas.start_agent_builder_schema import StartAgentBuilderSchema
 from app.models.sub_category_table import SubCategory
 from app.models.tags_table import Tags
-from app.models.topic_category_table import TopicCategory
-from app.models.topic_keywords_details_table import TopicKeywordsDetails
 from app.models.update_model.agent_update import AgentUpdate
 from utils.logger import Logger
 
@@ -286,87 +296,73 @@ def start_agent_builder(start_agent_data: StartAgentBuilderSchema, db: Session)
     return {"message": "Agent builder started successfully"}
 
 
-def get_agent_content_list(agent_id: int, db: Session) -> dict:
-    """Get content list of a specific agent by ID."""
-    agent_data = db.query(Agent).filter(Agent.id == agent_id).first()
+def get_agent_content_list(  # noqa: PLR0913
+    agent_id: int,
+    db: Session,
+    cursor: str | None = None,  # noqa: FA102
+    limit: int = DEFAULT_CONTENT_PAGE_SIZE,
+    sort: ContentSort = ContentSort.DATE,
+    order: SortOrder = SortOrder.DESC,
+    risk: str | None = None,  # noqa: FA102
+    social_media: str | None = None,  # noqa: FA102
+) -> dict:
+    """Get a page of the content list of a specific agent by ID."""
+    agent_data = db.query(Agent.id).filter(Agent.id == agent_id).first()
     if not agent_data:
         raise HTTPException(
             status_code=404,
             detail=f"Agent with ID {agent_id} not found.",
         )
-    map_data = [
-        entry.preprocessed_unbiased_id
-        for entry in db.query(MapAgentsPreprocessedUnbiased)
-        .filter(
-            MapAgentsPreprocessedUnbiased.agent_id == agent_id,
-            MapAgentsPreprocessedUnbiased.deleted_at.is_(None),
-        )
-        .all()
-    ]
 
-    preprocessed_data = (
-        db.query(PreprocessedUnbiased)
-        .filter(PreprocessedUnbiased.id.in_(map_data))
-        .all()
-    )
-    result = []
-    for video in preprocessed_data:
-        analysis_output = (
-            db.query(
-                AnalysisOutput.category_id,
-                AnalysisOutput.sub_category_id,
+    query = (
+        mapped_content_query(
+            db,
+            [
+                PreprocessedUnbiased.video_id,
+                PreprocessedUnbiased.user_handle,
+                PreprocessedUnbiased.video_posted_timestamp,
+                PreprocessedUnbiased.video_source,
+                PreprocessedUnbiased.video_hashtags,
                 AnalysisOutput.risk_status,
                 AnalysisOutput.timestamp,
                 BAContentDataAsset.identification_id,
-            )
-            .filter(AnalysisOutput.preprocessed_unbiased_id == video.id)
-            .outerjoin(
-                BAContentDataAsset,
-                BAContentDataAsset.video_id == AnalysisOutput.video_id,
-            )
-            .first()
-        )
-        category = (
-            db.query(Category)
-            .filter(Category.id == analysis_output.category_id)
-            .first()
-        )
-        sub_category = (
-            db.query(SubCategory)
-            .filter(SubCategory.id == analysis_output.sub_category_id)
-            .first()
-        )
-        topic = (
-            db.query(
-                TopicCategory.topic_category_name,
-            )
-            .join(
-                TopicKeywordsDetails,
-                TopicCategory.id == TopicKeywordsDetails.topic_category_id,
-            )
-            .filter(
-                TopicKeywordsDetails.preprocessed_unbiased_id == video.id,
-            )
-            .first()
+                Category.category_name,
+                SubCategory.sub_category_name,
+                first_topic_name().label("topic"),
+            ],
+            MapAgentsPreprocessedUnbiased,
+            MapAgentsPreprocessedUnbiased.agent_id == agent_id,
         )
+        .outerjoin(Category, Category.id == AnalysisOutput.category_id)
+        .outerjoin(SubCategory, SubCategory.id == AnalysisOutput.sub_category_id)
+        .filter(*content_filters(risk, social_media))
+    )
+    contents, next_cursor = paginate_content(query, sort, order, cursor, limit)
 
-        result.append(
+    return {
+        "data": [
             {
-                "video_id": video.video_id,
-                "user_handle": video.user_handle,
-                "identification_id": analysis_output.identification_id,
-                "video_posted_timestamp": video.video_posted_timestamp.isoformat(),
-                "video_source": video.video_source,
-                "ai_topic": topic.topic_category_name,
+                "video_id": content.video_id,
+                "user_handle": content.user_handle,
+                "identification_id": content.identification_id,
+                "video_posted_timestamp": content.video_posted_timestamp.isoformat()
+                if content.video_posted_timestamp
+                else None,
+                "video_source": content.video_source,
+                "ai_topic": content.topic,
                 "status": "AI Flagged",  # unknown
-                "risk_status": analysis_output.risk_status,
-                "category": category.category_name,
-                "sub_category": sub_category.sub_category_name,
-                "video_hashtags": video.video_hashtags,
-                "ss_process_timestamp": analysis_output.timestamp.isoformat(),
-            },
-        )
-    return {"data": result}
+                "risk_status": content.risk_status,
+                "category": content.category_name,
+                "sub_category": content.sub_category_name,
+                "video_hashtags": content.video_hashtags,
+                "ss_process_timestamp": content.timestamp.isoformat()
+                if content.timestamp
+                else None,
+            }
+            for content in contents
+        ],
+        "next_cursor": next_cursor,
+    }
 
 
 def update_agent(
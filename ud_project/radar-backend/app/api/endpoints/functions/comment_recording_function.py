@@ -2,7 +2,6 @@
 
 import asyncio
 import json
-from datetime import datetime, timezone
 
 import aiohttp
 from fastapi import HTTPException
@@ -12,12 +11,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import get_settings
 from app.core.db_config import get_live_db_async
 from app.core.websocket import websocket_manager
-from app.models.comment_table import CommentRecord
 from app.models.watchlist_table import Watchlist
+from app.services.comment_buffer import CommentWriteBuffer
 from utils.logger import Logger
 
 logger = Logger(__name__)
 settings = get_settings()
+comment_write_buffer = CommentWriteBuffer(
+    get_live_db_async,
+    max_batch=settings.COMMENT_FLUSH_SIZE,
+    flush_interval=settings.COMMENT_FLUSH_INTERVAL,
+    max_queue=settings.COMMENT_BUFFER_MAX_SIZE,
+)
 
 HTTP_OK = 200
 HTTP_BAD_REQUEST = 400
@@ -146,13 +151,25 @@ async def start_comment_recording(
         }
 
 
-async def handle_comment_stream(  # noqa: C901, PLR0911, PLR0912, PLR0915
+async def handle_comment_stream(
     username: str,
     stream_id: str,
     user_id: str,
     db: AsyncSession,  # noqa: ARG001
 ) -> None:
-    """Handle TikTok comment stream connection and processing."""
+    """Handle TikTok comment stream connection and processing, then save its buffered comments."""
+    try:
+        await _process_comment_stream(username, stream_id, user_id)
+    finally:
+        await comment_write_buffer.close(stream_id)
+
+
+async def _process_comment_stream(  # noqa: C901, PLR0911, PLR0912, PLR0915
+    username: str,
+    stream_id: str,
+    user_id: str,
+) -> None:
+    """Connect to the TikTok comment stream and process its comments."""
     logger.info("Initializing comment stream handler for %s", username)
 
     timeout = aiohttp.ClientTimeout(
@@ -359,20 +376,24 @@ async def stop_comment_recording(username: str, user_id: str, db: AsyncSession)
 
 
 async def save_comment_to_db(stream_id: str, username: str, comment: dict) -> None:
-    """Save one comment to the DB."""
-    try:
-        async with get_live_db_async() as async_session:
-            comment_record = CommentRecord(
-                StreamId=stream_id,
-                Username=username,
-                Comment=json.dumps(comment),
-                Timestamp=datetime.now(timezone.utc),
-            )
-            async_session.add(comment_record)
-            await async_session.commit()
-    except Exception:
-        logger.exception("Failed to save comment")
-        raise
+    """Buffer one comment, saved to the DB with the next batch of its stream.
+
+    Waits when the buffer of the stream is full, until its pending batch is saved.
+    """
+    await comment_write_buffer.put(stream_id, username, comment)
+
+
+async def flush_comment_buffers() -> None:
+    """Save the buffered comments of every stream, e.g. on shutdown."""
+    await comment_write_buffer.close_all()
+
+
+def get_comment_buffer_status() -> dict:
+    """Get the ingest and flush metrics of the buffered streams and their totals, closed streams included."""
+    return {
+        "streams": comment_write_buffer.status(),
+        "totals": comment_write_buffer.totals(),
+    }
 
 
 async def setup_comment_websocket(
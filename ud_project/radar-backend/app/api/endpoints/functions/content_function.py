@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import json
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import DateTime, cast, func, literal, null, select, union_all
+
+from app.core.constants import DEFAULT_CONTENT_PAGE_SIZE
+from app.core.vm_db import Session_Vm
 from app.models.analysis_output_table import AnalysisOutput
 from app.models.category_table import Category
 from app.models.comments_output_table import CommentsOutput
@@ -15,82 +21,288 @@ from app.models.sub_category_table import SubCategory
 from app.models.topic_category_table import TopicCategory
 from app.models.topic_keywords_details_table import TopicKeywordsDetails
 from app.models.trial_ba_wordcloud_table import TrialBAWordcloud
+from app.services.content_detail_cache import get_content_detail_cache
 from app.utils.utils import format_datetime, safe_json_loads
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlalchemy.engine import Row
     from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
 
-def get_all_content_details(db: Session = None) -> dict:
-    """Get all content details."""
-    contents = db.query(BAContentDataAsset).all()
+def get_all_content_details(
+    db: Session = None,
+    cursor: int | None = None,
+    limit: int = DEFAULT_CONTENT_PAGE_SIZE,
+) -> dict:
+    """Get a page of the content details, in content ID order.
 
-    content_data = []
+    Args:
+        db (Session): Database session.
+        cursor (int | None): ID of the last content of the previous page, None for the first page.
+        limit (int): Number of content in the page, those without a category mapping being skipped.
 
-    for content in contents:
-        content_details = get_content_details(content.video_id, db)
-        if content_details:
-            content_data.append(content_details)
+    Returns:
+        dict: Content details of the page and cursor of the next page, None on the last page.
+
+    """
+    query = db.query(BAContentDataAsset.id, BAContentDataAsset.video_id)
+    if cursor is not None:
+        query = query.filter(BAContentDataAsset.id > cursor)
+    contents = query.order_by(BAContentDataAsset.id).limit(limit + 1).all()
+
+    next_cursor = contents[limit - 1].id if len(contents) > limit else None
+    contents = contents[:limit]
+    details = fetch_content_details([content.video_id for content in contents], db)
+
+    return {
+        "data": [
+            details[content.video_id]
+            for content in contents
+            if content.video_id in details
+        ],
+        "next_cursor": next_cursor,
+    }
+
+
+def stream_all_content_details(
+    cursor: int | None = None,
+    limit: int | None = None,
+) -> Iterator[str]:
+    """Stream the content details as the JSON object returned by get_all_content_details.
+
+    The content details are loaded and written page by page with a session of the stream,
+    as the session of the request is closed before the response is streamed.
+
+    Args:
+        cursor (int | None): ID of the content to stream the next content of, None to stream from the first.
+        limit (int | None): Number of content to stream, None to stream every content.
+
+    Yields:
+        str: Parts of the JSON object.
 
-    return {"data": content_data}
+    """
+    db = Session_Vm()
+    try:
+        yield '{"data": ['
+        separator = ""
+        while True:
+            page = get_all_content_details(
+                db,
+                cursor,
+                limit or DEFAULT_CONTENT_PAGE_SIZE,
+            )
+            for content_details in page["data"]:
+                yield separator + json.dumps(jsonable_encoder(content_details))
+                separator = ", "
+            cursor = page["next_cursor"]
+            if limit is not None or cursor is None:
+                break
+        yield f'], "next_cursor": {json.dumps(cursor)}}}'
+    finally:
+        db.close()
 
 
 def get_content_details(video_id: str, db: Session = None) -> dict | None:
     """Get content details."""
-    try:
-        content = (
-            db.query(BAContentDataAsset)
-            .filter(BAContentDataAsset.video_id == video_id)
-            .first()
-        )
-        mapped_cat_sub = (
-            db.query(MappedCatSub).filter(MappedCatSub.video_id == video_id).first()
-        )
+    return fetch_content_details([video_id], db).get(video_id)
+
+
+def fetch_content_details(video_ids: list[str], db: Session) -> dict[str, dict]:
+    """Get the details of videos, from the cache unless their analysis or comments changed.
+
+    Args:
+        video_ids (list[str]): Video IDs of the content.
+        db (Session): Database session.
+
+    Returns:
+        dict[str, dict]: Details by video ID, missing for the content without a category
+            mapping or whose details could not be assembled.
+
+    """
+    if not video_ids:
+        return {}
+
+    cache = get_content_detail_cache()
+    versions = content_versions(video_ids, db)
+    details = {}
+    for video_id in video_ids:
+        cached = cache.get(video_id, versions[video_id])
+        if cached is not None:
+            details[video_id] = cached
 
-        if mapped_cat_sub is None:
-            return None
+    missing = [video_id for video_id in video_ids if video_id not in details]
+    if missing:
+        for video_id, content_details in load_content_details(missing, db).items():
+            cache.put(video_id, versions[video_id], content_details)
+            details[video_id] = content_details
+    return details
 
-        analysis = (
-            db.query(AnalysisOutput).filter(AnalysisOutput.video_id == video_id).first()
+
+def content_versions(video_ids: list[str], db: Session) -> dict[str, dict]:
+    """Get the version of the analysis and comments of videos, with one query.
+
+    The version of a video is the count, last ID and last timestamp of its analysis output
+    and comments, which change when they are added or reprocessed.
+    """
+    versions = {video_id: {} for video_id in video_ids}
+    rows = db.execute(
+        union_all(
+            *(
+                select(
+                    literal(model.__tablename__).label("kind"),
+                    model.video_id,
+                    func.count(model.id).label("count"),
+                    func.max(model.id).label("last_id"),
+                    func.max(model.timestamp).label("last_timestamp"),
+                )
+                .where(model.video_id.in_(video_ids))
+                .group_by(model.video_id)
+                for model in (AnalysisOutput, CommentsOutput)
+            ),
+        ),
+    ).all()
+    for row in rows:
+        versions[row.video_id][row.kind] = (
+            row.count,
+            row.last_id,
+            row.last_timestamp,
         )
-        comments = (
-            db.query(CommentsOutput).filter(CommentsOutput.video_id == video_id).all()
+    return versions
+
+
+def load_content_details(video_ids: list[str], db: Session) -> dict[str, dict]:
+    """Assemble the details of videos from two queries.
+
+    The first query joins the content with its first category mapping, first analysis
+    output and profile. The second one gets the comments, topics and wordcloud keywords
+    of the content, only the keywords found in the video description being loaded.
+    """
+    first_mapping_id = (
+        select(func.min(MappedCatSub.id))
+        .where(MappedCatSub.video_id == BAContentDataAsset.video_id)
+        .correlate(BAContentDataAsset)
+        .scalar_subquery()
+    )
+    first_analysis_id = (
+        select(func.min(AnalysisOutput.id))
+        .where(AnalysisOutput.video_id == BAContentDataAsset.video_id)
+        .correlate(BAContentDataAsset)
+        .scalar_subquery()
+    )
+    first_profile_id = (
+        select(func.min(BAProfileDataAsset.id))
+        .where(BAProfileDataAsset.profile_api_id == BAContentDataAsset.profile_api_id)
+        .correlate(BAContentDataAsset)
+        .scalar_subquery()
+    )
+    contents = (
+        db.query(
+            BAContentDataAsset,
+            BAProfileDataAsset,
+            Category.category_name,
+            SubCategory.sub_category_name,
+            AnalysisOutput.id.label("analysis_id"),
+            AnalysisOutput.timestamp.label("analysis_timestamp"),
         )
-        categories = (
-            db.query(Category).filter(Category.id == mapped_cat_sub.category_id).first()
+        .join(MappedCatSub, MappedCatSub.id == first_mapping_id)
+        .outerjoin(Category, Category.id == MappedCatSub.category_id)
+        .outerjoin(SubCategory, SubCategory.id == MappedCatSub.sub_category_id)
+        .outerjoin(AnalysisOutput, AnalysisOutput.id == first_analysis_id)
+        .outerjoin(BAProfileDataAsset, BAProfileDataAsset.id == first_profile_id)
+        .filter(BAContentDataAsset.video_id.in_(video_ids))
+        .all()
+    )
+    if not contents:
+        return {}
+
+    related = {content.BAContentDataAsset.video_id: [] for content in contents}
+    for row in db.execute(related_rows_query(list(related))).all():
+        related[row.video_id].append(row)
+
+    details = {}
+    for content in contents:
+        video_id = content.BAContentDataAsset.video_id
+        content_details = build_content_details(content, related[video_id])
+        if content_details is not None:
+            details[video_id] = content_details
+    return details
+
+
+def related_rows_query(video_ids: list[str]) -> Any:  # noqa: ANN401
+    """Query the comments, topics and matching wordcloud keywords of videos.
+
+    Every row has the kind of the related row, the video ID, the ID of the related row, its
+    text and, for comments, the posted timestamp. The keywords are matched in SQL, case
+    insensitively under the default collation, and matched exactly on assembly.
+    """
+    comments = select(
+        literal("comment").label("kind"),
+        CommentsOutput.video_id.label("video_id"),
+        CommentsOutput.id.label("id"),
+        CommentsOutput.text.label("text"),
+        CommentsOutput.comment_posted_timestamp.label("posted_timestamp"),
+    ).where(CommentsOutput.video_id.in_(video_ids))
+    topics = (
+        select(
+            literal("topic"),
+            TopicKeywordsDetails.video_id,
+            TopicKeywordsDetails.id,
+            TopicCategory.topic_category_name,
+            cast(null(), DateTime),
         )
-        sub_categories = (
-            db.query(SubCategory)
-            .filter(SubCategory.id == mapped_cat_sub.sub_category_id)
-            .first()
+        .select_from(TopicKeywordsDetails)
+        .join(
+            TopicCategory,
+            TopicCategory.id == TopicKeywordsDetails.topic_category_id,
         )
-        wordcloud = db.query(TrialBAWordcloud).all()
-        profile = (
-            db.query(BAProfileDataAsset)
-            .filter(BAProfileDataAsset.profile_api_id == content.profile_api_id)
-            .first()
+        .where(TopicKeywordsDetails.video_id.in_(video_ids))
+    )
+    keywords = (
+        select(
+            literal("keyword"),
+            BAContentDataAsset.video_id,
+            TrialBAWordcloud.id,
+            TrialBAWordcloud.keyword,
+            cast(null(), DateTime),
         )
-        topic = (
-            db.query(
-                TopicCategory.topic_category_name,
-            )
-            .join(
-                TopicKeywordsDetails,
-                TopicCategory.id == TopicKeywordsDetails.topic_category_id,
-            )
-            .filter(
-                TopicKeywordsDetails.video_id == content.video_id,
-            )
-            .all()
+        .select_from(BAContentDataAsset)
+        .join(
+            TrialBAWordcloud,
+            BAContentDataAsset.video_description.contains(TrialBAWordcloud.keyword),
         )
+        .where(BAContentDataAsset.video_id.in_(video_ids))
+    )
+    return union_all(comments, topics, keywords)
+
+
+def build_content_details(row: Row, related: list[Row]) -> dict | None:
+    """Assemble the details of a content from its joined row and its related rows."""
+    content = row.BAContentDataAsset
+    profile = row.BAProfileDataAsset
+    category_name = row.category_name
+    sub_category_name = row.sub_category_name
+    related = sorted(related, key=lambda related_row: related_row.id)
+    comments = [related_row for related_row in related if related_row.kind == "comment"]
+    topics = [
+        related_row.text for related_row in related if related_row.kind == "topic"
+    ]
+    keywords = [
+        related_row.text
+        for related_row in related
+        if related_row.kind == "keyword"
+        and related_row.text in (content.video_description or "")
+    ]
+    try:
         content_events = []
-        if analysis:
+        if row.analysis_id is not None:
             content_events.append(
                 {
                     "time": "",
-                    "date": format_datetime(analysis.timestamp),
+                    "date": format_datetime(row.analysis_timestamp),
                     "text": "Analysis Completed",
                 },
             )
@@ -99,7 +311,7 @@ def get_content_details(video_id: str, db: Session = None) -> dict | None:
                 [
                     {
                         "time": "",
-                        "date": format_datetime(comment.comment_posted_timestamp),
+                        "date": format_datetime(comment.posted_timestamp),
                         "text": "Comments Retrieved",
                     }
                     for comment in comments
@@ -111,11 +323,9 @@ def get_content_details(video_id: str, db: Session = None) -> dict | None:
             "identification_id": f"{content.identification_id}",
             "content_date": format_datetime(content.video_posted_timestamp),
             "report_status": content.status,
-            "category": categories.category_name if categories else None,
-            "sub_category": sub_categories.sub_category_name
-            if sub_categories
-            else None,
-            "ai_topic": [topic.topic_category_name for topic in topic],
+            "category": category_name,
+            "sub_category": sub_category_name,
+            "ai_topic": topics,
             "likes": content.video_like_count,
             "engagement_score": content.video_engagement_rate,
             "comments_no": content.comment_count,
@@ -124,22 +334,14 @@ def get_content_details(video_id: str, db: Session = None) -> dict | None:
             "content_img": content.video_screenshot_url,
             "user_handle": content.user_handle,
             "content_events": content_events,
-            "content_tags": [
-                item.keyword
-                for item in wordcloud
-                if item.keyword in content.video_description
-            ],
+            "content_tags": keywords,
             "content_url": content.video_path,
             "content_description": content.original_transcription,
             "scrappedDate": format_datetime(content.crawling_timestamp),
             "comment_content": [comment.text for comment in comments]
             if comments
             else None,
-            "wordcloud": [
-                item.keyword
-                for item in wordcloud
-                if item.keyword in content.video_description
-            ],
+            "wordcloud": keywords.copy(),
             "profile": {
                 "user_following_count": profile.user_following_count
                 if profile
@@ -189,10 +391,8 @@ def get_content_details(video_id: str, db: Session = None) -> dict | None:
             ],
             "original_transcription": content.original_transcription,
             "video_summary": content.video_summary,
-            "categories": [categories.category_name] if categories else [],
-            "subCategories": [sub_categories.sub_category_name]
-            if sub_categories
-            else [],
+            "categories": [category_name] if category_name else [],
+            "subCategories": [sub_category_name] if sub_category_name else [],
             "topics": content.topic_category,
             "hashtags": [
                 {"id": i + 1, "name": tag, "risk_level": "Low"}
@@ -0,0 +1,215 @@
+"""Functions for listing mapped content with one joined and paginated query."""
+
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from fastapi import HTTPException
+from sqlalchemy import and_, asc, case, desc, func, or_, select
+from sqlalchemy.orm import aliased
+
+from app.core.constants import BAD_REQUEST_STATUS_CODE, DEFAULT_CONTENT_PAGE_SIZE
+from app.enums.content_sort import ContentSort
+from app.enums.sort_order import SortOrder
+from app.models.analysis_output_table import AnalysisOutput
+from app.models.content_data_asset_table import BAContentDataAsset
+from app.models.preprocessed_unbiased_table import PreprocessedUnbiased
+from app.models.topic_category_table import TopicCategory
+from app.models.topic_keywords_details_table import TopicKeywordsDetails
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Row
+    from sqlalchemy.orm import Query, Session
+    from sqlalchemy.sql.elements import ColumnElement
+
+# Posted timestamp used to sort the content without one, last in descending order
+MISSING_POSTED_TIMESTAMP = datetime(1970, 1, 1)  # noqa: DTZ001
+
+RISK_RANK = case(
+    (func.lower(AnalysisOutput.risk_status) == "high", 4),
+    (func.lower(AnalysisOutput.risk_status) == "medium", 3),
+    (func.lower(AnalysisOutput.risk_status) == "low", 2),
+    (func.lower(AnalysisOutput.risk_status) == "irrelevant", 1),
+    else_=0,
+)
+
+
+def first_topic_name() -> ColumnElement:
+    """Name of the first topic of the content, as a subquery correlated to the content."""
+    return (
+        select(TopicCategory.topic_category_name)
+        .join(
+            TopicKeywordsDetails,
+            TopicCategory.id == TopicKeywordsDetails.topic_category_id,
+        )
+        .where(TopicKeywordsDetails.preprocessed_unbiased_id == PreprocessedUnbiased.id)
+        .order_by(TopicKeywordsDetails.id)
+        .limit(1)
+        .correlate(PreprocessedUnbiased)
+        .scalar_subquery()
+    )
+
+
+def mapped_content_query(
+    db: Session,
+    columns: list,
+    mapping_model: type,
+    *criteria: ColumnElement,
+) -> Query:
+    """Query the mapped content joined with its first analysis output and its content data asset.
+
+    Args:
+        db (Session): Database session.
+        columns (list): Columns to project.
+        mapping_model (type): Table mapping the content, e.g. MapAgentsPreprocessedUnbiased.
+        *criteria (ColumnElement): Filters of the mapping rows, e.g. on the agent ID.
+
+    Returns:
+        Query: Query with one row per mapped content, mapped more than once or not.
+
+    """
+    mapped_ids = select(mapping_model.preprocessed_unbiased_id).where(
+        mapping_model.deleted_at.is_(None),
+        *criteria,
+    )
+    first_analysis = aliased(AnalysisOutput)
+    first_analysis_id = (
+        select(func.min(first_analysis.id))
+        .where(first_analysis.preprocessed_unbiased_id == PreprocessedUnbiased.id)
+        .correlate(PreprocessedUnbiased)
+        .scalar_subquery()
+    )
+
+    return (
+        db.query(*columns)
+        .select_from(PreprocessedUnbiased)
+        .outerjoin(AnalysisOutput, AnalysisOutput.id == first_analysis_id)
+        .outerjoin(
+            BAContentDataAsset,
+            BAContentDataAsset.video_id == AnalysisOutput.video_id,
+        )
+        .filter(PreprocessedUnbiased.id.in_(mapped_ids))
+    )
+
+
+def content_filters(
+    risk: str | None = None,
+    social_media: str | None = None,
+) -> list[ColumnElement]:
+    """Build the filters of a content query.
+
+    Args:
+        risk (str | None): Risk status of the content, case insensitive.
+        social_media (str | None): Social media of the content, e.g. "www" for www.tiktok.com links.
+
+    Returns:
+        list[ColumnElement]: Filters to apply to a mapped content query.
+
+    """
+    filters = []
+    if risk:
+        filters.append(func.lower(AnalysisOutput.risk_status) == risk.lower())
+    if social_media:
+        # The social media is the first label of the host of the content link
+        filters.append(
+            PreprocessedUnbiased.video_source.contains(
+                f"://{social_media}.",
+                autoescape=True,
+            ),
+        )
+    return filters
+
+
+def encode_cursor(sort: ContentSort, key: Any, content_id: int) -> str:  # noqa: ANN401
+    """Encode the position of the last content of a page."""
+    if isinstance(key, datetime):
+        key = key.isoformat()
+    payload = json.dumps([sort.value, key, content_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, sort: ContentSort) -> tuple[Any, int]:
+    """Decode the position encoded by encode_cursor.
+
+    Raises:
+        HTTPException: If the cursor is invalid or was not made for this sort.
+
+    """
+    try:
+        cursor_sort, key, content_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode()),
+        )
+        if cursor_sort != sort.value:
+            msg = "Cursor sort does not match"
+            raise ValueError(msg)  # noqa: TRY301
+        if sort == ContentSort.DATE:
+            key = datetime.fromisoformat(key)
+        return key, int(content_id)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(
+            status_code=BAD_REQUEST_STATUS_CODE,
+            detail="Invalid cursor.",
+        ) from e
+
+
+def paginate_content(
+    query: Query,
+    sort: ContentSort = ContentSort.DATE,
+    order: SortOrder = SortOrder.DESC,
+    cursor: str | None = None,
+    limit: int = DEFAULT_CONTENT_PAGE_SIZE,
+) -> tuple[list[Row], str | None]:
+    """Get a page of a mapped content query.
+
+    The content is sorted by the sort key then by ID, so that the cursor of the last
+    content of a page keeps its position while content is added.
+
+    Args:
+        query (Query): Mapped content query.
+        sort (ContentSort): Field to sort by.
+        order (SortOrder): Sort order, descending lists the latest or highest risk content first.
+        cursor (str | None): Cursor of the page, None for the first page.
+        limit (int): Number of content in the page.
+
+    Returns:
+        tuple[list[Row], str | None]: Content of the page and cursor of the next page, None on the
+            last page.
+
+    """
+    sort_key = (
+        RISK_RANK
+        if sort == ContentSort.RISK
+        else func.coalesce(
+            PreprocessedUnbiased.video_posted_timestamp,
+            MISSING_POSTED_TIMESTAMP,
+        )
+    )
+    content_id = PreprocessedUnbiased.id
+    descending = order == SortOrder.DESC
+
+    if cursor:
+        key, last_id = decode_cursor(cursor, sort)
+        if descending:
+            query = query.filter(
+                or_(sort_key < key, and_(sort_key == key, content_id < last_id)),
+            )
+        else:
+            query = query.filter(
+                or_(sort_key > key, and_(sort_key == key, content_id > last_id)),
+            )
+
+    direction = desc if descending else asc
+    rows = (
+        query.add_columns(sort_key.label("sort_key"), content_id.label("content_id"))
+        .order_by(direction(sort_key), direction(content_id))
+        .limit(limit + 1)
+        .all()
+    )
+
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(sort, rows[-1].sort_key, rows[-1].content_id)
@@ -10,16 +10,31 @@ from urllib.parse import urlparse
 
 import requests
 from fastapi import BackgroundTasks, HTTPException
-from sqlalchemy import case, func
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import aliased
 
 if TYPE_CHECKING:
+    from sqlalchemy.engine import Row
     from sqlalchemy.orm import Session
+    from sqlalchemy.sql.elements import ColumnElement
 
+from app.api.endpoints.functions.content_list_function import (
+    content_filters,
+    first_topic_name,
+    mapped_content_query,
+    paginate_content,
+)
 from app.api.endpoints.functions.preprocessed_data_function import get_preprocessed_data
-from app.core.constants import DEFAULT_CRAWLER_URL_FOR_DIRECT_LINK
+from app.core.constants import (
+    DEFAULT_CONTENT_PAGE_SIZE,
+    DEFAULT_CRAWLER_URL_FOR_DIRECT_LINK,
+    DEFAULT_SIMILAR_CONTENT_LIMIT,
+)
 from app.core.dependencies import get_db
+from app.core.vm_db import Session_Vm
 from app.enums.agent_status import AgentStatus
+from app.enums.content_sort import ContentSort
+from app.enums.sort_order import SortOrder
 from app.models.analysis_output_table import AnalysisOutput
 from app.models.category_table import Category
 from app.models.content_data_asset_table import BAContentDataAsset
@@ -32,6 +47,7 @@ from app.models.profile_data_asset_table import BAProfileDataAsset
 from app.models.sub_category_table import SubCategory
 from app.models.topic_category_table import TopicCategory
 from app.models.topic_keywords_details_table import TopicKeywordsDetails
+from app.services.similar_content_index import get_similar_content_index
 from utils.logger import Logger
 
 log = Logger("DirectLinkAnalysis_Function")
@@ -200,19 +216,72 @@ def get_agent_list(db: Session) -> list[dict]:
         ) from e
 
 
-def get_agent_content_list(agent_name: str, db: Session) -> dict:
-    """Retrieve content list for a specific agent.
+def _content_list_item(content: Row, status: str) -> dict:
+    """Format a content of a content list."""
+    timestamp = content.video_posted_timestamp
+    time_str = timestamp.strftime("%H:%M") if timestamp else "17:20"
+    date_str = timestamp.strftime("%d/%m/%y") if timestamp else "11/10/24"
+
+    parsed_url = urlparse(content.video_source)
+    social_media = parsed_url.netloc.split(".")[0] if parsed_url.netloc else "unknown"
+
+    return {
+        "id": content.identification_id,
+        "content": {
+            "image_url": content.video_screenshot,
+            "title": content.title,
+            "link": content.video_source,
+        },
+        "time": time_str,
+        "date": date_str,
+        "social_media": social_media,
+        "risk": content.risk_status,
+        "topic": content.topic,
+        "status": status,
+        "justification": content.video_summary,
+    }
+
+
+CONTENT_LIST_COLUMNS = [
+    PreprocessedUnbiased.video_screenshot,
+    PreprocessedUnbiased.title,
+    PreprocessedUnbiased.video_source,
+    PreprocessedUnbiased.video_posted_timestamp,
+    PreprocessedUnbiased.video_summary,
+    AnalysisOutput.risk_status,
+    BAContentDataAsset.identification_id,
+    func.coalesce(first_topic_name(), "Unknown").label("topic"),
+]
+
+
+def get_agent_content_list(  # noqa: PLR0913
+    agent_name: str,
+    db: Session,
+    cursor: str | None = None,
+    limit: int = DEFAULT_CONTENT_PAGE_SIZE,
+    sort: ContentSort = ContentSort.DATE,
+    order: SortOrder = SortOrder.DESC,
+    risk: str | None = None,
+    social_media: str | None = None,
+) -> dict:
+    """Retrieve a page of the content list for a specific agent.
 
     Args:
         agent_name (str): Name of the agent.
         db (Session): Database session.
+        cursor (str | None): Cursor of the page, None for the first page.
+        limit (int): Number of content in the page.
+        sort (ContentSort): Field to sort by.
+        order (SortOrder): Sort order.
+        risk (str | None): Risk status to filter by.
+        social_media (str | None): Social media to filter by.
 
     Returns:
-        dict: Content list for the agent.
+        dict: Content list for the agent and cursor of the next page.
 
     """
     agent_data = (
-        db.query(DirectLinkAnalysis)
+        db.query(DirectLinkAnalysis.id, DirectLinkAnalysis.status)
         .filter(DirectLinkAnalysis.agentName == agent_name)
         .first()
     )
@@ -221,181 +290,86 @@ def get_agent_content_list(agent_name: str, db: Session) -> dict:
             status_code=404,
             detail=f"Agent with name {agent_name} not found.",
         )
-    map_data = [
-        entry.preprocessed_unbiased_id
-        for entry in db.query(MapDirectLinkAnalysisPreprocessedUnbiased)
-        .filter(
-            MapDirectLinkAnalysisPreprocessedUnbiased.direct_link_analysis_id
-            == agent_data.id,
-            MapDirectLinkAnalysisPreprocessedUnbiased.deleted_at.is_(None),
-        )
-        .all()
-    ]
-
-    preprocessed_data = (
-        db.query(PreprocessedUnbiased)
-        .filter(PreprocessedUnbiased.id.in_(map_data))
-        .all()
-    )
-    result = []
-    for video in preprocessed_data:
-        analysis_output = (
-            db.query(
-                AnalysisOutput.category_id,
-                AnalysisOutput.sub_category_id,
-                AnalysisOutput.risk_status,
-                AnalysisOutput.timestamp,
-                BAContentDataAsset.identification_id,
-            )
-            .filter(AnalysisOutput.preprocessed_unbiased_id == video.id)
-            .outerjoin(
-                BAContentDataAsset,
-                BAContentDataAsset.video_id == AnalysisOutput.video_id,
-            )
-            .first()
-        )
 
-        topic = (
-            db.query(
-                TopicCategory.topic_category_name,
-            )
-            .join(
-                TopicKeywordsDetails,
-                TopicCategory.id == TopicKeywordsDetails.topic_category_id,
-            )
-            .filter(
-                TopicKeywordsDetails.preprocessed_unbiased_id == video.id,
-            )
-            .first()
-        )
+    query = mapped_content_query(
+        db,
+        CONTENT_LIST_COLUMNS,
+        MapDirectLinkAnalysisPreprocessedUnbiased,
+        MapDirectLinkAnalysisPreprocessedUnbiased.direct_link_analysis_id
+        == agent_data.id,
+    ).filter(*content_filters(risk, social_media))
+    contents, next_cursor = paginate_content(query, sort, order, cursor, limit)
+
+    return {
+        "data": [
+            _content_list_item(content, agent_data.status) for content in contents
+        ],
+        "next_cursor": next_cursor,
+    }
 
-        timestamp = video.video_posted_timestamp
-        time_str = timestamp.strftime("%H:%M") if timestamp else "17:20"
-        date_str = timestamp.strftime("%d/%m/%y") if timestamp else "11/10/24"
 
-        parsed_url = urlparse(video.video_source)
-        social_media = (
-            parsed_url.netloc.split(".")[0] if parsed_url.netloc else "unknown"
+def direct_link_analysis_status() -> ColumnElement:
+    """Status of the first direct link analysis of the content, as a subquery correlated to the content."""
+    return func.coalesce(
+        select(DirectLinkAnalysis.status)
+        .join(
+            MapDirectLinkAnalysisPreprocessedUnbiased,
+            MapDirectLinkAnalysisPreprocessedUnbiased.direct_link_analysis_id
+            == DirectLinkAnalysis.id,
         )
-
-        result.append(
-            {
-                "id": analysis_output.identification_id,
-                "content": {
-                    "image_url": video.video_screenshot,
-                    "title": video.title,
-                    "link": video.video_source,
-                },
-                "time": time_str,
-                "date": date_str,
-                "social_media": social_media,
-                "risk": analysis_output.risk_status,
-                "topic": topic.topic_category_name if topic else "Unknown",
-                "status": agent_data.status,
-                "justification": video.video_summary,
-            },
+        .where(
+            MapDirectLinkAnalysisPreprocessedUnbiased.preprocessed_unbiased_id
+            == PreprocessedUnbiased.id,
+            MapDirectLinkAnalysisPreprocessedUnbiased.deleted_at.is_(None),
         )
-
-    return {"data": result}
+        .order_by(MapDirectLinkAnalysisPreprocessedUnbiased.id)
+        .limit(1)
+        .correlate(PreprocessedUnbiased)
+        .scalar_subquery(),
+        "Unknown",
+    )
 
 
-def get_content_list(db: Session) -> dict:
-    """Retrieve a list of all content.
+def get_content_list(  # noqa: PLR0913
+    db: Session,
+    cursor: str | None = None,
+    limit: int = DEFAULT_CONTENT_PAGE_SIZE,
+    sort: ContentSort = ContentSort.DATE,
+    order: SortOrder = SortOrder.DESC,
+    risk: str | None = None,
+    status: str | None = None,
+    social_media: str | None = None,
+) -> dict:
+    """Retrieve a page of the list of all content.
 
     Args:
         db (Session): Database session.
+        cursor (str | None): Cursor of the page, None for the first page.
+        limit (int): Number of content in the page.
+        sort (ContentSort): Field to sort by.
+        order (SortOrder): Sort order.
+        risk (str | None): Risk status to filter by.
+        status (str | None): Direct link analysis status to filter by.
+        social_media (str | None): Social media to filter by.
 
     Returns:
-        dict: List of all content with details.
+        dict: List of content with details and cursor of the next page.
 
     """
-    map_data = [
-        entry.preprocessed_unbiased_id
-        for entry in db.query(MapDirectLinkAnalysisPreprocessedUnbiased)
-        .filter(MapDirectLinkAnalysisPreprocessedUnbiased.deleted_at.is_(None))
-        .all()
-    ]
-
-    preprocessed_data = (
-        db.query(PreprocessedUnbiased)
-        .filter(PreprocessedUnbiased.id.in_(map_data))
-        .all()
-    )
-
-    result = []
-    for video in preprocessed_data:
-        analysis_output = (
-            db.query(
-                AnalysisOutput.category_id,
-                AnalysisOutput.sub_category_id,
-                AnalysisOutput.risk_status,
-                AnalysisOutput.timestamp,
-                BAContentDataAsset.identification_id,
-            )
-            .filter(AnalysisOutput.preprocessed_unbiased_id == video.id)
-            .outerjoin(
-                BAContentDataAsset,
-                BAContentDataAsset.video_id == AnalysisOutput.video_id,
-            )
-            .first()
-        )
-
-        map_entry = (
-            db.query(MapDirectLinkAnalysisPreprocessedUnbiased)
-            .filter(
-                MapDirectLinkAnalysisPreprocessedUnbiased.preprocessed_unbiased_id
-                == video.id,
-            )
-            .first()
-        )
-        if map_entry:
-            direct_link_analysis = (
-                db.query(DirectLinkAnalysis)
-                .filter(DirectLinkAnalysis.id == map_entry.direct_link_analysis_id)
-                .first()
-            )
-            status = direct_link_analysis.status if direct_link_analysis else "Unknown"
-        else:
-            status = "Unknown"
-
-        topic = (
-            db.query(TopicCategory.topic_category_name)
-            .join(
-                TopicKeywordsDetails,
-                TopicCategory.id == TopicKeywordsDetails.topic_category_id,
-            )
-            .filter(TopicKeywordsDetails.preprocessed_unbiased_id == video.id)
-            .first()
-        )
-
-        timestamp = video.video_posted_timestamp
-        time_str = timestamp.strftime("%H:%M") if timestamp else "17:20"
-        date_str = timestamp.strftime("%d/%m/%y") if timestamp else "11/10/24"
-
-        parsed_url = urlparse(video.video_source)
-        social_media = (
-            parsed_url.netloc.split(".")[0] if parsed_url.netloc else "unknown"
-        )
-
-        result.append(
-            {
-                "id": analysis_output.identification_id,
-                "content": {
-                    "image_url": video.video_screenshot,
-                    "title": video.title,
-                    "link": video.video_source,
-                },
-                "time": time_str,
-                "date": date_str,
-                "social_media": social_media,
-                "risk": analysis_output.risk_status,
-                "topic": topic.topic_category_name if topic else "Unknown",
-                "status": status,
-                "justification": video.video_summary,
-            },
-        )
-
-    return {"data": result}
+    status_column = direct_link_analysis_status()
+    query = mapped_content_query(
+        db,
+        [*CONTENT_LIST_COLUMNS, status_column.label("status")],
+        MapDirectLinkAnalysisPreprocessedUnbiased,
+    ).filter(*content_filters(risk, social_media))
+    if status:
+        query = query.filter(status_column == status)
+    contents, next_cursor = paginate_content(query, sort, order, cursor, limit)
+
+    return {
+        "data": [_content_list_item(content, content.status) for content in contents],
+        "next_cursor": next_cursor,
+    }
 
 
 def get_categories_by_username(username: str, db: Session) -> list:
@@ -603,86 +577,53 @@ def get_content_details(db: Session) -> dict:
         return {"data": result}
 
 
-def get_similar_content(identification_id: str, db: Session) -> dict:
-    """Retrieve similar content based on identification ID.
+def get_similar_content(
+    identification_id: str,
+    db: Session,
+    limit: int = DEFAULT_SIMILAR_CONTENT_LIMIT,
+) -> dict:
+    """Retrieve the content most similar to a case, by topic, category and engagement.
 
     Args:
         identification_id (str): The ID of the content to find similar items for.
         db (Session): Database session.
+        limit (int): Number of similar content to retrieve.
 
     Returns:
-        dict: A dictionary containing similar content details.
+        dict: A dictionary containing similar content details, most similar first.
 
     """
     try:
-        map_data = [
-            entry.preprocessed_unbiased_id
-            for entry in db.query(MapDirectLinkAnalysisPreprocessedUnbiased)
-            .filter(MapDirectLinkAnalysisPreprocessedUnbiased.deleted_at.is_(None))
-            .all()
-        ]
-
-        preprocessed_data = (
-            db.query(PreprocessedUnbiased)
-            .filter(PreprocessedUnbiased.id.in_(map_data))
-            .all()
-        )
+        index = get_similar_content_index()
+        if index.is_built:
+            # Content analysed since the last refresh are found once the refresh is done
+            index.refresh_in_background(Session_Vm)
+        else:
+            # Waits for the first build, also when another request started it
+            index.refresh(db)
 
         result = []
-        for video in preprocessed_data:
-            analysis_output = (
-                db.query(
-                    AnalysisOutput.category_id,
-                    AnalysisOutput.sub_category_id,
-                    AnalysisOutput.risk_status,
-                    AnalysisOutput.timestamp,
-                    BAContentDataAsset.identification_id,
-                    BAContentDataAsset.likes,
-                    BAContentDataAsset.comments,
-                    BAContentDataAsset.shares,
-                )
-                .filter(AnalysisOutput.preprocessed_unbiased_id == video.id)
-                .outerjoin(
-                    BAContentDataAsset,
-                    BAContentDataAsset.video_id == AnalysisOutput.video_id,
-                )
-                .first()
-            )
-
-            # Filter content by identification_id
-            if (
-                analysis_output
-                and analysis_output.identification_id == identification_id
-            ):
-                topics = (
-                    db.query(TopicCategory.topic_category_name)
-                    .join(
-                        TopicKeywordsDetails,
-                        TopicCategory.id == TopicKeywordsDetails.topic_category_id,
-                    )
-                    .filter(TopicKeywordsDetails.preprocessed_unbiased_id == video.id)
-                    .all()
-                )
-
-                timestamp = video.video_posted_timestamp
-                time_str = timestamp.strftime("%H:%M") if timestamp else "17:20"
-                date_str = timestamp.strftime("%d/%m/%y") if timestamp else "11/10/24"
+        for content, similarity in index.similar(identification_id, limit):
+            timestamp = content.video_posted_timestamp
+            time_str = timestamp.strftime("%H:%M") if timestamp else "17:20"
+            date_str = timestamp.strftime("%d/%m/%y") if timestamp else "11/10/24"
 
-                parsed_url = urlparse(video.video_source)
-                social_media = (
-                    parsed_url.netloc.split(".")[0] if parsed_url.netloc else "unknown"
-                )
+            parsed_url = urlparse(content.video_source)
+            social_media = (
+                parsed_url.netloc.split(".")[0] if parsed_url.netloc else "unknown"
+            )
 
-                result.append(
-                    {
-                        "caseId": analysis_output.identification_id,
-                        "time": time_str,
-                        "date": date_str,
-                        "socialMedia": social_media,
-                        "topic": [topic.topic_category_name for topic in topics],
-                        "risk": analysis_output.risk_status,
-                    },
-                )
+            result.append(
+                {
+                    "caseId": content.identification_id,
+                    "time": time_str,
+                    "date": date_str,
+                    "socialMedia": social_media,
+                    "topic": content.topics,
+                    "risk": content.risk_status,
+                    "similarity": round(similarity, 4),
+                },
+            )
 
     except Exception as e:
         raise HTTPException(
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 import subprocess
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -12,7 +13,7 @@ from typing import Any
 import aiohttp
 import requests
 from fastapi import HTTPException
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession  # noqa: TCH002
 
@@ -30,6 +31,7 @@ from app.core.websocket import websocket_manager
 from app.models.live_stream_table import LiveStream
 from app.models.notification_table import Notification
 from app.models.watchlist_table import Watchlist
+from app.services.watchlist_schedule import WatchedCreator, WatchlistSchedule
 from utils.logger import Logger
 
 settings = get_settings()
@@ -37,6 +39,13 @@ logger = Logger(__name__)
 
 monitoring_task = None
 background_tasks = set()
+watchlist_schedule = WatchlistSchedule(
+    polling_interval=settings.POLLING_INTERVAL,
+    hot_interval=settings.WATCHLIST_HOT_POLLING_INTERVAL,
+    max_interval=settings.WATCHLIST_MAX_POLLING_INTERVAL,
+    backoff_checks=settings.WATCHLIST_BACKOFF_CHECKS,
+    resync_seconds=settings.WATCHLIST_RESYNC_SECONDS,
+)
 
 HTTP_OK = 200
 
@@ -119,51 +128,155 @@ async def check_live_status(
         return {"data": {"alive": False}}
 
 
+async def fetch_live_statuses(
+    usernames: list[str],
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+) -> dict[str, dict[str, Any]]:
+    """Check if users are live concurrently, with at most one request per semaphore slot.
+
+    Returns:
+        Live status of the users, missing the users whose check failed.
+
+    """
+
+    async def check(username: str) -> tuple[str, dict[str, Any]]:
+        async with semaphore:
+            return username, await check_live_status(username, session)
+
+    return {
+        username: status
+        for username, status in await asyncio.gather(*map(check, usernames))
+        # check_live_status returns a status without "alive" when the check failed
+        if "alive" in status
+    }
+
+
+async def update_creator(
+    creator: WatchedCreator,
+    live_status: dict[str, Any] | None,
+) -> None:
+    """Handle the stream start or end of a checked creator and schedule its next check."""
+    if live_status is None:
+        watchlist_schedule.record_check(creator, None)
+        return
+
+    is_live = bool(live_status.get("alive", False))
+    try:
+        if is_live and not creator.is_live:
+            async with get_live_db_async() as db:
+                await handle_stream_start(
+                    creator.user_handle,
+                    db,
+                    live_status.get("room_id"),
+                )
+        elif not is_live and creator.is_live:
+            async with get_live_db_async() as db:
+                await handle_stream_end(creator.user_handle, db)
+    except Exception:
+        logger.exception("Error processing %s", creator.user_handle)
+        # Retry the stream start or end on the next check
+        watchlist_schedule.record_check(creator, None)
+    else:
+        watchlist_schedule.record_check(creator, is_live)
+
+
+async def check_creators(
+    creators: list[WatchedCreator],
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+) -> None:
+    """Check if creators are live and handle their stream starts and ends."""
+    statuses = await fetch_live_statuses(
+        [creator.user_handle for creator in creators],
+        session,
+        semaphore,
+    )
+    await asyncio.gather(
+        *(
+            update_creator(creator, statuses.get(creator.user_handle))
+            for creator in creators
+        ),
+    )
+
+
+async def reload_watchlist(db: AsyncSession) -> None:
+    """Load the watchlist rows updated since the last load into the schedule."""
+    columns = (
+        Watchlist.id,
+        Watchlist.user_handle,
+        Watchlist.is_live,
+        Watchlist.last_updated,
+    )
+    now = time.monotonic()
+    if not watchlist_schedule.needs_resync(now):
+        # Rows updated within the second of the last load are loaded again, in case
+        # they were updated after it
+        result = await db.execute(
+            select(*columns).where(
+                Watchlist.last_updated >= watchlist_schedule.last_updated,
+            )
+            if watchlist_schedule.last_updated is not None
+            else select(*columns),
+        )
+        watchlist_schedule.load(result.all(), now)
+        count = await db.scalar(select(func.count(Watchlist.id)))
+        if count == len(watchlist_schedule):
+            return
+
+    result = await db.execute(select(*columns))
+    watchlist_schedule.load(result.all(), now, full=True)
+
+
+async def run_monitor_cycle(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+) -> None:
+    """Check the creators due for a check concurrently."""
+    started_at = time.monotonic()
+    due = watchlist_schedule.due(started_at)
+    if not due:
+        return
+
+    await check_creators(due, session, semaphore)
+    watchlist_schedule.metrics.record_cycle(time.monotonic() - started_at)
+
+
 async def monitor_watchlist() -> None:
-    """Monitor watchlist users for live status."""
+    """Monitor watchlist users for live status.
+
+    Every cycle loads the watchlist rows updated since the previous one, then checks the
+    users due for a check on the adaptive schedule of watchlist_schedule, concurrently
+    with at most WATCHLIST_CHECK_CONCURRENCY requests to the status endpoint.
+    """
     try:
-        async with aiohttp.ClientSession() as session:
+        timeout = aiohttp.ClientTimeout(total=settings.WATCHLIST_CHECK_TIMEOUT)
+        semaphore = asyncio.Semaphore(settings.WATCHLIST_CHECK_CONCURRENCY)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
             while True:
                 try:
                     async with get_live_db_async() as db:
-                        result = await db.execute(
-                            select(Watchlist),
-                        )
-                        watchlist = result.scalars().all()
-
-                        for user in watchlist:
-                            try:
-                                live_status = await check_live_status(
-                                    user.user_handle,
-                                    session,
-                                )
-                                is_live = live_status.get("alive", False)
-
-                                if is_live and not user.is_live:
-                                    await handle_stream_start(
-                                        user.user_handle,
-                                        db,
-                                        live_status.get("room_id"),
-                                    )
-                                elif not is_live and user.is_live:
-                                    await handle_stream_end(user.user_handle, db)
-                            except Exception:  # noqa: PERF203
-                                logger.exception(
-                                    "Error processing %s",
-                                    user.user_handle,
-                                )
-
+                        await reload_watchlist(db)
+                    await run_monitor_cycle(session, semaphore)
                 except SQLAlchemyError:
                     logger.exception("Database error in monitor_watchlist loop")
                 except Exception:
                     logger.exception("Error in monitor_watchlist loop: %s")
-                await asyncio.sleep(settings.POLLING_INTERVAL)
+                await asyncio.sleep(watchlist_schedule.sleep_seconds(time.monotonic()))
     except asyncio.CancelledError:
         logger.info("monitor_watchlist task received cancellation.")
     except Exception as e:  # noqa: BLE001
         logger.critical("Fatal error in monitor_watchlist: %s", e)
 
 
+def get_monitoring_status() -> dict[str, Any]:
+    """Get the size, cycle time and lag metrics of the watchlist monitoring."""
+    return {
+        "running": monitoring_task is not None and not monitoring_task.done(),
+        **watchlist_schedule.status(),
+    }
+
+
 async def handle_stream_start(  # noqa: PLR0915, C901
     username: str,
     db: AsyncSession,
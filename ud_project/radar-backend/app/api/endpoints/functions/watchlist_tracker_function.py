@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 
 from fastapi import HTTPException
-from sqlalchemy import text
+from sqlalchemy import func, text
 from sqlalchemy.orm import Session  # noqa: TCH002
 
 from app.models.watchlist_table import Watchlist
@@ -69,7 +69,8 @@ async def update_user_stats(
                 watchlist_item.user_following_count = user_data.user_following_count
                 watchlist_item.user_followers_count = user_data.user_followers_count
                 watchlist_item.user_total_videos = user_data.user_total_videos
-                watchlist_item.last_updated = datetime.now(timezone.utc)
+                # Set with the database clock, as on insert and update of the watchlist
+                watchlist_item.last_updated = func.current_timestamp()
                 live_db.commit()
             else:
                 _raise_http_error(404, f"User {user_handle} not found in watchlist")
@@ -134,5 +135,5 @@ async def update_user_live_status(
             detail=f"User {user_handle} not found in the watchlist",
         )
     watchlist_item.is_live = is_live
-    watchlist_item.last_updated = datetime.now(timezone.utc)
+    watchlist_item.last_updated = func.current_timestamp()
     live_db.commit()
@@ -18,7 +18,9 @@ from app.api.endpoints.functions.agent_function import (
     update_agent,
     update_agent_is_published,
 )
+from app.api.endpoints.functions.content_list_function import decode_cursor
 from app.core.constants import SUCCESS_CODE
+from app.enums.content_sort import ContentSort
 from app.models.schemas.start_agent_builder_schema import StartAgentBuilderSchema
 from app.models.update_model.agent_update import AgentUpdate
 
@@ -147,38 +149,70 @@ def test_get_agent_crawler_preview(mock_db_session: Session) -> None:
 
 def test_get_agent_content_list(mock_db_session: Session) -> None:
     """Test the get_agent_content_list function."""
-    mock_db_session.query().filter().first.return_value = MagicMock(id=1)
-    mock_db_session.query().filter().all.return_value = [
+    query = mock_db_session.query.return_value
+    for method in (
+        "filter",
+        "select_from",
+        "outerjoin",
+        "add_columns",
+        "order_by",
+        "limit",
+    ):
+        getattr(query, method).return_value = query
+    query.first.return_value = MagicMock(id=1)
+    query.all.return_value = [
         MagicMock(
-            id=1,
             video_id="vid1",
             user_handle="user1",
             video_posted_timestamp=datetime.now(tz=UTC),
             video_source="source1",
             video_hashtags="hashtags",
+            risk_status="low",
+            timestamp=datetime.now(tz=UTC),
+            identification_id="id1",
+            category_name="Category1",
+            sub_category_name="SubCategory1",
+            topic="Topic1",
         ),
     ]
-    mock_db_session.query().filter().outerjoin().first.return_value = MagicMock(
-        category_id=1,
-        sub_category_id=1,
-        risk_status="low",
-        timestamp=datetime.now(tz=UTC),
-        identification_id="id1",
-    )
-    mock_db_session.query().filter().first.return_value = MagicMock(
-        category_name="Category1",
-    )
-    mock_db_session.query().filter().first.return_value = MagicMock(
-        sub_category_name="SubCategory1",
-    )
-    mock_db_session.query().join().filter().first.return_value = MagicMock(
-        topic_category_name="Topic1",
-    )
 
     result = get_agent_content_list(1, mock_db_session)
 
     assert len(result["data"]) == 1  # noqa: S101
     assert result["data"][0]["video_id"] == "vid1"  # noqa: S101
+    assert result["data"][0]["ai_topic"] == "Topic1"  # noqa: S101
+    assert result["next_cursor"] is None  # noqa: S101
+    query.limit.assert_called_once_with(51)
+
+
+def test_get_agent_content_list_next_cursor(mock_db_session: Session) -> None:
+    """Test the get_agent_content_list function returns the cursor of the next page."""
+    query = mock_db_session.query.return_value
+    for method in (
+        "filter",
+        "select_from",
+        "outerjoin",
+        "add_columns",
+        "order_by",
+        "limit",
+    ):
+        getattr(query, method).return_value = query
+    query.first.return_value = MagicMock(id=1)
+    posted_timestamp = datetime(2024, 1, 1, tzinfo=UTC)
+    query.all.return_value = [
+        MagicMock(
+            video_id=f"vid{content_id}",
+            sort_key=posted_timestamp,
+            content_id=content_id,
+        )
+        for content_id in (3, 2, 1)
+    ]
+
+    result = get_agent_content_list(1, mock_db_session, limit=2)
+
+    assert [content["video_id"] for content in result["data"]] == ["vid3", "vid2"]  # noqa: S101
+    next_cursor = decode_cursor(result["next_cursor"], ContentSort.DATE)
+    assert next_cursor == (posted_timestamp, 2)  # noqa: S101
 
 
 def test_update_agent(
@@ -5,6 +5,7 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session  # noqa: TCH002
 
+from app.api.endpoints.functions.watchlist_function import get_monitoring_status
 from app.api.endpoints.functions.watchlist_tracker_function import (
     add_user_to_watchlist,
     fetch_watchlist,
@@ -108,3 +109,9 @@ async def update_live_status(
         ) from e
     else:
         return {"message": f"Updated live status for {user_handle}"}
+
+
+@router.get("/watchlist/monitor_status")
+async def get_monitor_status() -> dict:
+    """Get the size, cycle time and lag metrics of the watchlist monitoring."""
+    return get_monitoring_status()
@@ -5,7 +5,8 @@ from __future__ import annotations
 import asyncio
 from typing import TYPE_CHECKING, Any
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 if TYPE_CHECKING:
@@ -18,6 +19,7 @@ from app.db.crud import (
     update_calculated_engagement,
     update_calculated_risk_score,
 )
+from app.enums.bulk_format import BulkFormat
 from app.models.batch_models import (
     BatchContentIdsRequest,
     BatchContentProcessingResponse,
@@ -34,11 +36,38 @@ from app.models.engagement_risk import (
     EngagementCalculationRequest,
     RiskCalculationRequest,
 )
-from app.services.batch_service import BatchProcessingService
+from app.services.batch_service import BatchProcessingService, read_bulk, write_bulk
 from app.services.engagement_risk import EngagementRiskService
 
 batch_router = APIRouter(prefix="/batch", tags=["batch-processing"])
 
+UNSUPPORTED_MEDIA_TYPE_STATUS_CODE = 415
+BULK_REQUEST_BODY = {
+    "content": {
+        bulk_format.value: {"schema": {"type": "string", "format": "binary"}}
+        for bulk_format in BulkFormat
+    },
+    "required": True,
+}
+
+
+def get_bulk_format(request: Request) -> BulkFormat:
+    """Get the bulk format of a request from its content type.
+
+    Raises:
+        HTTPException: If the content type is not a bulk format.
+
+    """
+    media_type = request.headers.get("content-type", "").split(";")[0].strip()
+    try:
+        return BulkFormat(media_type)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=UNSUPPORTED_MEDIA_TYPE_STATUS_CODE,
+            detail=f"Unsupported content type, expected one of: "
+            f"{', '.join(bulk_format.value for bulk_format in BulkFormat)}",
+        ) from e
+
 
 @batch_router.post(
     "/calculate-engagement",
@@ -75,6 +104,65 @@ async def batch_calculate_risk(
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
+@batch_router.post(
+    "/calculate-engagement/bulk",
+    summary="Bulk calculate engagement metrics",
+    description="Calculate the engagement of an NDJSON or Arrow stream batch in one vectorized pass",
+    openapi_extra={"requestBody": BULK_REQUEST_BODY},
+)
+async def bulk_calculate_engagement(
+    request: Request,
+    bulk_format: BulkFormat = Depends(get_bulk_format),
+) -> Response:
+    """Bulk calculate engagement metrics.
+
+    Each row has the fields of a calculate-engagement request. The response has one row per
+    request row, in the format of the request, null for the rows that are not valid.
+    """
+    body = await request.body()
+    try:
+        results = await run_in_threadpool(
+            lambda: write_bulk(
+                BatchProcessingService.process_engagement_bulk(
+                    read_bulk(body, bulk_format),
+                ),
+                bulk_format,
+            ),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return Response(content=results, media_type=bulk_format.value)
+
+
+@batch_router.post(
+    "/calculate-risk/bulk",
+    summary="Bulk calculate risk scores",
+    description="Calculate the risk of an NDJSON or Arrow stream batch in one vectorized pass",
+    openapi_extra={"requestBody": BULK_REQUEST_BODY},
+)
+async def bulk_calculate_risk(
+    request: Request,
+    bulk_format: BulkFormat = Depends(get_bulk_format),
+) -> Response:
+    """Bulk calculate risk scores.
+
+    Each row has the fields of a calculate-risk request, or risk_status and sub_category
+    columns instead of the weights mappings. The response has one row per request row, in
+    the format of the request, null for the rows that are not valid.
+    """
+    body = await request.body()
+    try:
+        results = await run_in_threadpool(
+            lambda: write_bulk(
+                BatchProcessingService.process_risk_bulk(read_bulk(body, bulk_format)),
+                bulk_format,
+            ),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return Response(content=results, media_type=bulk_format.value)
+
+
 @batch_router.post(
     "/calculate-engagement-prediction",
     response_model=BatchEngagementPredictionResponse,
@@ -135,6 +223,10 @@ async def batch_process_db_content(
         successful_results = {}
         failed_content_ids = []
 
+        # Get risk weights from config, once for the batch
+        risk_weights = get_risk_weights_map()
+        subcat_weights = get_subcat_weights_map()
+
         async def process_single_content(
             content_id: int,
         ) -> tuple[int, dict[str, Any] | None]:
@@ -163,10 +255,6 @@ async def batch_process_db_content(
                 # Update engagement in DB
                 update_calculated_engagement(db, content_id, eng_rate)
 
-                # Get risk weights from config
-                risk_weights = get_risk_weights_map()
-                subcat_weights = get_subcat_weights_map()
-
                 risk_weight = risk_weights.get(
                     record.risk_status,
                     settings.RISK_WEIGHT_LOW,
@@ -25,6 +25,19 @@ class Settings(BaseSettings):
     # Polling Interval
     POLLING_INTERVAL: int = 30
 
+    # Watchlist monitor
+    WATCHLIST_HOT_POLLING_INTERVAL: int = 10
+    WATCHLIST_MAX_POLLING_INTERVAL: int = 300
+    WATCHLIST_BACKOFF_CHECKS: int = 10
+    WATCHLIST_RESYNC_SECONDS: int = 300
+    WATCHLIST_CHECK_CONCURRENCY: int = 10
+    WATCHLIST_CHECK_TIMEOUT: int = 15
+
+    # Live comment write-behind buffer
+    COMMENT_FLUSH_SIZE: int = 200
+    COMMENT_FLUSH_INTERVAL: float = 1.0
+    COMMENT_BUFFER_MAX_SIZE: int = 5000
+
     # Others
     FRONTEND_BASE_URL: str
 
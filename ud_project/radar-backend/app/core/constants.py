@@ -83,3 +83,21 @@ DEFAULT_SIMILARITY_AGENT_URL = "http://ad34ed07797334e8ba6314ab2e747ff8-10261126
 DEFAULT_CROSS_CATEGORY_INSIGHT_URL = "http://af3164eb711524ba5afd1b47b63ebdd3-1243418058.ap-southeast-1.elb.amazonaws.com:8080"
 DEFAULT_EXTRACTION_LAW_PDF_URL = "http://a155f7502d7f2406087d86f8aefcac97-500080031.ap-southeast-1.elb.amazonaws.com:8077"
 DEFAULT_ENGAGEMENT_COUNT_URL = "http://a67e02a6c8e6b4b3898befefb32d4549-107744915.ap-southeast-1.elb.amazonaws.com:8001"
+
+DEFAULT_CONTENT_PAGE_SIZE = 50
+MAX_CONTENT_PAGE_SIZE = 200
+
+DEFAULT_SIMILAR_CONTENT_LIMIT = 10
+MAX_SIMILAR_CONTENT_LIMIT = 50
+# Seconds between two checks for new content, and between two full rebuilds of the similar content index
+SIMILAR_CONTENT_REFRESH_SECONDS = int(
+    os.getenv("SIMILAR_CONTENT_REFRESH_SECONDS", "60"),
+)
+SIMILAR_CONTENT_REBUILD_SECONDS = int(
+    os.getenv("SIMILAR_CONTENT_REBUILD_SECONDS", "3600"),
+)
+
+# Number of assembled content details kept in memory, and seconds before one is reloaded
+# even if the analysis and comments of its video did not change
+CONTENT_DETAIL_CACHE_SIZE = int(os.getenv("CONTENT_DETAIL_CACHE_SIZE", "1000"))
+CONTENT_DETAIL_CACHE_SECONDS = int(os.getenv("CONTENT_DETAIL_CACHE_SECONDS", "300"))
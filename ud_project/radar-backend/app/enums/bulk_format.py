@@ -0,0 +1,10 @@
+"""Bulk format enum class."""
+
+from enum import Enum
+
+
+class BulkFormat(Enum):
+    """Enumeration for the media types of the bulk batch inputs and outputs."""
+
+    NDJSON = "application/x-ndjson"
+    ARROW = "application/vnd.apache.arrow.stream"
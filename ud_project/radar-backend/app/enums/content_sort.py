@@ -0,0 +1,10 @@
+"""Content sort enum class."""
+
+from enum import Enum
+
+
+class ContentSort(Enum):
+    """Enumeration for the fields a content list is sorted by."""
+
+    DATE = "date"
+    RISK = "risk"
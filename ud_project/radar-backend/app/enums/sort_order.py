@@ -0,0 +1,10 @@
+"""Sort order enum class."""
+
+from enum import Enum
+
+
+class SortOrder(Enum):
+    """Enumeration for Sort Order."""
+
+    ASC = "asc"
+    DESC = "desc"
@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import io
+from datetime import datetime
+
+import numpy as np
+import polars as pl
 
 from app.core.config import get_risk_weights_map, get_subcat_weights_map, settings
+from app.enums.bulk_format import BulkFormat
 from app.models.batch_models import (
     BatchEngagementCalculationRequest,
     BatchEngagementCalculationResponse,
@@ -15,11 +21,16 @@ from app.models.batch_models import (
     BatchRiskPredictionRequest,
     BatchRiskPredictionResponse,
 )
-from app.models.engagement_risk import (
-    EngagementCalculationRequest,  # noqa: TCH001
-    RiskCalculationRequest,  # noqa: TCH001
-)
 from app.services.engagement_risk import EngagementRiskService
+from app.services.vectorized_scoring import (
+    BREAKDOWN_KEYS,
+    ENGAGEMENT_COLUMNS,
+    RISK_FACTOR_KEYS,
+    recency_scores,
+    score_engagement,
+    score_risk,
+    to_datetime64,
+)
 
 
 class BatchProcessingError(Exception):
@@ -56,7 +67,7 @@ class BatchProcessingService:
     async def process_engagement_batch(
         batch_request: BatchEngagementCalculationRequest,
     ) -> BatchEngagementCalculationResponse:
-        """Process multiple engagement calculation requests in parallel.
+        """Process multiple engagement calculation requests in one vectorized pass.
 
         Args:
             batch_request: Batch of engagement calculation requests
@@ -65,56 +76,49 @@ class BatchProcessingService:
             Response containing processed results and statistics
 
         """
-        results = []
-        failed_indices = []
-
-        async def process_single(
-            index: int,
-            request: EngagementCalculationRequest,
-        ) -> tuple[int, dict | None]:
-            try:
-                total_eng, eng_rate, breakdown = (
-                    EngagementRiskService.calculate_engagement(request)
+        requests = batch_request.requests
+        scores = score_engagement(
+            *(
+                np.fromiter(
+                    (getattr(request, column) for request in requests),
+                    dtype=np.int64,
+                    count=len(requests),
                 )
-            except BatchProcessingError:
-                return index, None
-            else:
-                return index, {
-                    "total_engagement": total_eng,
-                    "video_engagement": eng_rate,
-                    "engagement_breakdown": breakdown,
-                }
-
-        tasks = [
-            process_single(idx, request)
-            for idx, request in enumerate(batch_request.requests)
+                for column in ENGAGEMENT_COLUMNS
+            ),
+        )
+        breakdowns = [
+            dict(zip(BREAKDOWN_KEYS, values))
+            for values in zip(
+                *(scores.breakdown[key].tolist() for key in BREAKDOWN_KEYS),
+            )
+        ]
+        results = [
+            {
+                "total_engagement": total_eng,
+                "video_engagement": eng_rate,
+                "engagement_breakdown": breakdown,
+            }
+            for total_eng, eng_rate, breakdown in zip(
+                scores.total_engagement.tolist(),
+                scores.video_engagement.tolist(),
+                breakdowns,
+            )
         ]
-
-        processed_results = await asyncio.gather(*tasks)
-
-        results = [None] * len(batch_request.requests)
-        for index, result in processed_results:
-            if result is None:
-                failed_indices.append(index)
-            else:
-                results[index] = result
-
-        # Remove None values
-        results = [r for r in results if r is not None]
 
         return BatchEngagementCalculationResponse(
             results=results,
-            failed_indices=failed_indices,
-            total_processed=len(batch_request.requests),
+            failed_indices=[],
+            total_processed=len(requests),
             total_success=len(results),
-            total_failed=len(failed_indices),
+            total_failed=0,
         )
 
     @staticmethod
     async def process_risk_batch(
         batch_request: BatchRiskCalculationRequest,
     ) -> BatchRiskCalculationResponse:
-        """Process multiple risk calculation requests in parallel.
+        """Process multiple risk calculation requests in one vectorized pass.
 
         Args:
             batch_request: Batch of risk calculation requests
@@ -123,48 +127,165 @@ class BatchProcessingService:
             Response containing processed results and statistics
 
         """
-        results = []
-        failed_indices = []
+        requests = batch_request.requests
+        video_engagement, risk_weights, subcat_weights = (
+            np.fromiter(
+                (getattr(request, column) for request in requests),
+                dtype=np.float64,
+                count=len(requests),
+            )
+            for column in (
+                "video_engagement",
+                "risk_weights_mapping",
+                "subcat_weights_mapping",
+            )
+        )
+        recency = recency_scores(
+            to_datetime64(request.video_posted_date for request in requests),
+        )
+        scores = score_risk(video_engagement, risk_weights, subcat_weights, recency)
+        factors = [
+            dict(zip(RISK_FACTOR_KEYS, values))
+            for values in zip(
+                *(scores.factors[key].tolist() for key in RISK_FACTOR_KEYS),
+            )
+        ]
+        results = [
+            {
+                "video_engagement_risk": risk_score,
+                "recency_score": recency_score,
+                "risk_factors": risk_factors,
+            }
+            for risk_score, recency_score, risk_factors in zip(
+                scores.risk_score.tolist(),
+                scores.recency_score.tolist(),
+                factors,
+            )
+        ]
 
-        async def process_single(
-            index: int,
-            request: RiskCalculationRequest,
-        ) -> tuple[int, dict | None]:
-            try:
-                risk_score, recency_score, factors = (
-                    EngagementRiskService.calculate_risk(request)
-                )
-            except BatchProcessingError:
-                return index, None
-            else:
-                return index, {
-                    "video_engagement_risk": risk_score,
-                    "recency_score": recency_score,
-                    "risk_factors": factors,
-                }
+        return BatchRiskCalculationResponse(
+            results=results,
+            failed_indices=[],
+            total_processed=len(requests),
+            total_success=len(results),
+            total_failed=0,
+        )
 
-        tasks = [
-            process_single(idx, request)
-            for idx, request in enumerate(batch_request.requests)
+    @staticmethod
+    def process_engagement_bulk(frame: pl.DataFrame) -> pl.DataFrame:
+        """Calculate the engagement of a bulk batch in one vectorized pass.
+
+        Args:
+            frame: One row per record, with the columns of EngagementCalculationRequest
+
+        Returns:
+            One row per record, in the order of the input, with the columns of
+            EngagementCalculationResponse and the breakdown flattened; null for the
+            records with a missing or negative count, or no views
+
+        Raises:
+            ValueError: If a column is missing or not numeric
+
+        """
+        counts = _numeric_columns(frame, ENGAGEMENT_COLUMNS, pl.Int64)
+        valid = (
+            counts.select(
+                pl.all_horizontal(pl.all().is_not_null() & (pl.all() >= 0))
+                & (pl.col("video_view_count") > 0),
+            )
+            .to_series()
+            .to_numpy()
+        )
+        # Invalid records are scored as one view without engagement, then masked
+        columns = [
+            counts[column].fill_null(0).to_numpy() for column in ENGAGEMENT_COLUMNS
         ]
+        columns[-1] = np.where(valid, columns[-1], 1)
+        scores = score_engagement(*columns)
+
+        return _mask_invalid(
+            pl.DataFrame(
+                {
+                    "total_engagement": scores.total_engagement,
+                    "video_engagement": scores.video_engagement,
+                    **{
+                        f"breakdown_{key}": scores.breakdown[key]
+                        for key in BREAKDOWN_KEYS
+                    },
+                },
+            ),
+            valid,
+        )
 
-        processed_results = await asyncio.gather(*tasks)
+    @staticmethod
+    def process_risk_bulk(frame: pl.DataFrame) -> pl.DataFrame:
+        """Calculate the risk of a bulk batch in one vectorized pass.
 
-        results = [None] * len(batch_request.requests)
-        for index, result in processed_results:
-            if result is None:
-                failed_indices.append(index)
-            else:
-                results[index] = result
+        The weights are read from the risk_weights_mapping and subcat_weights_mapping
+        columns when given, otherwise from the configured weights of the risk_status and
+        sub_category columns.
 
-        results = [r for r in results if r is not None]
+        Args:
+            frame: One row per record, with the columns of RiskCalculationRequest
 
-        return BatchRiskCalculationResponse(
-            results=results,
-            failed_indices=failed_indices,
-            total_processed=len(batch_request.requests),
-            total_success=len(results),
-            total_failed=len(failed_indices),
+        Returns:
+            One row per record, in the order of the input, with the columns of
+            RiskCalculationResponse and the risk factors flattened; null for the records
+            with a missing value, a negative engagement, a weight not above 0 or a posted
+            date that is not a datetime
+
+        Raises:
+            ValueError: If a column is missing or has the wrong type
+
+        """
+        weight_columns = ("risk_weights_mapping", "subcat_weights_mapping")
+        if not set(weight_columns) <= set(frame.columns):
+            frame = frame.with_columns(
+                risk_weights_mapping=_label_weights(
+                    frame,
+                    "risk_status",
+                    get_risk_weights_map(),
+                    settings.RISK_WEIGHT_LOW,
+                ),
+                subcat_weights_mapping=_label_weights(
+                    frame,
+                    "sub_category",
+                    get_subcat_weights_map(),
+                    settings.SUBCAT_WEIGHT_DEFAULT,
+                ),
+            )
+        values = _numeric_columns(
+            frame,
+            ("video_engagement", *weight_columns),
+            pl.Float64,
+        ).with_columns(video_posted_date=_utc_datetimes(frame, "video_posted_date"))
+        valid = (
+            values.select(
+                pl.all_horizontal(pl.all().is_not_null())
+                & (pl.col("video_engagement") >= 0)
+                & (pl.col("risk_weights_mapping") > 0)
+                & (pl.col("subcat_weights_mapping") > 0),
+            )
+            .to_series()
+            .to_numpy()
+        )
+        recency = recency_scores(
+            values["video_posted_date"].fill_null(datetime(1970, 1, 1)).to_numpy(),  # noqa: DTZ001
+        )
+        scores = score_risk(
+            *(values[column].fill_null(0).to_numpy() for column in values.columns[:3]),
+            recency,
+        )
+
+        return _mask_invalid(
+            pl.DataFrame(
+                {
+                    "video_engagement_risk": scores.risk_score,
+                    "recency_score": scores.recency_score,
+                    **scores.factors,
+                },
+            ),
+            valid,
         )
 
     @staticmethod
@@ -284,3 +405,120 @@ class BatchProcessingService:
             total_success=len(results),
             total_failed=len(failed_indices),
         )
+
+
+def read_bulk(body: bytes, bulk_format: BulkFormat) -> pl.DataFrame:
+    """Read a bulk batch, one row per record.
+
+    Raises:
+        ValueError: If the body is not a valid document of the format
+
+    """
+    try:
+        if bulk_format == BulkFormat.ARROW:
+            return pl.read_ipc_stream(io.BytesIO(body))
+        return pl.read_ndjson(io.BytesIO(body))
+    except (pl.exceptions.PolarsError, RuntimeError) as e:
+        msg = f"Invalid {bulk_format.name} batch: {e!s}"
+        raise ValueError(msg) from e
+
+
+def write_bulk(frame: pl.DataFrame, bulk_format: BulkFormat) -> bytes:
+    """Write the results of a bulk batch in the format of its input."""
+    buffer = io.BytesIO()
+    if bulk_format == BulkFormat.ARROW:
+        frame.write_ipc_stream(buffer)
+    else:
+        frame.write_ndjson(buffer)
+    return buffer.getvalue()
+
+
+def _numeric_columns(
+    frame: pl.DataFrame,
+    columns: tuple[str, ...],
+    dtype: type[pl.DataType],
+) -> pl.DataFrame:
+    """Select numeric columns, cast to dtype.
+
+    Raises:
+        ValueError: If a column is missing or not numeric
+
+    """
+    missing = [column for column in columns if column not in frame.columns]
+    if missing:
+        msg = f"Missing columns: {', '.join(missing)}"
+        raise ValueError(msg)
+    for column in columns:
+        if not frame.schema[column].is_numeric() and frame.schema[column] != pl.Null:
+            msg = f"Column {column} is not numeric"
+            raise ValueError(msg)
+    return frame.select(pl.col(column).cast(dtype) for column in columns)
+
+
+def _label_weights(
+    frame: pl.DataFrame,
+    column: str,
+    weights_map: dict[str, float],
+    default: float,
+) -> pl.Series:
+    """Map a label column to the weights of its labels, each distinct label resolved once.
+
+    Raises:
+        ValueError: If the column is missing
+
+    """
+    if column not in frame.columns:
+        msg = f"Missing columns: {column}, or the weights mapping columns"
+        raise ValueError(msg)
+    return (
+        frame[column]
+        .cast(pl.String)
+        .replace_strict(weights_map, default=default, return_dtype=pl.Float64)
+    )
+
+
+def _utc_datetimes(frame: pl.DataFrame, column: str) -> pl.Series:
+    """Convert a column of datetimes or ISO 8601 strings to naive UTC datetimes.
+
+    Naive datetimes are in UTC, and strings that are not ISO 8601 datetimes are null.
+
+    Raises:
+        ValueError: If the column is missing or neither datetimes nor strings
+
+    """
+    if column not in frame.columns:
+        msg = f"Missing columns: {column}"
+        raise ValueError(msg)
+    dates = frame[column]
+    if dates.dtype == pl.String:
+        # Parse each string with the format it matches, with or without a UTC offset
+        dates = dates.str.replace(" ", "T", literal=True).str.replace("Z$", "+00:00")
+        dates = pl.select(
+            pl.coalesce(
+                dates.str.to_datetime(
+                    "%Y-%m-%dT%H:%M:%S%.f%:z",
+                    time_unit="us",
+                    time_zone="UTC",
+                    strict=False,
+                ),
+                dates.str.to_datetime(
+                    "%Y-%m-%dT%H:%M:%S%.f",
+                    time_unit="us",
+                    time_zone="UTC",
+                    strict=False,
+                ),
+            ),
+        ).to_series()
+    elif dates.dtype == pl.Null:
+        dates = dates.cast(pl.Datetime("us", "UTC"))
+    elif not isinstance(dates.dtype, pl.Datetime):
+        msg = f"Column {column} is not a datetime"
+        raise ValueError(msg)
+    if dates.dtype.time_zone is not None:
+        dates = dates.dt.convert_time_zone("UTC").dt.replace_time_zone(None)
+    return dates.dt.cast_time_unit("us").alias(column)
+
+
+def _mask_invalid(results: pl.DataFrame, valid: np.ndarray) -> pl.DataFrame:
+    """Set the results of the invalid records to null."""
+    return results.select(pl.when(pl.Series(valid)).then(pl.all()))
@@ -0,0 +1,259 @@
+"""Live comment write-behind buffer service."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import insert
+
+from app.models.comment_table import CommentRecord
+from utils.logger import Logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from contextlib import AbstractAsyncContextManager
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = Logger(__name__)
+
+# Number of attempts to write a batch before its comments are dropped
+FLUSH_ATTEMPTS = 3
+FLUSH_RETRY_DELAY = 1
+
+# Queued to stop the flusher of a stream once the comments queued before are written
+_CLOSE = object()
+
+
+@dataclass
+class CommentBufferMetrics:
+    """Ingest and flush metrics of the comments of a stream."""
+
+    ingested: int = 0
+    flushed: int = 0
+    dropped: int = 0
+    flushes: int = 0
+    failed_flushes: int = 0
+    backpressure_waits: int = 0
+    backpressure_seconds: float = 0.0
+    last_flush_size: int = 0
+    last_flush_seconds: float = 0.0
+    max_flush_seconds: float = 0.0
+
+    def add(self, other: CommentBufferMetrics) -> None:
+        """Add the metrics of another stream, keeping the max and last flush of this one."""
+        for field in fields(self):
+            if not field.name.startswith(("last_", "max_")):
+                setattr(
+                    self,
+                    field.name,
+                    getattr(self, field.name) + getattr(other, field.name),
+                )
+        self.max_flush_seconds = max(self.max_flush_seconds, other.max_flush_seconds)
+
+
+class StreamCommentBuffer:
+    """Write-behind buffer of the comments of one stream.
+
+    Comments are queued and written by a background flusher with one multi-row INSERT
+    per batch, once max_batch comments are queued or flush_interval seconds after the
+    first comment of the batch. The queue holds at most max_queue comments, beyond which
+    adding a comment waits for a flush, slowing down the reading of the comment stream.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        stream_id: str,
+        username: str,
+        session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+        max_batch: int,
+        flush_interval: float,
+        max_queue: int,
+    ) -> None:
+        """Initialize an empty buffer, its flusher started with the first comment."""
+        self.stream_id = stream_id
+        self.username = username
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.metrics = CommentBufferMetrics()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._flusher: asyncio.Task | None = None
+
+    async def put(self, comment: dict[str, Any]) -> None:
+        """Queue a comment, waiting for a flush if the queue is full."""
+        row = {
+            "StreamId": self.stream_id,
+            "Username": self.username,
+            "Comment": json.dumps(comment),
+            "Timestamp": datetime.now(timezone.utc),
+        }
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(
+                self._flush_queue(),
+                name=f"comment_flush_{self.stream_id}",
+            )
+
+        if self._queue.full():
+            started_at = time.monotonic()
+            await self._queue.put(row)
+            self.metrics.backpressure_waits += 1
+            self.metrics.backpressure_seconds += time.monotonic() - started_at
+        else:
+            self._queue.put_nowait(row)
+        self.metrics.ingested += 1
+
+    async def close(self) -> None:
+        """Write the queued comments and stop the flusher."""
+        if self._flusher is None:
+            return
+        await self._queue.put(_CLOSE)
+        await self._flusher
+        self._flusher = None
+
+    async def _flush_queue(self) -> None:
+        """Write the queued comments in batches until the buffer is closed."""
+        loop = asyncio.get_running_loop()
+        closed = False
+        while not closed:
+            row = await self._queue.get()
+            if row is _CLOSE:
+                return
+
+            rows = [row]
+            deadline = loop.time() + self.flush_interval
+            while len(rows) < self.max_batch:
+                try:
+                    row = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        row = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                if row is _CLOSE:
+                    closed = True
+                    break
+                rows.append(row)
+
+            await self._write(rows)
+
+    async def _write(self, rows: list[dict[str, Any]]) -> None:
+        """Insert a batch of comments, dropping them if every attempt failed."""
+        for attempt in range(1, FLUSH_ATTEMPTS + 1):
+            started_at = time.monotonic()
+            try:
+                async with self.session_factory() as session:
+                    await session.execute(insert(CommentRecord).values(rows))
+                    await session.commit()
+            except Exception:
+                self.metrics.failed_flushes += 1
+                logger.exception(
+                    "Failed to save %d comments of stream %s (attempt %d/%d)",
+                    len(rows),
+                    self.stream_id,
+                    attempt,
+                    FLUSH_ATTEMPTS,
+                )
+                if attempt < FLUSH_ATTEMPTS:
+                    await asyncio.sleep(FLUSH_RETRY_DELAY)
+            else:
+                seconds = time.monotonic() - started_at
+                self.metrics.flushes += 1
+                self.metrics.flushed += len(rows)
+                self.metrics.last_flush_size = len(rows)
+                self.metrics.last_flush_seconds = seconds
+                self.metrics.max_flush_seconds = max(
+                    self.metrics.max_flush_seconds,
+                    seconds,
+                )
+                return
+
+        self.metrics.dropped += len(rows)
+
+    def status(self) -> dict[str, Any]:
+        """Get the queue size and the ingest and flush metrics of the buffer."""
+        return {
+            "username": self.username,
+            "queued": self._queue.qsize(),
+            **asdict(self.metrics),
+        }
+
+
+class CommentWriteBuffer:
+    """Write-behind buffers of the comments of the recorded streams."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+        max_batch: int,
+        flush_interval: float,
+        max_queue: int,
+    ) -> None:
+        """Initialize without buffers, a buffer being created with the first comment of a stream."""
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.streams: dict[str, StreamCommentBuffer] = {}
+        # Metrics of the closed streams, kept once their buffers are removed
+        self.closed_streams = 0
+        self.closed_metrics = CommentBufferMetrics()
+
+    async def put(self, stream_id: str, username: str, comment: dict[str, Any]) -> None:
+        """Queue a comment in the buffer of its stream."""
+        buffer = self.streams.get(stream_id)
+        if buffer is None:
+            buffer = self.streams[stream_id] = StreamCommentBuffer(
+                stream_id,
+                username,
+                self.session_factory,
+                self.max_batch,
+                self.flush_interval,
+                self.max_queue,
+            )
+        await buffer.put(comment)
+
+    async def close(self, stream_id: str) -> None:
+        """Write the queued comments of a stream and remove its buffer, keeping its metrics in the totals."""
+        buffer = self.streams.pop(stream_id, None)
+        if buffer is not None:
+            await buffer.close()
+            self.closed_streams += 1
+            self.closed_metrics.add(buffer.metrics)
+
+    async def close_all(self) -> None:
+        """Write the queued comments of every stream and remove their buffers."""
+        await asyncio.gather(
+            *(self.close(stream_id) for stream_id in list(self.streams)),
+        )
+
+    def status(self) -> dict[str, dict[str, Any]]:
+        """Get the queue size and the ingest and flush metrics of every stream."""
+        return {
+            stream_id: buffer.status() for stream_id, buffer in self.streams.items()
+        }
+
+    def totals(self) -> dict[str, Any]:
+        """Get the ingest and flush metrics of every open and closed stream."""
+        metrics = CommentBufferMetrics()
+        metrics.add(self.closed_metrics)
+        for buffer in self.streams.values():
+            metrics.add(buffer.metrics)
+        totals = asdict(metrics)
+        del totals["last_flush_size"], totals["last_flush_seconds"]
+        return {
+            "open_streams": len(self.streams),
+            "closed_streams": self.closed_streams,
+            "queued": sum(
+                buffer.status()["queued"] for buffer in self.streams.values()
+            ),
+            **totals,
+        }
@@ -0,0 +1,74 @@
+"""Content detail cache service."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+from app.core.constants import CONTENT_DETAIL_CACHE_SECONDS, CONTENT_DETAIL_CACHE_SIZE
+
+
+class ContentDetailCache:
+    """Least recently used cache of the assembled content details.
+
+    An entry is stored with the version of the analysis and comments of its video, and is
+    only returned for the same version, so that the details are reassembled once analysis
+    or comments are added or updated. Entries also expire after ttl_seconds, to pick up
+    the content, category and profile fields updated since.
+    """
+
+    def __init__(
+        self,
+        max_size: int = CONTENT_DETAIL_CACHE_SIZE,
+        ttl_seconds: float = CONTENT_DETAIL_CACHE_SECONDS,
+    ) -> None:
+        """Initialize an empty cache."""
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[dict, float, dict]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of cached content details."""
+        return len(self._entries)
+
+    def get(self, video_id: str, version: dict) -> dict | None:
+        """Get the cached details of a video, None if missing, outdated or expired.
+
+        Args:
+            video_id (str): Video ID of the content.
+            version (dict): Current version of the analysis and comments of the video.
+
+        Returns:
+            dict | None: Cached details, shared between requests and not to be modified.
+
+        """
+        with self._lock:
+            entry = self._entries.get(video_id)
+            if entry is None:
+                return None
+            cached_version, cached_at, details = entry
+            if (
+                cached_version != version
+                or time.monotonic() - cached_at >= self.ttl_seconds
+            ):
+                del self._entries[video_id]
+                return None
+            self._entries.move_to_end(video_id)
+            return details
+
+    def put(self, video_id: str, version: dict, details: dict) -> None:
+        """Cache the details of a video, evicting the least recently used ones beyond the max size."""
+        with self._lock:
+            self._entries[video_id] = (version, time.monotonic(), details)
+            self._entries.move_to_end(video_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+@lru_cache
+def get_content_detail_cache() -> ContentDetailCache:
+    """Get the process-wide content detail cache."""
+    return ContentDetailCache()
@@ -0,0 +1,374 @@
+"""Similar content index service."""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from sqlalchemy import func
+
+from app.api.endpoints.functions.content_list_function import mapped_content_query
+from app.core.constants import (
+    DEFAULT_SIMILAR_CONTENT_LIMIT,
+    SIMILAR_CONTENT_REBUILD_SECONDS,
+    SIMILAR_CONTENT_REFRESH_SECONDS,
+)
+from app.models.analysis_output_table import AnalysisOutput
+from app.models.content_data_asset_table import BAContentDataAsset
+from app.models.map_direct_link_analysis_preprocessed_unbiased_table import (
+    MapDirectLinkAnalysisPreprocessedUnbiased,
+)
+from app.models.preprocessed_unbiased_table import PreprocessedUnbiased
+from app.models.topic_category_table import TopicCategory
+from app.models.topic_keywords_details_table import TopicKeywordsDetails
+from utils.logger import Logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from sqlalchemy.orm import Session
+
+logger = Logger(__name__)
+
+# Weights of the similarity of two content, summing to 1
+TOPIC_WEIGHT = 0.4
+SUB_CATEGORY_WEIGHT = 0.3
+CATEGORY_WEIGHT = 0.1
+ENGAGEMENT_WEIGHT = 0.2
+
+# Number of content whose topics are loaded with one query
+TOPIC_QUERY_BATCH_SIZE = 1000
+
+
+@dataclass(eq=False)
+class IndexedContent:
+    """Content indexed by identification ID, topic, category and engagement."""
+
+    content_id: int
+    identification_id: str
+    category_id: int | None
+    sub_category_id: int | None
+    engagement: float
+    risk_status: str | None
+    video_source: str | None
+    video_posted_timestamp: datetime | None
+    topic_ids: list[int] = field(default_factory=list)
+    topics: list[str] = field(default_factory=list)
+
+    def group_keys(self) -> list[tuple]:
+        """Keys of the groups of content sharing a feature with this content, most specific first."""
+        keys = [
+            ("topic", topic_id, self.sub_category_id) for topic_id in self.topic_ids
+        ]
+        keys += [("topic", topic_id) for topic_id in self.topic_ids]
+        if self.sub_category_id is not None:
+            keys.append(("sub_category", self.sub_category_id))
+        if self.category_id is not None:
+            keys.append(("category", self.category_id))
+        return keys
+
+    def similarity(self, other: IndexedContent) -> float:
+        """Similarity between 0 and 1 of the topics, category and engagement of two content."""
+        score = 0.0
+        if set(self.topic_ids) & set(other.topic_ids):
+            score += TOPIC_WEIGHT
+        if (
+            self.sub_category_id is not None
+            and self.sub_category_id == other.sub_category_id
+        ):
+            score += SUB_CATEGORY_WEIGHT
+        if self.category_id is not None and self.category_id == other.category_id:
+            score += CATEGORY_WEIGHT
+        return score + ENGAGEMENT_WEIGHT / (1 + abs(self.engagement - other.engagement))
+
+
+class EngagementGroup:
+    """Content sharing a feature, sorted by engagement."""
+
+    def __init__(self) -> None:
+        """Initialize an empty group."""
+        self.engagements: list[float] = []
+        self.contents: list[IndexedContent] = []
+
+    def copy(self) -> EngagementGroup:
+        """Copy the group, to add content while the original is read."""
+        group = EngagementGroup()
+        group.engagements = self.engagements.copy()
+        group.contents = self.contents.copy()
+        return group
+
+    def add(self, content: IndexedContent) -> None:
+        """Add a content, keeping the group sorted."""
+        position = bisect.bisect(self.engagements, content.engagement)
+        self.engagements.insert(position, content.engagement)
+        self.contents.insert(position, content)
+
+    def nearest(self, engagement: float, count: int) -> list[IndexedContent]:
+        """Get the count content with the closest engagement, in O(log n + count)."""
+        right = bisect.bisect(self.engagements, engagement)
+        left = right - 1
+        nearest = []
+        while len(nearest) < count and (left >= 0 or right < len(self.contents)):
+            if right >= len(self.contents) or (
+                left >= 0
+                and engagement - self.engagements[left]
+                <= self.engagements[right] - engagement
+            ):
+                nearest.append(self.contents[left])
+                left -= 1
+            else:
+                nearest.append(self.contents[right])
+                right += 1
+        return nearest
+
+
+class SimilarContentIndex:
+    """In-memory nearest neighbour index of the direct link analysis content.
+
+    Content is grouped by topic, topic and sub-category, sub-category and category, each
+    group sorted by engagement. The similar content of a case are taken among the content
+    with the closest engagement in the groups of the case, so a lookup does not depend on
+    the number of indexed content.
+
+    The index loads the content added since its last refresh, and is rebuilt periodically
+    to pick up the topics, risks and mappings updated since. Refreshes update copies of the
+    index, swapped in once loaded, so lookups never wait for them. One refresh runs at a
+    time, the index being served as it is while another thread refreshes it, except before
+    its first build, which the other threads wait for instead of serving an empty index.
+    """
+
+    def __init__(
+        self,
+        refresh_seconds: float = SIMILAR_CONTENT_REFRESH_SECONDS,
+        rebuild_seconds: float = SIMILAR_CONTENT_REBUILD_SECONDS,
+    ) -> None:
+        """Initialize an empty index."""
+        self.refresh_seconds = refresh_seconds
+        self.rebuild_seconds = rebuild_seconds
+        self._lock = threading.Lock()
+        self._contents: dict[str, IndexedContent] = {}
+        self._groups: dict[tuple, EngagementGroup] = {}
+        self._last_asset_id = 0
+        self._built_at: float | None = None
+        self._refreshed_at: float | None = None
+
+    def __len__(self) -> int:
+        """Get the number of indexed content."""
+        return len(self._contents)
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the index was built, so that it can be served while refreshed."""
+        return self._built_at is not None
+
+    def refresh(self, db: Session, *, force: bool = False) -> bool:
+        """Index the content added since the last refresh, when the refresh interval elapsed.
+
+        Args:
+            db (Session): Database session.
+            force (bool): Refresh even if the refresh interval did not elapse.
+
+        Returns:
+            bool: Whether the index was refreshed, False if it was fresh or another thread
+                was refreshing it. Before the first build, waits for the build of another
+                thread instead.
+
+        """
+        if not force and not self._is_stale():
+            return False
+
+        # Once built, the current index is served while another thread refreshes it
+        if not self._lock.acquire(blocking=not self.is_built):
+            return False
+        try:
+            # Another thread may have refreshed the index since the staleness check
+            if not force and not self._is_stale():
+                return False
+
+            now = time.monotonic()
+            last_asset_id = db.query(func.max(BAContentDataAsset.id)).scalar() or 0
+            if self._built_at is None or now - self._built_at >= self.rebuild_seconds:
+                self._load(db, {}, {}, 0, last_asset_id)
+                self._built_at = now
+            elif last_asset_id > self._last_asset_id:
+                self._load(
+                    db,
+                    self._contents.copy(),
+                    self._groups.copy(),
+                    self._last_asset_id,
+                    last_asset_id,
+                )
+            self._refreshed_at = now
+            return True
+        finally:
+            self._lock.release()
+
+    def refresh_in_background(self, session_factory: Callable[[], Session]) -> None:
+        """Refresh the index in a background thread with its own session, if it is stale.
+
+        Args:
+            session_factory (Callable[[], Session]): Factory of the session of the refresh,
+                closed once the refresh is done.
+
+        """
+        if not self._is_stale() or self._lock.locked():
+            return
+
+        threading.Thread(
+            target=self._refresh_with_session,
+            args=(session_factory,),
+            name="similar_content_index_refresh",
+            daemon=True,
+        ).start()
+
+    def _refresh_with_session(self, session_factory: Callable[[], Session]) -> None:
+        db = session_factory()
+        try:
+            self.refresh(db)
+        except Exception:
+            logger.exception("Failed to refresh the similar content index")
+        finally:
+            db.close()
+
+    def _is_stale(self) -> bool:
+        return (
+            self._refreshed_at is None
+            or time.monotonic() - self._refreshed_at >= self.refresh_seconds
+        )
+
+    def _load(
+        self,
+        db: Session,
+        indexed: dict[str, IndexedContent],
+        groups: dict[tuple, EngagementGroup],
+        indexed_asset_id: int,
+        last_asset_id: int,
+    ) -> None:
+        """Index the content with an asset ID in (indexed_asset_id, last_asset_id], then swap the index in."""
+        rows = (
+            mapped_content_query(
+                db,
+                [
+                    PreprocessedUnbiased.id,
+                    PreprocessedUnbiased.video_source,
+                    PreprocessedUnbiased.video_posted_timestamp,
+                    AnalysisOutput.category_id,
+                    AnalysisOutput.sub_category_id,
+                    AnalysisOutput.risk_status,
+                    BAContentDataAsset.identification_id,
+                    BAContentDataAsset.video_engagement_rate,
+                ],
+                MapDirectLinkAnalysisPreprocessedUnbiased,
+            )
+            .filter(
+                BAContentDataAsset.id > indexed_asset_id,
+                BAContentDataAsset.id <= last_asset_id,
+            )
+            .all()
+        )
+        contents = {
+            row.id: IndexedContent(
+                content_id=row.id,
+                identification_id=row.identification_id,
+                category_id=row.category_id,
+                sub_category_id=row.sub_category_id,
+                engagement=math.log1p(max(row.video_engagement_rate or 0.0, 0.0)),
+                risk_status=row.risk_status,
+                video_source=row.video_source,
+                video_posted_timestamp=row.video_posted_timestamp,
+            )
+            for row in rows
+            if row.identification_id not in indexed
+        }
+
+        content_ids = list(contents)
+        for start in range(0, len(content_ids), TOPIC_QUERY_BATCH_SIZE):
+            topics = (
+                db.query(
+                    TopicKeywordsDetails.preprocessed_unbiased_id,
+                    TopicCategory.id,
+                    TopicCategory.topic_category_name,
+                )
+                .join(
+                    TopicKeywordsDetails,
+                    TopicCategory.id == TopicKeywordsDetails.topic_category_id,
+                )
+                .filter(
+                    TopicKeywordsDetails.preprocessed_unbiased_id.in_(
+                        content_ids[start : start + TOPIC_QUERY_BATCH_SIZE],
+                    ),
+                )
+                .order_by(TopicKeywordsDetails.id)
+                .all()
+            )
+            for content_id, topic_id, topic_name in topics:
+                content = contents[content_id]
+                if topic_id not in content.topic_ids:
+                    content.topic_ids.append(topic_id)
+                    content.topics.append(topic_name)
+
+        copied = set()
+        for content in contents.values():
+            indexed[content.identification_id] = content
+            for key in content.group_keys():
+                if key not in copied:
+                    groups[key] = (
+                        groups[key].copy() if key in groups else EngagementGroup()
+                    )
+                    copied.add(key)
+                groups[key].add(content)
+
+        self._contents, self._groups = indexed, groups
+        self._last_asset_id = last_asset_id
+
+    def get(self, identification_id: str) -> IndexedContent | None:
+        """Get an indexed content by identification ID."""
+        return self._contents.get(identification_id)
+
+    def similar(
+        self,
+        identification_id: str,
+        limit: int = DEFAULT_SIMILAR_CONTENT_LIMIT,
+    ) -> list[tuple[IndexedContent, float]]:
+        """Get the most similar content of a case.
+
+        Args:
+            identification_id (str): Identification ID of the case.
+            limit (int): Number of similar content.
+
+        Returns:
+            list[tuple[IndexedContent, float]]: Similar content and their similarity, most
+                similar first. Empty if the case is not indexed.
+
+        """
+        contents, groups = self._contents, self._groups
+        target = contents.get(identification_id)
+        if target is None:
+            return []
+
+        candidates = {}
+        for key in target.group_keys():
+            group = groups.get(key)
+            if group is None:
+                continue
+            for content in group.nearest(target.engagement, limit + 1):
+                if content is not target:
+                    candidates[content.content_id] = content
+
+        scored = [
+            (content, target.similarity(content)) for content in candidates.values()
+        ]
+        scored.sort(key=lambda item: (-item[1], item[0].content_id))
+        return scored[:limit]
+
+
+@lru_cache
+def get_similar_content_index() -> SimilarContentIndex:
+    """Get the process-wide similar content index."""
+    return SimilarContentIndex()
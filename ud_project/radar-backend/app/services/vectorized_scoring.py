@@ -0,0 +1,176 @@
+"""Vectorized engagement and risk scoring service.
+
+Scores a whole batch with the formulas of EngagementRiskService, as NumPy operations on
+columns of counts, dates and weights instead of one call per record.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from app.core.constants import TIER_RANGES
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+ENGAGEMENT_COLUMNS = (
+    "video_share_count",
+    "video_save_count",
+    "comment_count",
+    "video_like_count",
+    "video_view_count",
+)
+BREAKDOWN_KEYS = ("shares", "saves", "comments", "likes")
+RISK_FACTOR_KEYS = (
+    "engagement_contribution",
+    "risk_weight_contribution",
+    "subcat_weight_contribution",
+    "recency_contribution",
+)
+
+MICROSECONDS_PER_DAY = 86_400_000_000
+DECIMALS = 2
+
+# Upper bound and score of the recency tiers, to find the tier of every day count at once
+TIER_MAX_DAYS = np.array([max_days for _, max_days, _ in TIER_RANGES])
+TIER_SCORES = np.array([score for _, _, score in TIER_RANGES])
+
+
+@dataclass
+class EngagementScores:
+    """Engagement of a batch, one array item per record."""
+
+    total_engagement: np.ndarray
+    video_engagement: np.ndarray
+    breakdown: dict[str, np.ndarray]
+
+
+@dataclass
+class RiskScores:
+    """Risk of a batch, one array item per record."""
+
+    risk_score: np.ndarray
+    recency_score: np.ndarray
+    factors: dict[str, np.ndarray]
+
+
+def round_decimals(values: np.ndarray) -> np.ndarray:
+    """Round to 2 decimals as the built-in round, which np.round differs from on ties.
+
+    The built-in round rounds the exact value of a float, while np.round rounds the float
+    scaled by 100, so they differ when the scaling rounds a value close to a tie to the
+    tie, e.g. 12.075 rounds to 12.07 but scales to 1207.5. These ties are rounded with
+    the built-in round.
+    """
+    scale = 10**DECIMALS
+    scaled = values * scale
+    rounded = np.rint(scaled) / scale
+    ties = np.flatnonzero(scaled - np.floor(scaled) == 0.5)  # noqa: PLR2004
+    rounded[ties] = [round(value, DECIMALS) for value in values[ties].tolist()]
+    return rounded
+
+
+def _percentages(parts: np.ndarray, totals: np.ndarray) -> np.ndarray:
+    """Percentage of each part of its total, rounded, 0 where the total is 0."""
+    nonzero = totals != 0
+    percentages = np.zeros(len(parts))
+    np.divide(parts, totals, out=percentages, where=nonzero)
+    return round_decimals(percentages * 100)
+
+
+def score_engagement(
+    shares: np.ndarray,
+    saves: np.ndarray,
+    comments: np.ndarray,
+    likes: np.ndarray,
+    views: np.ndarray,
+) -> EngagementScores:
+    """Calculate the engagement of a batch, as EngagementRiskService.calculate_engagement.
+
+    Args:
+        shares: Share counts
+        saves: Save counts
+        comments: Comment counts
+        likes: Like counts
+        views: View counts, all above 0
+
+    Returns:
+        Total engagement, engagement rate and engagement breakdown of every record
+
+    """
+    total = shares + saves + comments + likes
+    video_engagement = round_decimals((total / views) * 100)
+    breakdown = {
+        key: _percentages(counts, total)
+        for key, counts in zip(BREAKDOWN_KEYS, (shares, saves, comments, likes))
+    }
+    return EngagementScores(total, video_engagement, breakdown)
+
+
+def to_datetime64(dates: Iterable[datetime]) -> np.ndarray:
+    """Convert dates to a UTC datetime64 array, naive dates being in UTC."""
+    return np.array(
+        [
+            date.astimezone(timezone.utc).replace(tzinfo=None)
+            if date.tzinfo is not None
+            else date
+            for date in dates
+        ],
+        dtype="datetime64[us]",
+    )
+
+
+def recency_scores(posted_dates: np.ndarray, now: datetime | None = None) -> np.ndarray:
+    """Calculate the recency score of every posted date, as EngagementRiskService.calculate_recency_score.
+
+    Args:
+        posted_dates: UTC posted dates, as datetime64
+        now: Current time, the time of the call by default
+
+    Returns:
+        Recency score of every posted date
+
+    """
+    now = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
+    now64 = np.datetime64(now.replace(tzinfo=None), "us")
+    elapsed = (now64 - posted_dates.astype("datetime64[us]")).astype(np.int64)
+    days = np.floor_divide(elapsed, MICROSECONDS_PER_DAY)
+
+    # The tiers are contiguous from day 0, so a tier is the first one ending on or after the
+    # day count; posted dates in the future fall back on the last tier
+    tiers = np.searchsorted(TIER_MAX_DAYS, days, side="left")
+    tiers[days < TIER_RANGES[0][0]] = len(TIER_RANGES) - 1
+    return TIER_SCORES[np.minimum(tiers, len(TIER_RANGES) - 1)]
+
+
+def score_risk(
+    video_engagement: np.ndarray,
+    risk_weights: np.ndarray,
+    subcat_weights: np.ndarray,
+    recency: np.ndarray,
+) -> RiskScores:
+    """Calculate the risk of a batch, as EngagementRiskService.calculate_risk.
+
+    Args:
+        video_engagement: Engagement rates
+        risk_weights: Weights of the risk statuses
+        subcat_weights: Weights of the sub-categories
+        recency: Recency scores, from recency_scores
+
+    Returns:
+        Risk score, recency score and risk factors of every record
+
+    """
+    risk = video_engagement * risk_weights * subcat_weights * recency
+    factors = {
+        key: _percentages(values, risk)
+        for key, values in zip(
+            RISK_FACTOR_KEYS,
+            (video_engagement, risk_weights, subcat_weights, recency),
+        )
+    }
+    return RiskScores(round_decimals(risk), recency, factors)
@@ -0,0 +1,220 @@
+"""Watchlist polling schedule service."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
+    from sqlalchemy.engine import Row
+
+
+@dataclass(eq=False)
+class WatchedCreator:
+    """Live status and polling state of a watchlist creator."""
+
+    watchlist_id: int
+    user_handle: str
+    is_live: bool
+    next_check_at: float
+    checked_at: float | None = None
+    offline_checks: int = 0
+
+
+@dataclass
+class WatchlistMetrics:
+    """Cycle time and lag of the watchlist monitor."""
+
+    cycles: int = 0
+    checks: int = 0
+    failed_checks: int = 0
+    last_cycle_checks: int = 0
+    last_cycle_seconds: float = 0.0
+    max_cycle_seconds: float = 0.0
+    last_cycle_lag_seconds: float = 0.0
+    max_lag_seconds: float = 0.0
+    lags: list[float] = field(default_factory=list, repr=False)
+
+    def record_check(self, lag: float, *, failed: bool = False) -> None:
+        """Record a check completed lag seconds after it was due."""
+        self.checks += 1
+        self.failed_checks += failed
+        self.lags.append(lag)
+
+    def record_cycle(self, seconds: float) -> None:
+        """Record a cycle and the checks recorded since the previous one."""
+        self.cycles += 1
+        self.last_cycle_checks = len(self.lags)
+        self.last_cycle_seconds = seconds
+        self.max_cycle_seconds = max(self.max_cycle_seconds, seconds)
+        self.last_cycle_lag_seconds = max(self.lags, default=0.0)
+        self.max_lag_seconds = max(self.max_lag_seconds, self.last_cycle_lag_seconds)
+        self.lags = []
+
+
+class WatchlistSchedule:
+    """Adaptive polling schedule of the watchlist creators.
+
+    Live creators are polled every hot interval so that stream ends are detected quickly.
+    Offline creators are polled every polling interval, doubled every backoff_checks
+    consecutive offline checks up to the max interval, so that long-offline creators are
+    polled less often. A creator going live or ending a stream is polled every polling
+    interval again.
+
+    The schedule is loaded with the watchlist rows updated since the last load, and fully
+    reloaded every resync interval or when its size does not match the watchlist, to drop
+    the removed creators.
+    """
+
+    def __init__(
+        self,
+        polling_interval: float,
+        hot_interval: float,
+        max_interval: float,
+        backoff_checks: int,
+        resync_seconds: float,
+    ) -> None:
+        """Initialize an empty schedule."""
+        self.polling_interval = polling_interval
+        self.hot_interval = hot_interval
+        self.max_interval = max_interval
+        self.backoff_checks = backoff_checks
+        self.resync_seconds = resync_seconds
+        self.creators: dict[int, WatchedCreator] = {}
+        self.metrics = WatchlistMetrics()
+        self.last_updated: datetime | None = None
+        self.resynced_at: float | None = None
+
+    def __len__(self) -> int:
+        """Get the number of scheduled creators."""
+        return len(self.creators)
+
+    def needs_resync(self, now: float) -> bool:
+        """Check whether the schedule should be fully reloaded."""
+        return self.resynced_at is None or now - self.resynced_at >= self.resync_seconds
+
+    def load(self, rows: Iterable[Row], now: float, *, full: bool = False) -> None:
+        """Load watchlist rows, keeping the polling state of the known creators.
+
+        Args:
+            rows: Rows with the id, user_handle, is_live and last_updated of the creators.
+            now: Monotonic time of the load.
+            full: Whether rows are the whole watchlist, dropping the creators missing from it.
+
+        """
+        loaded_ids = set()
+        for row in rows:
+            loaded_ids.add(row.id)
+            if row.last_updated is not None and (
+                self.last_updated is None or row.last_updated > self.last_updated
+            ):
+                self.last_updated = row.last_updated
+
+            creator = self.creators.get(row.id)
+            if creator is None or creator.user_handle != row.user_handle:
+                self.creators[row.id] = WatchedCreator(
+                    watchlist_id=row.id,
+                    user_handle=row.user_handle,
+                    is_live=bool(row.is_live),
+                    next_check_at=now,
+                )
+            elif bool(row.is_live) != creator.is_live:
+                # Updated outside of the monitor, e.g. through the update status endpoint
+                creator.is_live = bool(row.is_live)
+                creator.offline_checks = 0
+                creator.next_check_at = min(creator.next_check_at, now)
+
+        if full:
+            for watchlist_id in self.creators.keys() - loaded_ids:
+                del self.creators[watchlist_id]
+            self.resynced_at = now
+
+    def interval(self, creator: WatchedCreator) -> float:
+        """Get the polling interval of a creator."""
+        if creator.is_live:
+            return self.hot_interval
+        backoff = 2 ** (creator.offline_checks // self.backoff_checks)
+        return min(self.polling_interval * backoff, self.max_interval)
+
+    def due(self, now: float) -> list[WatchedCreator]:
+        """Get the creators due for a check, most overdue first."""
+        return sorted(
+            (
+                creator
+                for creator in self.creators.values()
+                if creator.next_check_at <= now
+            ),
+            key=lambda creator: creator.next_check_at,
+        )
+
+    def record_check(
+        self,
+        creator: WatchedCreator,
+        is_live: bool | None,
+        now: float | None = None,
+    ) -> None:
+        """Record the live status of a creator and schedule its next check.
+
+        Args:
+            creator: Checked creator.
+            is_live: Live status of the creator, None if the check failed.
+            now: Monotonic time of the end of the check, the time of the call by default.
+
+        """
+        now = time.monotonic() if now is None else now
+        self.metrics.record_check(
+            max(now - creator.next_check_at, 0.0),
+            failed=is_live is None,
+        )
+        if is_live is None:
+            # Retry a failed check within the polling interval, even if backed off
+            creator.next_check_at = now + min(
+                self.interval(creator),
+                self.polling_interval,
+            )
+            return
+
+        creator.offline_checks = (
+            creator.offline_checks + 1 if not is_live and not creator.is_live else 0
+        )
+        creator.is_live = is_live
+        creator.checked_at = now
+        creator.next_check_at = now + self.interval(creator)
+
+    def sleep_seconds(self, now: float) -> float:
+        """Get the time until the next due check, at most the polling interval and at least 1 second."""
+        next_check_at = min(
+            (creator.next_check_at for creator in self.creators.values()),
+            default=now + self.polling_interval,
+        )
+        return min(max(next_check_at - now, 1.0), self.polling_interval)
+
+    def status(self, now: float | None = None) -> dict:
+        """Get the size, cycle time and lag metrics of the schedule."""
+        now = time.monotonic() if now is None else now
+        checked_at = [
+            creator.checked_at
+            for creator in self.creators.values()
+            if creator.checked_at is not None
+        ]
+        metrics = self.metrics
+        return {
+            "creators": len(self.creators),
+            "live_creators": sum(creator.is_live for creator in self.creators.values()),
+            "due_creators": len(self.due(now)),
+            "oldest_check_seconds": round(now - min(checked_at), 3)
+            if checked_at
+            else None,
+            "cycles": metrics.cycles,
+            "checks": metrics.checks,
+            "failed_checks": metrics.failed_checks,
+            "last_cycle_checks": metrics.last_cycle_checks,
+            "last_cycle_seconds": round(metrics.last_cycle_seconds, 3),
+            "max_cycle_seconds": round(metrics.max_cycle_seconds, 3),
+            "last_cycle_lag_seconds": round(metrics.last_cycle_lag_seconds, 3),
+            "max_lag_seconds": round(metrics.max_lag_seconds, 3),
+        }
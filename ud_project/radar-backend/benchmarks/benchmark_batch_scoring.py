@@ -0,0 +1,173 @@
+"""Benchmark of the batch engagement and risk scoring.
+
+Compares scoring every record with EngagementRiskService (previous behaviour of the batch
+service) with the vectorized scoring, on arrays and end to end on NDJSON and Arrow stream
+bulk batches.
+
+Usage:
+    python -m benchmarks.benchmark_batch_scoring --records 1000000
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+
+from app.enums.bulk_format import BulkFormat
+from app.models.engagement_risk import (
+    EngagementCalculationRequest,
+    RiskCalculationRequest,
+)
+from app.services.batch_service import BatchProcessingService, read_bulk, write_bulk
+from app.services.engagement_risk import EngagementRiskService
+from app.services.vectorized_scoring import (
+    ENGAGEMENT_COLUMNS,
+    recency_scores,
+    score_engagement,
+    score_risk,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+RISK_STATUSES = ["High", "Medium", "Low", "Irrelevant"]
+SUB_CATEGORIES = ["Gold", "Cryptocurrency", "Forex", "Job Scam", "Other"]
+
+
+def make_batch(n_records: int, seed: int = 0) -> pl.DataFrame:
+    """Make a batch of random counts, posted dates and labels."""
+    rng = np.random.default_rng(seed)
+    now = np.datetime64(datetime.now(timezone.utc).replace(tzinfo=None), "us")
+    posted_offsets = rng.integers(0, 120 * 86_400, n_records) * 1_000_000
+    return pl.DataFrame(
+        {
+            "video_share_count": rng.integers(0, 1_000, n_records),
+            "video_save_count": rng.integers(0, 1_000, n_records),
+            "comment_count": rng.integers(0, 1_000, n_records),
+            "video_like_count": rng.integers(0, 100_000, n_records),
+            "video_view_count": rng.integers(1, 10_000_000, n_records),
+            "video_engagement": rng.uniform(0, 50, n_records),
+            "risk_status": rng.choice(RISK_STATUSES, n_records),
+            "sub_category": rng.choice(SUB_CATEGORIES, n_records),
+            "video_posted_date": now - posted_offsets.astype("timedelta64[us]"),
+        },
+    )
+
+
+def score_scalar(frame: pl.DataFrame) -> None:
+    """Score every record with EngagementRiskService, from validated requests."""
+    engagement_requests = [
+        EngagementCalculationRequest(**row)
+        for row in frame.select(ENGAGEMENT_COLUMNS).iter_rows(named=True)
+    ]
+    risk_requests = [
+        RiskCalculationRequest(
+            video_engagement=video_engagement,
+            risk_weights_mapping=0.5,
+            subcat_weights_mapping=0.33,
+            video_posted_date=posted_date,
+        )
+        for video_engagement, posted_date in frame.select(
+            "video_engagement",
+            "video_posted_date",
+        ).iter_rows()
+    ]
+    for request in engagement_requests:
+        EngagementRiskService.calculate_engagement(request)
+    for request in risk_requests:
+        EngagementRiskService.calculate_risk(request)
+
+
+def score_arrays(frame: pl.DataFrame) -> None:
+    """Score the columns of the batch with the vectorized scoring."""
+    score_engagement(*(frame[column].to_numpy() for column in ENGAGEMENT_COLUMNS))
+    score_risk(
+        frame["video_engagement"].to_numpy(),
+        np.full(len(frame), 0.5),
+        np.full(len(frame), 0.33),
+        recency_scores(frame["video_posted_date"].to_numpy()),
+    )
+
+
+def make_bulk_scoring(
+    frame: pl.DataFrame,
+    bulk_format: BulkFormat,
+) -> Callable[[pl.DataFrame], None]:
+    """Make a scoring of the batch serialized in a bulk format, from body to body."""
+    engagement_body = write_bulk(frame.select(ENGAGEMENT_COLUMNS), bulk_format)
+    risk_body = write_bulk(
+        frame.select(
+            "video_engagement",
+            "risk_status",
+            "sub_category",
+            "video_posted_date",
+        ),
+        bulk_format,
+    )
+
+    def score_bulk(_: pl.DataFrame) -> None:
+        write_bulk(
+            BatchProcessingService.process_engagement_bulk(
+                read_bulk(engagement_body, bulk_format),
+            ),
+            bulk_format,
+        )
+        write_bulk(
+            BatchProcessingService.process_risk_bulk(read_bulk(risk_body, bulk_format)),
+            bulk_format,
+        )
+
+    return score_bulk
+
+
+def run_benchmark(
+    name: str,
+    score: Callable[[pl.DataFrame], None],
+    frame: pl.DataFrame,
+) -> float:
+    """Time the engagement and risk scoring of a batch, returning the elapsed seconds."""
+    start_time = perf_counter()
+    score(frame)
+    elapsed_time = perf_counter() - start_time
+    print(  # noqa: T201
+        f"{name:<12} total {elapsed_time * 1000:10.2f} ms | "
+        f"per record {elapsed_time / len(frame) * 1e9:8.2f} ns",
+    )
+    return elapsed_time
+
+
+def _main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument(
+        "--scalar-records",
+        type=int,
+        default=100_000,
+        help="Records scored one by one, the per record time being extrapolated",
+    )
+    args = parser.parse_args()
+
+    frame = make_batch(args.records)
+    print(f"{args.records} records")  # noqa: T201
+    scalar_time = run_benchmark(
+        "scalar",
+        score_scalar,
+        frame.head(args.scalar_records),
+    ) * (args.records / min(args.scalar_records, args.records))
+    print(f"{'':<12} extrapolated {scalar_time * 1000:10.2f} ms")  # noqa: T201
+    run_benchmark("vectorized", score_arrays, frame)
+    for bulk_format in BulkFormat:
+        run_benchmark(
+            f"bulk {bulk_format.name.lower()}",
+            make_bulk_scoring(frame, bulk_format),
+            frame,
+        )
+
+
+if __name__ == "__main__":
+    _main()
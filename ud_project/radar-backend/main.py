@@ -6,6 +6,9 @@ import uvicorn
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 
+from app.api.endpoints.functions.comment_recording_function import (
+    flush_comment_buffers,
+)
 from app.api.endpoints.functions.watchlist_function import (
     initialize_monitoring,
     shutdown_monitoring,
@@ -26,6 +29,8 @@ async def lifespan(app_: FastAPI):  # noqa: ARG001, ANN201
     finally:
         logger.info("Shutting down: Cleaning up watchlist monitoring.")
         await shutdown_monitoring()
+        logger.info("Shutting down: Saving buffered live comments.")
+        await flush_comment_buffers()
 
 
 def create_app() -> FastAPI:
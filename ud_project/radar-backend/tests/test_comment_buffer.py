@@ -0,0 +1,100 @@
+"""Module contains tests for the comment write buffer in the app.services module."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services import comment_buffer
+from app.services.comment_buffer import CommentWriteBuffer
+
+
+def mock_session_factory(session: AsyncMock) -> MagicMock:
+    """Mock a session factory yielding the same session."""
+
+    @asynccontextmanager
+    async def session_scope():  # noqa: ANN202
+        yield session
+
+    return MagicMock(side_effect=session_scope)
+
+
+def inserted_batch_sizes(session: AsyncMock) -> list[int]:  # noqa: FA102
+    """Get the number of rows of every INSERT executed on the session."""
+    return [
+        len(call.args[0].compile().params) // 4
+        for call in session.execute.call_args_list
+    ]
+
+
+@pytest.mark.asyncio
+async def test_flush_by_size_and_on_close() -> None:
+    """Test comments are written in batches of max_batch and the remainder on close."""
+    session = AsyncMock()
+    buffer = CommentWriteBuffer(
+        mock_session_factory(session),
+        max_batch=10,
+        flush_interval=60,
+        max_queue=100,
+    )
+
+    for index in range(25):
+        await buffer.put("stream1", "user1", {"comment": index})
+    await asyncio.sleep(0)
+    status = buffer.status()["stream1"]
+    await buffer.close("stream1")
+
+    assert status["ingested"] == 25  # noqa: S101, PLR2004
+    assert inserted_batch_sizes(session) == [10, 10, 5]  # noqa: S101
+    assert session.commit.await_count == 3  # noqa: S101, PLR2004
+    assert buffer.status() == {}  # noqa: S101
+    totals = buffer.totals()
+    assert totals["open_streams"] == 0  # noqa: S101
+    assert totals["closed_streams"] == 1  # noqa: S101
+    assert totals["flushed"] == 25  # noqa: S101, PLR2004
+    assert totals["flushes"] == 3  # noqa: S101, PLR2004
+
+
+@pytest.mark.asyncio
+async def test_flush_by_interval() -> None:
+    """Test a partial batch is written once the flush interval has elapsed."""
+    session = AsyncMock()
+    buffer = CommentWriteBuffer(
+        mock_session_factory(session),
+        max_batch=10,
+        flush_interval=0.05,
+        max_queue=100,
+    )
+
+    for index in range(3):
+        await buffer.put("stream1", "user1", {"comment": index})
+    await asyncio.sleep(0.2)
+
+    assert inserted_batch_sizes(session) == [3]  # noqa: S101
+    assert buffer.status()["stream1"]["flushed"] == 3  # noqa: S101, PLR2004
+    await buffer.close_all()
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_drops_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a batch is retried and dropped once every attempt failed."""
+    monkeypatch.setattr(comment_buffer, "FLUSH_RETRY_DELAY", 0)
+    session = AsyncMock()
+    session.execute.side_effect = RuntimeError("database unavailable")
+    buffer = CommentWriteBuffer(
+        mock_session_factory(session),
+        max_batch=10,
+        flush_interval=60,
+        max_queue=100,
+    )
+
+    await buffer.put("stream1", "user1", {"comment": "hello"})
+    stream_buffer = buffer.streams["stream1"]
+    await buffer.close("stream1")
+
+    assert session.execute.await_count == comment_buffer.FLUSH_ATTEMPTS  # noqa: S101
+    assert stream_buffer.metrics.dropped == 1  # noqa: S101
+    assert stream_buffer.metrics.flushed == 0  # noqa: S101
+    assert buffer.totals()["dropped"] == 1  # noqa: S101
+    assert buffer.totals()["failed_flushes"] == comment_buffer.FLUSH_ATTEMPTS  # noqa: S101
@@ -5,7 +5,10 @@ from unittest.mock import MagicMock
 import pytest
 from sqlalchemy.orm import Session
 
-from app.api.endpoints.functions.content_function import get_content_details
+from app.api.endpoints.functions.content_function import (
+    get_all_content_details,
+    get_content_details,
+)
 from app.models.analysis_output_table import AnalysisOutput
 from app.models.category_table import Category
 from app.models.comments_output_table import CommentsOutput
@@ -15,6 +18,7 @@ from app.models.profile_data_asset_table import BAProfileDataAsset
 from app.models.sub_category_table import SubCategory
 from app.models.topic_category_table import TopicCategory
 from app.models.trial_ba_wordcloud_table import TrialBAWordcloud
+from app.services.content_detail_cache import get_content_detail_cache
 
 LIKES = 100
 ENGAGEMENT_SCORE = 0.5
@@ -28,8 +32,29 @@ USER_TOTAL_VIDEOS = 50
 
 @pytest.fixture
 def mock_db_session() -> Session:
-    """Fixture to mock a database session."""
-    return MagicMock(spec=Session)
+    """Fixture to mock a database session, with an empty content detail cache."""
+    get_content_detail_cache.cache_clear()
+    db = MagicMock(spec=Session)
+    query = db.query.return_value
+    for method in ("filter", "join", "outerjoin", "order_by", "limit"):
+        getattr(query, method).return_value = query
+    return db
+
+
+def related_row(
+    kind: str,
+    row_id: int,
+    text: str,
+    posted_timestamp: str | None = None,  # noqa: FA102
+) -> MagicMock:
+    """Build a row of the related comments, topics and keywords query."""
+    return MagicMock(
+        kind=kind,
+        video_id="video123",
+        id=row_id,
+        text=text,
+        posted_timestamp=posted_timestamp,
+    )
 
 
 def test_content_details(mock_db_session: Session) -> None:  # noqa: PLR0915
@@ -54,6 +79,7 @@ def test_content_details(mock_db_session: Session) -> None:  # noqa: PLR0915
     mock_content.eng_justification = '["justification1", "justification2"]'
     mock_content.malay_justification = '["justifikasi1", "justifikasi2"]'
     mock_content.video_summary = "This is a video summary"
+    mock_content.video_description = "A video about keyword1"
     mock_content.topic_category = "Topic A"
 
     # Mocking the MappedCatSub object
@@ -96,19 +122,30 @@ def test_content_details(mock_db_session: Session) -> None:  # noqa: PLR0915
     mock_topic_category = MagicMock(spec=TopicCategory)
     mock_topic_category.topic_category_name = "Topic A"
 
-    # Setting up the mock session to return the mocked objects
-    mock_db_session.query.return_value.filter.return_value.first.side_effect = [
-        mock_content,
-        mock_mapped_cat_sub,
-        mock_analysis,
-        mock_category,
-        mock_sub_category,
-        mock_profile,
+    # Setting up the mock session to return the joined content row and its related rows
+    mock_db_session.query.return_value.all.return_value = [
+        MagicMock(
+            BAContentDataAsset=mock_content,
+            BAProfileDataAsset=mock_profile,
+            category_name=mock_category.category_name,
+            sub_category_name=mock_sub_category.sub_category_name,
+            analysis_id=1,
+            analysis_timestamp=mock_analysis.timestamp,
+        ),
     ]
-    mock_db_session.query.return_value.filter.return_value.all.side_effect = [
-        [mock_comment],
-        [mock_wordcloud],
-        [mock_topic_category],
+    mock_db_session.execute.return_value.all.side_effect = [
+        [],
+        [
+            related_row(
+                "comment",
+                1,
+                mock_comment.text,
+                mock_comment.comment_posted_timestamp,
+            ),
+            related_row("keyword", 2, "missing"),
+            related_row("keyword", 1, mock_wordcloud.keyword),
+            related_row("topic", 1, mock_topic_category.topic_category_name),
+        ],
     ]
 
     # Calling the function under test
@@ -129,6 +166,13 @@ def test_content_details(mock_db_session: Session) -> None:  # noqa: PLR0915
     assert result["content_url"] == "http://example.com/video.mp4"  # noqa: S101
     assert result["content_description"] == "This is a video description"  # noqa: S101
     assert result["scrappedDate"] == "2024-01-01T00:00:00"  # noqa: S101
+    assert result["ai_topic"] == ["Topic A"]  # noqa: S101
+    assert result["content_tags"] == ["keyword1"]  # noqa: S101
+    assert result["wordcloud"] == ["keyword1"]  # noqa: S101
+    assert [event["text"] for event in result["content_events"]] == [  # noqa: S101
+        "Analysis Completed",
+        "Comments Retrieved",
+    ]
     assert result["comment_content"] == ["This is a comment"]  # noqa: S101
     assert result["profile"]["user_following_count"] == USER_FOLLOWING_COUNT  # noqa: S101
     assert result["profile"]["user_followers_count"] == USER_FOLLOWERS_COUNT  # noqa: S101
@@ -169,3 +213,70 @@ def test_content_details(mock_db_session: Session) -> None:  # noqa: PLR0915
         "Sexual Harassment",
         "Violence",
     ]
+
+
+def test_content_details_cached(mock_db_session: Session) -> None:
+    """Test the details are reassembled only when the comments of the video change."""
+    mock_content = MagicMock(spec=BAContentDataAsset)
+    mock_content.video_id = "video123"
+    mock_content.video_description = ""
+    mock_content.video_hashtags = "[]"
+    mock_content.eng_justification = "[]"
+    mock_content.malay_justification = "[]"
+    mock_content.content_law_regulated = "[]"
+    mock_db_session.query.return_value.all.return_value = [
+        MagicMock(
+            BAContentDataAsset=mock_content,
+            BAProfileDataAsset=None,
+            analysis_id=None,
+        ),
+    ]
+    comments_version = MagicMock(
+        kind="comments_output",
+        video_id="video123",
+        count=1,
+        last_id=1,
+        last_timestamp=None,
+    )
+    comment = related_row("comment", 1, "first comment")
+    mock_db_session.execute.return_value.all.side_effect = [
+        [comments_version],
+        [comment],
+        [comments_version],
+        [
+            MagicMock(
+                kind="comments_output",
+                video_id="video123",
+                count=2,
+                last_id=2,
+                last_timestamp=None,
+            ),
+        ],
+        [comment, related_row("comment", 2, "second comment")],
+    ]
+
+    first = get_content_details("video123", mock_db_session)
+    cached = get_content_details("video123", mock_db_session)
+    updated = get_content_details("video123", mock_db_session)
+
+    assert cached is first  # noqa: S101
+    assert mock_db_session.query.call_count == 2  # noqa: S101, PLR2004
+    assert updated["comment_content"] == ["first comment", "second comment"]  # noqa: S101
+
+
+def test_all_content_details_page(mock_db_session: Session) -> None:
+    """Test a page skips the content without details and returns the next page cursor."""
+    mock_db_session.query.return_value.all.side_effect = [
+        [
+            MagicMock(id=1, video_id="video1"),
+            MagicMock(id=2, video_id="video2"),
+            MagicMock(id=3, video_id="video3"),
+        ],
+        [],
+    ]
+    mock_db_session.execute.return_value.all.return_value = []
+
+    page = get_all_content_details(mock_db_session, cursor=None, limit=2)
+
+    assert page == {"data": [], "next_cursor": 2}  # noqa: S101
+    mock_db_session.query.return_value.limit.assert_called_once_with(3)
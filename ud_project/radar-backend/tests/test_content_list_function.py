@@ -0,0 +1,47 @@
+"""Module contains tests for the content_list_function in the app.api.endpoints.functions module."""
+
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.endpoints.functions.content_list_function import (
+    content_filters,
+    decode_cursor,
+    encode_cursor,
+)
+from app.core.constants import BAD_REQUEST_STATUS_CODE
+from app.enums.content_sort import ContentSort
+
+
+def test_cursor_round_trip() -> None:
+    """Test a cursor decodes to the position it was encoded from."""
+    posted_timestamp = datetime(2024, 1, 1, 10, 30)  # noqa: DTZ001
+
+    date_cursor = encode_cursor(ContentSort.DATE, posted_timestamp, 42)
+    risk_cursor = encode_cursor(ContentSort.RISK, 4, 7)
+
+    assert decode_cursor(date_cursor, ContentSort.DATE) == (posted_timestamp, 42)  # noqa: S101
+    assert decode_cursor(risk_cursor, ContentSort.RISK) == (4, 7)  # noqa: S101
+
+
+@pytest.mark.parametrize(
+    ("cursor", "sort"),
+    [
+        ("not a cursor", ContentSort.DATE),
+        (encode_cursor(ContentSort.RISK, 4, 7), ContentSort.DATE),
+    ],
+)
+def test_decode_invalid_cursor(cursor: str, sort: ContentSort) -> None:
+    """Test an invalid cursor, or a cursor of another sort, is a bad request."""
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, sort)
+
+    assert exc_info.value.status_code == BAD_REQUEST_STATUS_CODE  # noqa: S101
+
+
+def test_content_filters() -> None:
+    """Test only the given filters are built."""
+    assert content_filters() == []  # noqa: S101
+    assert len(content_filters(risk="High")) == 1  # noqa: S101
+    assert len(content_filters(risk="High", social_media="www")) == 2  # noqa: S101, PLR2004
@@ -0,0 +1,176 @@
+"""Module contains tests for the similar content index in the app.services module."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.services.similar_content_index import (
+    EngagementGroup,
+    IndexedContent,
+    SimilarContentIndex,
+)
+
+
+@pytest.fixture
+def mock_db_session() -> MagicMock:
+    """Mock the database session, every query method returning the same query."""
+    db = MagicMock(spec=Session)
+    query = db.query.return_value
+    for method in ("filter", "select_from", "outerjoin", "join", "order_by"):
+        getattr(query, method).return_value = query
+    return db
+
+
+def content_row(
+    content_id: int,
+    category_id: int,
+    sub_category_id: int,
+    engagement_rate: float,
+) -> MagicMock:
+    """Build a row of the indexed content query."""
+    return MagicMock(
+        id=content_id,
+        identification_id=f"case{content_id}",
+        category_id=category_id,
+        sub_category_id=sub_category_id,
+        risk_status="high",
+        video_source=f"https://www.tiktok.com/{content_id}",
+        video_posted_timestamp=None,
+        video_engagement_rate=engagement_rate,
+    )
+
+
+def test_engagement_group_nearest() -> None:
+    """Test the group returns the content with the closest engagement."""
+    group = EngagementGroup()
+    for content_id, engagement in enumerate([0.1, 5.0, 1.0, 2.0, 9.0]):
+        group.add(
+            IndexedContent(
+                content_id=content_id,
+                identification_id=f"case{content_id}",
+                category_id=None,
+                sub_category_id=None,
+                engagement=engagement,
+                risk_status=None,
+                video_source=None,
+                video_posted_timestamp=None,
+            ),
+        )
+
+    nearest = group.nearest(1.8, 3)
+
+    assert [content.engagement for content in nearest] == [2.0, 1.0, 0.1]  # noqa: S101
+
+
+def test_similar_content(mock_db_session: MagicMock) -> None:
+    """Test the similar content are ranked by shared topic, category and engagement."""
+    mock_db_session.query.return_value.scalar.return_value = 4
+    mock_db_session.query.return_value.all.side_effect = [
+        [
+            content_row(1, category_id=1, sub_category_id=10, engagement_rate=2.0),
+            content_row(2, category_id=1, sub_category_id=10, engagement_rate=2.5),
+            content_row(3, category_id=1, sub_category_id=11, engagement_rate=2.0),
+            content_row(4, category_id=2, sub_category_id=20, engagement_rate=2.0),
+        ],
+        [(1, 100, "Scam"), (2, 100, "Scam"), (4, 100, "Scam")],
+    ]
+    index = SimilarContentIndex()
+
+    index.refresh(mock_db_session)
+    similar = index.similar("case1", limit=2)
+
+    assert len(index) == 4  # noqa: S101, PLR2004
+    assert [content.identification_id for content, _ in similar] == ["case2", "case4"]  # noqa: S101
+    assert similar[0][0].topics == ["Scam"]  # noqa: S101
+    assert index.similar("unknown") == []  # noqa: S101
+
+
+def test_refresh_loads_only_new_content(mock_db_session: MagicMock) -> None:
+    """Test a refresh skips loading when no content was added since the last one."""
+    mock_db_session.query.return_value.scalar.return_value = 1
+    mock_db_session.query.return_value.all.side_effect = [
+        [content_row(1, category_id=1, sub_category_id=10, engagement_rate=2.0)],
+        [],
+    ]
+    index = SimilarContentIndex()
+    index.refresh(mock_db_session)
+
+    index.refresh(mock_db_session)
+    index.refresh(mock_db_session, force=True)
+
+    assert mock_db_session.query.return_value.scalar.call_count == 2  # noqa: S101, PLR2004
+    assert mock_db_session.query.return_value.all.call_count == 2  # noqa: S101, PLR2004
+    assert index.get("case1") is not None  # noqa: S101
+
+
+def test_refresh_serves_index_while_refreshing(mock_db_session: MagicMock) -> None:
+    """Test a refresh of a built index does not wait for the refresh of another thread."""
+    index = SimilarContentIndex(refresh_seconds=0)
+    index.refresh(mock_db_session)
+    mock_db_session.reset_mock()
+
+    with index._lock:  # noqa: SLF001
+        assert not index.refresh(mock_db_session)  # noqa: S101
+        index.refresh_in_background(MagicMock())
+
+    mock_db_session.query.assert_not_called()
+    assert index.is_built  # noqa: S101
+
+
+def test_refresh_waits_for_first_build(mock_db_session: MagicMock) -> None:
+    """Test a refresh before the first build waits for the build of another thread."""
+    loading = threading.Event()
+    release = threading.Event()
+    results = [
+        [content_row(1, category_id=1, sub_category_id=10, engagement_rate=2.0)],
+        [],
+    ]
+
+    def load_rows() -> list:
+        """Load the content once the test releases the build, then their topics."""
+        if not loading.is_set():
+            loading.set()
+            release.wait(5)
+        return results.pop(0)
+
+    mock_db_session.query.return_value.scalar.return_value = 1
+    mock_db_session.query.return_value.all.side_effect = load_rows
+    index = SimilarContentIndex()
+    building = threading.Thread(target=index.refresh, args=(mock_db_session,))
+    waiting_db = MagicMock(spec=Session)
+    waiting = threading.Thread(target=index.refresh, args=(waiting_db,))
+
+    building.start()
+    assert loading.wait(5)  # noqa: S101
+    waiting.start()
+    waiting.join(0.1)
+    assert waiting.is_alive()  # noqa: S101
+
+    release.set()
+    building.join(5)
+    waiting.join(5)
+
+    assert not waiting.is_alive()  # noqa: S101
+    assert index.get("case1") is not None  # noqa: S101
+    waiting_db.query.assert_not_called()
+
+
+def test_refresh_in_background(mock_db_session: MagicMock) -> None:
+    """Test a stale index is refreshed in a thread with its own session, closed after."""
+    mock_db_session.query.return_value.scalar.return_value = 1
+    mock_db_session.query.return_value.all.side_effect = [
+        [content_row(1, category_id=1, sub_category_id=10, engagement_rate=2.0)],
+        [],
+    ]
+    index = SimilarContentIndex()
+
+    with patch.object(threading, "Thread") as thread:
+        index.refresh_in_background(MagicMock(return_value=mock_db_session))
+    target = thread.call_args.kwargs["target"]
+    target(*thread.call_args.kwargs["args"])
+
+    thread.return_value.start.assert_called_once()
+    assert index.get("case1") is not None  # noqa: S101
+    mock_db_session.close.assert_called_once()
@@ -0,0 +1,127 @@
+"""Module contains tests for the vectorized scoring in the app.services module."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import polars as pl
+
+from app.models.engagement_risk import (
+    EngagementCalculationRequest,
+    RiskCalculationRequest,
+)
+from app.services.batch_service import BatchProcessingService
+from app.services.engagement_risk import EngagementRiskService
+from app.services.vectorized_scoring import (
+    BREAKDOWN_KEYS,
+    RISK_FACTOR_KEYS,
+    recency_scores,
+    round_decimals,
+    score_engagement,
+    score_risk,
+    to_datetime64,
+)
+
+
+def test_round_decimals_matches_round() -> None:
+    """Test values scaled to a tie are rounded as the built-in round."""
+    values = np.array([12.075, 0.285, 1.005, 2.675, 6.75, 81.175, 0.0])
+
+    expected = [round(value, 2) for value in values.tolist()]
+
+    assert round_decimals(values).tolist() == expected  # noqa: S101
+
+
+def test_recency_scores_tiers() -> None:
+    """Test the recency scores at the bounds of the tiers, and of future dates."""
+    now = datetime(2025, 1, 31, 12, tzinfo=timezone.utc)
+    days = [0, 7, 8, 14, 15, 85, 400, -1]
+    posted_dates = to_datetime64(now - timedelta(days=day, hours=1) for day in days)
+
+    scores = recency_scores(posted_dates, now)
+
+    assert scores.tolist() == [25, 25, 20, 20, 15, 4, 4, 4]  # noqa: S101
+
+
+def test_score_matches_engagement_risk_service() -> None:
+    """Test the vectorized scoring matches the scoring of every record."""
+    requests = [
+        EngagementCalculationRequest(
+            video_share_count=shares,
+            video_save_count=saves,
+            comment_count=comments,
+            video_like_count=likes,
+            video_view_count=views,
+        )
+        for shares, saves, comments, likes, views in [
+            (270, 483, 0, 3247, 161924),
+            (0, 0, 0, 0, 10),
+            (1, 2, 3, 4, 5),
+        ]
+    ]
+    posted_date = datetime.now(timezone(timedelta(hours=8))) - timedelta(days=10)
+
+    engagement = score_engagement(
+        *(
+            np.array([getattr(request, column) for request in requests])
+            for column in (
+                "video_share_count",
+                "video_save_count",
+                "comment_count",
+                "video_like_count",
+                "video_view_count",
+            )
+        ),
+    )
+    risk = score_risk(
+        engagement.video_engagement,
+        np.full(len(requests), 0.8),
+        np.full(len(requests), 0.33),
+        recency_scores(to_datetime64([posted_date] * len(requests))),
+    )
+
+    for index, request in enumerate(requests):
+        total, rate, breakdown = EngagementRiskService.calculate_engagement(request)
+        risk_score, recency_score, factors = EngagementRiskService.calculate_risk(
+            RiskCalculationRequest(
+                video_engagement=rate,
+                risk_weights_mapping=0.8,
+                subcat_weights_mapping=0.33,
+                video_posted_date=posted_date,
+            ),
+        )
+        assert engagement.total_engagement[index] == total  # noqa: S101
+        assert engagement.video_engagement[index] == rate  # noqa: S101
+        assert {  # noqa: S101
+            key: engagement.breakdown[key][index] for key in BREAKDOWN_KEYS
+        } == breakdown
+        assert risk.risk_score[index] == risk_score  # noqa: S101
+        assert risk.recency_score[index] == recency_score  # noqa: S101
+        assert {key: risk.factors[key][index] for key in RISK_FACTOR_KEYS} == factors  # noqa: S101
+
+
+def test_process_bulk_masks_invalid_records() -> None:
+    """Test the bulk scoring keeps the order of the records, with null invalid records."""
+    engagement = BatchProcessingService.process_engagement_bulk(
+        pl.DataFrame(
+            {
+                "video_share_count": [1, 1, None],
+                "video_save_count": [1, 1, 1],
+                "comment_count": [1, 1, 1],
+                "video_like_count": [1, 1, 1],
+                "video_view_count": [8, 0, 8],
+            },
+        ),
+    )
+    risk = BatchProcessingService.process_risk_bulk(
+        pl.DataFrame(
+            {
+                "video_engagement": [50.0, 50.0],
+                "risk_status": ["High", None],
+                "sub_category": ["Gold", "Gold"],
+                "video_posted_date": [datetime.now(timezone.utc).isoformat(), "bad"],
+            },
+        ),
+    )
+
+    assert engagement["video_engagement"].to_list() == [50.0, None, None]  # noqa: S101
+    assert risk["recency_score"].to_list() == [25, None]  # noqa: S101
@@ -0,0 +1,125 @@
+"""Module contains tests for the watchlist schedule in the app.services module."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.api.endpoints.functions import watchlist_function
+from app.services.watchlist_schedule import WatchlistSchedule
+
+
+@pytest.fixture
+def schedule() -> WatchlistSchedule:
+    """Schedule polling every 30s, every 10s when live, backing off every 2 offline checks."""
+    return WatchlistSchedule(
+        polling_interval=30,
+        hot_interval=10,
+        max_interval=100,
+        backoff_checks=2,
+        resync_seconds=300,
+    )
+
+
+def watchlist_row(
+    watchlist_id: int,
+    *,
+    is_live: bool = False,
+    last_updated: datetime | None = None,  # noqa: FA102
+) -> MagicMock:
+    """Build a row of the watchlist query."""
+    return MagicMock(
+        id=watchlist_id,
+        user_handle=f"user{watchlist_id}",
+        is_live=is_live,
+        last_updated=last_updated or datetime(2025, 1, 1),  # noqa: DTZ001
+    )
+
+
+def test_intervals_back_off_while_offline(schedule: WatchlistSchedule) -> None:
+    """Test live creators are polled often and long-offline creators less and less."""
+    schedule.load([watchlist_row(1)], now=0, full=True)
+    creator = schedule.creators[1]
+
+    intervals = []
+    for now in range(7):
+        schedule.record_check(creator, is_live=False, now=now)
+        intervals.append(creator.next_check_at - now)
+    schedule.record_check(creator, is_live=True, now=7)
+
+    assert intervals == [30, 60, 60, 100, 100, 100, 100]  # noqa: S101
+    assert creator.next_check_at == 7 + 10  # noqa: S101
+
+    schedule.record_check(creator, is_live=False, now=8)
+    assert creator.next_check_at == 8 + 30  # noqa: S101
+
+
+def test_failed_check_is_retried(schedule: WatchlistSchedule) -> None:
+    """Test a failed check keeps the live status and is retried within the polling interval."""
+    schedule.load([watchlist_row(1, is_live=True)], now=0, full=True)
+    creator = schedule.creators[1]
+    creator.offline_checks = 10
+
+    schedule.record_check(creator, None, now=5)
+
+    assert creator.is_live  # noqa: S101
+    assert creator.next_check_at == 5 + 10  # noqa: S101
+    assert schedule.metrics.failed_checks == 1  # noqa: S101
+
+
+def test_load_keeps_state_and_drops_removed_creators(
+    schedule: WatchlistSchedule,
+) -> None:
+    """Test loading rows keeps the schedule of known creators and a full load drops the removed ones."""
+    schedule.load([watchlist_row(1), watchlist_row(2)], now=0, full=True)
+    schedule.record_check(schedule.creators[1], is_live=False, now=1)
+
+    schedule.load(
+        [watchlist_row(2, is_live=True, last_updated=datetime(2025, 1, 2))],  # noqa: DTZ001
+        now=2,
+    )
+    assert [creator.user_handle for creator in schedule.due(2)] == ["user2"]  # noqa: S101
+    assert schedule.creators[2].is_live  # noqa: S101
+    assert schedule.last_updated == datetime(2025, 1, 2)  # noqa: S101, DTZ001
+
+    schedule.load([watchlist_row(2)], now=3, full=True)
+    assert list(schedule.creators) == [2]  # noqa: S101
+    assert not schedule.needs_resync(4)  # noqa: S101
+
+
+def test_metrics_record_cycle_time_and_lag(schedule: WatchlistSchedule) -> None:
+    """Test the cycle metrics take the lag of the checks of the cycle."""
+    schedule.load([watchlist_row(1), watchlist_row(2)], now=0, full=True)
+
+    schedule.record_check(schedule.creators[1], is_live=False, now=0.5)
+    schedule.record_check(schedule.creators[2], is_live=False, now=1.5)
+    schedule.metrics.record_cycle(1.5)
+    status = schedule.status(now=2)
+
+    assert status["last_cycle_checks"] == 2  # noqa: S101, PLR2004
+    assert status["last_cycle_lag_seconds"] == 1.5  # noqa: S101, PLR2004
+    assert status["oldest_check_seconds"] == 1.5  # noqa: S101, PLR2004
+    assert schedule.sleep_seconds(now=2) == 28.5  # noqa: S101, PLR2004
+
+
+@pytest.mark.asyncio
+async def test_fetch_live_statuses_skips_failed_checks() -> None:
+    """Test users are checked concurrently and the failed checks left out."""
+    check_live_status = AsyncMock(
+        side_effect=lambda username, _: (
+            {"data": {"alive": False}}
+            if username == "failed"
+            else {"alive": username == "live"}
+        ),
+    )
+
+    with patch.object(watchlist_function, "check_live_status", check_live_status):
+        statuses = await watchlist_function.fetch_live_statuses(
+            ["live", "offline", "failed"],
+            MagicMock(),
+            asyncio.Semaphore(2),
+        )
+
+    assert statuses == {"live": {"alive": True}, "offline": {"alive": False}}  # noqa: S101
+    assert check_live_status.await_count == 3  # noqa: S101, PLR2004
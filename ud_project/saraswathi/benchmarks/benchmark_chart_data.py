@@ -0,0 +1,237 @@
+"""Benchmark of the chart data transformations shared by the extractor and updater.
+
+Compares the previous row-wise code of the chart generators (decimal conversion
+of the chart series, "YYYY-MM" X-Axis sorting, series pivots and table chart
+cell formatting) with the
+vectorized helpers of `components/utils/chart_data.py`, on query results with
+DECIMAL Y-Axis values as returned by MySQL.
+
+Usage:
+    python -m benchmarks.benchmark_chart_data --rows 10000 100000 1000000
+"""
+
+import datetime
+import decimal
+
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from components.utils import (
+    build_table_rows,
+    pivot_series_columns,
+    sort_by_date_parts,
+    sort_pandas_date,
+    to_json_list,
+)
+
+
+def make_chart_data(n_rows: int, n_series: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    months = [f"{2000 + idx // 12}-{idx % 12 + 1}" for idx in range(240)]
+
+    return pd.DataFrame(
+        {
+            "xAxis": rng.choice(months, n_rows),
+            "series": rng.choice([f"series_{idx}" for idx in range(n_series)], n_rows),
+            "yAxis": [
+                decimal.Decimal(f"{value:.2f}") for value in rng.random(n_rows) * 1000
+            ],
+        }
+    )
+
+
+def json_list_before(chart_data: pd.DataFrame) -> list:
+    return [
+        float(val) if isinstance(val, decimal.Decimal) else val
+        for val in chart_data["yAxis"].values.tolist()
+    ]
+
+
+def json_list_after(chart_data: pd.DataFrame) -> list:
+    return to_json_list(chart_data["yAxis"])
+
+
+def sort_before(chart_data: pd.DataFrame) -> pd.DataFrame:
+    try:
+        chart_data = chart_data.sort_values(
+            by="xAxis",
+            key=lambda x: x.apply(
+                lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
+            ),
+        )
+    except Exception:
+        chart_data = chart_data.sort_values(by="xAxis", ascending=True)
+
+    def parse_date(date_str):
+        year, month = date_str.split("-")
+        return (int(year), int(month), 0)
+
+    return chart_data.sort_values(by="xAxis", key=lambda x: x.apply(parse_date))
+
+
+def sort_after(chart_data: pd.DataFrame) -> pd.DataFrame:
+    return sort_pandas_date(sort_by_date_parts(chart_data, "xAxis"), "xAxis")
+
+
+def pivot_before(chart_data: pd.DataFrame) -> pd.DataFrame:
+    new_chart_data = pd.DataFrame()
+
+    pivot_data = chart_data.pivot_table(
+        index="xAxis", columns="series", values=["yAxis"]
+    )
+    pivot_data = pivot_data.reset_index()
+    new_chart_data["xAxis"] = [
+        float(val) if isinstance(val, decimal.Decimal) else val
+        for val in pivot_data["xAxis"].values.tolist()
+    ]
+
+    yAxis_pivot_table = pivot_data["yAxis"]
+    for yAxis_pivot_column in list(yAxis_pivot_table.columns):
+        new_columns = {
+            f"yAxis_{yAxis_pivot_column}": [
+                float(val) if isinstance(val, decimal.Decimal) else val
+                for val in yAxis_pivot_table[yAxis_pivot_column].values.tolist()
+            ],
+        }
+        added_chart_data = pd.DataFrame(new_columns)
+        new_chart_data = pd.concat([new_chart_data, added_chart_data], axis=1)
+
+    return new_chart_data.fillna(
+        {
+            col: (0 if new_chart_data[col].dtype in [np.float64, np.int64] else "null")
+            for col in new_chart_data.columns
+        },
+    )
+
+
+def pivot_after(chart_data: pd.DataFrame) -> pd.DataFrame:
+    return pivot_series_columns(chart_data, "xAxis", "series", ["yAxis"])
+
+
+def table_rows_before(chart_data: pd.DataFrame) -> list:
+    table_data = []
+
+    for row in chart_data.values.tolist():
+        row_data = {}
+        for column_idx, column_name in enumerate(chart_data.columns):
+            try:
+                if isinstance(row[column_idx], int):
+                    row_data[column_name] = row[column_idx]
+                elif isinstance(row[column_idx], float):
+                    row_data[column_name] = round(row[column_idx], 6)
+                elif isinstance(row[column_idx], decimal.Decimal):
+                    row_data[column_name] = round(float(row[column_idx]), 6)
+                elif (
+                    isinstance(row[column_idx], datetime.date)
+                    or isinstance(row[column_idx], datetime.datetime)
+                ) and not pd.isnull(row[column_idx]):
+                    row_data[column_name] = row[column_idx].strftime("%m/%d/%Y")
+                else:
+                    row_data[column_name] = str(row[column_idx])
+            except Exception:
+                row_data[column_name] = str(row[column_idx])
+        table_data.append(row_data)
+
+    return table_data
+
+
+def table_rows_after(chart_data: pd.DataFrame) -> list:
+    return build_table_rows(chart_data, list(chart_data.columns))
+
+
+def run_benchmark(
+    name: str,
+    before: Callable,
+    after: Callable,
+    chart_data: pd.DataFrame,
+    n_repeats: int,
+    compared_columns: Optional[List[str]] = None,
+) -> None:
+    elapsed_times: List[float] = []
+
+    for transformation in [before, after]:
+        start_time = perf_counter()
+        for _ in range(n_repeats):
+            result = transformation(chart_data)
+        elapsed_times.append((perf_counter() - start_time) / n_repeats)
+
+        if transformation is before:
+            expected_result = result
+
+    if isinstance(result, pd.DataFrame):
+        # Rows with equal sort keys may be in another order
+        if compared_columns is not None:
+            result = result[compared_columns]
+            expected_result = expected_result[compared_columns]
+        pd.testing.assert_frame_equal(
+            result.reset_index(drop=True), expected_result.reset_index(drop=True)
+        )
+    else:
+        assert result == expected_result
+
+    print(
+        f"{name:<12} before {elapsed_times[0] * 1000:10.2f} ms | "
+        f"after {elapsed_times[1] * 1000:10.2f} ms | "
+        f"speedup {elapsed_times[0] / elapsed_times[1]:6.1f}x"
+    )
+
+
+def _main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--series", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    for n_rows in args.rows:
+        chart_data = make_chart_data(n_rows, args.series)
+        # The Y-Axis is numerical once the chart generators convert it
+        numerical_chart_data = chart_data.assign(
+            yAxis=pd.to_numeric(chart_data["yAxis"])
+        )
+
+        print(f"{n_rows} rows, {args.series} series")
+        run_benchmark(
+            "decimal Y",
+            json_list_before,
+            json_list_after,
+            chart_data,
+            args.repeats,
+        )
+        run_benchmark(
+            "numerical Y",
+            json_list_before,
+            json_list_after,
+            numerical_chart_data,
+            args.repeats,
+        )
+        run_benchmark(
+            "date sort",
+            sort_before,
+            sort_after,
+            chart_data,
+            args.repeats,
+            compared_columns=["xAxis"],
+        )
+        run_benchmark(
+            "pivot",
+            pivot_before,
+            pivot_after,
+            numerical_chart_data,
+            args.repeats,
+        )
+        run_benchmark(
+            "table rows",
+            table_rows_before,
+            table_rows_after,
+            numerical_chart_data,
+            args.repeats,
+        )
+
+
+if __name__ == "__main__":
+    _main()
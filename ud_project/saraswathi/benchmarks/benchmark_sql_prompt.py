@@ -0,0 +1,114 @@
+"""Benchmark of the table-level SQL prompt fragments built by `_generate_sql`.
+
+Compares rebuilding the fragments for every chart (previous behaviour) with the
+cached `SQLPromptBundle`, for stories of several charts over fresh copies of the
+same DataSummary (as served by the DataSummary cache on every request).
+
+Usage:
+    python -m benchmarks.benchmark_sql_prompt --columns 80 --requests 50 --charts 8
+"""
+
+import copy
+import logging
+import tracemalloc
+
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Callable
+
+from components.datamodel import DataSummary
+from components.sql_query import build_sql_prompt_bundle, get_sql_prompt_bundle
+
+
+def make_data_summary(n_columns: int, sql_library: str) -> DataSummary:
+    column_names = [f"column_{idx}" for idx in range(n_columns)]
+
+    return DataSummary(
+        database_schema_sql="CREATE TABLE `benchmark_table` (\n"
+        + ",\n".join(f"    `{column}` DECIMAL(10, 2)" for column in column_names)
+        + "\n);",
+        table_description="Benchmark table " * 20,
+        column_description_dict={
+            column: f"Description of {column} " * 4 for column in column_names
+        },
+        column_sample_dict={
+            column: [f"{column}_sample_{idx}" for idx in range(5)]
+            for column in column_names
+        },
+        sql_library=sql_library,
+        database_properties={"db_tag": "benchmark"},
+        column_name_list=column_names,
+        column_display_name_dict={
+            column: column.replace("_", " ").title() for column in column_names
+        },
+        column_data_tribes={column: "numerical" for column in column_names},
+        column_n_unique_value_dict={column: 100 for column in column_names},
+        column_sql_data_types={column: "DECIMAL" for column in column_names},
+        table_join_sql_query="",
+    )
+
+
+def run_benchmark(
+    name: str,
+    build_prompt_bundle: Callable,
+    data_summary: DataSummary,
+    n_requests: int,
+    n_charts: int,
+) -> None:
+    logger = logging.getLogger(__name__)
+    data_summaries = [copy.deepcopy(data_summary) for _ in range(n_requests)]
+    peak_allocations = []
+
+    tracemalloc.start()
+    start_time = perf_counter()
+
+    for request_data_summary in data_summaries:
+        for _ in range(n_charts):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            build_prompt_bundle(request_data_summary, "db", "benchmark_table", logger)
+            peak_allocations.append(tracemalloc.get_traced_memory()[1] - baseline)
+
+    elapsed_time = perf_counter() - start_time
+    tracemalloc.stop()
+
+    n_builds = n_requests * n_charts
+    print(
+        f"{name:<10} total {elapsed_time * 1000:9.2f} ms | "
+        f"per chart {elapsed_time / n_builds * 1e6:8.2f} us | "
+        f"peak allocation per chart {sum(peak_allocations) / n_builds / 1024:8.2f} KiB"
+    )
+
+
+def _main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--columns", type=int, default=80)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--charts", type=int, default=8)
+    parser.add_argument("--sql-library", default="MySQL")
+    args = parser.parse_args()
+
+    data_summary = make_data_summary(args.columns, args.sql_library)
+
+    print(
+        f"{args.requests} requests x {args.charts} charts, "
+        f"{args.columns} columns, {args.sql_library}"
+    )
+    run_benchmark(
+        "before",
+        build_sql_prompt_bundle,
+        data_summary,
+        args.requests,
+        args.charts,
+    )
+    run_benchmark(
+        "after",
+        get_sql_prompt_bundle,
+        data_summary,
+        args.requests,
+        args.charts,
+    )
+
+
+if __name__ == "__main__":
+    _main()
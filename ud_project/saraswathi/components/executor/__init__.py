@@ -1,3 +1,8 @@
+from .connection_pool import (
+    dispose_connection_pools,
+    get_connection_pool_status,
+    get_pooled_engine,
+)
 from .executor import (
     execute_beautiful_table_sql_query,
     execute_sql_query,
@@ -6,6 +11,9 @@ from .executor import (
 )
 
 __all__ = [
+    "dispose_connection_pools",
+    "get_connection_pool_status",
+    "get_pooled_engine",
     "execute_sql_query",
     "execute_beautiful_table_sql_query",
     "execute_sql_query_updater",
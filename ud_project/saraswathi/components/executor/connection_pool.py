@@ -0,0 +1,169 @@
+import os
+import threading
+
+from typing import Any, Dict, Tuple
+from urllib.parse import quote_plus
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine
+
+# Pool settings shared by every client database engine
+SQL_POOL_SIZE: int = int(os.getenv("SQL_POOL_SIZE", "5"))
+SQL_POOL_MAX_OVERFLOW: int = int(os.getenv("SQL_POOL_MAX_OVERFLOW", "10"))
+SQL_POOL_TIMEOUT: float = float(os.getenv("SQL_POOL_TIMEOUT", "30"))
+SQL_POOL_RECYCLE: int = int(os.getenv("SQL_POOL_RECYCLE", "1800"))
+SQL_QUERY_TIMEOUT: float = float(os.getenv("SQL_QUERY_TIMEOUT", "120"))
+
+_engines: Dict[Tuple, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def _normalize_sql_library(sql_library: str) -> str:
+    return sql_library.lower().replace("_", "").replace("-", "").replace(" ", "")
+
+
+def _create_pooled_engine(sql_library: str, **connection_properties: Any) -> Engine:
+    """Create a pooled SQLAlchemy engine for the given client database.
+
+    Every engine pings its connections on checkout (health check), recycles them
+    after `SQL_POOL_RECYCLE` seconds and applies `SQL_QUERY_TIMEOUT` to each
+    statement with the native mechanism of the database.
+    """
+    pool_options: dict = {
+        "pool_size": SQL_POOL_SIZE,
+        "max_overflow": SQL_POOL_MAX_OVERFLOW,
+        "pool_timeout": SQL_POOL_TIMEOUT,
+        "pool_recycle": SQL_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+    query_timeout_ms = int(SQL_QUERY_TIMEOUT * 1000)
+    connect_args: dict = {}
+
+    if sql_library in ["mysql", "mariadb"]:
+        url = URL.create(
+            f"{sql_library}+mysqlconnector",
+            username=str(connection_properties["user"]),
+            password=str(connection_properties["password"]),
+            host=str(connection_properties["host"]),
+            port=int(connection_properties["port"]),
+        )
+    elif sql_library == "postgresql":
+        url = URL.create(
+            "postgresql+psycopg2",
+            username=str(connection_properties["user"]),
+            password=str(connection_properties["password"]),
+            host=str(connection_properties["host"]),
+            port=int(connection_properties["port"]),
+            database=connection_properties["database_name"],
+        )
+        if query_timeout_ms > 0:
+            connect_args["options"] = f"-c statement_timeout={query_timeout_ms}"
+    elif sql_library == "oracle":
+        url = URL.create(
+            "oracle+oracledb",
+            username=str(connection_properties["user"]),
+            password=str(connection_properties["password"]),
+            host=str(connection_properties["host"]),
+            port=int(connection_properties["port"]),
+            query={"service_name": connection_properties["database_name"]},
+        )
+    elif sql_library == "sqlite":
+        url = URL.create("sqlite", database=connection_properties["sqlite_path"])
+        connect_args["check_same_thread"] = False
+    elif sql_library == "sqlserver":
+        odbc_connection_string = (
+            "DRIVER={SQL Server};"
+            f"SERVER={connection_properties['server']};"
+            'DATABASE="";'
+            f"UID={connection_properties['uid']};"
+            f"PWD={connection_properties['pwd']};"
+        )
+        url = URL.create(
+            "mssql+pyodbc",
+            query={"odbc_connect": quote_plus(odbc_connection_string)},
+        )
+    else:
+        raise RuntimeError(f"SQL Library {sql_library} is not supported!")
+
+    engine = create_engine(url, connect_args=connect_args, **pool_options)
+
+    if query_timeout_ms > 0 and sql_library in [
+        "mysql",
+        "mariadb",
+        "oracle",
+        "sqlserver",
+    ]:
+
+        @event.listens_for(engine, "connect")
+        def set_query_timeout(dbapi_connection, connection_record):
+            if sql_library == "oracle":
+                dbapi_connection.call_timeout = query_timeout_ms
+            elif sql_library == "sqlserver":
+                dbapi_connection.timeout = max(1, round(SQL_QUERY_TIMEOUT))
+            else:
+                timeout_statement = (
+                    f"SET SESSION MAX_EXECUTION_TIME={query_timeout_ms}"
+                    if sql_library == "mysql"
+                    else f"SET SESSION max_statement_time={SQL_QUERY_TIMEOUT}"
+                )
+                cursor = dbapi_connection.cursor()
+                try:
+                    cursor.execute(timeout_statement)
+                finally:
+                    cursor.close()
+
+    return engine
+
+
+def get_pooled_engine(sql_library: str, **connection_properties: Any) -> Engine:
+    """Get the process-wide pooled engine of a client database, creating it on first use.
+
+    Engines are keyed by the SQL library and the connection properties of the
+    client database (the `CLIENT_DB` entry of a db_tag), so every executor and
+    every `fix_sql_query` retry against the same database shares one pool.
+
+    Args:
+        sql_library (str): SQL library of the client database, e.g. "MySQL"
+        **connection_properties (Any): connection properties used by the query
+            executors (host/user/password/port, database_name, sqlite_path or
+            server/uid/pwd)
+
+    Returns:
+        Engine: pooled SQLAlchemy engine
+
+    """
+    sql_library = _normalize_sql_library(sql_library)
+    engine_key = (sql_library, tuple(sorted(connection_properties.items())))
+
+    engine = _engines.get(engine_key)
+    if engine is not None:
+        return engine
+
+    with _engines_lock:
+        if engine_key not in _engines:
+            _engines[engine_key] = _create_pooled_engine(
+                sql_library, **connection_properties
+            )
+
+        return _engines[engine_key]
+
+
+def get_connection_pool_status() -> list:
+    """Return the pool status of every client database engine."""
+    with _engines_lock:
+        return [
+            {
+                "sql_library": sql_library,
+                "url": engine.url.render_as_string(hide_password=True),
+                "status": engine.pool.status(),
+            }
+            for (sql_library, _), engine in _engines.items()
+        ]
+
+
+def dispose_connection_pools() -> None:
+    """Close every pooled connection, e.g. on application shutdown."""
+    with _engines_lock:
+        for engine in _engines.values():
+            engine.dispose()
+
+        _engines.clear()
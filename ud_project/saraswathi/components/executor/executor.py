@@ -35,7 +35,7 @@ from .sqlserver import (
     execute_sqlserver_updater,
     run_sqlserver_query_only,
 )
-from .template import code_executor_template
+from .query_executor import sql_query_executors
 from logging_library.performancelogger.performance_logger import PerformanceLogger
 
 
@@ -60,11 +60,11 @@ def execute_sql_query(
             sql_library.lower().replace("_", "").replace("-", "").replace(" ", "")
         )
 
-        if sql_library not in code_executor_template:
+        if sql_library not in sql_query_executors:
             code_level_logger.error(f"SQL Library {sql_library} is not supported!")
             raise RuntimeError(f"SQL Library {sql_library} is not supported!")
         else:
-            code_template = code_executor_template[sql_library]
+            query_executor = sql_query_executors[sql_library]
 
         if sql_library in ["mysql", "mariadb"]:
             host = database_properties["hostname"]
@@ -78,7 +78,7 @@ def execute_sql_query(
                 aggregations,
                 database_name,
                 table_name,
-                code_template,
+                query_executor,
                 chart_query,
                 host,
                 user,
@@ -100,7 +100,7 @@ def execute_sql_query(
                 aggregations,
                 database_name,
                 table_name,
-                code_template,
+                query_executor,
                 chart_query,
                 user,
                 password,
@@ -119,7 +119,7 @@ def execute_sql_query(
                 aggregations,
                 database_name,
                 table_name,
-                code_template,
+                query_executor,
                 chart_query,
                 sqlite_path,
                 chart_axis,
@@ -137,7 +137,7 @@ def execute_sql_query(
                 aggregations,
                 database_name,
                 table_name,
-                code_template,
+                query_executor,
                 chart_query,
                 server,
                 uid,
@@ -158,7 +158,7 @@ def execute_sql_query(
                 aggregations,
                 database_name,
                 table_name,
-                code_template,
+                query_executor,
                 chart_query,
                 user,
                 password,
@@ -183,7 +183,7 @@ def execute_beautiful_table_sql_query(
 ):
     sql_library = sql_library.lower().replace("_", "").replace("-", "").replace(" ", "")
 
-    code_template = code_executor_template[sql_library]
+    query_executor = sql_query_executors[sql_library]
 
     if sql_library in ["mysql", "mariadb"]:
         host = database_properties["hostname"]
@@ -191,7 +191,7 @@ def execute_beautiful_table_sql_query(
         password = database_properties["password"]
         port = database_properties["port"]
         chart_data = execute_mysql_mariadb_beautiful_table(
-            code_template,
+            query_executor,
             chart_query,
             host,
             user,
@@ -205,7 +205,7 @@ def execute_beautiful_table_sql_query(
         port = database_properties["port"]
 
         chart_data = execute_postgresql_beautiful_table(
-            code_template,
+            query_executor,
             chart_query,
             user,
             password,
@@ -216,7 +216,7 @@ def execute_beautiful_table_sql_query(
     elif sql_library == "sqlite":
         sqlite_path = database_properties["sqlite_path"]
         chart_data = execute_sqlite_beautiful_table(
-            code_template,
+            query_executor,
             chart_query,
             sqlite_path,
         )
@@ -225,7 +225,7 @@ def execute_beautiful_table_sql_query(
         uid = database_properties["username"]
         pwd = database_properties["password"]
         chart_data = execute_sqlserver_beautiful_table(
-            code_template,
+            query_executor,
             chart_query,
             server,
             uid,
@@ -237,7 +237,7 @@ def execute_beautiful_table_sql_query(
         host = database_properties["hostname"]
         port = database_properties["port"]
         chart_data = execute_oracle_beautiful_table(
-            code_template,
+            query_executor,
             chart_query,
             host,
             user,
@@ -276,7 +276,7 @@ def execute_sql_query_updater(
         .replace(" ", "")
     )
 
-    code_template = code_executor_template[sql_library]
+    query_executor = sql_query_executors[sql_library]
 
     if sql_library in ["mysql", "mariadb"]:
         host: str = database_properties["hostname"]
@@ -284,7 +284,7 @@ def execute_sql_query_updater(
         password: str = database_properties["password"]
         port: int = database_properties["port"]
         chart_data = execute_mysql_mariadb_updater(
-            code_template,
+            query_executor,
             chart_json,
             host,
             user,
@@ -298,7 +298,7 @@ def execute_sql_query_updater(
         port = database_properties["port"]
         database_name: str = database_properties["database_name"]
         chart_data = execute_postgresql_updater(
-            code_template,
+            query_executor,
             chart_json,
             user,
             password,
@@ -309,7 +309,7 @@ def execute_sql_query_updater(
     elif sql_library == "sqlite":
         sqlite_path = database_properties["sqlite_path"]
         chart_data = execute_sqlite_updater(
-            code_template,
+            query_executor,
             chart_json,
             sqlite_path,
         )
@@ -318,7 +318,7 @@ def execute_sql_query_updater(
         uid = database_properties["username"]
         pwd = database_properties["password"]
         chart_data = execute_sqlserver_updater(
-            code_template,
+            query_executor,
             chart_json,
             server,
             uid,
@@ -331,7 +331,7 @@ def execute_sql_query_updater(
         port = database_properties["port"]
         database_name = database_properties["database_name"]
         chart_data = execute_oracle_updater(
-            code_template,
+            query_executor,
             chart_json,
             user,
             password,
@@ -353,7 +353,7 @@ def run_sql_query_only(
     """Run query"""
     sql_library = sql_library.lower().replace("_", "").replace("-", "").replace(" ", "")
 
-    code_template = code_executor_template[sql_library]
+    query_executor = sql_query_executors[sql_library]
 
     if sql_library in ["mysql", "mariadb"]:
         host = database_properties["hostname"]
@@ -362,7 +362,7 @@ def run_sql_query_only(
         port = database_properties["port"]
         chart_data = run_mysql_mariadb_query_only(
             sql_query,
-            code_template,
+            query_executor,
             host,
             user,
             password,
@@ -375,7 +375,7 @@ def run_sql_query_only(
         port = database_properties["port"]
         chart_data = run_postgresql_query_only(
             sql_query,
-            code_template,
+            query_executor,
             user,
             password,
             host,
@@ -385,7 +385,7 @@ def run_sql_query_only(
         sqlite_path = database_properties["sqlite_path"]
         chart_data = run_sqlite_query_only(
             sql_query,
-            code_template,
+            query_executor,
             sqlite_path,
         )
     elif sql_library == "sqlserver":
@@ -394,7 +394,7 @@ def run_sql_query_only(
         pwd = database_properties["password"]
         chart_data = run_sqlserver_query_only(
             sql_query,
-            code_template,
+            query_executor,
             server,
             uid,
             pwd,
@@ -406,7 +406,7 @@ def run_sql_query_only(
         port = database_properties["port"]
         chart_data = run_oracle_query_only(
             sql_query,
-            code_template,
+            query_executor,
             user,
             password,
             host,
@@ -1,14 +1,12 @@
-import ast
-import importlib
 import re
 import traceback
-import types
 import pandas as pd
 import logging
 
-from typing import Any
+from typing import Any, Callable
 from ..datamodel import DataSummary
 from ..utils import remove_null_series, remove_null_x_axis
+from .query_executor import QueryResult, get_max_result_rows
 from .sql_fixer import fix_sql_query
 
 
@@ -19,7 +17,7 @@ def execute_mysql_mariadb(
     aggregations: list,
     database_name: str,
     table_name: str,
-    code_template: str,
+    query_executor: Callable[..., QueryResult],
     chart_query_data: dict,
     host: str,
     user: str,
@@ -29,50 +27,6 @@ def execute_mysql_mariadb(
     logging_url: str,
     code_level_logger: logging.Logger,
 ) -> dict:
-    def get_globals_dict(
-        code_template: str,
-        host: str,
-        user: str,
-        password: str,
-        port: int,
-    ):
-        # Parse the code string into an AST
-        tree = ast.parse(code_template)
-        # Extract the names of the imported modules and their aliases
-        imported_modules: list = []
-        for node in tree.body:
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    module = importlib.import_module(alias.name)
-                    imported_modules.append((alias.name, alias.asname, module))
-            elif isinstance(node, ast.ImportFrom):
-                if node.module is not None:
-                    module = importlib.import_module(node.module)
-                    for alias in node.names:
-                        obj = getattr(module, alias.name)
-                        imported_modules.append(
-                            (f"{node.module}.{alias.name}", alias.asname, obj),
-                        )
-
-        # Import the required modules into a dictionary
-        globals_dict: dict = {}
-        for module_name, alias, obj in imported_modules:
-            if alias:
-                globals_dict[alias] = obj
-            else:
-                globals_dict[module_name.split(".")[-1]] = obj
-
-        ex_dicts: dict = {
-            "pd": pd,
-            "host": host,
-            "user": user,
-            "password": password,
-            "port": port,
-            "error": "",
-        }
-        globals_dict.update(ex_dicts)
-        return globals_dict
-
     # Benchmark Purpose
     valid_sql = 0
     total_sql = 0
@@ -80,20 +34,16 @@ def execute_mysql_mariadb(
     sub_chart_data_list = chart_query_data["sub_questions"]
 
     main_chart_sql = chart_query_data["main_chart_sql"]
-    ex_locals = get_globals_dict(code_template, host, user, password, port)
-    ex_locals["sql_query"] = main_chart_sql
-    exec(
-        code_template.format(
-            host=host,
-            user=user,
-            password=password,
-            port=port,
-            sql_query=main_chart_sql,
-        ),
-        ex_locals,
+    processed_data, error = query_executor(
+        host=host,
+        user=user,
+        password=password,
+        port=port,
+        sql_query=main_chart_sql,
+        max_rows=get_max_result_rows(chart_query_data["main_chart_type"]),
     )
 
-    if ex_locals["processed_data"].empty:
+    if processed_data.empty:
         if "main_question" in chart_query_data and "main_title" in chart_query_data:
             main_question = chart_query_data["main_question"]
             main_chart_title = chart_query_data["main_title"]
@@ -125,72 +75,62 @@ def execute_mysql_mariadb(
                     aggregations,
                     database_name,
                     table_name,
-                    ex_locals["error"],
+                    error,
                     logging_url,
                     main_question,
                     main_chart_title,
                     main_instruction,
                 )
 
-                ex_locals["sql_query"] = main_chart_sql
-                exec(
-                    code_template.format(
-                        host=host,
-                        user=user,
-                        password=password,
-                        port=port,
-                        sql_query=main_chart_sql,
-                    ),
-                    ex_locals,
+                processed_data, error = query_executor(
+                    host=host,
+                    user=user,
+                    password=password,
+                    port=port,
+                    sql_query=main_chart_sql,
+                    max_rows=get_max_result_rows(chart_query_data["main_chart_type"]),
                 )
 
-                if ex_locals["processed_data"].empty:
+                if processed_data.empty:
                     print("Empty Data SQL:")
-                    print(ex_locals["sql_query"])
+                    print(main_chart_sql)
                     code_level_logger.error(
-                        f"Chart data is empty. SQL: {ex_locals['sql_query']}"
-                    )
-                    raise RuntimeError(
-                        f"Chart data is empty. SQL: {ex_locals['sql_query']}"
+                        f"Chart data is empty. SQL: {main_chart_sql}"
                     )
+                    raise RuntimeError(f"Chart data is empty. SQL: {main_chart_sql}")
 
                 chart_query_data["main_chart_sql"] = main_chart_sql
                 chart_query_data["main_chart_sql_raw"] = main_chart_sql_raw
                 break
             except Exception:
                 code_level_logger.error(
-                    f"SQL: {ex_locals['sql_query']} . {traceback.format_exc()}"
+                    f"SQL: {main_chart_sql} . {traceback.format_exc()}"
                 )
                 print(traceback.format_exc())
 
     if (
-        isinstance(ex_locals["processed_data"], pd.DataFrame)
-        and len(ex_locals["processed_data"].columns) > 0
-        and not ex_locals["processed_data"].empty
-        and ex_locals["processed_data"][ex_locals["processed_data"].columns[0]]
-        .isnull()
-        .all()
+        isinstance(processed_data, pd.DataFrame)
+        and len(processed_data.columns) > 0
+        and not processed_data.empty
+        and processed_data[processed_data.columns[0]].isnull().all()
     ):
         pattern = r"CONCAT\(YEAR\(`([^`]*)`\), '-Q', QUARTER\(`[^`]*`\)\)"
         replacement = r"CONCAT(YEAR(STR_TO_DATE(\g<1>, '%d/%m/%Y')), '-Q', QUARTER(STR_TO_DATE(\g<1>, '%d/%m/%Y')))"
         main_chart_sql = re.sub(pattern, replacement, main_chart_sql)
 
-        ex_locals["sql_query"] = main_chart_sql
-        exec(
-            code_template.format(
-                host=host,
-                user=user,
-                password=password,
-                port=port,
-                sql_query=main_chart_sql,
-            ),
-            ex_locals,
+        processed_data, error = query_executor(
+            host=host,
+            user=user,
+            password=password,
+            port=port,
+            sql_query=main_chart_sql,
+            max_rows=get_max_result_rows(chart_query_data["main_chart_type"]),
         )
 
         chart_query_data["main_chart_sql"] = main_chart_sql
 
-    if not ex_locals["processed_data"].empty:
-        chart_data = ex_locals["processed_data"]
+    if not processed_data.empty:
+        chart_data = processed_data
         chart_data_columns = chart_data.columns
 
         if "xAxis" in chart_data_columns:
@@ -250,30 +190,29 @@ def execute_mysql_mariadb(
                             aggregations,
                             database_name,
                             table_name,
-                            ex_locals["error"],
+                            error,
                             logging_url,
                             main_question,
                             main_chart_title,
                             main_instruction,
                         )
 
-                        ex_locals["sql_query"] = main_chart_sql
-                        exec(
-                            code_template.format(
-                                host=host,
-                                user=user,
-                                password=password,
-                                port=port,
-                                sql_query=main_chart_sql,
+                        processed_data, error = query_executor(
+                            host=host,
+                            user=user,
+                            password=password,
+                            port=port,
+                            sql_query=main_chart_sql,
+                            max_rows=get_max_result_rows(
+                                chart_query_data["main_chart_type"]
                             ),
-                            ex_locals,
                         )
 
-                        if ex_locals["processed_data"].empty:
+                        if processed_data.empty:
                             print("Empty Data SQL:")
-                            print(ex_locals["sql_query"])
+                            print(main_chart_sql)
                             code_level_logger.error(
-                                f"Chart data is empty. SQL: {ex_locals['sql_query']}"
+                                f"Chart data is empty. SQL: {main_chart_sql}"
                             )
                             raise RuntimeError("Chart data is empty")
 
@@ -284,16 +223,16 @@ def execute_mysql_mariadb(
                         print(traceback.format_exc())
 
                 if "str_to_date" not in main_chart_sql.lower():
-                    ex_locals["processed_data"] = pd.DataFrame()
+                    processed_data = pd.DataFrame()
 
-    if not ex_locals["processed_data"].empty:
+    if not processed_data.empty:
         valid_sql += 1
 
     total_sql += 1
 
     # Remove row with null x-axis
     chart_data = remove_null_x_axis(
-        ex_locals["processed_data"],
+        processed_data,
         chart_query_data["main_chart_axis"],
     )
 
@@ -321,19 +260,16 @@ def execute_mysql_mariadb(
         sub_chart_sql_raw = sub_chart_data["chart_sql_raw"]
         sub_chart_id = sub_chart_data["chart_id"]
 
-        ex_locals["sql_query"] = sub_chart_sql
-        exec(
-            code_template.format(
-                host=host,
-                user=user,
-                password=password,
-                port=port,
-                sql_query=sub_chart_sql,
-            ),
-            ex_locals,
+        processed_data, error = query_executor(
+            host=host,
+            user=user,
+            password=password,
+            port=port,
+            sql_query=sub_chart_sql,
+            max_rows=get_max_result_rows(sub_chart_data["chart_type"]),
         )
 
-        if ex_locals["processed_data"].empty:
+        if processed_data.empty:
             for trial in range(1):
                 try:
                     sub_chart_sql, sub_chart_sql_raw = fix_sql_query(
@@ -347,30 +283,27 @@ def execute_mysql_mariadb(
                         aggregations,
                         database_name,
                         table_name,
-                        ex_locals["error"],
+                        error,
                         logging_url,
                         sub_question,
                         sub_chart_title,
                         sub_instruction,
                     )
 
-                    ex_locals["sql_query"] = sub_chart_sql
-                    exec(
-                        code_template.format(
-                            host=host,
-                            user=user,
-                            password=password,
-                            port=port,
-                            sql_query=sub_chart_sql,
-                        ),
-                        ex_locals,
+                    processed_data, error = query_executor(
+                        host=host,
+                        user=user,
+                        password=password,
+                        port=port,
+                        sql_query=sub_chart_sql,
+                        max_rows=get_max_result_rows(sub_chart_data["chart_type"]),
                     )
 
-                    if ex_locals["processed_data"].empty:
+                    if processed_data.empty:
                         print("Empty Data SQL:")
-                        print(ex_locals["sql_query"])
+                        print(sub_chart_sql)
                         code_level_logger.error(
-                            f"Chart data is empty. SQL: {ex_locals['sql_query']}"
+                            f"Chart data is empty. SQL: {sub_chart_sql}"
                         )
                         raise RuntimeError("Chart data is empty")
 
@@ -382,8 +315,8 @@ def execute_mysql_mariadb(
                 except Exception:
                     print(traceback.format_exc())
 
-        if not ex_locals["processed_data"].empty:
-            chart_data = ex_locals["processed_data"]
+        if not processed_data.empty:
+            chart_data = processed_data
             chart_data_columns = chart_data.columns
 
             if "xAxis" in chart_data_columns:
@@ -440,30 +373,29 @@ def execute_mysql_mariadb(
                                 aggregations,
                                 database_name,
                                 table_name,
-                                ex_locals["error"],
+                                error,
                                 logging_url,
                                 sub_question,
                                 sub_chart_title,
                                 sub_instruction,
                             )
 
-                            ex_locals["sql_query"] = sub_chart_sql
-                            exec(
-                                code_template.format(
-                                    host=host,
-                                    user=user,
-                                    password=password,
-                                    port=port,
-                                    sql_query=sub_chart_sql,
+                            processed_data, error = query_executor(
+                                host=host,
+                                user=user,
+                                password=password,
+                                port=port,
+                                sql_query=sub_chart_sql,
+                                max_rows=get_max_result_rows(
+                                    sub_chart_data["chart_type"]
                                 ),
-                                ex_locals,
                             )
 
-                            if ex_locals["processed_data"].empty:
+                            if processed_data.empty:
                                 print("Empty Data SQL:")
-                                print(ex_locals["sql_query"])
+                                print(sub_chart_sql)
                                 code_level_logger.error(
-                                    f"Chart data is empty. SQL: {ex_locals['sql_query']}"
+                                    f"Chart data is empty. SQL: {sub_chart_sql}"
                                 )
                                 raise RuntimeError("Chart data is empty")
 
@@ -478,16 +410,16 @@ def execute_mysql_mariadb(
                             print(traceback.format_exc())
 
                     if "str_to_date" not in sub_chart_sql.lower():
-                        ex_locals["processed_data"] = pd.DataFrame()
+                        processed_data = pd.DataFrame()
 
-        if not ex_locals["processed_data"].empty:
+        if not processed_data.empty:
             valid_sql += 1
 
         total_sql += 1
 
         # Create a new dictionary for the sub-question with both question and chart data with removed null x-axis
         chart_data = remove_null_x_axis(
-            ex_locals["processed_data"],
+            processed_data,
             sub_chart_data["chart_axis"],
         )
 
@@ -503,151 +435,48 @@ def execute_mysql_mariadb(
 
 
 def execute_mysql_mariadb_beautiful_table(
-    code_template: str,
+    query_executor: Callable[..., QueryResult],
     chart_query: str,
     host: str,
     user: str,
     password: str,
     port: int,
 ) -> pd.DataFrame:
-    def get_globals_dict(
-        code_template: str,
-        host: str,
-        user: str,
-        password: str,
-        port: int,
-    ):
-        # Parse the code string into an AST
-        tree = ast.parse(code_template)
-        # Extract the names of the imported modules and their aliases
-        imported_modules: list = []
-        for node in tree.body:
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    module = importlib.import_module(alias.name)
-                    imported_modules.append((alias.name, alias.asname, module))
-            elif isinstance(node, ast.ImportFrom):
-                if node.module is not None:
-                    module = importlib.import_module(node.module)
-                    for alias in node.names:
-                        obj = getattr(module, alias.name)
-                        imported_modules.append(
-                            (f"{node.module}.{alias.name}", alias.asname, obj),
-                        )
-
-        # Import the required modules into a dictionary
-        globals_dict: dict = {}
-        for module_name, alias, obj in imported_modules:
-            if alias:
-                globals_dict[alias] = obj
-            else:
-                globals_dict[module_name.split(".")[-1]] = obj
-
-        ex_dicts: dict = {
-            "pd": pd,
-            "host": host,
-            "user": user,
-            "password": password,
-            "port": port,
-            "error": "",
-        }
-        globals_dict.update(ex_dicts)
-        return globals_dict
-
-    ex_locals = get_globals_dict(
-        code_template,
-        host,
-        user,
-        password,
-        port,
-    )
-    ex_locals["sql_query"] = chart_query
-    exec(
-        code_template.format(
-            host=host,
-            user=user,
-            password=password,
-            port=port,
-            sql_query=chart_query,
-        ),
-        ex_locals,
+    processed_data, error = query_executor(
+        host=host,
+        user=user,
+        password=password,
+        port=port,
+        sql_query=chart_query,
     )
 
-    chart_data = ex_locals["processed_data"]
+    chart_data = processed_data
 
     return chart_data
 
 
 def execute_mysql_mariadb_updater(
-    code_template: str,
+    query_executor: Callable[..., QueryResult],
     chart_json: dict,
     host: str,
     user: str,
     password: str,
     port: int,
 ) -> pd.DataFrame:
-    def get_globals_dict(
-        code_template: str,
-        host: str,
-        user: str,
-        password: str,
-        port: int,
-    ):
-        # Parse the code string into an AST
-        tree = ast.parse(code_template)
-        # Extract the names of the imported modules and their aliases
-        imported_modules: list = []
-        for node in tree.body:
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    module = importlib.import_module(alias.name)
-                    imported_modules.append((alias.name, alias.asname, module))
-            elif isinstance(node, ast.ImportFrom):
-                if node.module is not None:
-                    module = importlib.import_module(node.module)
-                    for alias in node.names:
-                        obj = getattr(module, alias.name)
-                        imported_modules.append(
-                            (f"{node.module}.{alias.name}", alias.asname, obj),
-                        )
-
-        # Import the required modules into a dictionary
-        globals_dict: dict = {}
-        for module_name, alias, obj in imported_modules:
-            if alias:
-                globals_dict[alias] = obj
-            else:
-                globals_dict[module_name.split(".")[-1]] = obj
-
-        ex_dicts: dict = {
-            "pd": pd,
-            "host": host,
-            "user": user,
-            "password": password,
-            "port": port,
-            "error": "",
-        }
-        globals_dict.update(ex_dicts)
-        return globals_dict
-
     chart_sql_query = chart_json["Chart_Query"]
-    ex_locals = get_globals_dict(code_template, host, user, password, port)
-    ex_locals["sql_query"] = chart_sql_query
 
-    exec(
-        code_template.format(
-            host=host,
-            user=user,
-            password=password,
-            port=port,
-            sql_query=chart_sql_query,
-        ),
-        ex_locals,
+    processed_data, error = query_executor(
+        host=host,
+        user=user,
+        password=password,
+        port=port,
+        sql_query=chart_sql_query,
+        max_rows=get_max_result_rows(chart_json.get("Chart_Type")),
     )
 
     # Remove row with null x-axis
     chart_data = remove_null_x_axis(
-        ex_locals["processed_data"],
+        processed_data,
         chart_json["Chart_Axis"],
     )
 
@@ -658,75 +487,18 @@ def execute_mysql_mariadb_updater(
 
 def run_mysql_mariadb_query_only(
     sql_query: str,
-    code_template: str,
+    query_executor: Callable[..., QueryResult],
     host: str,
     user: str,
     password: str,
     port: int,
 ):
-    def get_globals_dict(
-        code_template: str,
-        host: str,
-        user: str,
-        password: str,
-        port: int,
-    ):
-        # Parse the code string into an AST
-        tree = ast.parse(code_template)
-        # Extract the names of the imported modules and their aliases
-        imported_modules: list = []
-        for node in tree.body:
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    module: types.ModuleType = importlib.import_module(alias.name)
-                    imported_modules.append((alias.name, alias.asname, module))
-            elif isinstance(node, ast.ImportFrom):
-                if node.module is not None:
-                    module = importlib.import_module(node.module)
-
-                    for alias in node.names:
-                        obj = getattr(module, alias.name)
-                        imported_modules.append(
-                            (f"{node.module}.{alias.name}", alias.asname, obj),
-                        )
-
-        # Import the required modules into a dictionary
-        globals_dict: dict = {}
-        for module_name, alias, obj in imported_modules:
-            if alias:
-                globals_dict[alias] = obj
-            else:
-                globals_dict[module_name.split(".")[-1]] = obj
-
-        ex_dicts: dict = {
-            "pd": pd,
-            "host": host,
-            "user": user,
-            "password": password,
-            "port": port,
-            "error": "",
-        }
-        globals_dict.update(ex_dicts)
-        return globals_dict
-
-    ex_locals = get_globals_dict(
-        code_template,
-        host,
-        user,
-        password,
-        port,
-    )
-
-    ex_locals["sql_query"] = sql_query
-    exec(
-        code_template.format(
-            host=host,
-            user=user,
-            password=password,
-            port=port,
-            sql_query=sql_query,
-        ),
-        ex_locals,
+    processed_data, error = query_executor(
+        host=host,
+        user=user,
+        password=password,
+        port=port,
+        sql_query=sql_query,
     )
 
-    return ex_locals["processed_data"]
+    return processed_data
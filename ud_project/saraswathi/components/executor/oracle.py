@@ -1,13 +1,12 @@
-import ast
-import importlib
 import re
 import traceback
 import logging
 import pandas as pd
 
-from typing import Any
+from typing import Any, Callable
 from ..datamodel import DataSummary
 from ..utils import remove_null_series, remove_null_x_axis
+from .query_executor import QueryResult, get_max_result_rows
 from .sql_fixer import fix_sql_query
 
 logger = logging.getLogger(__name__)
@@ -20,7 +19,7 @@ def execute_oracle(
     aggregations: list,
     database_name: str,
     table_name: str,
-    code_template: str,
+    query_executor: Callable[..., QueryResult],
     chart_query_data: dict,
     user: str,
     password: str,
@@ -30,52 +29,6 @@ def execute_oracle(
     logging_url: str,
     code_level_logger: logging.Logger,
 ) -> dict:
-    def get_globals_dict(
-        code_template: str,
-        user: str,
-        password: str,
-        host: str,
-        port: int,
-        database_name: str,
-    ):
-        # Parse the code string into an AST
-        tree = ast.parse(code_template)
-        # Extract the names of the imported modules and their aliases
-        imported_modules: list = []
-        for node in tree.body:
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    module = importlib.import_module(alias.name)
-                    imported_modules.append((alias.name, alias.asname, module))
-            elif isinstance(node, ast.ImportFrom):
-                if node.module is not None:
-                    module = importlib.import_module(node.module)
-                    for alias in node.names:
-                        obj = getattr(module, alias.name)
-                        imported_modules.append(
-                            (f"{node.module}.{alias.name}", alias.asname, obj),
-                        )
-
-        # Import the required modules into a dictionary
-        globals_dict: dict = {}
-        for module_name, alias, obj in imported_modules:
-            if alias:
-                globals_dict[alias] = obj
-            else:
-                globals_dict[module_name.split(".")[-1]] = obj
-
-        ex_dicts: dict = {
-            "pd": pd,
-            "user": user,
-            "password": password,
-            "host": host,
-            "port": port,
-            "database_name": database_name,
-            "error": "",
-        }
-        globals_dict.update(ex_dicts)
-        return globals_dict
-
     # Benchmark Purpose
     valid_sql = 0
     total_sql = 0
@@ -84,29 +37,17 @@ def execute_oracle(
 
     main_chart_sql = chart_query_data["main_chart_sql"]
 
-    ex_locals = get_globals_dict(
-        code_template,
-        user,
-        password,
-        host,
-        port,
-        database_name,
-    )
-    ex_locals["sql_query"] = main_chart_sql
-
-    exec(
-        code_template.format(
-            user=user,
-            password=password,
-            host=host,
-            port=port,
-            sql_query=main_chart_sql,
-            database_name=database_name,
-        ),
-        ex_locals,
+    processed_data, error = query_executor(
+        user=user,
+        password=password,
+        host=host,
+        port=port,
+        sql_query=main_chart_sql,
+        database_name=database_name,
+        max_rows=get_max_result_rows(chart_query_data["main_chart_type"]),
     )
 
-    if ex_locals["processed_data"].empty:
+    if processed_data.empty:
         if "main_question" in chart_query_data and "main_title" in chart_query_data:
             main_question = chart_query_data["main_question"]
             main_chart_title = chart_query_data["main_title"]
@@ -138,31 +79,28 @@ def execute_oracle(
                     aggregations,
                     database_name,
                     table_name,
-                    ex_locals["error"],
+                    error,
                     logging_url,
                     main_question,
                     main_chart_title,
                     main_instruction,
                 )
 
-                ex_locals["sql_query"] = main_chart_sql
-                exec(
-                    code_template.format(
-                        host=host,
-                        user=user,
-                        password=password,
-                        port=port,
-                        sql_query=main_chart_sql,
-                        database_name=database_name,
-                    ),
-                    ex_locals,
+                processed_data, error = query_executor(
+                    host=host,
+                    user=user,
+                    password=password,
+                    port=port,
+                    sql_query=main_chart_sql,
+                    database_name=database_name,
+                    max_rows=get_max_result_rows(chart_query_data["main_chart_type"]),
                 )
 
-                if ex_locals["processed_data"].empty:
+                if processed_data.empty:
                     print("Empty Data SQL:")
-                    print(ex_locals["sql_query"])
+                    print(main_chart_sql)
                     code_level_logger.error(
-                        f"Chart data is empty. SQL: {ex_locals['sql_query']}"
+                        f"Chart data is empty. SQL: {main_chart_sql}"
                     )
                     raise RuntimeError("Chart data is empty")
 
@@ -172,8 +110,8 @@ def execute_oracle(
             except Exception:
                 print(traceback.format_exc())
 
-    if not ex_locals["processed_data"].empty:
-        chart_data = ex_locals["processed_data"]
+    if not processed_data.empty:
+        chart_data = processed_data
         chart_data_columns = chart_data.columns
 
         if "xAxis" in chart_data_columns:
@@ -233,31 +171,30 @@ def execute_oracle(
                             aggregations,
                             database_name,
                             table_name,
-                            ex_locals["error"],
+                            error,
                             logging_url,
                             main_question,
                             main_chart_title,
                             main_instruction,
                         )
 
-                        ex_locals["sql_query"] = main_chart_sql
-                        exec(
-                            code_template.format(
-                                host=host,
-                                user=user,
-                                password=password,
-                                port=port,
-                                sql_query=main_chart_sql,
-                                database_name=database_name,
+                        processed_data, error = query_executor(
+                            host=host,
+                            user=user,
+                            password=password,
+                            port=port,
+                            sql_query=main_chart_sql,
+                            database_name=database_name,
+                            max_rows=get_max_result_rows(
+                                chart_query_data["main_chart_type"]
                             ),
-                            ex_locals,
                         )
 
-                        if ex_locals["processed_data"].empty:
+                        if processed_data.empty:
                             print("Empty Data SQL:")
-                            print(ex_locals["sql_query"])
+                            print(main_chart_sql)
                             code_level_logger.error(
-                                f"Chart data is empty. SQL: {ex_locals['sql_query']}"
+                                f"Chart data is empty. SQL: {main_chart_sql}"
                             )
                             raise RuntimeError("Chart data is empty")
 
@@ -268,16 +205,16 @@ def execute_oracle(
                         print(traceback.format_exc())
 
                 if "to_date" not in main_chart_sql.lower():
-                    ex_locals["processed_data"] = pd.DataFrame()
+                    processed_data = pd.DataFrame()
 
-    if not ex_locals["processed_data"].empty:
+    if not processed_data.empty:
         valid_sql += 1
 
     total_sql += 1
 
     # Remove row with null x-axis
     chart_data = remove_null_x_axis(
-        ex_locals["processed_data"],
+        processed_data,
         chart_query_data["main_chart_axis"],
     )
 
@@ -305,20 +242,17 @@ def execute_oracle(
         sub_chart_sql_raw = sub_chart_data["chart_sql_raw"]
         sub_chart_id = sub_chart_data["chart_id"]
 
-        ex_locals["sql_query"] = sub_chart_sql
-        exec(
-            code_template.format(
-                user=user,
-                password=password,
-                host=host,
-                port=port,
-                sql_query=sub_chart_sql,
-                database_name=database_name,
-            ),
-            ex_locals,
+        processed_data, error = query_executor(
+            user=user,
+            password=password,
+            host=host,
+            port=port,
+            sql_query=sub_chart_sql,
+            database_name=database_name,
+            max_rows=get_max_result_rows(sub_chart_data["chart_type"]),
         )
 
-        if ex_locals["processed_data"].empty:
+        if processed_data.empty:
             for trial in range(1):
                 try:
                     sub_chart_sql, sub_chart_sql_raw = fix_sql_query(
@@ -332,31 +266,28 @@ def execute_oracle(
                         aggregations,
                         database_name,
                         table_name,
-                        ex_locals["error"],
+                        error,
                         logging_url,
                         sub_question,
                         sub_chart_title,
                         sub_instruction,
                     )
 
-                    ex_locals["sql_query"] = sub_chart_sql
-                    exec(
-                        code_template.format(
-                            host=host,
-                            user=user,
-                            password=password,
-                            port=port,
-                            sql_query=sub_chart_sql,
-                            database_name=database_name,
-                        ),
-                        ex_locals,
+                    processed_data, error = query_executor(
+                        host=host,
+                        user=user,
+                        password=password,
+                        port=port,
+                        sql_query=sub_chart_sql,
+                        database_name=database_name,
+                        max_rows=get_max_result_rows(sub_chart_data["chart_type"]),
                     )
 
-                    if ex_locals["processed_data"].empty:
+                    if processed_data.empty:
                         print("Empty Data SQL:")
-                        print(ex_locals["sql_query"])
+                        print(sub_chart_sql)
                         code_level_logger.error(
-                            f"Chart data is empty. SQL: {ex_locals['sql_query']}"
+                            f"Chart data is empty. SQL: {sub_chart_sql}"
                         )
                         raise RuntimeError("Chart data is empty")
 
@@ -368,8 +299,8 @@ def execute_oracle(
                 except Exception:
                     print(traceback.format_exc())
 
-        if not ex_locals["processed_data"].empty:
-            chart_data = ex_locals["processed_data"]
+        if not processed_data.empty:
+            chart_data = processed_data
             chart_data_columns = chart_data.columns
 
             if "xAxis" in chart_data_columns:
@@ -426,31 +357,30 @@ def execute_oracle(
                                 aggregations,
                                 database_name,
                                 table_name,
-                                ex_locals["error"],
+                                error,
                                 logging_url,
                                 sub_question,
                                 sub_chart_title,
                                 sub_instruction,
                             )
 
-                            ex_locals["sql_query"] = sub_chart_sql
-                            exec(
-                                code_template.format(
-                                    host=host,
-                                    user=user,
-                                    password=password,
-                                    port=port,
-                                    sql_query=sub_chart_sql,
-                                    database_name=database_name,
+                            processed_data, error = query_executor(
+                                host=host,
+                                user=user,
+                                password=password,
+                                port=port,
+                                sql_query=sub_chart_sql,
+                                database_name=database_name,
+                                max_rows=get_max_result_rows(
+                                    sub_chart_data["chart_type"]
                                 ),
-                                ex_locals,
                             )
 
-                            if ex_locals["processed_data"].empty:
+                            if processed_data.empty:
                                 print("Empty Data SQL:")
-                                print(ex_locals["sql_query"])
+                                print(sub_chart_sql)
                                 code_level_logger.error(
-                                    f"Chart data is empty. SQL: {ex_locals['sql_query']}"
+                                    f"Chart data is empty. SQL: {sub_chart_sql}"
                                 )
                                 raise RuntimeError("Chart data is empty")
 
@@ -465,16 +395,16 @@ def execute_oracle(
                             print(traceback.format_exc())
 
                     if "to_date" not in sub_chart_sql.lower():
-                        ex_locals["processed_data"] = pd.DataFrame()
+                        processed_data = pd.DataFrame()
 
-        if not ex_locals["processed_data"].empty:
+        if not processed_data.empty:
             valid_sql += 1
 
         total_sql += 1
 
         # Create a new dictionary for the sub-question with both question and chart data with removed null x-axis
         chart_data = remove_null_x_axis(
-            ex_locals["processed_data"],
+            processed_data,
             sub_chart_data["chart_axis"],
         )
 
@@ -493,7 +423,7 @@ def execute_oracle(
 
 
 def execute_oracle_beautiful_table(
-    code_template: str,
+    query_executor: Callable[..., QueryResult],
     chart_query: str,
     host: str,
     user: str,
@@ -501,82 +431,22 @@ def execute_oracle_beautiful_table(
     port: int,
     database_name: str,
 ) -> pd.DataFrame:
-    def get_globals_dict(
-        code_template: str,
-        user: str,
-        password: str,
-        host: str,
-        port: int,
-        database_name: str,
-    ):
-        # Parse the code string into an AST
-        tree = ast.parse(code_template)
-        # Extract the names of the imported modules and their aliases
-        imported_modules: list = []
-        for node in tree.body:
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    module = importlib.import_module(alias.name)
-                    imported_modules.append((alias.name, alias.asname, module))
-            elif isinstance(node, ast.ImportFrom):
-                if node.module is not None:
-                    module = importlib.import_module(node.module)
-                    for alias in node.names:
-                        obj = getattr(module, alias.name)
-                        imported_modules.append(
-                            (f"{node.module}.{alias.name}", alias.asname, obj),
-                        )
-
-        # Import the required modules into a dictionary
-        globals_dict: dict = {}
-        for module_name, alias, obj in imported_modules:
-            if alias:
-                globals_dict[alias] = obj
-            else:
-                globals_dict[module_name.split(".")[-1]] = obj
-
-        ex_dicts: dict = {
-            "pd": pd,
-            "host": host,
-            "user": user,
-            "password": password,
-            "port": port,
-            "database_name": database_name,
-            "error": "",
-        }
-        globals_dict.update(ex_dicts)
-        return globals_dict
-
-    ex_locals = get_globals_dict(
-        code_template,
-        user,
-        password,
-        host,
-        port,
-        database_name,
-    )
-
-    ex_locals["sql_query"] = chart_query
-
-    exec(
-        code_template.format(
-            user=user,
-            password=password,
-            host=host,
-            port=port,
-            sql_query=chart_query,
-            database_name=database_name,
-        ),
-        ex_locals,
+    processed_data, error = query_executor(
+        user=user,
+        password=password,
+        host=host,
+        port=port,
+        sql_query=chart_query,
+        database_name=database_name,
     )
 
-    chart_data = ex_locals["processed_data"]
+    chart_data = processed_data
 
     return chart_data
 
 
 def execute_oracle_updater(
-    code_template: str,
+    query_executor: Callable[..., QueryResult],
     chart_json: dict,
     user: str,
     password: str,
@@ -584,76 +454,20 @@ def execute_oracle_updater(
     port: int,
     database_name: str,
 ) -> pd.DataFrame:
-    def get_globals_dict(
-        code_template: str,
-        user: str,
-        password: str,
-        host: str,
-        port: int,
-        database_name: str,
-    ):
-        # Parse the code string into an AST
-        tree = ast.parse(code_template)
-        # Extract the names of the imported modules and their aliases
-        imported_modules: list = []
-        for node in tree.body:
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    module = importlib.import_module(alias.name)
-                    imported_modules.append((alias.name, alias.asname, module))
-            elif isinstance(node, ast.ImportFrom):
-                if node.module is not None:
-                    module = importlib.import_module(node.module)
-                    for alias in node.names:
-                        obj = getattr(module, alias.name)
-                        imported_modules.append(
-                            (f"{node.module}.{alias.name}", alias.asname, obj),
-                        )
-
-        # Import the required modules into a dictionary
-        globals_dict: dict = {}
-        for module_name, alias, obj in imported_modules:
-            if alias:
-                globals_dict[alias] = obj
-            else:
-                globals_dict[module_name.split(".")[-1]] = obj
-
-        ex_dicts: dict = {
-            "pd": pd,
-            "user": user,
-            "password": password,
-            "host": host,
-            "port": port,
-            "database_name": database_name,
-            "error": "",
-        }
-        globals_dict.update(ex_dicts)
-        return globals_dict
-
-    ex_locals = get_globals_dict(
-        code_template,
-        user,
-        password,
-        host,
-        port,
-        database_name,
-    )
-
     chart_sql_query = chart_json["Chart_Query"]
-    ex_locals["sql_query"] = chart_sql_query
-    code_template = code_template.format(
+    processed_data, error = query_executor(
         user=user,
         password=password,
         host=host,
         port=port,
         sql_query=chart_sql_query,
         database_name=database_name,
+        max_rows=get_max_result_rows(chart_json.get("Chart_Type")),
     )
-    exec(code_template, ex_locals)
 
     # Remove row with null x-axis
     chart_data = remove_null_x_axis(
-        ex_locals["processed_data"],
+        processed_data,
         chart_json["Chart_Axis"],
     )
 
@@ -664,74 +478,20 @@ def execute_oracle_updater(
 
 def run_oracle_query_only(
     sql_query: str,
-    code_template: str,
+    query_executor: Callable[..., QueryResult],
     user: str,
     password: str,
     host: str,
     port: int,
+    database_name: str = "",
 ):
-    def get_globals_dict(
-        code_template: str,
-        user: str,
-        password: str,
-        host: str,
-        port: int,
-    ):
-        # Parse the code string into an AST
-        tree = ast.parse(code_template)
-        # Extract the names of the imported modules and their aliases
-        imported_modules: list = []
-        for node in tree.body:
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    module = importlib.import_module(alias.name)
-                    imported_modules.append((alias.name, alias.asname, module))
-            elif isinstance(node, ast.ImportFrom):
-                if node.module is not None:
-                    module = importlib.import_module(node.module)
-                    for alias in node.names:
-                        obj = getattr(module, alias.name)
-                        imported_modules.append(
-                            (f"{node.module}.{alias.name}", alias.asname, obj),
-                        )
-
-        # Import the required modules into a dictionary
-        globals_dict: dict = {}
-        for module_name, alias, obj in imported_modules:
-            if alias:
-                globals_dict[alias] = obj
-            else:
-                globals_dict[module_name.split(".")[-1]] = obj
-
-        ex_dicts: dict = {
-            "pd": pd,
-            "host": host,
-            "username": user,
-            "password": password,
-            "port": port,
-            "error": "",
-        }
-        globals_dict.update(ex_dicts)
-        return globals_dict
-
-    ex_locals = get_globals_dict(
-        code_template,
-        user,
-        password,
-        host,
-        port,
-    )
-    ex_locals["sql_query"] = sql_query
-
-    exec(
-        code_template.format(
-            username=user,
-            password=password,
-            host=host,
-            port=port,
-            sql_query=sql_query,
-        ),
-        ex_locals,
+    processed_data, error = query_executor(
+        user=user,
+        password=password,
+        host=host,
+        port=port,
+        sql_query=sql_query,
+        database_name=database_name,
     )
 
-    return ex_locals["processed_data"]
+    return processed_data
@@ -0,0 +1,294 @@
+import json
+import logging
+import os
+import pandas as pd
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .connection_pool import get_pooled_engine
+
+logger = logging.getLogger(__name__)
+
+# Number of rows pulled from the cursor per round trip
+SQL_FETCH_BATCH_SIZE: int = int(os.getenv("SQL_FETCH_BATCH_SIZE", "5000"))
+
+# Chart types that can only display a limited number of points. The caps stay
+# well above the thresholds where the extractors switch a chart to another chart
+# type (e.g. pie chart with more than 12 slices), so those fallbacks still apply.
+CHART_TYPE_MAX_ROWS: Dict[str, int] = {
+    "card_chart": 1000,
+    "pie_chart": 1000,
+    "pyramid_chart": 1000,
+    "radar_chart": 1000,
+    "treemap_chart": 5000,
+    "scatterplot_chart": 10000,
+    "bubbleplot_chart": 10000,
+    **json.loads(os.getenv("SQL_CHART_TYPE_MAX_ROWS", "{}")),
+}
+
+QueryResult = Tuple[pd.DataFrame, Any]
+
+
+def get_max_result_rows(chart_type: Optional[str] = None) -> Optional[int]:
+    """Get the maximum number of rows to read for a chart type.
+
+    Only the chart types that can display a limited number of points are
+    capped, so query-only and beautiful table results are always complete.
+
+    Args:
+        chart_type (Optional[str]): chart type of the query, None for queries
+            that are not rendered as a chart (e.g. beautiful table)
+
+    Returns:
+        Optional[int]: row cap of the query, None if the result is not capped
+
+    """
+    max_rows = CHART_TYPE_MAX_ROWS.get(chart_type, 0) if chart_type else 0
+
+    return max_rows if max_rows > 0 else None
+
+
+def fetch_dataframe(cursor: Any, max_rows: Optional[int] = None) -> pd.DataFrame:
+    """Read the result set of an executed DB-API cursor into a DataFrame.
+
+    Rows are pulled with `fetchmany` in `SQL_FETCH_BATCH_SIZE` batches and the
+    read stops once `max_rows` rows have been received, so capped queries never
+    transfer the rest of the result set. Every batch is converted to a small
+    DataFrame as soon as it is received, so only one batch of row tuples is
+    held at a time, and the batches are concatenated once at the end. A
+    truncated result is logged as a warning and flagged in the `truncated`
+    entry of the DataFrame `attrs`.
+
+    Args:
+        cursor (Any): DB-API cursor with an executed query
+        max_rows (Optional[int]): maximum number of rows to read
+
+    Returns:
+        pd.DataFrame: DataFrame of the query result
+
+    """
+    columns = [desc[0] for desc in cursor.description]
+    batch_dfs: List[pd.DataFrame] = []
+    row_count = 0
+
+    while max_rows is None or row_count < max_rows:
+        batch_size = SQL_FETCH_BATCH_SIZE
+        if max_rows is not None:
+            batch_size = min(batch_size, max_rows - row_count)
+
+        batch = cursor.fetchmany(batch_size)
+        if not batch:
+            break
+
+        batch_dfs.append(pd.DataFrame(batch, columns=columns))
+        row_count += len(batch)
+
+    # One more row tells a result of exactly max_rows rows from a truncated one
+    truncated = (
+        max_rows is not None and row_count >= max_rows and cursor.fetchone() is not None
+    )
+    if truncated:
+        logger.warning(f"Query result truncated to {max_rows} rows")
+
+    queried_df = concat_batches(batch_dfs, columns)
+    queried_df.attrs["truncated"] = truncated
+
+    return queried_df
+
+
+def concat_batches(batch_dfs: List[pd.DataFrame], columns: List[str]) -> pd.DataFrame:
+    """Concatenate the DataFrames of the fetched batches.
+
+    A column can be inferred with different dtypes in different batches (e.g.
+    object in a batch of NULLs and float64 in the next one). Such columns are
+    concatenated as objects and inferred again, so the result has the dtypes
+    of a DataFrame built from all the rows at once.
+
+    Args:
+        batch_dfs (List[pd.DataFrame]): DataFrames of the fetched batches
+        columns (List[str]): column names of the result set
+
+    Returns:
+        pd.DataFrame: DataFrame of all the batches
+
+    """
+    if not batch_dfs:
+        return pd.DataFrame([], columns=columns)
+    if len(batch_dfs) == 1:
+        return batch_dfs[0]
+
+    mixed_columns = {
+        column: object
+        for column_idx, column in enumerate(columns)
+        if len({batch_df.dtypes.iloc[column_idx] for batch_df in batch_dfs}) > 1
+    }
+    if mixed_columns:
+        batch_dfs = [batch_df.astype(mixed_columns) for batch_df in batch_dfs]
+
+    queried_df = pd.concat(batch_dfs, ignore_index=True, copy=False)
+    if mixed_columns:
+        queried_df = queried_df.infer_objects()
+
+    return queried_df
+
+
+def run_pooled_sql_query(
+    sql_library: str,
+    sql_query: str,
+    max_rows: Optional[int] = None,
+    **connection_properties: Any,
+) -> QueryResult:
+    """Run a SQL query on a pooled connection of the client database.
+
+    Args:
+        sql_library (str): SQL library of the client database
+        sql_query (str): SQL query to be run
+        max_rows (Optional[int]): maximum number of rows to read
+        **connection_properties (Any): connection properties of the client database
+
+    Returns:
+        QueryResult: queried DataFrame and the error of the query ("" on success)
+
+    """
+    connection = get_pooled_engine(
+        sql_library, **connection_properties
+    ).raw_connection()
+    cursor = connection.cursor()
+
+    try:
+        cursor.execute(sql_query)
+        return fetch_dataframe(cursor, max_rows), ""
+    except Exception as e:
+        return pd.DataFrame(), e
+    finally:
+        try:
+            cursor.close()
+        except Exception:
+            # Unread rows of a capped result set (e.g. MySQL unbuffered cursors)
+            # make the connection unusable, so drop it instead of pooling it
+            connection.invalidate()
+
+        # Return the connection to the pool
+        connection.close()
+
+
+def execute_mysql_query(
+    host: str,
+    user: str,
+    password: str,
+    port: int,
+    sql_query: str,
+    max_rows: Optional[int] = None,
+) -> QueryResult:
+    return run_pooled_sql_query(
+        "mysql",
+        sql_query,
+        max_rows,
+        host=host,
+        user=user,
+        password=password,
+        port=port,
+    )
+
+
+def execute_mariadb_query(
+    host: str,
+    user: str,
+    password: str,
+    port: int,
+    sql_query: str,
+    max_rows: Optional[int] = None,
+) -> QueryResult:
+    return run_pooled_sql_query(
+        "mariadb",
+        sql_query,
+        max_rows,
+        host=host,
+        user=user,
+        password=password,
+        port=port,
+    )
+
+
+def execute_postgresql_query(
+    user: str,
+    password: str,
+    host: str,
+    port: int,
+    sql_query: str,
+    database_name: str,
+    max_rows: Optional[int] = None,
+) -> QueryResult:
+    return run_pooled_sql_query(
+        "postgresql",
+        sql_query,
+        max_rows,
+        user=user,
+        password=password,
+        host=host,
+        port=port,
+        database_name=database_name,
+    )
+
+
+def execute_sqlite_query(
+    sqlite_path: str,
+    sql_query: str,
+    max_rows: Optional[int] = None,
+) -> QueryResult:
+    return run_pooled_sql_query(
+        "sqlite",
+        sql_query,
+        max_rows,
+        sqlite_path=sqlite_path,
+    )
+
+
+def execute_sqlserver_query(
+    server: str,
+    uid: str,
+    pwd: str,
+    sql_query: str,
+    max_rows: Optional[int] = None,
+) -> QueryResult:
+    return run_pooled_sql_query(
+        "sqlserver",
+        sql_query,
+        max_rows,
+        server=server,
+        uid=uid,
+        pwd=pwd,
+    )
+
+
+def execute_oracle_query(
+    host: str,
+    user: str,
+    password: str,
+    port: int,
+    sql_query: str,
+    database_name: str,
+    max_rows: Optional[int] = None,
+) -> QueryResult:
+    queried_df, error = run_pooled_sql_query(
+        "oracle",
+        sql_query,
+        max_rows,
+        host=host,
+        user=user,
+        password=password,
+        port=port,
+        database_name=database_name,
+    )
+
+    # Oracle errors are reported as text to the SQL fixer
+    return queried_df, str(error) if error != "" else error
+
+
+sql_query_executors: Dict[str, Callable[..., QueryResult]] = {
+    "mysql": execute_mysql_query,
+    "mariadb": execute_mariadb_query,
+    "postgresql": execute_postgresql_query,
+    "sqlite": execute_sqlite_query,
+    "sqlserver": execute_sqlserver_query,
+    "oracle": execute_oracle_query,
+}
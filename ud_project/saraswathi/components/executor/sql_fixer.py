@@ -13,6 +13,7 @@ from components.sql_query import (
 )
 
 from ..datamodel import DataSummary
+from ..sql_cache import build_sql_cache_key, generated_sql_cache
 from ..utils import (
     generate_column_information_prompt,
     normalize_chart_type,
@@ -39,6 +40,22 @@ def fix_sql_query(
     chart_title: Union[str, None] = None,
     instruction: Union[str, None] = None,
 ):
+    # The generated SQL query failed to produce chart data, never serve it again
+    generated_sql_cache.delete(
+        build_sql_cache_key(
+            data_summary,
+            chart_type,
+            chart_axis,
+            filters,
+            aggregations,
+            database_name,
+            table_name,
+            question,
+            chart_title,
+            instruction,
+        )
+    )
+
     normalized_chart_type = normalize_chart_type(chart_type)
 
     chart_axis_edited = chart_axis.copy()
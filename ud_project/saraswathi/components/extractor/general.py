@@ -13,9 +13,13 @@ from time import perf_counter
 from typing import Tuple, Union, Any
 from ..datamodel import DataSummary
 from ..utils import (
+    build_table_rows,
     calculate_bins,
     detect_and_sort_pandas_date,
     sort_pandas_date,
+    pivot_series_columns,
+    sort_by_date_parts,
+    to_json_list,
     validate_and_fix_xAxis_title,
     calculate_token_usage,
     adjust_axis_title_and_data,
@@ -323,7 +327,6 @@ def generate_aggregated_table_chart_d3(
     table_chart_json_dict["data"] = []
 
     column_names = list(chart_data.columns)
-    chart_data_values = chart_data.values.tolist()
 
     if base_chart_type in [
         "bar_chart",
@@ -350,142 +353,56 @@ def generate_aggregated_table_chart_d3(
             code_level_logger.error("bar_chart: X-Axis is not found in extraction!")
             raise RuntimeError("bar_chart: X-Axis is not found in extraction!")
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        ),
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
 
-        chart_data_values = chart_data.values.tolist()
-
-        for row in chart_data_values:
-            row_data = {}
-            for column_idx, column_name in enumerate(column_names):
-                try:
-                    if column_name == "xAxis" or (
-                        "xAxis_column" in chart_axis
-                        and column_name in chart_axis["xAxis_column"]
-                    ):
-                        new_column_name = chart_axis["xAxis_title"]
-                    elif column_name.startswith("yAxis"):
-                        # Check for yAxis, yAxis2, yAxis3, etc.
-                        axis_key = f"{column_name}_title"
-                        if axis_key in chart_axis:
-                            if "_" in column_name:
-                                new_column_name = column_name
-                                new_column_name = new_column_name.replace(
-                                    new_column_name.split("_")[0],
-                                    chart_axis[axis_key],
-                                )
-                            else:
-                                new_column_name = chart_axis[axis_key]
-                        else:
-                            # Fallback to the original column name if no matching title is found
+        table_column_names = []
+        for column_name in column_names:
+            try:
+                if column_name == "xAxis" or (
+                    "xAxis_column" in chart_axis
+                    and column_name in chart_axis["xAxis_column"]
+                ):
+                    new_column_name = chart_axis["xAxis_title"]
+                elif column_name.startswith("yAxis"):
+                    # Check for yAxis, yAxis2, yAxis3, etc.
+                    axis_key = f"{column_name}_title"
+                    if axis_key in chart_axis:
+                        if "_" in column_name:
                             new_column_name = column_name
-                    elif column_name == "series" or (
-                        "series_column" in chart_axis
-                        and column_name in chart_axis["series_column"]
-                    ):
-                        new_column_name = chart_axis["series_title"]
+                            new_column_name = new_column_name.replace(
+                                new_column_name.split("_")[0],
+                                chart_axis[axis_key],
+                            )
+                        else:
+                            new_column_name = chart_axis[axis_key]
                     else:
+                        # Fallback to the original column name if no matching title is found
                         new_column_name = column_name
-                except Exception:
+                elif column_name == "series" or (
+                    "series_column" in chart_axis
+                    and column_name in chart_axis["series_column"]
+                ):
+                    new_column_name = chart_axis["series_title"]
+                else:
                     new_column_name = column_name
+            except Exception:
+                new_column_name = column_name
 
-                new_column_name = new_column_name.replace("_", " ")
-
-                try:
-                    if isinstance(row[column_idx], int):
-                        # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                        row_data[new_column_name] = row[column_idx]
-                    elif isinstance(row[column_idx], float):
-                        # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                        # Round off to 6 decimal points
-                        row_data[new_column_name] = round(row[column_idx], 6)
-                    elif isinstance(row[column_idx], decimal.Decimal):
-                        # row_data[new_column_name] = '{:,}'.format(float(row[column_idx]))
-                        # Round off to 6 decimal points
-                        row_data[new_column_name] = round(float(row[column_idx]), 6)
-                    # elif pd.api.types.is_datetime64_any_dtype(row[column_idx]):
-                    #     row_data[new_column_name] = row[column_idx].astype(str)
-                    elif (
-                        isinstance(row[column_idx], datetime.date)
-                        or isinstance(row[column_idx], datetime.datetime)
-                    ) and not pd.isnull(row[column_idx]):
-                        row_data[new_column_name] = row[column_idx].strftime("%m/%d/%Y")
-                    else:
-                        row_data[new_column_name] = str(row[column_idx])
-                except Exception:
-                    print(traceback.format_exc())
-                    # logger.error(traceback.format_exc())
-                    row_data[new_column_name] = str(row[column_idx])
+            new_column_name = new_column_name.replace("_", " ")
+            table_column_names.append(new_column_name)
 
-            table_chart_json_dict["data"].append(row_data)
+        table_chart_json_dict["data"].extend(
+            build_table_rows(chart_data, table_column_names)
+        )
     elif base_chart_type in ["histogram_chart"]:
         chart_data_columns = list(chart_data.columns)
 
         xAxis_column_name = chart_data_columns[0]
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        ),
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -546,8 +463,6 @@ def generate_aggregated_table_chart_d3(
             )
             raise RuntimeError("histogram_chart: X-Axis is not found in extraction!")
 
-        chart_data_values = chart_data.values.tolist()
-
         for chart_column_name in chart_data_columns:
             try:
                 if not isinstance(
@@ -604,98 +519,53 @@ def generate_aggregated_table_chart_d3(
                 "aggregated table chart: X-Axis is not found in extraction!",
             )
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        )
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name, ascending=True
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
 
-        chart_data_values = chart_data.values.tolist()
-
-        for row in chart_data_values:
-            row_data = {}
-            for column_idx, column_name in enumerate(column_names):
-                try:
-                    if "xAxis" == column_name or (
-                        "xAxis_column" in chart_axis.keys()
-                        and column_name in chart_axis["xAxis_column"]
-                    ):
-                        new_column_name = chart_axis["xAxis_title"]
-                    elif column_name.startswith("yAxis"):
-                        # Check for yAxis, yAxis2, yAxis3, etc.
-                        axis_key = f"{column_name}_title"
-                        if axis_key in chart_axis:
-                            if "_" in column_name:
-                                new_column_name = column_name
-                                new_column_name = new_column_name.replace(
-                                    new_column_name.split("_")[0], chart_axis[axis_key]
-                                )
-                            else:
-                                new_column_name = chart_axis[axis_key]
-                        else:
+        table_column_names = []
+        for column_name in column_names:
+            try:
+                if "xAxis" == column_name or (
+                    "xAxis_column" in chart_axis.keys()
+                    and column_name in chart_axis["xAxis_column"]
+                ):
+                    new_column_name = chart_axis["xAxis_title"]
+                elif column_name.startswith("yAxis"):
+                    # Check for yAxis, yAxis2, yAxis3, etc.
+                    axis_key = f"{column_name}_title"
+                    if axis_key in chart_axis:
+                        if "_" in column_name:
                             new_column_name = column_name
-                    elif "zAxis" == column_name or (
-                        "zAxis_column" in chart_axis.keys()
-                        and column_name in chart_axis["zAxis_column"]
-                    ):
-                        new_column_name = chart_axis["zAxis_title"]
-                    elif "series" == column_name or (
-                        "series_column" in chart_axis.keys()
-                        and column_name in chart_axis["series_column"]
-                    ):
-                        new_column_name = chart_axis["series_title"]
+                            new_column_name = new_column_name.replace(
+                                new_column_name.split("_")[0], chart_axis[axis_key]
+                            )
+                        else:
+                            new_column_name = chart_axis[axis_key]
                     else:
                         new_column_name = column_name
-                except Exception:
+                elif "zAxis" == column_name or (
+                    "zAxis_column" in chart_axis.keys()
+                    and column_name in chart_axis["zAxis_column"]
+                ):
+                    new_column_name = chart_axis["zAxis_title"]
+                elif "series" == column_name or (
+                    "series_column" in chart_axis.keys()
+                    and column_name in chart_axis["series_column"]
+                ):
+                    new_column_name = chart_axis["series_title"]
+                else:
                     new_column_name = column_name
+            except Exception:
+                new_column_name = column_name
 
-                new_column_name = new_column_name.replace("_", " ")
+            new_column_name = new_column_name.replace("_", " ")
+            table_column_names.append(new_column_name)
 
-                try:
-                    if isinstance(row[column_idx], int):
-                        row_data[new_column_name] = row[column_idx]
-                    elif isinstance(row[column_idx], float):
-                        row_data[new_column_name] = round(row[column_idx], 6)
-                    elif isinstance(row[column_idx], decimal.Decimal):
-                        row_data[new_column_name] = round(float(row[column_idx]), 6)
-                    elif (
-                        isinstance(row[column_idx], datetime.date)
-                        or isinstance(row[column_idx], datetime.datetime)
-                    ) and not pd.isnull(row[column_idx]):
-                        row_data[new_column_name] = row[column_idx].strftime("%m/%d/%Y")
-                    else:
-                        row_data[new_column_name] = str(row[column_idx])
-                except Exception:
-                    row_data[new_column_name] = str(row[column_idx])
-            table_chart_json_dict["data"].append(row_data)
+        table_chart_json_dict["data"].extend(
+            build_table_rows(chart_data, table_column_names)
+        )
 
     elif base_chart_type in [
         "bubbleplot_chart",
@@ -724,100 +594,54 @@ def generate_aggregated_table_chart_d3(
                 "aggregated table chart: X-Axis is not found in extraction!",
             )
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        ),
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
 
-        chart_data_values = chart_data.values.tolist()
-
-        for row in chart_data_values:
-            row_data = {}
-            for column_idx, column_name in enumerate(column_names):
-                try:
-                    if column_name == "xAxis" or (
-                        "xAxis_column" in chart_axis
-                        and column_name in chart_axis["xAxis_column"]
-                    ):
-                        new_column_name = chart_axis["xAxis_title"]
-                    elif column_name.startswith("yAxis"):
-                        # Check for yAxis, yAxis2, yAxis3, etc.
-                        axis_key = f"{column_name}_title"
-                        if axis_key in chart_axis:
-                            if "_" in column_name:
-                                new_column_name = column_name
-                                new_column_name = new_column_name.replace(
-                                    new_column_name.split("_")[0],
-                                    chart_axis[axis_key],
-                                )
-                            else:
-                                new_column_name = chart_axis[axis_key]
-                        else:
+        table_column_names = []
+        for column_name in column_names:
+            try:
+                if column_name == "xAxis" or (
+                    "xAxis_column" in chart_axis
+                    and column_name in chart_axis["xAxis_column"]
+                ):
+                    new_column_name = chart_axis["xAxis_title"]
+                elif column_name.startswith("yAxis"):
+                    # Check for yAxis, yAxis2, yAxis3, etc.
+                    axis_key = f"{column_name}_title"
+                    if axis_key in chart_axis:
+                        if "_" in column_name:
                             new_column_name = column_name
-                    elif column_name == "zAxis" or (
-                        "zAxis_column" in chart_axis
-                        and column_name in chart_axis["zAxis_column"]
-                    ):
-                        new_column_name = chart_axis["zAxis_title"]
-                    elif column_name == "series" or (
-                        "series_column" in chart_axis
-                        and column_name in chart_axis["series_column"]
-                    ):
-                        new_column_name = chart_axis["series_title"]
+                            new_column_name = new_column_name.replace(
+                                new_column_name.split("_")[0],
+                                chart_axis[axis_key],
+                            )
+                        else:
+                            new_column_name = chart_axis[axis_key]
                     else:
                         new_column_name = column_name
-                except Exception:
+                elif column_name == "zAxis" or (
+                    "zAxis_column" in chart_axis
+                    and column_name in chart_axis["zAxis_column"]
+                ):
+                    new_column_name = chart_axis["zAxis_title"]
+                elif column_name == "series" or (
+                    "series_column" in chart_axis
+                    and column_name in chart_axis["series_column"]
+                ):
+                    new_column_name = chart_axis["series_title"]
+                else:
                     new_column_name = column_name
+            except Exception:
+                new_column_name = column_name
 
-                new_column_name = new_column_name.replace("_", " ")
+            new_column_name = new_column_name.replace("_", " ")
+            table_column_names.append(new_column_name)
 
-                try:
-                    if isinstance(row[column_idx], int):
-                        row_data[new_column_name] = row[column_idx]
-                    elif isinstance(row[column_idx], float):
-                        row_data[new_column_name] = round(row[column_idx], 6)
-                    elif isinstance(row[column_idx], decimal.Decimal):
-                        row_data[new_column_name] = round(float(row[column_idx]), 6)
-                    elif (
-                        isinstance(row[column_idx], datetime.date)
-                        or isinstance(row[column_idx], datetime.datetime)
-                    ) and not pd.isnull(row[column_idx]):
-                        row_data[new_column_name] = row[column_idx].strftime("%m/%d/%Y")
-                    else:
-                        row_data[new_column_name] = str(row[column_idx])
-                except Exception:
-                    row_data[new_column_name] = str(row[column_idx])
-            table_chart_json_dict["data"].append(row_data)
+        table_chart_json_dict["data"].extend(
+            build_table_rows(chart_data, table_column_names)
+        )
 
     elif base_chart_type in [
         "area_chart",
@@ -851,103 +675,50 @@ def generate_aggregated_table_chart_d3(
                 "aggregated table chart: X-Axis is not found in extraction!",
             )
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        ),
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
 
-        chart_data_values = chart_data.values.tolist()
-
-        for row in chart_data_values:
-            row_data = {}
-            for column_idx, column_name in enumerate(column_names):
-                try:
-                    if column_name == "xAxis" or (
-                        "xAxis_column" in chart_axis
-                        and column_name in chart_axis["xAxis_column"]
-                    ):
-                        new_column_name = chart_axis["xAxis_title"]
-                    elif column_name.startswith("yAxis"):
-                        # Check for yAxis, yAxis2, yAxis3, etc.
-                        axis_key = f"{column_name}_title"
-                        if axis_key in chart_axis:
-                            if "_" in column_name:
-                                new_column_name = column_name
-                                new_column_name = new_column_name.replace(
-                                    new_column_name.split("_")[0],
-                                    chart_axis[axis_key],
-                                )
-                            else:
-                                new_column_name = chart_axis[axis_key]
-                        else:
-                            # Fallback to the original column name if no matching title is found
+        table_column_names = []
+        for column_name in column_names:
+            try:
+                if column_name == "xAxis" or (
+                    "xAxis_column" in chart_axis
+                    and column_name in chart_axis["xAxis_column"]
+                ):
+                    new_column_name = chart_axis["xAxis_title"]
+                elif column_name.startswith("yAxis"):
+                    # Check for yAxis, yAxis2, yAxis3, etc.
+                    axis_key = f"{column_name}_title"
+                    if axis_key in chart_axis:
+                        if "_" in column_name:
                             new_column_name = column_name
-                    elif column_name == "series" or (
-                        "series_column" in chart_axis
-                        and column_name in chart_axis["series_column"]
-                    ):
-                        new_column_name = chart_axis["series_title"]
+                            new_column_name = new_column_name.replace(
+                                new_column_name.split("_")[0],
+                                chart_axis[axis_key],
+                            )
+                        else:
+                            new_column_name = chart_axis[axis_key]
                     else:
+                        # Fallback to the original column name if no matching title is found
                         new_column_name = column_name
-                except Exception:
+                elif column_name == "series" or (
+                    "series_column" in chart_axis
+                    and column_name in chart_axis["series_column"]
+                ):
+                    new_column_name = chart_axis["series_title"]
+                else:
                     new_column_name = column_name
+            except Exception:
+                new_column_name = column_name
 
-                new_column_name = new_column_name.replace("_", " ")
+            new_column_name = new_column_name.replace("_", " ")
+            table_column_names.append(new_column_name)
 
-                try:
-                    if isinstance(row[column_idx], int):
-                        # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                        row_data[new_column_name] = row[column_idx]
-                    elif isinstance(row[column_idx], float):
-                        # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                        # Round off to 6 decimal points
-                        row_data[new_column_name] = round(row[column_idx], 6)
-                    elif isinstance(row[column_idx], decimal.Decimal):
-                        # row_data[new_column_name] = '{:,}'.format(float(row[column_idx]))
-                        # Round off to 6 decimal points
-                        row_data[new_column_name] = round(float(row[column_idx]), 6)
-                    # elif pd.api.types.is_datetime64_any_dtype(row[column_idx]):
-                    #     row_data[new_column_name] = row[column_idx].astype(str)
-                    elif (
-                        isinstance(row[column_idx], datetime.date)
-                        or isinstance(row[column_idx], datetime.datetime)
-                    ) and not pd.isnull(row[column_idx]):
-                        row_data[new_column_name] = row[column_idx].strftime("%m/%d/%Y")
-                    else:
-                        row_data[new_column_name] = str(row[column_idx])
-                except Exception:
-                    row_data[new_column_name] = str(row[column_idx])
-            table_chart_json_dict["data"].append(row_data)
+        table_chart_json_dict["data"].extend(
+            build_table_rows(chart_data, table_column_names)
+        )
 
     elif base_chart_type in [
         "scatterplot_chart",
@@ -1020,103 +791,50 @@ def generate_aggregated_table_chart_d3(
                         f"scatterplot_chart: {numerical_column_name} is not numerical!",
                     )
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        ),
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
 
-        chart_data_values = chart_data.values.tolist()
-
-        for row in chart_data_values:
-            row_data = {}
-            for column_idx, column_name in enumerate(column_names):
-                try:
-                    if column_name == "xAxis" or (
-                        "xAxis_column" in chart_axis
-                        and column_name in chart_axis["xAxis_column"]
-                    ):
-                        new_column_name = chart_axis["xAxis_title"]
-                    elif column_name.startswith("yAxis"):
-                        # Check for yAxis, yAxis2, yAxis3, etc.
-                        axis_key = f"{column_name}_title"
-                        if axis_key in chart_axis:
-                            if "_" in column_name:
-                                new_column_name = column_name
-                                new_column_name = new_column_name.replace(
-                                    new_column_name.split("_")[0],
-                                    chart_axis[axis_key],
-                                )
-                            else:
-                                new_column_name = chart_axis[axis_key]
-                        else:
-                            # Fallback to the original column name if no matching title is found
+        table_column_names = []
+        for column_name in column_names:
+            try:
+                if column_name == "xAxis" or (
+                    "xAxis_column" in chart_axis
+                    and column_name in chart_axis["xAxis_column"]
+                ):
+                    new_column_name = chart_axis["xAxis_title"]
+                elif column_name.startswith("yAxis"):
+                    # Check for yAxis, yAxis2, yAxis3, etc.
+                    axis_key = f"{column_name}_title"
+                    if axis_key in chart_axis:
+                        if "_" in column_name:
                             new_column_name = column_name
-                    elif column_name == "series" or (
-                        "series_column" in chart_axis
-                        and column_name in chart_axis["series_column"]
-                    ):
-                        new_column_name = chart_axis["series_title"]
+                            new_column_name = new_column_name.replace(
+                                new_column_name.split("_")[0],
+                                chart_axis[axis_key],
+                            )
+                        else:
+                            new_column_name = chart_axis[axis_key]
                     else:
+                        # Fallback to the original column name if no matching title is found
                         new_column_name = column_name
-                except Exception:
+                elif column_name == "series" or (
+                    "series_column" in chart_axis
+                    and column_name in chart_axis["series_column"]
+                ):
+                    new_column_name = chart_axis["series_title"]
+                else:
                     new_column_name = column_name
+            except Exception:
+                new_column_name = column_name
 
-                new_column_name = new_column_name.replace("_", " ")
+            new_column_name = new_column_name.replace("_", " ")
+            table_column_names.append(new_column_name)
 
-                try:
-                    if isinstance(row[column_idx], int):
-                        # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                        row_data[new_column_name] = row[column_idx]
-                    elif isinstance(row[column_idx], float):
-                        # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                        # Round off to 6 decimal points
-                        row_data[new_column_name] = round(row[column_idx], 6)
-                    elif isinstance(row[column_idx], decimal.Decimal):
-                        # row_data[new_column_name] = '{:,}'.format(float(row[column_idx]))
-                        # Round off to 6 decimal points
-                        row_data[new_column_name] = round(float(row[column_idx]), 6)
-                    # elif pd.api.types.is_datetime64_any_dtype(row[column_idx]):
-                    #     row_data[new_column_name] = row[column_idx].astype(str)
-                    elif (
-                        isinstance(row[column_idx], datetime.date)
-                        or isinstance(row[column_idx], datetime.datetime)
-                    ) and not pd.isnull(row[column_idx]):
-                        row_data[new_column_name] = row[column_idx].strftime("%m/%d/%Y")
-                    else:
-                        row_data[new_column_name] = str(row[column_idx])
-                except Exception:
-                    row_data[new_column_name] = str(row[column_idx])
-            table_chart_json_dict["data"].append(row_data)
+        table_chart_json_dict["data"].extend(
+            build_table_rows(chart_data, table_column_names)
+        )
 
     elif base_chart_type in ["barlinecombo_chart"]:
         chart_data_columns = list(chart_data.columns)
@@ -1140,105 +858,50 @@ def generate_aggregated_table_chart_d3(
             )
             raise RuntimeError("barlinecombo_chart: X-Axis is not found in extraction!")
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        ),
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
 
-        chart_data_values = chart_data.values.tolist()
-
-        for row in chart_data_values:
-            row_data = {}
-            for column_idx, column_name in enumerate(column_names):
-                try:
-                    if column_name == "xAxis" or (
-                        "xAxis_column" in chart_axis
-                        and column_name in chart_axis["xAxis_column"]
-                    ):
-                        new_column_name = chart_axis["xAxis_title"]
-                    elif column_name.startswith("yAxis"):
-                        # Check for yAxis, yAxis2, yAxis3, etc.
-                        axis_key = f"{column_name}_title"
-                        if axis_key in chart_axis:
-                            if "_" in column_name:
-                                new_column_name = column_name
-                                new_column_name = new_column_name.replace(
-                                    new_column_name.split("_")[0],
-                                    chart_axis[axis_key],
-                                )
-                            else:
-                                new_column_name = chart_axis[axis_key]
-                        else:
-                            # Fallback to the original column name if no matching title is found
+        table_column_names = []
+        for column_name in column_names:
+            try:
+                if column_name == "xAxis" or (
+                    "xAxis_column" in chart_axis
+                    and column_name in chart_axis["xAxis_column"]
+                ):
+                    new_column_name = chart_axis["xAxis_title"]
+                elif column_name.startswith("yAxis"):
+                    # Check for yAxis, yAxis2, yAxis3, etc.
+                    axis_key = f"{column_name}_title"
+                    if axis_key in chart_axis:
+                        if "_" in column_name:
                             new_column_name = column_name
-                    elif column_name == "series" or (
-                        "series_column" in chart_axis
-                        and column_name in chart_axis["series_column"]
-                    ):
-                        new_column_name = chart_axis["series_title"]
+                            new_column_name = new_column_name.replace(
+                                new_column_name.split("_")[0],
+                                chart_axis[axis_key],
+                            )
+                        else:
+                            new_column_name = chart_axis[axis_key]
                     else:
+                        # Fallback to the original column name if no matching title is found
                         new_column_name = column_name
-                except Exception:
+                elif column_name == "series" or (
+                    "series_column" in chart_axis
+                    and column_name in chart_axis["series_column"]
+                ):
+                    new_column_name = chart_axis["series_title"]
+                else:
                     new_column_name = column_name
+            except Exception:
+                new_column_name = column_name
 
-                new_column_name = new_column_name.replace("_", " ")
+            new_column_name = new_column_name.replace("_", " ")
+            table_column_names.append(new_column_name)
 
-                try:
-                    if isinstance(row[column_idx], int):
-                        # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                        row_data[new_column_name] = row[column_idx]
-                    elif isinstance(row[column_idx], float):
-                        # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                        # Round off to 6 decimal points
-                        row_data[new_column_name] = round(row[column_idx], 6)
-                    elif isinstance(row[column_idx], decimal.Decimal):
-                        # row_data[new_column_name] = '{:,}'.format(float(row[column_idx]))
-                        # Round off to 6 decimal points
-                        row_data[new_column_name] = round(float(row[column_idx]), 6)
-                    # elif pd.api.types.is_datetime64_any_dtype(row[column_idx]):
-                    #     row_data[new_column_name] = row[column_idx].astype(str)
-                    elif (
-                        isinstance(row[column_idx], datetime.date)
-                        or isinstance(row[column_idx], datetime.datetime)
-                    ) and not pd.isnull(row[column_idx]):
-                        row_data[new_column_name] = row[column_idx].strftime("%m/%d/%Y")
-                    else:
-                        row_data[new_column_name] = str(row[column_idx])
-                except Exception:
-                    print(traceback.format_exc())
-                    # logger.error(traceback.format_exc())
-                    row_data[new_column_name] = str(row[column_idx])
-            table_chart_json_dict["data"].append(row_data)
+        table_chart_json_dict["data"].extend(
+            build_table_rows(chart_data, table_column_names)
+        )
     else:
         code_level_logger.error(
             f"{base_chart_type} Chart Type is not supported in generate aggregated table chart!",
@@ -2114,34 +1777,7 @@ def generate_combo_chart_d3(
             code_level_logger,
         )
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -2171,14 +1807,8 @@ def generate_combo_chart_d3(
             code_level_logger,
         )
 
-    y_values = [
-        float(val) if isinstance(val, decimal.Decimal) else val
-        for val in chart_data[yAxisBar_column_name].values.tolist()
-    ]
-    y2_values = [
-        float(val) if isinstance(val, decimal.Decimal) else val
-        for val in chart_data[yAxisLine_column_name].values.tolist()
-    ]
+    y_values = to_json_list(chart_data[yAxisBar_column_name])
+    y2_values = to_json_list(chart_data[yAxisLine_column_name])
 
     if y2_values == []:
         # combo_chart_json_dict["Chart_Type"] = "bar_chart"
@@ -2411,38 +2041,11 @@ def generate_line_chart_d3(
         and series_column_name in chart_data.columns
         and chart_data[series_column_name].nunique() > 1
     ):
-        new_chart_data = pd.DataFrame()
-
-        pivot_data = chart_data.pivot_table(
-            index=xAxis_column_name,
-            columns=series_column_name,
-            values=yAxis_column_names,
-        )
-        pivot_data = pivot_data.reset_index()
-        new_chart_data[xAxis_column_name] = [
-            float(val) if isinstance(val, decimal.Decimal) else val
-            for val in pivot_data[xAxis_column_name].values.tolist()
-        ]
-
-        for yAxis_column_name in yAxis_column_names:
-            yAxis_pivot_table = pivot_data[yAxis_column_name]
-            for yAxis_pivot_column in list(yAxis_pivot_table.columns):
-                new_columns = {
-                    f"{yAxis_column_name}_{yAxis_pivot_column}": [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in yAxis_pivot_table[yAxis_pivot_column].values.tolist()
-                    ],
-                }
-                added_chart_data = pd.DataFrame(new_columns)
-                new_chart_data = pd.concat([new_chart_data, added_chart_data], axis=1)
-
-        chart_data = new_chart_data.fillna(
-            {
-                col: (
-                    0 if new_chart_data[col].dtype in [np.float64, np.int64] else "null"
-                )
-                for col in new_chart_data.columns
-            },
+        chart_data = pivot_series_columns(
+            chart_data,
+            xAxis_column_name,
+            series_column_name,
+            yAxis_column_names,
         )
 
     if (
@@ -2501,34 +2104,7 @@ def generate_line_chart_d3(
         line_chart_json_dict["xAxis"] = new_chart_axis["xAxis_title"].replace("_", " ")
         line_chart_json_dict["Chart_Title"] = new_chart_title
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -2565,10 +2141,7 @@ def generate_line_chart_d3(
             continue
 
         if yAxis_idx <= 1:
-            line_chart_json_dict["Y"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            line_chart_json_dict["Y"] = to_json_list(chart_data[column_name])
 
             underscore_index = column_name.find("_")
 
@@ -2707,10 +2280,9 @@ def generate_line_chart_d3(
             #     # line_chart_json_dict["Chart_Type"] = "column_chart"
             #     line_chart_json_dict["Chart_Type"] = "grouped_column_chart"
         else:
-            line_chart_json_dict[f"Y{yAxis_idx}"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            line_chart_json_dict[f"Y{yAxis_idx}"] = to_json_list(
+                chart_data[column_name]
+            )
 
             underscore_index = column_name.find("_")
 
@@ -3238,34 +2810,7 @@ def generate_scatterplot_chart_d3(
         )
         scatterplot_chart_json_dict["Chart_Title"] = new_chart_title
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -3344,43 +2889,7 @@ def generate_scatterplot_chart_d3(
                 ].replace("_", " ")
                 scatterplot_chart_json_dict["Chart_Title"] = new_chart_title
 
-            try:
-                if len(series_chart_data[xAxis_column_name][0].split("-")) == 1:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                    )
-                elif len(series_chart_data[xAxis_column_name][0].split("-")) == 2:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        key=lambda x: x.apply(
-                            lambda date: (
-                                int(date.split("-")[0]),
-                                int(date.split("-")[1]),
-                            ),
-                        ),
-                    )
-                elif len(series_chart_data[xAxis_column_name][0].split("-")) == 3:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        key=lambda x: x.apply(
-                            lambda date: (
-                                int(date.split("-")[0]),
-                                int(date.split("-")[1]),
-                                int(date.split("-")[2]),
-                            ),
-                        ),
-                    )
-                else:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        ascending=True,
-                    )
-            except Exception:
-                series_chart_data = series_chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
+            series_chart_data = sort_by_date_parts(series_chart_data, xAxis_column_name)
 
             if isinstance(xAxis_column_name, str):
                 series_chart_data = sort_pandas_date(
@@ -3397,19 +2906,13 @@ def generate_scatterplot_chart_d3(
                     continue
 
                 if yAxis_idx <= 1:
-                    scatterplot_chart_json_dict["X"] = [
-                        float(x_data) if isinstance(x_data, decimal.Decimal) else x_data
-                        for x_data in series_chart_data[
-                            xAxis_column_name
-                        ].values.tolist()
-                    ]
+                    scatterplot_chart_json_dict["X"] = to_json_list(
+                        series_chart_data[xAxis_column_name]
+                    )
 
-                    scatterplot_chart_json_dict["Y"] = [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in series_chart_data[
-                            series_chart_column
-                        ].values.tolist()
-                    ]
+                    scatterplot_chart_json_dict["Y"] = to_json_list(
+                        series_chart_data[series_chart_column]
+                    )
 
                     # Add Series Title to Series Value
                     if (
@@ -3507,17 +3010,13 @@ def generate_scatterplot_chart_d3(
                     #     # scatterplot_chart_json_dict["Chart_Type"] = "column_chart"
                     #     scatterplot_chart_json_dict["Chart_Type"] = "grouped_column_chart"
                 else:
-                    scatterplot_chart_json_dict[f"X{yAxis_idx}"] = [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in series_chart_data[xAxis_column_name].values.tolist()
-                    ]
+                    scatterplot_chart_json_dict[f"X{yAxis_idx}"] = to_json_list(
+                        series_chart_data[xAxis_column_name]
+                    )
 
-                    scatterplot_chart_json_dict[f"Y{yAxis_idx}"] = [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in series_chart_data[
-                            series_chart_column
-                        ].values.tolist()
-                    ]
+                    scatterplot_chart_json_dict[f"Y{yAxis_idx}"] = to_json_list(
+                        series_chart_data[series_chart_column]
+                    )
 
                     # Add Series Title to Series Value
                     if (
@@ -3631,37 +3130,7 @@ def generate_scatterplot_chart_d3(
     else:
         yAxis_idx = 1
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        ),
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -3671,15 +3140,13 @@ def generate_scatterplot_chart_d3(
                 continue
 
             if yAxis_idx <= 1:
-                scatterplot_chart_json_dict["X"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[xAxis_column_name].values.tolist()
-                ]
+                scatterplot_chart_json_dict["X"] = to_json_list(
+                    chart_data[xAxis_column_name]
+                )
 
-                scatterplot_chart_json_dict["Y"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[yAxis_column_name].values.tolist()
-                ]
+                scatterplot_chart_json_dict["Y"] = to_json_list(
+                    chart_data[yAxis_column_name]
+                )
 
                 if check_aggregation_phrases(chart_axis[f"{column_name}_title"]):
                     scatterplot_chart_json_dict["yName"] = chart_axis[
@@ -3730,15 +3197,13 @@ def generate_scatterplot_chart_d3(
                 #     # scatterplot_chart_json_dict["Chart_Type"] = "column_chart"
                 #     scatterplot_chart_json_dict["Chart_Type"] = "grouped_column_chart"
             else:
-                scatterplot_chart_json_dict[f"X{yAxis_idx}"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[xAxis_column_name].values.tolist()
-                ]
+                scatterplot_chart_json_dict[f"X{yAxis_idx}"] = to_json_list(
+                    chart_data[xAxis_column_name]
+                )
 
-                scatterplot_chart_json_dict[f"Y{yAxis_idx}"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[column_name].values.tolist()
-                ]
+                scatterplot_chart_json_dict[f"Y{yAxis_idx}"] = to_json_list(
+                    chart_data[column_name]
+                )
 
                 if check_aggregation_phrases(chart_axis[f"{column_name}_title"]):
                     scatterplot_chart_json_dict[f"y{yAxis_idx}Name"] = chart_axis[
@@ -4109,38 +3574,11 @@ def generate_spline_chart_d3(
         and series_column_name in chart_data.columns
         and chart_data[series_column_name].nunique() > 1
     ):
-        new_chart_data = pd.DataFrame()
-
-        pivot_data = chart_data.pivot_table(
-            index=xAxis_column_name,
-            columns=series_column_name,
-            values=yAxis_column_names,
-        )
-        pivot_data = pivot_data.reset_index()
-        new_chart_data[xAxis_column_name] = [
-            float(val) if isinstance(val, decimal.Decimal) else val
-            for val in pivot_data[xAxis_column_name].values.tolist()
-        ]
-
-        for yAxis_column_name in yAxis_column_names:
-            yAxis_pivot_table = pivot_data[yAxis_column_name]
-            for yAxis_pivot_column in list(yAxis_pivot_table.columns):
-                new_columns = {
-                    f"{yAxis_column_name}_{yAxis_pivot_column}": [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in yAxis_pivot_table[yAxis_pivot_column].values.tolist()
-                    ],
-                }
-                added_chart_data = pd.DataFrame(new_columns)
-                new_chart_data = pd.concat([new_chart_data, added_chart_data], axis=1)
-
-        chart_data = new_chart_data.fillna(
-            {
-                col: (
-                    0 if new_chart_data[col].dtype in [np.float64, np.int64] else "null"
-                )
-                for col in new_chart_data.columns
-            },
+        chart_data = pivot_series_columns(
+            chart_data,
+            xAxis_column_name,
+            series_column_name,
+            yAxis_column_names,
         )
 
     if (
@@ -4202,34 +3640,7 @@ def generate_spline_chart_d3(
         )
         spline_chart_json_dict["Chart_Title"] = new_chart_title
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -4266,10 +3677,7 @@ def generate_spline_chart_d3(
             continue
 
         if yAxis_idx <= 1:
-            spline_chart_json_dict["Y"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            spline_chart_json_dict["Y"] = to_json_list(chart_data[column_name])
 
             underscore_index = column_name.find("_")
 
@@ -4408,10 +3816,9 @@ def generate_spline_chart_d3(
             #     # spline_chart_json_dict["Chart_Type"] = "column_chart"
             #     spline_chart_json_dict["Chart_Type"] = "grouped_column_chart"
         else:
-            spline_chart_json_dict[f"Y{yAxis_idx}"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            spline_chart_json_dict[f"Y{yAxis_idx}"] = to_json_list(
+                chart_data[column_name]
+            )
 
             underscore_index = column_name.find("_")
 
@@ -4850,34 +4257,7 @@ def generate_bar_chart_d3(
         bar_chart_json_dict["xAxis"] = new_chart_axis["xAxis_title"].replace("_", " ")
         bar_chart_json_dict["Chart_Title"] = new_chart_title
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -5173,34 +4553,7 @@ def generate_column_chart_d3(
         )
         column_chart_json_dict["Chart_Title"] = new_chart_title
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -5451,35 +4804,12 @@ def generate_group_column_chart_d3(
         and series_column_name in chart_data.columns
         and chart_data[series_column_name].nunique() > 1
     ):
-        new_chart_data = pd.DataFrame()
-
-        pivot_data = chart_data.pivot_table(
-            index="xAxis",
-            columns="series",
-            values=yAxis_column_names,
-        )
-        pivot_data = pivot_data.reset_index()
-        new_chart_data["xAxis"] = pivot_data["xAxis"].values.tolist()
-
-        for yAxis_column_name in yAxis_column_names:
-            yAxis_pivot_table = pivot_data[yAxis_column_name]
-            for yAxis_pivot_column in list(yAxis_pivot_table.columns):
-                new_columns = {
-                    f"{yAxis_column_name}_{yAxis_pivot_column}": [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in yAxis_pivot_table[yAxis_pivot_column].values.tolist()
-                    ],
-                }
-                added_chart_data = pd.DataFrame(new_columns)
-                new_chart_data = pd.concat([new_chart_data, added_chart_data], axis=1)
-
-        chart_data = new_chart_data.fillna(
-            {
-                col: (
-                    0 if new_chart_data[col].dtype in [np.float64, np.int64] else "null"
-                )
-                for col in new_chart_data.columns
-            },
+        chart_data = pivot_series_columns(
+            chart_data,
+            "xAxis",
+            "series",
+            yAxis_column_names,
+            convert_xAxis_decimal=False,
         )
 
     if (
@@ -5541,34 +4871,7 @@ def generate_group_column_chart_d3(
         )
         grouped_column_chart_json_dict["Chart_Title"] = new_chart_title
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -5584,10 +4887,7 @@ def generate_group_column_chart_d3(
             continue
 
         if yAxis_idx <= 1:
-            grouped_column_chart_json_dict["Y"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            grouped_column_chart_json_dict["Y"] = to_json_list(chart_data[column_name])
 
             underscore_index = column_name.find("_")
 
@@ -5730,10 +5030,9 @@ def generate_group_column_chart_d3(
                     "grouped_column_chart: Y-axis is not integer or float!",
                 )
         else:
-            grouped_column_chart_json_dict[f"Y{yAxis_idx}"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            grouped_column_chart_json_dict[f"Y{yAxis_idx}"] = to_json_list(
+                chart_data[column_name]
+            )
 
             underscore_index = column_name.find("_")
 
@@ -6110,36 +5409,12 @@ def generate_group_bar_chart_d3(
         and series_column_name in chart_data.columns
         and chart_data[series_column_name].nunique() > 1
     ):
-        new_chart_data = pd.DataFrame()
-
-        pivot_data = chart_data.pivot_table(
-            index=xAxis_column_name,
-            columns=series_column_name,
-            values=yAxis_column_names,
-        )
-        pivot_data = pivot_data.reset_index()
-        new_chart_data[xAxis_column_name] = pivot_data[
-            xAxis_column_name
-        ].values.tolist()
-
-        for yAxis_column_name in yAxis_column_names:
-            yAxis_pivot_table = pivot_data[yAxis_column_name]
-            for yAxis_pivot_column in list(yAxis_pivot_table.columns):
-                new_columns = {
-                    f"{yAxis_column_name}_{yAxis_pivot_column}": yAxis_pivot_table[
-                        yAxis_pivot_column
-                    ].values.tolist(),
-                }
-                added_chart_data = pd.DataFrame(new_columns)
-                new_chart_data = pd.concat([new_chart_data, added_chart_data], axis=1)
-
-        chart_data = new_chart_data.fillna(
-            {
-                col: (
-                    0 if new_chart_data[col].dtype in [np.float64, np.int64] else "null"
-                )
-                for col in new_chart_data.columns
-            },
+        chart_data = pivot_series_columns(
+            chart_data,
+            xAxis_column_name,
+            series_column_name,
+            yAxis_column_names,
+            convert_xAxis_decimal=False,
         )
 
     if (
@@ -6201,34 +5476,7 @@ def generate_group_bar_chart_d3(
         )
         grouped_bar_chart_json_dict["Chart_Title"] = new_chart_title
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data, is_date = detect_and_sort_pandas_date(chart_data, xAxis_column_name)
@@ -6247,10 +5495,7 @@ def generate_group_bar_chart_d3(
             continue
 
         if yAxis_idx <= 1:
-            grouped_bar_chart_json_dict["Y"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            grouped_bar_chart_json_dict["Y"] = to_json_list(chart_data[column_name])
 
             underscore_index = column_name.find("_")
 
@@ -6391,10 +5636,9 @@ def generate_group_bar_chart_d3(
             #     # grouped_bar_chart_json_dict["Chart_Type"] = "column_chart"
             #     grouped_bar_chart_json_dict["Chart_Type"] = "grouped_column_chart"
         else:
-            grouped_bar_chart_json_dict[f"Y{yAxis_idx}"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            grouped_bar_chart_json_dict[f"Y{yAxis_idx}"] = to_json_list(
+                chart_data[column_name]
+            )
 
             underscore_index = column_name.find("_")
 
@@ -6932,37 +6176,12 @@ def generate_radar_chart_d3(
         and series_column_name in chart_data.columns
         and chart_data[series_column_name].nunique() > 1
     ):
-        new_chart_data = pd.DataFrame()
-
-        pivot_data = chart_data.pivot_table(
-            index=xAxis_column_name,
-            columns=series_column_name,
-            values=yAxis_column_names,
-        )
-        pivot_data = pivot_data.reset_index()
-        new_chart_data[xAxis_column_name] = pivot_data[
-            xAxis_column_name
-        ].values.tolist()
-
-        for yAxis_column_name in yAxis_column_names:
-            yAxis_pivot_table = pivot_data[yAxis_column_name]
-            for yAxis_pivot_column in list(yAxis_pivot_table.columns):
-                new_columns = {
-                    f"{yAxis_column_name}_{yAxis_pivot_column}": [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in yAxis_pivot_table[yAxis_pivot_column].values.tolist()
-                    ],
-                }
-                added_chart_data = pd.DataFrame(new_columns)
-                new_chart_data = pd.concat([new_chart_data, added_chart_data], axis=1)
-
-        chart_data = new_chart_data.fillna(
-            {
-                col: (
-                    0 if new_chart_data[col].dtype in [np.float64, np.int64] else "null"
-                )
-                for col in new_chart_data.columns
-            },
+        chart_data = pivot_series_columns(
+            chart_data,
+            xAxis_column_name,
+            series_column_name,
+            yAxis_column_names,
+            convert_xAxis_decimal=False,
         )
 
     if (
@@ -7021,34 +6240,7 @@ def generate_radar_chart_d3(
         radar_chart_json_dict["xAxis"] = new_chart_axis["xAxis_title"].replace("_", " ")
         radar_chart_json_dict["Chart_Title"] = new_chart_title
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -7087,10 +6279,7 @@ def generate_radar_chart_d3(
             continue
 
         if yAxis_idx <= 1:
-            radar_chart_json_dict["Y"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            radar_chart_json_dict["Y"] = to_json_list(chart_data[column_name])
 
             underscore_index = column_name.find("_")
 
@@ -7229,10 +6418,9 @@ def generate_radar_chart_d3(
             #     # radar_chart_json_dict["Chart_Type"] = "column_chart"
             #     radar_chart_json_dict["Chart_Type"] = "grouped_column_chart"
         else:
-            radar_chart_json_dict[f"Y{yAxis_idx}"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            radar_chart_json_dict[f"Y{yAxis_idx}"] = to_json_list(
+                chart_data[column_name]
+            )
 
             underscore_index = column_name.find("_")
 
@@ -7572,36 +6760,12 @@ def generate_area_chart_d3(
         and series_column_name in chart_data.columns
         and chart_data[series_column_name].nunique() > 1
     ):
-        new_chart_data = pd.DataFrame()
-
-        pivot_data = chart_data.pivot_table(
-            index=xAxis_column_name,
-            columns=series_column_name,
-            values=yAxis_column_names,
-        )
-        pivot_data = pivot_data.reset_index()
-        new_chart_data[xAxis_column_name] = pivot_data[
-            xAxis_column_name
-        ].values.tolist()
-
-        for yAxis_column_name in yAxis_column_names:
-            yAxis_pivot_table = pivot_data[yAxis_column_name]
-            for yAxis_pivot_column in list(yAxis_pivot_table.columns):
-                new_columns = {
-                    f"{yAxis_column_name}_{yAxis_pivot_column}": yAxis_pivot_table[
-                        yAxis_pivot_column
-                    ].values.tolist(),
-                }
-                added_chart_data = pd.DataFrame(new_columns)
-                new_chart_data = pd.concat([new_chart_data, added_chart_data], axis=1)
-
-        chart_data = new_chart_data.fillna(
-            {
-                col: (
-                    0 if new_chart_data[col].dtype in [np.float64, np.int64] else "null"
-                )
-                for col in new_chart_data.columns
-            },
+        chart_data = pivot_series_columns(
+            chart_data,
+            xAxis_column_name,
+            series_column_name,
+            yAxis_column_names,
+            convert_xAxis_decimal=False,
         )
 
     if (
@@ -7660,34 +6824,7 @@ def generate_area_chart_d3(
         area_chart_json_dict["xAxis"] = new_chart_axis["xAxis_title"].replace("_", " ")
         area_chart_json_dict["Chart_Title"] = new_chart_title
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -7724,10 +6861,7 @@ def generate_area_chart_d3(
             continue
 
         if yAxis_idx <= 1:
-            area_chart_json_dict["Y"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            area_chart_json_dict["Y"] = to_json_list(chart_data[column_name])
 
             underscore_index = column_name.find("_")
 
@@ -7866,10 +7000,9 @@ def generate_area_chart_d3(
             #     # area_chart_json_dict["Chart_Type"] = "column_chart"
             #     area_chart_json_dict["Chart_Type"] = "grouped_column_chart"
         else:
-            area_chart_json_dict[f"Y{yAxis_idx}"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            area_chart_json_dict[f"Y{yAxis_idx}"] = to_json_list(
+                chart_data[column_name]
+            )
 
             underscore_index = column_name.find("_")
 
@@ -8283,85 +7416,35 @@ def generate_table_chart_d3(
     else:
         xAxis_column_name = column_names[0]
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
 
-    chart_data_values = chart_data.values.tolist()
-
-    for row in chart_data_values:
-        row_data = {}
-        for column_idx, column_name in enumerate(column_names):
-            try:
-                if column_name == "xAxis" or (
-                    "xAxis_column" in chart_axis
-                    and column_name in chart_axis["xAxis_column"]
-                ):
-                    new_column_name = chart_axis["xAxis_title"]
-                elif column_name == "yAxis" or (
-                    "yAxis_column" in chart_axis
-                    and column_name in chart_axis["yAxis_column"]
-                ):
-                    new_column_name = chart_axis["yAxis_title"]
-                else:
-                    new_column_name = column_name
-            except Exception:
+    table_column_names = []
+    for column_name in column_names:
+        try:
+            if column_name == "xAxis" or (
+                "xAxis_column" in chart_axis
+                and column_name in chart_axis["xAxis_column"]
+            ):
+                new_column_name = chart_axis["xAxis_title"]
+            elif column_name == "yAxis" or (
+                "yAxis_column" in chart_axis
+                and column_name in chart_axis["yAxis_column"]
+            ):
+                new_column_name = chart_axis["yAxis_title"]
+            else:
                 new_column_name = column_name
+        except Exception:
+            new_column_name = column_name
 
-            new_column_name = new_column_name.replace("_", " ")
+        new_column_name = new_column_name.replace("_", " ")
+        table_column_names.append(new_column_name)
 
-            try:
-                if isinstance(row[column_idx], int):
-                    # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                    row_data[new_column_name] = row[column_idx]
-                elif isinstance(row[column_idx], float):
-                    # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                    # Round off to 6 decimal points
-                    row_data[new_column_name] = round(row[column_idx], 6)
-                elif isinstance(row[column_idx], decimal.Decimal):
-                    # row_data[new_column_name] = '{:,}'.format(float(row[column_idx]))
-                    # Round off to 6 decimal points
-                    row_data[new_column_name] = round(float(row[column_idx]), 6)
-                # elif pd.api.types.is_datetime64_any_dtype(row[column_idx]):
-                #     row_data[new_column_name] = row[column_idx].astype(str)
-                elif (
-                    isinstance(row[column_idx], datetime.date)
-                    or isinstance(row[column_idx], datetime.datetime)
-                ) and not pd.isnull(row[column_idx]):
-                    row_data[new_column_name] = row[column_idx].strftime("%m/%d/%Y")
-                else:
-                    row_data[new_column_name] = str(row[column_idx])
-            except Exception:
-                row_data[new_column_name] = str(row[column_idx])
-        table_chart_json_dict["data"].append(row_data)
+    table_chart_json_dict["data"].extend(
+        build_table_rows(chart_data, table_column_names)
+    )
 
     table_chart_json_dict["Chart_Size"] = sys.getsizeof(table_chart_json_dict["data"])
 
@@ -8539,34 +7622,7 @@ def generate_pie_chart_d3(
             code_level_logger.error(f"pie_chart: {yAxis_column_name} is not numerical!")
             raise RuntimeError(f"pie_chart: {yAxis_column_name} is not numerical!")
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if len(pie_chart_json_dict["Chart_Data"]) > 12:
         bar_chart_json_dict: dict = generate_group_bar_chart_d3(
@@ -8674,34 +7730,7 @@ def generate_pie_chart_d3(
         pie_chart_json_dict["xAxis"] = new_chart_axis["xAxis_title"].replace("_", " ")
         pie_chart_json_dict["Chart_Title"] = new_chart_title
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -9036,34 +8065,7 @@ def generate_pyramid_chart_d3(
         )
         pyramid_chart_json_dict["Chart_Title"] = new_chart_title
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -9071,10 +8073,7 @@ def generate_pyramid_chart_d3(
     pyramid_chart_json_dict["X"] = [
         str(x_data) for x_data in sorted_chart_data[xAxis_column_name].values.tolist()
     ]
-    pyramid_chart_json_dict["Y"] = [
-        float(val) if isinstance(val, decimal.Decimal) else val
-        for val in sorted_chart_data[yAxis_column_name].values.tolist()
-    ]
+    pyramid_chart_json_dict["Y"] = to_json_list(sorted_chart_data[yAxis_column_name])
 
     if not (
         isinstance(pyramid_chart_json_dict["Y"][0], int)
@@ -9398,34 +8397,7 @@ def generate_treemap_chart_d3(
         )
         treemap_chart_json_dict["Chart_Title"] = new_chart_title
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -9504,43 +8476,7 @@ def generate_treemap_chart_d3(
                 ].replace("_", " ")
                 treemap_chart_json_dict["Chart_Title"] = new_chart_title
 
-            try:
-                if len(series_chart_data[xAxis_column_name][0].split("-")) == 1:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                    )
-                elif len(series_chart_data[xAxis_column_name][0].split("-")) == 2:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        key=lambda x: x.apply(
-                            lambda date: (
-                                int(date.split("-")[0]),
-                                int(date.split("-")[1]),
-                            ),
-                        ),
-                    )
-                elif len(series_chart_data[xAxis_column_name][0].split("-")) == 3:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        key=lambda x: x.apply(
-                            lambda date: (
-                                int(date.split("-")[0]),
-                                int(date.split("-")[1]),
-                                int(date.split("-")[2]),
-                            ),
-                        ),
-                    )
-                else:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        ascending=True,
-                    )
-            except Exception:
-                series_chart_data = series_chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
+            series_chart_data = sort_by_date_parts(series_chart_data, xAxis_column_name)
 
             if isinstance(xAxis_column_name, str):
                 series_chart_data = sort_pandas_date(
@@ -9564,12 +8500,9 @@ def generate_treemap_chart_d3(
                         ].values.tolist()
                     ]
 
-                    treemap_chart_json_dict["Y"] = [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in series_chart_data[
-                            series_chart_column
-                        ].values.tolist()
-                    ]
+                    treemap_chart_json_dict["Y"] = to_json_list(
+                        series_chart_data[series_chart_column]
+                    )
 
                     # Add Series Title to Series Value
                     if (
@@ -9674,12 +8607,9 @@ def generate_treemap_chart_d3(
                         ].values.tolist()
                     ]
 
-                    treemap_chart_json_dict[f"Y{yAxis_idx}"] = [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in series_chart_data[
-                            series_chart_column
-                        ].values.tolist()
-                    ]
+                    treemap_chart_json_dict[f"Y{yAxis_idx}"] = to_json_list(
+                        series_chart_data[series_chart_column]
+                    )
 
                     # Add Series Title to Series Value
                     if (
@@ -9793,37 +8723,7 @@ def generate_treemap_chart_d3(
     else:
         yAxis_idx = 1
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        ),
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -9838,10 +8738,7 @@ def generate_treemap_chart_d3(
                     for x_data in chart_data[xAxis_column_name].values.tolist()
                 ]
 
-                treemap_chart_json_dict["Y"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[column_name].values.tolist()
-                ]
+                treemap_chart_json_dict["Y"] = to_json_list(chart_data[column_name])
 
                 if check_aggregation_phrases(chart_axis[f"{column_name}_title"]):
                     treemap_chart_json_dict["yName"] = chart_axis[
@@ -9895,10 +8792,9 @@ def generate_treemap_chart_d3(
                     for x_data in chart_data[xAxis_column_name].values.tolist()
                 ]
 
-                treemap_chart_json_dict[f"Y{yAxis_idx}"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[column_name].values.tolist()
-                ]
+                treemap_chart_json_dict[f"Y{yAxis_idx}"] = to_json_list(
+                    chart_data[column_name]
+                )
 
                 if check_aggregation_phrases(chart_axis[f"{column_name}_title"]):
                     treemap_chart_json_dict[f"y{yAxis_idx}Name"] = chart_axis[
@@ -10311,34 +9207,7 @@ def generate_bubbleplot_chart_d3(
         )
         bubble_chart_json_dict["Chart_Title"] = new_chart_title
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -10418,43 +9287,7 @@ def generate_bubbleplot_chart_d3(
                 )
                 bubble_chart_json_dict["Chart_Title"] = new_chart_title
 
-            try:
-                if len(series_chart_data[xAxis_column_name][0].split("-")) == 1:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                    )
-                elif len(series_chart_data[xAxis_column_name][0].split("-")) == 2:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        key=lambda x: x.apply(
-                            lambda date: (
-                                int(date.split("-")[0]),
-                                int(date.split("-")[1]),
-                            ),
-                        ),
-                    )
-                elif len(series_chart_data[xAxis_column_name][0].split("-")) == 3:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        key=lambda x: x.apply(
-                            lambda date: (
-                                int(date.split("-")[0]),
-                                int(date.split("-")[1]),
-                                int(date.split("-")[2]),
-                            ),
-                        ),
-                    )
-                else:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        ascending=True,
-                    )
-            except Exception:
-                series_chart_data = series_chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
+            series_chart_data = sort_by_date_parts(series_chart_data, xAxis_column_name)
 
             if isinstance(xAxis_column_name, str):
                 series_chart_data = sort_pandas_date(
@@ -10471,22 +9304,17 @@ def generate_bubbleplot_chart_d3(
                     continue
 
                 if yAxis_idx <= 1:
-                    bubble_chart_json_dict["X"] = [
-                        float(x_data) if isinstance(x_data, decimal.Decimal) else x_data
-                        for x_data in series_chart_data[
-                            xAxis_column_name
-                        ].values.tolist()
-                    ]
+                    bubble_chart_json_dict["X"] = to_json_list(
+                        series_chart_data[xAxis_column_name]
+                    )
 
-                    bubble_chart_json_dict["Y"] = [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in series_chart_data[yAxis_column_name].values.tolist()
-                    ]
+                    bubble_chart_json_dict["Y"] = to_json_list(
+                        series_chart_data[yAxis_column_name]
+                    )
 
-                    bubble_chart_json_dict["Z"] = [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in series_chart_data[zAxis_column_name].values.tolist()
-                    ]
+                    bubble_chart_json_dict["Z"] = to_json_list(
+                        series_chart_data[zAxis_column_name]
+                    )
 
                     # Add Series Title to Series Value
                     if (
@@ -10585,33 +9413,22 @@ def generate_bubbleplot_chart_d3(
                     #     scatterplot_chart_json_dict["Chart_Type"] = "grouped_column_chart"
                 else:
                     X_data = list(
-                        [
-                            float(val) if isinstance(val, decimal.Decimal) else val
-                            for val in series_chart_data[
-                                xAxis_column_name
-                            ].values.tolist()
-                        ],
+                        to_json_list(series_chart_data[xAxis_column_name]),
                     )
 
                     bubble_chart_json_dict[f"X{yAxis_idx}"] = X_data
 
                     Y_data = list(
-                        [
-                            float(val) if isinstance(val, decimal.Decimal) else val
-                            for val in series_chart_data[
-                                yAxis_column_name
-                            ].values.tolist()
-                        ],
+                        to_json_list(series_chart_data[yAxis_column_name]),
                     )
 
                     bubble_chart_json_dict[f"Y{yAxis_idx}"] = Y_data
 
                     bubble_chart_json_dict[f"Y{yAxis_idx}"] = Y_data
 
-                    bubble_chart_json_dict[f"Z{yAxis_idx}"] = [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in series_chart_data[zAxis_column_name].values.tolist()
-                    ]
+                    bubble_chart_json_dict[f"Z{yAxis_idx}"] = to_json_list(
+                        series_chart_data[zAxis_column_name]
+                    )
 
                     # Add Series Title to Series Value
                     if (
@@ -10722,37 +9539,7 @@ def generate_bubbleplot_chart_d3(
     else:
         yAxis_idx = 1
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        ),
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -10763,21 +9550,16 @@ def generate_bubbleplot_chart_d3(
 
             if yAxis_idx <= 1:
                 bubble_chart_json_dict["X"] = (
-                    [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in chart_data[xAxis_column_name].values.tolist()
-                    ],
+                    to_json_list(chart_data[xAxis_column_name]),
                 )
 
-                bubble_chart_json_dict["Y"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[yAxis_column_name].values.tolist()
-                ]
+                bubble_chart_json_dict["Y"] = to_json_list(
+                    chart_data[yAxis_column_name]
+                )
 
-                bubble_chart_json_dict["Z"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[zAxis_column_name].values.tolist()
-                ]
+                bubble_chart_json_dict["Z"] = to_json_list(
+                    chart_data[zAxis_column_name]
+                )
 
                 if check_aggregation_phrases(chart_axis[f"{column_name}_title"]):
                     bubble_chart_json_dict["yName"] = chart_axis[
@@ -10828,20 +9610,17 @@ def generate_bubbleplot_chart_d3(
                 #     # scatterplot_chart_json_dict["Chart_Type"] = "column_chart"
                 #     scatterplot_chart_json_dict["Chart_Type"] = "grouped_column_chart"
             else:
-                bubble_chart_json_dict[f"X{yAxis_idx}"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[xAxis_column_name].values.tolist()
-                ]
+                bubble_chart_json_dict[f"X{yAxis_idx}"] = to_json_list(
+                    chart_data[xAxis_column_name]
+                )
 
-                bubble_chart_json_dict[f"Y{yAxis_idx}"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[yAxis_column_name].values.tolist()
-                ]
+                bubble_chart_json_dict[f"Y{yAxis_idx}"] = to_json_list(
+                    chart_data[yAxis_column_name]
+                )
 
-                bubble_chart_json_dict[f"Z{yAxis_idx}"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[zAxis_column_name].values.tolist()
-                ]
+                bubble_chart_json_dict[f"Z{yAxis_idx}"] = to_json_list(
+                    chart_data[zAxis_column_name]
+                )
 
                 if check_aggregation_phrases(chart_axis[f"{column_name}_title"]):
                     bubble_chart_json_dict[f"y{yAxis_idx}Name"] = chart_axis[
@@ -0,0 +1,306 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .datamodel import DataSummary
+
+# Bump whenever the SQL prompt or the SQL postprocessing changes so that SQL
+# generated by an older build is never served.
+GENERATED_SQL_CACHE_VERSION: int = 1
+
+SQLCacheKey = Tuple[int, str, str, str, str, str]
+
+
+def normalize_prompt_text(text: Union[str, None]) -> str:
+    """Normalize a question, chart title or instruction for the cache key."""
+    if text is None:
+        return ""
+
+    return re.sub(r"\s+", " ", str(text)).strip().lower().rstrip("?.! ")
+
+
+def build_schema_fingerprint(data_summary: DataSummary) -> str:
+    """Hash the schema and metadata of a DataSummary used by the SQL prompt."""
+    schema = {
+        "sql_library": data_summary.sql_library,
+        "database_schema_sql": data_summary.database_schema_sql,
+        "table_join_sql_query": data_summary.table_join_sql_query,
+        "table_description": data_summary.table_description,
+        "column_name_list": data_summary.column_name_list,
+        "column_sql_data_types": data_summary.column_sql_data_types,
+        "column_description_dict": data_summary.column_description_dict,
+    }
+
+    return hashlib.sha256(
+        json.dumps(schema, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def build_sql_cache_key(
+    data_summary: DataSummary,
+    chart_type: str,
+    chart_axis: dict,
+    filters: dict,
+    aggregations: list,
+    database_name: str,
+    table_name: str,
+    question: Union[str, None] = None,
+    chart_title: Union[str, None] = None,
+    instruction: Union[str, None] = None,
+) -> SQLCacheKey:
+    """Build the cache key of a generated SQL query.
+
+    Args:
+        data_summary (DataSummary): summary of the queried table
+        chart_type (str): chart type of the SQL query
+        chart_axis (dict): chart axis of the SQL query
+        filters (dict): user filters
+        aggregations (list): user aggregations
+        database_name (str): database name of the table
+        table_name (str): table name of the SQL query
+        question (Union[str, None], optional): chart question. Defaults to None.
+        chart_title (Union[str, None], optional): chart title. Defaults to None.
+        instruction (Union[str, None], optional): chart instruction. Defaults to None.
+
+    Returns:
+        SQLCacheKey: versioned cache key
+
+    """
+    request = {
+        "question": normalize_prompt_text(question),
+        "chart_title": normalize_prompt_text(chart_title),
+        "instruction": normalize_prompt_text(instruction),
+        "chart_type": chart_type,
+        "chart_axis": chart_axis,
+        "filters": filters,
+        "aggregations": aggregations,
+    }
+
+    return (
+        GENERATED_SQL_CACHE_VERSION,
+        str(data_summary.database_properties.get("db_tag", "")),
+        database_name,
+        table_name,
+        build_schema_fingerprint(data_summary),
+        hashlib.sha256(
+            json.dumps(request, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest(),
+    )
+
+
+class GeneratedSQLCache:
+    """In-process LRU cache of generated SQL queries with TTL expiry.
+
+    Entries of a table are evicted as soon as its schema fingerprint changes, and
+    the chart IDs served from an entry are tracked so that negative chart feedback
+    evicts the SQL query behind the chart.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 3600.0):
+        if max_size < 0:
+            raise ValueError("max_size must be a non-negative integer")
+        if ttl < 0:
+            raise ValueError("ttl must be a non-negative number")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[SQLCacheKey, Tuple[float, str, str]]" = (
+            OrderedDict()
+        )
+        self._chart_keys: "OrderedDict[str, SQLCacheKey]" = OrderedDict()
+        self._fingerprints: Dict[Tuple[str, str, str], str] = {}
+        self._lock = threading.RLock()
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.invalidations: int = 0
+        self.schema_evictions: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl > 0
+
+    def get(
+        self,
+        key: SQLCacheKey,
+        chart_id: Optional[Any] = None,
+    ) -> Optional[Tuple[str, str]]:
+        """Get the cached (sql_query, sql_query_raw), or None if it is missing or expired.
+
+        Args:
+            key (SQLCacheKey): cache key of the SQL query
+            chart_id (Optional[Any], optional): chart ID served with the SQL query.
+                Defaults to None.
+
+        Returns:
+            Optional[Tuple[str, str]]: cached SQL query and raw SQL query
+
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            self._check_schema_fingerprint(key)
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                expires_at, sql_query, sql_query_raw = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._add_chart(key, chart_id)
+                    self.hits += 1
+                    return sql_query, sql_query_raw
+
+                del self._entries[key]
+                self.evictions += 1
+
+            self.misses += 1
+            return None
+
+    def set(
+        self,
+        key: SQLCacheKey,
+        sql_query: str,
+        sql_query_raw: str,
+        chart_id: Optional[Any] = None,
+    ) -> None:
+        """Store a validated SQL query and the chart ID it was generated for."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._check_schema_fingerprint(key)
+            self._entries[key] = (time.monotonic() + self.ttl, sql_query, sql_query_raw)
+            self._entries.move_to_end(key)
+            self._add_chart(key, chart_id)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def add_chart(self, key: SQLCacheKey, chart_id: Any) -> None:
+        """Track a chart ID served with the SQL query of the given key."""
+        with self._lock:
+            self._add_chart(key, chart_id)
+
+    def _add_chart(self, key: SQLCacheKey, chart_id: Optional[Any]) -> None:
+        if chart_id is None or str(chart_id) == "":
+            return
+
+        self._chart_keys[str(chart_id)] = key
+        self._chart_keys.move_to_end(str(chart_id))
+
+        # Keep the chart index bounded, old charts rarely receive feedback
+        while len(self._chart_keys) > self.max_size * 16:
+            self._chart_keys.popitem(last=False)
+
+    def _check_schema_fingerprint(self, key: SQLCacheKey) -> None:
+        table = (key[1], key[2], key[3])
+        schema_fingerprint = key[4]
+
+        if self._fingerprints.get(table, schema_fingerprint) != schema_fingerprint:
+            for stale_key in [
+                stale_key
+                for stale_key in self._entries
+                if (stale_key[1], stale_key[2], stale_key[3]) == table
+                and stale_key[4] != schema_fingerprint
+            ]:
+                del self._entries[stale_key]
+                self.schema_evictions += 1
+
+        self._fingerprints[table] = schema_fingerprint
+
+    def delete(self, key: SQLCacheKey) -> bool:
+        """Drop the SQL query of the given key, e.g. after it failed to run."""
+        with self._lock:
+            if self._entries.pop(key, None) is None:
+                return False
+
+            self.invalidations += 1
+            return True
+
+    def invalidate_chart(self, chart_id: Any) -> bool:
+        """Drop the SQL query served with the given chart, e.g. on negative feedback."""
+        with self._lock:
+            key = self._chart_keys.pop(str(chart_id), None)
+
+            return key is not None and self.delete(key)
+
+    def invalidate(
+        self,
+        database_identifier: Optional[str] = None,
+        database_name: Optional[str] = None,
+        table_name: Optional[str] = None,
+    ) -> int:
+        """Drop every cached SQL query matching the given table coordinates.
+        Arguments left as None match any value, so calling it without arguments
+        clears the whole cache.
+
+        Args:
+            database_identifier (Optional[str]): database identifier (db_tag) to match
+            database_name (Optional[str]): database name to match
+            table_name (Optional[str]): table name to match
+
+        Returns:
+            int: number of invalidated entries
+
+        """
+        with self._lock:
+            invalidated_keys = [
+                key
+                for key in self._entries
+                if (database_identifier is None or key[1] == database_identifier)
+                and (database_name is None or key[2] == database_name)
+                and (table_name is None or key[3] == table_name)
+            ]
+
+            for key in invalidated_keys:
+                del self._entries[key]
+
+            self.invalidations += len(invalidated_keys)
+
+        return len(invalidated_keys)
+
+    def clear(self) -> None:
+        """Drop all cached entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._chart_keys.clear()
+            self._fingerprints.clear()
+
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.invalidations = 0
+            self.schema_evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the hit/miss counters of the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "schema_evictions": self.schema_evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+generated_sql_cache = GeneratedSQLCache(
+    max_size=int(os.getenv("GENERATED_SQL_CACHE_MAX_SIZE", "1024")),
+    ttl=float(os.getenv("GENERATED_SQL_CACHE_TTL", "3600")),
+)
@@ -3,13 +3,22 @@ import re
 import logging
 import os
 import requests
-from typing import Any, Tuple, Union
+import hashlib
+import json
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import fields
+from functools import partial
+from pydantic.dataclasses import dataclass
+from typing import Any, Dict, Tuple, Union
 from time import perf_counter
 
 from rapidfuzz import fuzz
 
 from components.cmysql import native
 from .datamodel import DataSummary
+from .sql_cache import build_sql_cache_key, generated_sql_cache
 from .utils import (
     generate_column_information_prompt,
     normalize_chart_type,
@@ -25,6 +34,7 @@ from logging_library.performancelogger.performance_logger import PerformanceLogg
 logger = logging.getLogger(__name__)
 
 TARGET_TOKEN_LIMIT = int(os.getenv("SQL_TOTAL_INPUT_TOKEN_LIMIT", "0"))
+SQL_PROMPT_BUNDLE_CACHE_SIZE = int(os.getenv("SQL_PROMPT_BUNDLE_CACHE_SIZE", "128"))
 
 
 def postprocess_sql(
@@ -10164,6 +10174,182 @@ Chart Axis Titles: {chart_axis_title_edited}"""
     return CHART_AXIS_INSTRUCTION, AXIS_KEY_LIST
 
 
+@dataclass(frozen=True)
+class SQLPromptBundle:
+    """SQL prompt fragments of a table that do not depend on the chart"""
+
+    table_instruction: str
+    backtick_instruction: str
+    native_lang: str
+    median_instruction: str
+    datatype_instruction: str
+    syntax_instruction: str
+    schema_prompt: str
+
+
+_sql_prompt_bundles: "OrderedDict[Tuple[str, str, str], SQLPromptBundle]" = (
+    OrderedDict()
+)
+_data_summary_fingerprints: Dict[int, Tuple[weakref.ref, str]] = {}
+_sql_prompt_bundle_lock = threading.Lock()
+
+
+def _forget_data_summary_fingerprint(
+    data_summary_id: int, _: "weakref.ref[DataSummary]"
+) -> None:
+    """Drop the fingerprint of a garbage collected DataSummary."""
+    _data_summary_fingerprints.pop(data_summary_id, None)
+
+
+def _get_data_summary_fingerprint(data_summary: DataSummary) -> str:
+    """Hash the content of a DataSummary once per DataSummary object."""
+    data_summary_id = id(data_summary)
+    entry = _data_summary_fingerprints.get(data_summary_id)
+
+    if entry is not None and entry[0]() is data_summary:
+        return entry[1]
+
+    fingerprint = hashlib.sha256(
+        json.dumps(
+            {
+                field.name: getattr(data_summary, field.name)
+                for field in fields(data_summary)
+            },
+            sort_keys=True,
+            default=str,
+        ).encode("utf-8")
+    ).hexdigest()
+
+    _data_summary_fingerprints[data_summary_id] = (
+        weakref.ref(
+            data_summary,
+            partial(_forget_data_summary_fingerprint, data_summary_id),
+        ),
+        fingerprint,
+    )
+
+    return fingerprint
+
+
+def build_sql_prompt_bundle(
+    data_summary: DataSummary,
+    database_name: str,
+    table_name: str,
+    code_level_logger: logging.Logger,
+) -> SQLPromptBundle:
+    """Build the SQL prompt fragments that only depend on the summarized table.
+
+    Args:
+        data_summary (DataSummary): summary of the queried table
+        database_name (str): database name of the table
+        table_name (str): table name of the SQL query
+        code_level_logger (logging.Logger): code level logger
+
+    Returns:
+        SQLPromptBundle: SQL prompt fragments of the table
+
+    """
+    column_information_prompt = generate_column_information_prompt(
+        data_summary.column_description_dict,
+        data_summary.column_sample_dict,
+        data_summary.column_display_name_dict,
+        data_summary.column_n_unique_value_dict,
+        data_summary.column_data_tribes,
+    )
+
+    return SQLPromptBundle(
+        table_instruction=generate_table_instruction(
+            data_summary,
+            database_name,
+            table_name,
+        ),
+        backtick_instruction=generate_backtick_instruction(data_summary),
+        native_lang=generate_sql_native_lang(data_summary, code_level_logger),
+        median_instruction=generate_median_instruction(
+            data_summary,
+            code_level_logger,
+        ),
+        datatype_instruction=generate_datatype_instruction(data_summary),
+        syntax_instruction=generate_syntax_instruction(data_summary),
+        schema_prompt=f"""Database SQL Schema:
+{data_summary.database_schema_sql}
+
+Database Table Description:
+{data_summary.table_description}
+
+{column_information_prompt}""",
+    )
+
+
+def get_sql_prompt_bundle(
+    data_summary: DataSummary,
+    database_name: str,
+    table_name: str,
+    code_level_logger: logging.Logger,
+) -> SQLPromptBundle:
+    """Get the SQL prompt fragments of a table, building them once per table.
+
+    Bundles are kept in an LRU of `SQL_PROMPT_BUNDLE_CACHE_SIZE` entries keyed by
+    the content of the DataSummary, so they are shared by every chart of a story
+    and by later requests on the same table.
+
+    Args:
+        data_summary (DataSummary): summary of the queried table
+        database_name (str): database name of the table
+        table_name (str): table name of the SQL query
+        code_level_logger (logging.Logger): code level logger
+
+    Returns:
+        SQLPromptBundle: SQL prompt fragments of the table
+
+    """
+    with _sql_prompt_bundle_lock:
+        bundle_key = (
+            _get_data_summary_fingerprint(data_summary),
+            database_name,
+            table_name,
+        )
+        prompt_bundle = _sql_prompt_bundles.get(bundle_key)
+
+        if prompt_bundle is not None:
+            _sql_prompt_bundles.move_to_end(bundle_key)
+            return prompt_bundle
+
+    prompt_bundle = build_sql_prompt_bundle(
+        data_summary,
+        database_name,
+        table_name,
+        code_level_logger,
+    )
+
+    if SQL_PROMPT_BUNDLE_CACHE_SIZE > 0:
+        with _sql_prompt_bundle_lock:
+            _sql_prompt_bundles[bundle_key] = prompt_bundle
+
+            while len(_sql_prompt_bundles) > SQL_PROMPT_BUNDLE_CACHE_SIZE:
+                _sql_prompt_bundles.popitem(last=False)
+
+    return prompt_bundle
+
+
+def _log_chart_sql_query(logging_url: str, chart_id: int, sql_query: str) -> int:
+    """Log the SQL query of a chart and return the chart ID assigned by the logging API."""
+    log_chart_data = {
+        "chart_id": chart_id,
+        "sql_query": sql_query,
+    }
+
+    logging_url_chart = logging_url + "chart"
+    log_response = requests.post(
+        logging_url_chart, json=log_chart_data, verify=False
+    ).json()
+
+    if log_response.get("chart_id", None) is not None:
+        chart_id = log_response["chart_id"]
+
+    return chart_id
+
+
 def _generate_sql(
     llama70b_client: Any,
     data_summary: DataSummary,
@@ -10184,6 +10370,27 @@ def _generate_sql(
         code_level_logger.error("Question and Instruction must not be used together!")
         raise RuntimeError("Question and Instruction must not be used together!")
 
+    sql_cache_key = build_sql_cache_key(
+        data_summary,
+        chart_type,
+        chart_axis,
+        filters,
+        aggregations,
+        database_name,
+        table_name,
+        question,
+        chart_title,
+        instruction,
+    )
+    cached_sql = generated_sql_cache.get(sql_cache_key)
+
+    if cached_sql is not None:
+        sql_string, sql_string_raw = cached_sql
+        chart_id = _log_chart_sql_query(logging_url, chart_id, sql_string_raw)
+        generated_sql_cache.add_chart(sql_cache_key, chart_id)
+
+        return sql_string, sql_string_raw
+
     normalized_chart_type = normalize_chart_type(chart_type)
 
     FILTER_INSTRUCTION = generate_filter_instruction(filters)
@@ -10200,25 +10407,17 @@ def _generate_sql(
         code_level_logger,
     )
 
-    TABLE_INSTRUCTION = generate_table_instruction(
+    PROMPT_BUNDLE = get_sql_prompt_bundle(
         data_summary,
         database_name,
         table_name,
-    )
-
-    BACKTICK_INSTRUCTION = generate_backtick_instruction(
-        data_summary,
+        code_level_logger,
     )
 
     ALIAS_INSTRUCTION = generate_alias_instruction(
         chart_type,
     )
 
-    NATIVE_LANG = generate_sql_native_lang(
-        data_summary,
-        code_level_logger,
-    )
-
     if chart_title is not None and question is not None:
         timeframe = classify_timeframe(chart_title, question)
         time_duration = classify_time_duration(chart_title, question)
@@ -10234,19 +10433,6 @@ def _generate_sql(
         code_level_logger,
     )
 
-    MEDIAN_INSTRUCTION = generate_median_instruction(
-        data_summary,
-        code_level_logger,
-    )
-
-    DATATYPE_INSTRUCTION = generate_datatype_instruction(
-        data_summary,
-    )
-
-    SYNTAX_INSTRUCTION = generate_syntax_instruction(
-        data_summary,
-    )
-
     CHART_AXIS_INSTRUCTION, AXIS_KEY_LIST = generate_chart_axis_instruction(
         chart_axis,
         chart_type,
@@ -10302,11 +10488,11 @@ Instructions:
 - If the question and chart title indicates a time duration such as "past 12 months," ensure that the data range is from the current date minus 1 year. If the question and chart title specifies "past year" or "last year," use data exclusively from the previous calendar year. Similarly, if the title specifies "next year" or "upcoming year," use data exclusively for the next calendar year.
 - Test your SQL query with a smaller dataset first to catch any syntax errors or logical issues before running it on the full dataset.
 - {AXIS_INSTRUCTIONS}
-- {TABLE_INSTRUCTION}
-- {BACKTICK_INSTRUCTION}
-- {MEDIAN_INSTRUCTION}
-{DATATYPE_INSTRUCTION}
-{SYNTAX_INSTRUCTION}"""
+- {PROMPT_BUNDLE.table_instruction}
+- {PROMPT_BUNDLE.backtick_instruction}
+- {PROMPT_BUNDLE.median_instruction}
+{PROMPT_BUNDLE.datatype_instruction}
+{PROMPT_BUNDLE.syntax_instruction}"""
 
     system_prompt_ending = f"""
 Please follow the chart axis instructions below:
@@ -10314,13 +10500,7 @@ Please follow the chart axis instructions below:
 
 For more context, you are provided a database SQL schema, database table description, and database column description to support the sql query generation. Ensure to use only the column from the column information.
 
-Database SQL Schema:
-{data_summary.database_schema_sql}
-
-Database Table Description:
-{data_summary.table_description}
-
-{generate_column_information_prompt(data_summary.column_description_dict,data_summary.column_sample_dict,data_summary.column_display_name_dict,data_summary.column_n_unique_value_dict,data_summary.column_data_tribes)}
+{PROMPT_BUNDLE.schema_prompt}
 
 {FILTER_INSTRUCTION}
 
@@ -10330,7 +10510,7 @@ Database Table Description:
 
 FUNCTIONS AND OPERATOR REFERENCE
 ---
-{NATIVE_LANG}
+{PROMPT_BUNDLE.native_lang}
 
 Your complete adherence to each instruction is non-negotiable and critical to the success of the task. No instruction can be missed, and every aspect of the SQL query must align precisely with all the instructions provided. Please review each instruction carefully and ensure full compliance before finalizing your SQL query. NEVER INCLUDE explanations or notes. PLEASE DO NOT HALLUCINATE!!
 
@@ -10445,18 +10625,7 @@ Instruction: {instruction}"""
         code_level_logger.error("MODULEID_GENERATE_SQL is invalid!")
         raise ValueError("MODULEID_GENERATE_SQL is invalid!")
 
-    log_chart_data = {
-        "chart_id": chart_id,
-        "sql_query": response,
-    }
-
-    logging_url_chart = logging_url + "chart"
-    log_response = requests.post(
-        logging_url_chart, json=log_chart_data, verify=False
-    ).json()
-
-    if log_response.get("chart_id", None) is not None:
-        chart_id = log_response["chart_id"]
+    chart_id = _log_chart_sql_query(logging_url, chart_id, response)
 
     formatted_data = {
         "chart_id": chart_id,
@@ -10494,6 +10663,8 @@ Instruction: {instruction}"""
         code_level_logger,
     )
 
+    generated_sql_cache.set(sql_cache_key, sql_string, sql_string_raw, chart_id)
+
     return sql_string, sql_string_raw
 
 
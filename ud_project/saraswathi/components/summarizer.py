@@ -3,6 +3,7 @@ import os
 import pandas as pd
 import logging
 
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 from vector_db_utils.column import (
     convert_joined_table_column_to_pinecone_format,
@@ -11,6 +12,7 @@ from vector_db_utils.column import (
 from vector_db_utils.table import get_joined_table_info, get_table_info
 from qdrant_client import QdrantClient
 from .datamodel import DataSummary
+from .summary_cache import build_summary_cache_key, data_summary_cache
 
 from logging_library.performancelogger.performance_logger import PerformanceLogger
 
@@ -624,6 +626,29 @@ def get_column_sql_data_types(
     return column_sql_data_types
 
 
+@lru_cache(maxsize=8)
+def _parse_client_db_credentials(client_db_json: str) -> tuple:
+    return tuple(json.loads(client_db_json))
+
+
+def get_database_properties(db_tag: str) -> dict:
+    """Get the client database properties of the given db_tag from the CLIENT_DB
+    environment variable. The JSON is only parsed again when the variable changes.
+
+    Args:
+        db_tag (str): database identifier of the client database
+
+    Returns:
+        dict: client database properties, empty if the db_tag is not found
+
+    """
+    for client_db_data in _parse_client_db_credentials(os.getenv("CLIENT_DB", "[]")):
+        if client_db_data["db_tag"] == db_tag:
+            return dict(client_db_data)
+
+    return {}
+
+
 def summarize(
     qdrant_client: QdrantClient,
     database_name: str,
@@ -635,6 +660,7 @@ def summarize(
     logging_url: str,
     session_id: str,
     code_level_logger: logging.Logger,
+    use_cache: bool = True,
 ) -> DataSummary:
     """Summarize a table from pinecone containing all the column metadata.
 
@@ -645,6 +671,7 @@ def summarize(
         column_collection (str): namespace used from the pinecone index to get column metadata
         table_name (str): table name to be summarized
         embeddings (AzureOpenAIEmbeddings): Langchain OpenAI/Cohere embedder class
+        use_cache (bool): serve and store the summary through the DataSummary cache
 
     Returns:
         dict: table summary dictionary
@@ -652,6 +679,19 @@ def summarize(
     """
 
     with PerformanceLogger(session_id):
+        cache_key = build_summary_cache_key(
+            database_identifier,
+            database_name,
+            table_name,
+            table_collection,
+            column_collection,
+        )
+
+        if use_cache:
+            cached_data_summary = data_summary_cache.get(cache_key)
+            if cached_data_summary is not None:
+                return cached_data_summary
+
         table_info = get_table_info(
             embedding_model_url,
             qdrant_client,
@@ -698,14 +738,7 @@ def summarize(
 
         # db_tag = "label3"
 
-        database_properties: dict = {}
-
-        client_db_credentials: list = json.loads(os.getenv("CLIENT_DB", "[]"))
-
-        for client_db_data in client_db_credentials:
-            if client_db_data["db_tag"] == db_tag:
-                database_properties = client_db_data
-                break
+        database_properties: dict = get_database_properties(db_tag)
 
         if database_properties == {}:
             code_level_logger.error("Database Properties is not found!")
@@ -726,7 +759,7 @@ def summarize(
             code_level_logger,
         )
 
-        return DataSummary(
+        data_summary = DataSummary(
             database_schema_sql=database_schema_sql,
             table_description=table_description,
             column_description_dict=column_description_dict,
@@ -741,6 +774,11 @@ def summarize(
             table_join_sql_query="",
         )
 
+        if use_cache:
+            data_summary_cache.set(cache_key, data_summary)
+
+        return data_summary
+
 
 def summarize_without_query_metadata(
     table_info: dict,
@@ -787,14 +825,7 @@ def summarize_without_query_metadata(
 
     # db_tag = "label1"
 
-    database_properties = {}
-
-    client_db_credentials: list = json.loads(os.getenv("CLIENT_DB", "[]"))
-
-    for client_db_data in client_db_credentials:
-        if client_db_data["db_tag"] == db_tag:
-            database_properties = client_db_data
-            break
+    database_properties = get_database_properties(db_tag)
 
     if database_properties == {}:
         code_level_logger.error("Database Properties is not found!")
@@ -896,14 +927,7 @@ def summarize_joined_table(
 
         # db_tag = "label3"
 
-        database_properties: dict = {}
-
-        client_db_credentials: list = json.loads(os.getenv("CLIENT_DB", "[]"))
-
-        for client_db_data in client_db_credentials:
-            if client_db_data["db_tag"] == db_tag:
-                database_properties = client_db_data
-                break
+        database_properties: dict = get_database_properties(db_tag)
 
         if database_properties == {}:
             code_level_logger.error(
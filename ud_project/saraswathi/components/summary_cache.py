@@ -0,0 +1,217 @@
+import copy
+import os
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from diskcache import Cache
+
+from .datamodel import DataSummary
+
+# Bump whenever the DataSummary layout or the summarizer output changes so
+# that stale on-disk entries written by an older build are never served.
+DATA_SUMMARY_CACHE_VERSION: int = 1
+
+SummaryCacheKey = Tuple[int, str, str, str, str, str]
+
+
+def build_summary_cache_key(
+    database_identifier: str,
+    database_name: str,
+    table_name: str,
+    table_collection: str,
+    column_collection: str,
+) -> SummaryCacheKey:
+    """Build the cache key of a DataSummary.
+
+    Args:
+        database_identifier (str): database identifier (db_tag) of the table
+        database_name (str): database name of the table
+        table_name (str): table name to be summarized
+        table_collection (str): Qdrant collection holding the table metadata
+        column_collection (str): Qdrant collection holding the column metadata
+
+    Returns:
+        SummaryCacheKey: versioned cache key
+
+    """
+    return (
+        DATA_SUMMARY_CACHE_VERSION,
+        database_identifier,
+        database_name,
+        table_name,
+        table_collection,
+        column_collection,
+    )
+
+
+class DataSummaryCache:
+    """In-process LRU cache of DataSummary objects with TTL expiry and an
+    optional on-disk (diskcache) tier shared across workers."""
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl: float = 600.0,
+        cache_dir: str = "",
+    ):
+        if max_size < 0:
+            raise ValueError("max_size must be a non-negative integer")
+        if ttl < 0:
+            raise ValueError("ttl must be a non-negative number")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[SummaryCacheKey, Tuple[float, DataSummary]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.RLock()
+        self._disk: Optional[Cache] = Cache(cache_dir) if cache_dir != "" else None
+
+        self.hits: int = 0
+        self.disk_hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.invalidations: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl > 0
+
+    def get(self, key: SummaryCacheKey) -> Optional[DataSummary]:
+        """Get a copy of the cached DataSummary, or None if it is missing or expired."""
+        if not self.enabled:
+            return None
+
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                expires_at, data_summary = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return copy.deepcopy(data_summary)
+
+                del self._entries[key]
+                self.evictions += 1
+
+            if self._disk is not None:
+                data_summary = self._disk.get(key)
+                if data_summary is not None:
+                    self._store(key, data_summary, now)
+                    self.disk_hits += 1
+                    return copy.deepcopy(data_summary)
+
+            self.misses += 1
+            return None
+
+    def set(self, key: SummaryCacheKey, data_summary: DataSummary) -> None:
+        """Store a copy of the DataSummary in memory and, if configured, on disk."""
+        if not self.enabled:
+            return
+
+        data_summary = copy.deepcopy(data_summary)
+
+        with self._lock:
+            self._store(key, data_summary, time.monotonic())
+
+            if self._disk is not None:
+                self._disk.set(key, data_summary, expire=self.ttl)
+
+    def _store(self, key: SummaryCacheKey, data_summary: DataSummary, now: float):
+        self._entries[key] = (now + self.ttl, data_summary)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(
+        self,
+        database_identifier: Optional[str] = None,
+        database_name: Optional[str] = None,
+        table_name: Optional[str] = None,
+    ) -> int:
+        """Drop every cached DataSummary matching the given table coordinates.
+        Arguments left as None match any value, so calling it without arguments
+        clears the whole cache.
+
+        Args:
+            database_identifier (Optional[str]): database identifier (db_tag) to match
+            database_name (Optional[str]): database name to match
+            table_name (Optional[str]): table name to match
+
+        Returns:
+            int: number of invalidated entries
+
+        """
+
+        def is_match(key: Any) -> bool:
+            return (
+                isinstance(key, tuple)
+                and len(key) == 6
+                and key[0] == DATA_SUMMARY_CACHE_VERSION
+                and (database_identifier is None or key[1] == database_identifier)
+                and (database_name is None or key[2] == database_name)
+                and (table_name is None or key[3] == table_name)
+            )
+
+        invalidated_keys: set = set()
+
+        with self._lock:
+            for key in [key for key in self._entries if is_match(key)]:
+                del self._entries[key]
+                invalidated_keys.add(key)
+
+            if self._disk is not None:
+                for key in [key for key in self._disk.iterkeys() if is_match(key)]:
+                    self._disk.delete(key)
+                    invalidated_keys.add(key)
+
+            self.invalidations += len(invalidated_keys)
+
+        return len(invalidated_keys)
+
+    def clear(self) -> None:
+        """Drop all cached entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            if self._disk is not None:
+                self._disk.clear()
+
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the hit/miss counters of the cache."""
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "disk_enabled": self._disk is not None,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+
+data_summary_cache = DataSummaryCache(
+    max_size=int(os.getenv("DATA_SUMMARY_CACHE_MAX_SIZE", "256")),
+    ttl=float(os.getenv("DATA_SUMMARY_CACHE_TTL", "600")),
+    cache_dir=os.getenv("DATA_SUMMARY_CACHE_DIR", ""),
+)
@@ -19,9 +19,13 @@ from ..insights import (
 )
 from ..postprocess import postprocess_updater_chart_json
 from ..utils import (
+    build_table_rows,
     is_within_max_length,
     map_original_list_with_sorted_x,
     sort_pandas_date,
+    pivot_series_columns,
+    sort_by_date_parts,
+    to_json_list,
     calculate_token_usage,
 )
 
@@ -46,7 +50,6 @@ def update_aggregated_table_chart_d3(
     new_data = []
 
     column_names = list(chart_data.columns)
-    chart_data_values = chart_data.values.tolist()
 
     if base_chart_type in [
         "bar_chart",
@@ -72,142 +75,54 @@ def update_aggregated_table_chart_d3(
         else:
             raise RuntimeError("bar_chart: X-Axis is not found in extraction!")
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        ),
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
 
-        chart_data_values = chart_data.values.tolist()
-
-        for row in chart_data_values:
-            row_data = {}
-            for column_idx, column_name in enumerate(column_names):
-                try:
-                    if column_name == "xAxis" or (
-                        "xAxis_column" in chart_axis
-                        and column_name in chart_axis["xAxis_column"]
-                    ):
-                        new_column_name = chart_axis["xAxis_title"]
-                    elif column_name.startswith("yAxis"):
-                        # Check for yAxis, yAxis2, yAxis3, etc.
-                        axis_key = f"{column_name}_title"
-                        if axis_key in chart_axis:
-                            if "_" in column_name:
-                                new_column_name = column_name
-                                new_column_name = new_column_name.replace(
-                                    new_column_name.split("_")[0],
-                                    chart_axis[axis_key],
-                                )
-                            else:
-                                new_column_name = chart_axis[axis_key]
-                        else:
-                            # Fallback to the original column name if no matching title is found
+        table_column_names = []
+        for column_name in column_names:
+            try:
+                if column_name == "xAxis" or (
+                    "xAxis_column" in chart_axis
+                    and column_name in chart_axis["xAxis_column"]
+                ):
+                    new_column_name = chart_axis["xAxis_title"]
+                elif column_name.startswith("yAxis"):
+                    # Check for yAxis, yAxis2, yAxis3, etc.
+                    axis_key = f"{column_name}_title"
+                    if axis_key in chart_axis:
+                        if "_" in column_name:
                             new_column_name = column_name
-                    elif column_name == "series" or (
-                        "series_column" in chart_axis
-                        and column_name in chart_axis["series_column"]
-                    ):
-                        new_column_name = chart_axis["series_title"]
+                            new_column_name = new_column_name.replace(
+                                new_column_name.split("_")[0],
+                                chart_axis[axis_key],
+                            )
+                        else:
+                            new_column_name = chart_axis[axis_key]
                     else:
+                        # Fallback to the original column name if no matching title is found
                         new_column_name = column_name
-                except Exception:
+                elif column_name == "series" or (
+                    "series_column" in chart_axis
+                    and column_name in chart_axis["series_column"]
+                ):
+                    new_column_name = chart_axis["series_title"]
+                else:
                     new_column_name = column_name
+            except Exception:
+                new_column_name = column_name
 
-                new_column_name = new_column_name.replace("_", " ")
-
-                try:
-                    if isinstance(row[column_idx], int):
-                        # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                        row_data[new_column_name] = row[column_idx]
-                    elif isinstance(row[column_idx], float):
-                        # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                        # Round off to 6 decimal points
-                        row_data[new_column_name] = round(row[column_idx], 6)
-                    elif isinstance(row[column_idx], decimal.Decimal):
-                        # row_data[new_column_name] = '{:,}'.format(float(row[column_idx]))
-                        # Round off to 6 decimal points
-                        row_data[new_column_name] = round(float(row[column_idx]), 6)
-                    # elif pd.api.types.is_datetime64_any_dtype(row[column_idx]):
-                    #     row_data[new_column_name] = row[column_idx].astype(str)
-                    elif (
-                        isinstance(row[column_idx], datetime.date)
-                        or isinstance(row[column_idx], datetime.datetime)
-                    ) and not pd.isnull(row[column_idx]):
-                        row_data[new_column_name] = row[column_idx].strftime("%m/%d/%Y")
-                    else:
-                        row_data[new_column_name] = str(row[column_idx])
-                except Exception:
-                    print(traceback.format_exc())
-                    # logger.error(traceback.format_exc())
-                    row_data[new_column_name] = str(row[column_idx])
+            new_column_name = new_column_name.replace("_", " ")
+            table_column_names.append(new_column_name)
 
-            new_data.append(row_data)
+        new_data.extend(build_table_rows(chart_data, table_column_names))
     elif base_chart_type in ["histogram_chart"]:
         chart_data_columns = list(chart_data.columns)
 
         xAxis_column_name = chart_data_columns[0]
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        ),
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -265,8 +180,6 @@ def update_aggregated_table_chart_d3(
         else:
             raise RuntimeError("histogram_chart: X-Axis is not found in extraction!")
 
-        chart_data_values = chart_data.values.tolist()
-
         for chart_column_name in chart_data_columns:
             try:
                 if not isinstance(
@@ -319,109 +232,54 @@ def update_aggregated_table_chart_d3(
                 "aggregated table chart: X-Axis is not found in extraction!",
             )
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        ),
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
 
-        chart_data_values = chart_data.values.tolist()
-
-        for row in chart_data_values:
-            row_data = {}
-            for column_idx, column_name in enumerate(column_names):
-                try:
-                    if column_name == "xAxis" or (
-                        "xAxis_column" in chart_axis
-                        and column_name in chart_axis["xAxis_column"]
-                    ):
-                        new_column_name = chart_axis["xAxis_title"]
-                    elif column_name.startswith("yAxis"):
-                        # Check for yAxis, yAxis2, yAxis3, etc.
-                        axis_key = f"{column_name}_title"
-                        if axis_key in chart_axis:
-                            if "_" in column_name:
-                                new_column_name = column_name
-                                new_column_name = new_column_name.replace(
-                                    new_column_name.split("_")[0],
-                                    chart_axis[axis_key],
-                                )
-                            else:
-                                new_column_name = chart_axis[axis_key]
-                        else:
-                            # Fallback to the original column name if no matching title is found
+        table_column_names = []
+        for column_name in column_names:
+            try:
+                if column_name == "xAxis" or (
+                    "xAxis_column" in chart_axis
+                    and column_name in chart_axis["xAxis_column"]
+                ):
+                    new_column_name = chart_axis["xAxis_title"]
+                elif column_name.startswith("yAxis"):
+                    # Check for yAxis, yAxis2, yAxis3, etc.
+                    axis_key = f"{column_name}_title"
+                    if axis_key in chart_axis:
+                        if "_" in column_name:
                             new_column_name = column_name
-                    elif column_name == "zAxis" or (
-                        "zAxis_column" in chart_axis
-                        and column_name in chart_axis["zAxis_column"]
-                    ):
-                        new_column_name = chart_axis["zAxis_title"]
-
-                    elif column_name == "series" or (
-                        "series_column" in chart_axis
-                        and column_name in chart_axis["series_column"]
-                    ):
-                        new_column_name = chart_axis["series_title"]
+                            new_column_name = new_column_name.replace(
+                                new_column_name.split("_")[0],
+                                chart_axis[axis_key],
+                            )
+                        else:
+                            new_column_name = chart_axis[axis_key]
                     else:
+                        # Fallback to the original column name if no matching title is found
                         new_column_name = column_name
-                except Exception:
+                elif column_name == "zAxis" or (
+                    "zAxis_column" in chart_axis
+                    and column_name in chart_axis["zAxis_column"]
+                ):
+                    new_column_name = chart_axis["zAxis_title"]
+
+                elif column_name == "series" or (
+                    "series_column" in chart_axis
+                    and column_name in chart_axis["series_column"]
+                ):
+                    new_column_name = chart_axis["series_title"]
+                else:
                     new_column_name = column_name
+            except Exception:
+                new_column_name = column_name
 
-                new_column_name = new_column_name.replace("_", " ")
+            new_column_name = new_column_name.replace("_", " ")
+            table_column_names.append(new_column_name)
 
-                try:
-                    if isinstance(row[column_idx], int):
-                        # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                        row_data[new_column_name] = row[column_idx]
-                    elif isinstance(row[column_idx], float):
-                        # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                        # Round off to 6 decimal points
-                        row_data[new_column_name] = round(row[column_idx], 6)
-                    elif isinstance(row[column_idx], decimal.Decimal):
-                        # row_data[new_column_name] = '{:,}'.format(float(row[column_idx]))
-                        # Round off to 6 decimal points
-                        row_data[new_column_name] = round(float(row[column_idx]), 6)
-                    # elif pd.api.types.is_datetime64_any_dtype(row[column_idx]):
-                    #     row_data[new_column_name] = row[column_idx].astype(str)
-                    elif (
-                        isinstance(row[column_idx], datetime.date)
-                        or isinstance(row[column_idx], datetime.datetime)
-                    ) and not pd.isnull(row[column_idx]):
-                        row_data[new_column_name] = row[column_idx].strftime("%m/%d/%Y")
-                    else:
-                        row_data[new_column_name] = str(row[column_idx])
-                except Exception:
-                    row_data[new_column_name] = str(row[column_idx])
-            new_data.append(row_data)
+        new_data.extend(build_table_rows(chart_data, table_column_names))
     elif base_chart_type in [
         "area_chart",
         "line_chart",
@@ -451,103 +309,48 @@ def update_aggregated_table_chart_d3(
                 "aggregated table chart: X-Axis is not found in extraction!",
             )
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        ),
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
 
-        chart_data_values = chart_data.values.tolist()
-
-        for row in chart_data_values:
-            row_data = {}
-            for column_idx, column_name in enumerate(column_names):
-                try:
-                    if column_name == "xAxis" or (
-                        "xAxis_column" in chart_axis
-                        and column_name in chart_axis["xAxis_column"]
-                    ):
-                        new_column_name = chart_axis["xAxis_title"]
-                    elif column_name.startswith("yAxis"):
-                        # Check for yAxis, yAxis2, yAxis3, etc.
-                        axis_key = f"{column_name}_title"
-                        if axis_key in chart_axis:
-                            if "_" in column_name:
-                                new_column_name = column_name
-                                new_column_name = new_column_name.replace(
-                                    new_column_name.split("_")[0],
-                                    chart_axis[axis_key],
-                                )
-                            else:
-                                new_column_name = chart_axis[axis_key]
-                        else:
-                            # Fallback to the original column name if no matching title is found
+        table_column_names = []
+        for column_name in column_names:
+            try:
+                if column_name == "xAxis" or (
+                    "xAxis_column" in chart_axis
+                    and column_name in chart_axis["xAxis_column"]
+                ):
+                    new_column_name = chart_axis["xAxis_title"]
+                elif column_name.startswith("yAxis"):
+                    # Check for yAxis, yAxis2, yAxis3, etc.
+                    axis_key = f"{column_name}_title"
+                    if axis_key in chart_axis:
+                        if "_" in column_name:
                             new_column_name = column_name
-                    elif column_name == "series" or (
-                        "series_column" in chart_axis
-                        and column_name in chart_axis["series_column"]
-                    ):
-                        new_column_name = chart_axis["series_title"]
+                            new_column_name = new_column_name.replace(
+                                new_column_name.split("_")[0],
+                                chart_axis[axis_key],
+                            )
+                        else:
+                            new_column_name = chart_axis[axis_key]
                     else:
+                        # Fallback to the original column name if no matching title is found
                         new_column_name = column_name
-                except Exception:
+                elif column_name == "series" or (
+                    "series_column" in chart_axis
+                    and column_name in chart_axis["series_column"]
+                ):
+                    new_column_name = chart_axis["series_title"]
+                else:
                     new_column_name = column_name
+            except Exception:
+                new_column_name = column_name
 
-                new_column_name = new_column_name.replace("_", " ")
+            new_column_name = new_column_name.replace("_", " ")
+            table_column_names.append(new_column_name)
 
-                try:
-                    if isinstance(row[column_idx], int):
-                        # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                        row_data[new_column_name] = row[column_idx]
-                    elif isinstance(row[column_idx], float):
-                        # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                        # Round off to 6 decimal points
-                        row_data[new_column_name] = round(row[column_idx], 6)
-                    elif isinstance(row[column_idx], decimal.Decimal):
-                        # row_data[new_column_name] = '{:,}'.format(float(row[column_idx]))
-                        # Round off to 6 decimal points
-                        row_data[new_column_name] = round(float(row[column_idx]), 6)
-                    # elif pd.api.types.is_datetime64_any_dtype(row[column_idx]):
-                    #     row_data[new_column_name] = row[column_idx].astype(str)
-                    elif (
-                        isinstance(row[column_idx], datetime.date)
-                        or isinstance(row[column_idx], datetime.datetime)
-                    ) and not pd.isnull(row[column_idx]):
-                        row_data[new_column_name] = row[column_idx].strftime("%m/%d/%Y")
-                    else:
-                        row_data[new_column_name] = str(row[column_idx])
-                except Exception:
-                    row_data[new_column_name] = str(row[column_idx])
-            new_data.append(row_data)
+        new_data.extend(build_table_rows(chart_data, table_column_names))
 
     elif base_chart_type in [
         "scatterplot_chart",
@@ -614,103 +417,48 @@ def update_aggregated_table_chart_d3(
                         f"scatterplot_chart: {numerical_column_name} is not numerical!",
                     )
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        ),
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
 
-        chart_data_values = chart_data.values.tolist()
-
-        for row in chart_data_values:
-            row_data = {}
-            for column_idx, column_name in enumerate(column_names):
-                try:
-                    if column_name == "xAxis" or (
-                        "xAxis_column" in chart_axis
-                        and column_name in chart_axis["xAxis_column"]
-                    ):
-                        new_column_name = chart_axis["xAxis_title"]
-                    elif column_name.startswith("yAxis"):
-                        # Check for yAxis, yAxis2, yAxis3, etc.
-                        axis_key = f"{column_name}_title"
-                        if axis_key in chart_axis:
-                            if "_" in column_name:
-                                new_column_name = column_name
-                                new_column_name = new_column_name.replace(
-                                    new_column_name.split("_")[0],
-                                    chart_axis[axis_key],
-                                )
-                            else:
-                                new_column_name = chart_axis[axis_key]
-                        else:
-                            # Fallback to the original column name if no matching title is found
+        table_column_names = []
+        for column_name in column_names:
+            try:
+                if column_name == "xAxis" or (
+                    "xAxis_column" in chart_axis
+                    and column_name in chart_axis["xAxis_column"]
+                ):
+                    new_column_name = chart_axis["xAxis_title"]
+                elif column_name.startswith("yAxis"):
+                    # Check for yAxis, yAxis2, yAxis3, etc.
+                    axis_key = f"{column_name}_title"
+                    if axis_key in chart_axis:
+                        if "_" in column_name:
                             new_column_name = column_name
-                    elif column_name == "series" or (
-                        "series_column" in chart_axis
-                        and column_name in chart_axis["series_column"]
-                    ):
-                        new_column_name = chart_axis["series_title"]
+                            new_column_name = new_column_name.replace(
+                                new_column_name.split("_")[0],
+                                chart_axis[axis_key],
+                            )
+                        else:
+                            new_column_name = chart_axis[axis_key]
                     else:
+                        # Fallback to the original column name if no matching title is found
                         new_column_name = column_name
-                except Exception:
+                elif column_name == "series" or (
+                    "series_column" in chart_axis
+                    and column_name in chart_axis["series_column"]
+                ):
+                    new_column_name = chart_axis["series_title"]
+                else:
                     new_column_name = column_name
+            except Exception:
+                new_column_name = column_name
 
-                new_column_name = new_column_name.replace("_", " ")
+            new_column_name = new_column_name.replace("_", " ")
+            table_column_names.append(new_column_name)
 
-                try:
-                    if isinstance(row[column_idx], int):
-                        # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                        row_data[new_column_name] = row[column_idx]
-                    elif isinstance(row[column_idx], float):
-                        # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                        # Round off to 6 decimal points
-                        row_data[new_column_name] = round(row[column_idx], 6)
-                    elif isinstance(row[column_idx], decimal.Decimal):
-                        # row_data[new_column_name] = '{:,}'.format(float(row[column_idx]))
-                        # Round off to 6 decimal points
-                        row_data[new_column_name] = round(float(row[column_idx]), 6)
-                    # elif pd.api.types.is_datetime64_any_dtype(row[column_idx]):
-                    #     row_data[new_column_name] = row[column_idx].astype(str)
-                    elif (
-                        isinstance(row[column_idx], datetime.date)
-                        or isinstance(row[column_idx], datetime.datetime)
-                    ) and not pd.isnull(row[column_idx]):
-                        row_data[new_column_name] = row[column_idx].strftime("%m/%d/%Y")
-                    else:
-                        row_data[new_column_name] = str(row[column_idx])
-                except Exception:
-                    row_data[new_column_name] = str(row[column_idx])
-            new_data.append(row_data)
+        new_data.extend(build_table_rows(chart_data, table_column_names))
 
     elif base_chart_type in ["barlinecombo_chart"]:
         chart_data_columns = list(chart_data.columns)
@@ -731,105 +479,48 @@ def update_aggregated_table_chart_d3(
         else:
             raise RuntimeError("barlinecombo_chart: X-Axis is not found in extraction!")
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        ),
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
 
-        chart_data_values = chart_data.values.tolist()
-
-        for row in chart_data_values:
-            row_data = {}
-            for column_idx, column_name in enumerate(column_names):
-                try:
-                    if column_name == "xAxis" or (
-                        "xAxis_column" in chart_axis
-                        and column_name in chart_axis["xAxis_column"]
-                    ):
-                        new_column_name = chart_axis["xAxis_title"]
-                    elif column_name.startswith("yAxis"):
-                        # Check for yAxis, yAxis2, yAxis3, etc.
-                        axis_key = f"{column_name}_title"
-                        if axis_key in chart_axis:
-                            if "_" in column_name:
-                                new_column_name = column_name
-                                new_column_name = new_column_name.replace(
-                                    new_column_name.split("_")[0],
-                                    chart_axis[axis_key],
-                                )
-                            else:
-                                new_column_name = chart_axis[axis_key]
-                        else:
-                            # Fallback to the original column name if no matching title is found
+        table_column_names = []
+        for column_name in column_names:
+            try:
+                if column_name == "xAxis" or (
+                    "xAxis_column" in chart_axis
+                    and column_name in chart_axis["xAxis_column"]
+                ):
+                    new_column_name = chart_axis["xAxis_title"]
+                elif column_name.startswith("yAxis"):
+                    # Check for yAxis, yAxis2, yAxis3, etc.
+                    axis_key = f"{column_name}_title"
+                    if axis_key in chart_axis:
+                        if "_" in column_name:
                             new_column_name = column_name
-                    elif column_name == "series" or (
-                        "series_column" in chart_axis
-                        and column_name in chart_axis["series_column"]
-                    ):
-                        new_column_name = chart_axis["series_title"]
+                            new_column_name = new_column_name.replace(
+                                new_column_name.split("_")[0],
+                                chart_axis[axis_key],
+                            )
+                        else:
+                            new_column_name = chart_axis[axis_key]
                     else:
+                        # Fallback to the original column name if no matching title is found
                         new_column_name = column_name
-                except Exception:
+                elif column_name == "series" or (
+                    "series_column" in chart_axis
+                    and column_name in chart_axis["series_column"]
+                ):
+                    new_column_name = chart_axis["series_title"]
+                else:
                     new_column_name = column_name
+            except Exception:
+                new_column_name = column_name
 
-                new_column_name = new_column_name.replace("_", " ")
+            new_column_name = new_column_name.replace("_", " ")
+            table_column_names.append(new_column_name)
 
-                try:
-                    if isinstance(row[column_idx], int):
-                        # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                        row_data[new_column_name] = row[column_idx]
-                    elif isinstance(row[column_idx], float):
-                        # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                        # Round off to 6 decimal points
-                        row_data[new_column_name] = round(row[column_idx], 6)
-                    elif isinstance(row[column_idx], decimal.Decimal):
-                        # row_data[new_column_name] = '{:,}'.format(float(row[column_idx]))
-                        # Round off to 6 decimal points
-                        row_data[new_column_name] = round(float(row[column_idx]), 6)
-                    # elif pd.api.types.is_datetime64_any_dtype(row[column_idx]):
-                    #     row_data[new_column_name] = row[column_idx].astype(str)
-                    elif (
-                        isinstance(row[column_idx], datetime.date)
-                        or isinstance(row[column_idx], datetime.datetime)
-                    ) and not pd.isnull(row[column_idx]):
-                        row_data[new_column_name] = row[column_idx].strftime("%m/%d/%Y")
-                    else:
-                        row_data[new_column_name] = str(row[column_idx])
-                except Exception:
-                    print(traceback.format_exc())
-                    # logger.error(traceback.format_exc())
-                    row_data[new_column_name] = str(row[column_idx])
-            new_data.append(row_data)
+        new_data.extend(build_table_rows(chart_data, table_column_names))
     else:
         raise RuntimeError(
             f"{base_chart_type} Chart Type is not supported in generate aggregated table chart!",
@@ -1459,34 +1150,7 @@ def update_combo_chart_d3(
     ):
         chart_data = update_axis_title_and_data(chart_data, chart_axis)
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -1500,14 +1164,8 @@ def update_combo_chart_d3(
             llama70b_client, chart_json, chart_data, logging_url
         )
 
-    chart_json["Y"] = [
-        float(val) if isinstance(val, decimal.Decimal) else val
-        for val in chart_data[yAxisBar_column_name].values.tolist()
-    ]
-    chart_json["Y2"] = [
-        float(val) if isinstance(val, decimal.Decimal) else val
-        for val in chart_data[yAxisLine_column_name].values.tolist()
-    ]
+    chart_json["Y"] = to_json_list(chart_data[yAxisBar_column_name])
+    chart_json["Y2"] = to_json_list(chart_data[yAxisLine_column_name])
 
     if "Y2" not in chart_json or chart_json["Y2"] == []:
         chart_json["Chart_Type"] = "bar_chart"
@@ -1624,38 +1282,11 @@ def update_line_chart_d3(
         and series_column_name in chart_data.columns
         and chart_data[series_column_name].nunique() > 1
     ):
-        new_chart_data = pd.DataFrame()
-
-        pivot_data = chart_data.pivot_table(
-            index=xAxis_column_name,
-            columns=series_column_name,
-            values=yAxis_column_names,
-        )
-        pivot_data = pivot_data.reset_index()
-        new_chart_data[xAxis_column_name] = [
-            float(val) if isinstance(val, decimal.Decimal) else val
-            for val in pivot_data[xAxis_column_name].values.tolist()
-        ]
-
-        for yAxis_column_name in yAxis_column_names:
-            yAxis_pivot_table = pivot_data[yAxis_column_name]
-            for yAxis_pivot_column in list(yAxis_pivot_table.columns):
-                new_columns = {
-                    f"{yAxis_column_name}_{yAxis_pivot_column}": [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in yAxis_pivot_table[yAxis_pivot_column].values.tolist()
-                    ],
-                }
-                added_chart_data = pd.DataFrame(new_columns)
-                new_chart_data = pd.concat([new_chart_data, added_chart_data], axis=1)
-
-        chart_data = new_chart_data.fillna(
-            {
-                col: (
-                    0 if new_chart_data[col].dtype in [np.float64, np.int64] else "null"
-                )
-                for col in new_chart_data.columns
-            },
+        chart_data = pivot_series_columns(
+            chart_data,
+            xAxis_column_name,
+            series_column_name,
+            yAxis_column_names,
         )
 
     if (
@@ -1705,34 +1336,7 @@ def update_line_chart_d3(
     ):
         chart_data = update_axis_title_and_data(chart_data, chart_axis)
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -1753,10 +1357,7 @@ def update_line_chart_d3(
             continue
 
         if yAxis_idx <= 1:
-            chart_json["Y"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            chart_json["Y"] = to_json_list(chart_data[column_name])
 
             underscore_index = column_name.find("_")
 
@@ -1897,10 +1498,7 @@ def update_line_chart_d3(
             # if check_negative_value(chart_json["Y"]):
             #     chart_json["Chart_Type"] = "column_chart"
         else:
-            chart_json[f"Y{yAxis_idx}"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            chart_json[f"Y{yAxis_idx}"] = to_json_list(chart_data[column_name])
 
             underscore_index = column_name.find("_")
 
@@ -2245,34 +1843,7 @@ def update_scatterplot_chart_d3(
     ):
         chart_data = update_axis_title_and_data(chart_data, chart_axis)
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -2338,43 +1909,7 @@ def update_scatterplot_chart_d3(
             ):
                 chart_data = update_axis_title_and_data(chart_data, chart_axis)
 
-            try:
-                if len(series_chart_data[xAxis_column_name][0].split("-")) == 1:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                    )
-                elif len(series_chart_data[xAxis_column_name][0].split("-")) == 2:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        key=lambda x: x.apply(
-                            lambda date: (
-                                int(date.split("-")[0]),
-                                int(date.split("-")[1]),
-                            ),
-                        ),
-                    )
-                elif len(series_chart_data[xAxis_column_name][0].split("-")) == 3:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        key=lambda x: x.apply(
-                            lambda date: (
-                                int(date.split("-")[0]),
-                                int(date.split("-")[1]),
-                                int(date.split("-")[2]),
-                            ),
-                        ),
-                    )
-                else:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        ascending=True,
-                    )
-            except Exception:
-                series_chart_data = series_chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
+            series_chart_data = sort_by_date_parts(series_chart_data, xAxis_column_name)
 
             if isinstance(xAxis_column_name, str):
                 series_chart_data = sort_pandas_date(
@@ -2398,12 +1933,9 @@ def update_scatterplot_chart_d3(
                         ].values.tolist()
                     ]
 
-                    chart_json["Y"] = [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in series_chart_data[
-                            series_chart_column
-                        ].values.tolist()
-                    ]
+                    chart_json["Y"] = to_json_list(
+                        series_chart_data[series_chart_column]
+                    )
 
                     # Add Series Title to Series Value
                     if (
@@ -2497,17 +2029,13 @@ def update_scatterplot_chart_d3(
                     # if check_negative_value(chart_json["Y"]):
                     #     chart_json["Chart_Type"] = "column_chart"
                 else:
-                    chart_json[f"X{yAxis_idx}"] = [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in series_chart_data[xAxis_column_name].values.tolist()
-                    ]
+                    chart_json[f"X{yAxis_idx}"] = to_json_list(
+                        series_chart_data[xAxis_column_name]
+                    )
 
-                    chart_json[f"Y{yAxis_idx}"] = [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in series_chart_data[
-                            series_chart_column
-                        ].values.tolist()
-                    ]
+                    chart_json[f"Y{yAxis_idx}"] = to_json_list(
+                        series_chart_data[series_chart_column]
+                    )
 
                     # Add Series Title to Series Value
                     if (
@@ -2602,37 +2130,7 @@ def update_scatterplot_chart_d3(
     else:
         yAxis_idx = 1
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        ),
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -2647,10 +2145,7 @@ def update_scatterplot_chart_d3(
                     for x_data in chart_data[xAxis_column_name].values.tolist()
                 ]
 
-                chart_json["Y"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[column_name].values.tolist()
-                ]
+                chart_json["Y"] = to_json_list(chart_data[column_name])
 
                 if check_aggregation_phrases(chart_axis[f"{column_name}_title"]):
                     chart_json["yName"] = chart_axis[f"{column_name}_title"]
@@ -2698,10 +2193,7 @@ def update_scatterplot_chart_d3(
                     for x_data in chart_data[xAxis_column_name].values.tolist()
                 ]
 
-                chart_json[f"Y{yAxis_idx}"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[column_name].values.tolist()
-                ]
+                chart_json[f"Y{yAxis_idx}"] = to_json_list(chart_data[column_name])
 
                 if check_aggregation_phrases(chart_axis[f"{column_name}_title"]):
                     chart_json[f"y{yAxis_idx}Name"] = chart_axis[f"{column_name}_title"]
@@ -2926,37 +2418,11 @@ def update_spline_chart_d3(
         and series_column_name in chart_data.columns
         and chart_data[series_column_name].nunique() > 1
     ):
-        new_chart_data = pd.DataFrame()
-
-        pivot_data = chart_data.pivot_table(
-            index=xAxis_column_name,
-            columns=series_column_name,
-            values=yAxis_column_names,
-        )
-        pivot_data = pivot_data.reset_index()
-        new_chart_data[xAxis_column_name] = [
-            float(val) if isinstance(val, decimal.Decimal) else val
-            for val in pivot_data[xAxis_column_name].values.tolist()
-        ]
-
-        for yAxis_column_name in yAxis_column_names:
-            yAxis_pivot_table = pivot_data[yAxis_column_name]
-            for yAxis_pivot_column in list(yAxis_pivot_table.columns):
-                new_columns = {
-                    f"{yAxis_column_name}_{yAxis_pivot_column}": yAxis_pivot_table[
-                        yAxis_pivot_column
-                    ].values.tolist(),
-                }
-                added_chart_data = pd.DataFrame(new_columns)
-                new_chart_data = pd.concat([new_chart_data, added_chart_data], axis=1)
-
-        chart_data = new_chart_data.fillna(
-            {
-                col: (
-                    0 if new_chart_data[col].dtype in [np.float64, np.int64] else "null"
-                )
-                for col in new_chart_data.columns
-            },
+        chart_data = pivot_series_columns(
+            chart_data,
+            xAxis_column_name,
+            series_column_name,
+            yAxis_column_names,
         )
 
     if (
@@ -3006,34 +2472,7 @@ def update_spline_chart_d3(
     ):
         chart_data = update_axis_title_and_data(chart_data, chart_axis)
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -3054,10 +2493,7 @@ def update_spline_chart_d3(
             continue
 
         if yAxis_idx <= 1:
-            chart_json["Y"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            chart_json["Y"] = to_json_list(chart_data[column_name])
 
             underscore_index = column_name.find("_")
 
@@ -3198,10 +2634,7 @@ def update_spline_chart_d3(
             # if check_negative_value(chart_axis["Y"]):
             #     chart_axis["Chart_Type"] = "column_chart"
         else:
-            chart_json[f"Y{yAxis_idx}"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            chart_json[f"Y{yAxis_idx}"] = to_json_list(chart_data[column_name])
 
             underscore_index = column_name.find("_")
 
@@ -3483,36 +2916,12 @@ def update_group_bar_chart_d3(
         and series_column_name in chart_data.columns
         and chart_data[series_column_name].nunique() > 1
     ):
-        new_chart_data = pd.DataFrame()
-
-        pivot_data = chart_data.pivot_table(
-            index=xAxis_column_name,
-            columns=series_column_name,
-            values=yAxis_column_names,
-        )
-        pivot_data = pivot_data.reset_index()
-        new_chart_data[xAxis_column_name] = pivot_data[
-            xAxis_column_name
-        ].values.tolist()
-
-        for yAxis_column_name in yAxis_column_names:
-            yAxis_pivot_table = pivot_data[yAxis_column_name]
-            for yAxis_pivot_column in list(yAxis_pivot_table.columns):
-                new_columns = {
-                    f"{yAxis_column_name}_{yAxis_pivot_column}": yAxis_pivot_table[
-                        yAxis_pivot_column
-                    ].values.tolist(),
-                }
-                added_chart_data = pd.DataFrame(new_columns)
-                new_chart_data = pd.concat([new_chart_data, added_chart_data], axis=1)
-
-        chart_data = new_chart_data.fillna(
-            {
-                col: (
-                    0 if new_chart_data[col].dtype in [np.float64, np.int64] else "null"
-                )
-                for col in new_chart_data.columns
-            },
+        chart_data = pivot_series_columns(
+            chart_data,
+            xAxis_column_name,
+            series_column_name,
+            yAxis_column_names,
+            convert_xAxis_decimal=False,
         )
 
     if (
@@ -3562,34 +2971,7 @@ def update_group_bar_chart_d3(
     ):
         chart_data = update_axis_title_and_data(chart_data, chart_axis)
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -3612,10 +2994,7 @@ def update_group_bar_chart_d3(
             continue
 
         if yAxis_idx <= 1:
-            chart_json["Y"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            chart_json["Y"] = to_json_list(chart_data[column_name])
 
             underscore_index = column_name.find("_")
 
@@ -3755,10 +3134,7 @@ def update_group_bar_chart_d3(
             # if check_negative_value(chart_json["Y"]):
             #     chart_json["Chart_Type"] = "column_chart"
         else:
-            chart_json[f"Y{yAxis_idx}"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            chart_json[f"Y{yAxis_idx}"] = to_json_list(chart_data[column_name])
 
             underscore_index = column_name.find("_")
 
@@ -4116,37 +3492,12 @@ def update_radar_chart_d3(
         and series_column_name in chart_data.columns
         and chart_data[series_column_name].nunique() > 1
     ):
-        new_chart_data = pd.DataFrame()
-
-        pivot_data = chart_data.pivot_table(
-            index=xAxis_column_name,
-            columns=series_column_name,
-            values=yAxis_column_names,
-        )
-        pivot_data = pivot_data.reset_index()
-        new_chart_data[xAxis_column_name] = pivot_data[
-            xAxis_column_name
-        ].values.tolist()
-
-        for yAxis_column_name in yAxis_column_names:
-            yAxis_pivot_table = pivot_data[yAxis_column_name]
-            for yAxis_pivot_column in list(yAxis_pivot_table.columns):
-                new_columns = {
-                    f"{yAxis_column_name}_{yAxis_pivot_column}": [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in yAxis_pivot_table[yAxis_pivot_column].values.tolist()
-                    ],
-                }
-                added_chart_data = pd.DataFrame(new_columns)
-                new_chart_data = pd.concat([new_chart_data, added_chart_data], axis=1)
-
-        chart_data = new_chart_data.fillna(
-            {
-                col: (
-                    0 if new_chart_data[col].dtype in [np.float64, np.int64] else "null"
-                )
-                for col in new_chart_data.columns
-            },
+        chart_data = pivot_series_columns(
+            chart_data,
+            xAxis_column_name,
+            series_column_name,
+            yAxis_column_names,
+            convert_xAxis_decimal=False,
         )
 
     if (
@@ -4196,34 +3547,7 @@ def update_radar_chart_d3(
     ):
         chart_data = update_axis_title_and_data(chart_data, chart_axis)
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -4246,10 +3570,7 @@ def update_radar_chart_d3(
             continue
 
         if yAxis_idx <= 1:
-            chart_json["Y"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            chart_json["Y"] = to_json_list(chart_data[column_name])
 
             underscore_index = column_name.find("_")
 
@@ -4382,10 +3703,7 @@ def update_radar_chart_d3(
             # if check_negative_value(chart_json["Y"]):
             #     chart_json["Chart_Type"] = "column_chart"
         else:
-            chart_json[f"Y{yAxis_idx}"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            chart_json[f"Y{yAxis_idx}"] = to_json_list(chart_data[column_name])
 
             underscore_index = column_name.find("_")
 
@@ -4607,36 +3925,12 @@ def update_area_chart_d3(
         and series_column_name in chart_data.columns
         and chart_data[series_column_name].nunique() > 1
     ):
-        new_chart_data = pd.DataFrame()
-
-        pivot_data = chart_data.pivot_table(
-            index=xAxis_column_name,
-            columns=series_column_name,
-            values=yAxis_column_names,
-        )
-        pivot_data = pivot_data.reset_index()
-        new_chart_data[xAxis_column_name] = pivot_data[
-            xAxis_column_name
-        ].values.tolist()
-
-        for yAxis_column_name in yAxis_column_names:
-            yAxis_pivot_table = pivot_data[yAxis_column_name]
-            for yAxis_pivot_column in list(yAxis_pivot_table.columns):
-                new_columns = {
-                    f"{yAxis_column_name}_{yAxis_pivot_column}": yAxis_pivot_table[
-                        yAxis_pivot_column
-                    ].values.tolist(),
-                }
-                added_chart_data = pd.DataFrame(new_columns)
-                new_chart_data = pd.concat([new_chart_data, added_chart_data], axis=1)
-
-        chart_data = new_chart_data.fillna(
-            {
-                col: (
-                    0 if new_chart_data[col].dtype in [np.float64, np.int64] else "null"
-                )
-                for col in new_chart_data.columns
-            },
+        chart_data = pivot_series_columns(
+            chart_data,
+            xAxis_column_name,
+            series_column_name,
+            yAxis_column_names,
+            convert_xAxis_decimal=False,
         )
 
     if (
@@ -4686,34 +3980,7 @@ def update_area_chart_d3(
     ):
         chart_data = update_axis_title_and_data(chart_data, chart_axis)
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -4737,10 +4004,7 @@ def update_area_chart_d3(
             continue
 
         if yAxis_idx <= 1:
-            chart_json["Y"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            chart_json["Y"] = to_json_list(chart_data[column_name])
 
             underscore_index = column_name.find("_")
 
@@ -4873,10 +4137,7 @@ def update_area_chart_d3(
             # if check_negative_value(chart_json["Y"]):
             #     chart_json["Chart_Type"] = "column_chart"
         else:
-            chart_json[f"Y{yAxis_idx}"] = [
-                float(val) if isinstance(val, decimal.Decimal) else val
-                for val in chart_data[column_name].values.tolist()
-            ]
+            chart_json[f"Y{yAxis_idx}"] = to_json_list(chart_data[column_name])
 
             underscore_index = column_name.find("_")
 
@@ -5177,83 +4438,33 @@ def update_table_chart_d3(
     else:
         xAxis_column_name = column_names[0]
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
 
-    chart_data_values = chart_data.values.tolist()
-
-    for row in chart_data_values:
-        row_data = {}
-        for column_idx, column_name in enumerate(column_names):
-            try:
-                if column_name == "xAxis" or (
-                    "xAxis_column" in chart_axis.keys()
-                    and column_name in chart_axis["xAxis_column"]
-                ):
-                    new_column_name = chart_axis["xAxis_title"]
-                elif column_name == "yAxis" or (
-                    "yAxis_column" in chart_axis.keys()
-                    and column_name in chart_axis["yAxis_column"]
-                ):
-                    new_column_name = chart_axis["yAxis_title"]
-                else:
-                    new_column_name = column_name
-            except Exception:
+    table_column_names = []
+    for column_name in column_names:
+        try:
+            if column_name == "xAxis" or (
+                "xAxis_column" in chart_axis.keys()
+                and column_name in chart_axis["xAxis_column"]
+            ):
+                new_column_name = chart_axis["xAxis_title"]
+            elif column_name == "yAxis" or (
+                "yAxis_column" in chart_axis.keys()
+                and column_name in chart_axis["yAxis_column"]
+            ):
+                new_column_name = chart_axis["yAxis_title"]
+            else:
                 new_column_name = column_name
+        except Exception:
+            new_column_name = column_name
 
-            new_column_name = new_column_name.replace("_", " ")
+        new_column_name = new_column_name.replace("_", " ")
+        table_column_names.append(new_column_name)
 
-            try:
-                if isinstance(row[column_idx], int) or isinstance(
-                    row[column_idx],
-                    float,
-                ):
-                    # row_data[new_column_name] = '{:,}'.format(row[column_idx])
-                    row_data[new_column_name] = row[column_idx]
-                elif isinstance(row[column_idx], decimal.Decimal):
-                    # row_data[new_column_name] = '{:,}'.format(float(row[column_idx]))
-                    row_data[new_column_name] = float(row[column_idx])
-                # elif pd.api.types.is_datetime64_any_dtype(row[column_idx]):
-                #     row_data[new_column_name] = row[column_idx].astype(str)
-                elif (
-                    isinstance(row[column_idx], datetime.date)
-                    or isinstance(row[column_idx], datetime.datetime)
-                ) and not pd.isnull(row[column_idx]):
-                    row_data[new_column_name] = row[column_idx].strftime("%m/%d/%Y")
-                else:
-                    row_data[new_column_name] = str(row[column_idx])
-            except Exception:
-                row_data[new_column_name] = str(row[column_idx])
-        new_data.append(row_data)
+    new_data.extend(build_table_rows(chart_data, table_column_names, decimals=None))
 
     chart_json["data"] = new_data
     chart_json["Chart_Size"] = sys.getsizeof(new_data)
@@ -5329,34 +4540,7 @@ def update_pie_chart_d3(
         except Exception:
             raise RuntimeError(f"pie_chart: {yAxis_column_name} is not numerical!")
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if len(chart_json["Chart_Data"]) > 12:
         return update_group_bar_chart_d3(
@@ -5422,34 +4606,7 @@ def update_pie_chart_d3(
     ):
         sorted_chart_data = update_axis_title_and_data(sorted_chart_data, chart_axis)
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -5622,34 +4779,7 @@ def update_pyramid_chart_d3(
         for val in sorted_chart_data[xAxis_column_name]
     ):
         sorted_chart_data = update_axis_title_and_data(sorted_chart_data, chart_axis)
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -5658,10 +4788,7 @@ def update_pyramid_chart_d3(
         str(x_data) for x_data in sorted_chart_data[xAxis_column_name].values.tolist()
     ]
 
-    chart_json["Y"] = [
-        float(val) if isinstance(val, decimal.Decimal) else val
-        for val in sorted_chart_data[yAxis_column_name].values.tolist()
-    ]
+    chart_json["Y"] = to_json_list(sorted_chart_data[yAxis_column_name])
 
     if not (
         isinstance(chart_json["Y"][0], int) or isinstance(chart_json["Y"][0], float)
@@ -5827,34 +4954,7 @@ def update_treemap_chart_d3(
     ):
         chart_data = update_axis_title_and_data(chart_data, chart_axis)
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -5923,43 +5023,7 @@ def update_treemap_chart_d3(
                     chart_axis,
                 )
 
-            try:
-                if len(series_chart_data[xAxis_column_name][0].split("-")) == 1:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                    )
-                elif len(series_chart_data[xAxis_column_name][0].split("-")) == 2:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        key=lambda x: x.apply(
-                            lambda date: (
-                                int(date.split("-")[0]),
-                                int(date.split("-")[1]),
-                            ),
-                        ),
-                    )
-                elif len(series_chart_data[xAxis_column_name][0].split("-")) == 3:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        key=lambda x: x.apply(
-                            lambda date: (
-                                int(date.split("-")[0]),
-                                int(date.split("-")[1]),
-                                int(date.split("-")[2]),
-                            ),
-                        ),
-                    )
-                else:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        ascending=True,
-                    )
-            except Exception:
-                series_chart_data = series_chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
+            series_chart_data = sort_by_date_parts(series_chart_data, xAxis_column_name)
 
             if isinstance(xAxis_column_name, str):
                 series_chart_data = sort_pandas_date(
@@ -5983,12 +5047,9 @@ def update_treemap_chart_d3(
                         ].values.tolist()
                     ]
 
-                    chart_json["Y"] = [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in series_chart_data[
-                            series_chart_column
-                        ].values.tolist()
-                    ]
+                    chart_json["Y"] = to_json_list(
+                        series_chart_data[series_chart_column]
+                    )
 
                     # Add Series Title to Series Value
                     if (
@@ -6065,12 +5126,9 @@ def update_treemap_chart_d3(
                         ].values.tolist()
                     ]
 
-                    chart_json[f"Y{yAxis_idx}"] = [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in series_chart_data[
-                            series_chart_column
-                        ].values.tolist()
-                    ]
+                    chart_json[f"Y{yAxis_idx}"] = to_json_list(
+                        series_chart_data[series_chart_column]
+                    )
 
                     # Add Series Title to Series Value
                     if (
@@ -6141,37 +5199,7 @@ def update_treemap_chart_d3(
     else:
         yAxis_idx = 1
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        ),
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -6186,10 +5214,7 @@ def update_treemap_chart_d3(
                     for x_data in chart_data[xAxis_column_name].values.tolist()
                 ]
 
-                chart_json["Y"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[column_name].values.tolist()
-                ]
+                chart_json["Y"] = to_json_list(chart_data[column_name])
 
                 if check_aggregation_phrases(chart_axis[f"{column_name}_title"]):
                     chart_json["yName"] = chart_axis[f"{column_name}_title"]
@@ -6236,10 +5261,7 @@ def update_treemap_chart_d3(
                     str(x_data)
                     for x_data in chart_data[xAxis_column_name].values.tolist()
                 ]
-                chart_json[f"Y{yAxis_idx}"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[column_name].values.tolist()
-                ]
+                chart_json[f"Y{yAxis_idx}"] = to_json_list(chart_data[column_name])
 
                 if check_aggregation_phrases(chart_axis[f"{column_name}_title"]):
                     chart_json[f"y{yAxis_idx}Name"] = chart_axis[f"{column_name}_title"]
@@ -6469,34 +5491,7 @@ def update_bubbleplot_chart_d3(
     ):
         chart_data = update_axis_title_and_data(chart_data, chart_axis)
 
-    try:
-        if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                ),
-            )
-        elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-            chart_data = chart_data.sort_values(
-                by=xAxis_column_name,
-                key=lambda x: x.apply(
-                    lambda date: (
-                        int(date.split("-")[0]),
-                        int(date.split("-")[1]),
-                        int(date.split("-")[2]),
-                    ),
-                ),
-            )
-        else:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
-    except Exception:
-        chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+    chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
     if isinstance(xAxis_column_name, str):
         chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -6565,43 +5560,7 @@ def update_bubbleplot_chart_d3(
                     chart_axis,
                 )
 
-            try:
-                if len(series_chart_data[xAxis_column_name][0].split("-")) == 1:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                    )
-                elif len(series_chart_data[xAxis_column_name][0].split("-")) == 2:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        key=lambda x: x.apply(
-                            lambda date: (
-                                int(date.split("-")[0]),
-                                int(date.split("-")[1]),
-                            ),
-                        ),
-                    )
-                elif len(series_chart_data[xAxis_column_name][0].split("-")) == 3:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        key=lambda x: x.apply(
-                            lambda date: (
-                                int(date.split("-")[0]),
-                                int(date.split("-")[1]),
-                                int(date.split("-")[2]),
-                            ),
-                        ),
-                    )
-                else:
-                    series_chart_data = series_chart_data.sort_values(
-                        by=xAxis_column_name,
-                        ascending=True,
-                    )
-            except Exception:
-                series_chart_data = series_chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
+            series_chart_data = sort_by_date_parts(series_chart_data, xAxis_column_name)
 
             if isinstance(xAxis_column_name, str):
                 series_chart_data = sort_pandas_date(
@@ -6625,17 +5584,11 @@ def update_bubbleplot_chart_d3(
                         ].values.tolist()
                     ]
 
-                    chart_json["Y"] = [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in series_chart_data[
-                            series_chart_column
-                        ].values.tolist()
-                    ]
+                    chart_json["Y"] = to_json_list(
+                        series_chart_data[series_chart_column]
+                    )
 
-                    chart_json["Z"] = [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in series_chart_data[zAxis_column_name].values.tolist()
-                    ]
+                    chart_json["Z"] = to_json_list(series_chart_data[zAxis_column_name])
 
                     # Add Series Title to Series Value
                     if (
@@ -6712,17 +5665,13 @@ def update_bubbleplot_chart_d3(
                         ].values.tolist()
                     ]
 
-                    chart_json[f"Y{yAxis_idx}"] = [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in series_chart_data[
-                            series_chart_column
-                        ].values.tolist()
-                    ]
+                    chart_json[f"Y{yAxis_idx}"] = to_json_list(
+                        series_chart_data[series_chart_column]
+                    )
 
-                    chart_json[f"Z{yAxis_idx}"] = [
-                        float(val) if isinstance(val, decimal.Decimal) else val
-                        for val in series_chart_data[zAxis_column_name].values.tolist()
-                    ]
+                    chart_json[f"Z{yAxis_idx}"] = to_json_list(
+                        series_chart_data[zAxis_column_name]
+                    )
 
                     # Add Series Title to Series Value
                     if (
@@ -6793,37 +5742,7 @@ def update_bubbleplot_chart_d3(
     else:
         yAxis_idx = 1
 
-        try:
-            if len(chart_data[xAxis_column_name][0].split("-")) == 1:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(lambda date: (int(date.split("-")[0]))),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 2:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (int(date.split("-")[0]), int(date.split("-")[1])),
-                    ),
-                )
-            elif len(chart_data[xAxis_column_name][0].split("-")) == 3:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    key=lambda x: x.apply(
-                        lambda date: (
-                            int(date.split("-")[0]),
-                            int(date.split("-")[1]),
-                            int(date.split("-")[2]),
-                        ),
-                    ),
-                )
-            else:
-                chart_data = chart_data.sort_values(
-                    by=xAxis_column_name,
-                    ascending=True,
-                )
-        except Exception:
-            chart_data = chart_data.sort_values(by=xAxis_column_name, ascending=True)
+        chart_data = sort_by_date_parts(chart_data, xAxis_column_name)
 
         if isinstance(xAxis_column_name, str):
             chart_data = sort_pandas_date(chart_data, xAxis_column_name)
@@ -6838,15 +5757,9 @@ def update_bubbleplot_chart_d3(
                     for x_data in chart_data[xAxis_column_name].values.tolist()
                 ]
 
-                chart_json["Y"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[column_name].values.tolist()
-                ]
+                chart_json["Y"] = to_json_list(chart_data[column_name])
 
-                chart_json["Z"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[zAxis_column_name].values.tolist()
-                ]
+                chart_json["Z"] = to_json_list(chart_data[zAxis_column_name])
 
                 if check_aggregation_phrases(chart_axis[f"{column_name}_title"]):
                     chart_json["yName"] = chart_axis[f"{column_name}_title"]
@@ -6895,14 +5808,10 @@ def update_bubbleplot_chart_d3(
                     str(x_data)
                     for x_data in chart_data[xAxis_column_name].values.tolist()
                 ]
-                chart_json[f"Y{yAxis_idx}"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[column_name].values.tolist()
-                ]
-                chart_json[f"Z{yAxis_idx}"] = [
-                    float(val) if isinstance(val, decimal.Decimal) else val
-                    for val in chart_data[zAxis_column_name].values.tolist()
-                ]
+                chart_json[f"Y{yAxis_idx}"] = to_json_list(chart_data[column_name])
+                chart_json[f"Z{yAxis_idx}"] = to_json_list(
+                    chart_data[zAxis_column_name]
+                )
 
                 if check_aggregation_phrases(chart_axis[f"{column_name}_title"]):
                     chart_json[f"y{yAxis_idx}Name"] = chart_axis[f"{column_name}_title"]
@@ -30,6 +30,16 @@ from .token import (
     tokens_count_for_message,
     calculate_token_usage,
 )
+from .chart_data import (
+    build_table_rows,
+    drop_null_axis_rows,
+    format_table_value,
+    format_table_values,
+    pivot_series_columns,
+    sort_by_date_parts,
+    sort_by_unique_keys,
+    to_json_list,
+)
 from .pandas import (
     clean_column_names,
     detect_and_sort_pandas_date,
@@ -77,6 +87,14 @@ __all__ = [
     "detect_and_sort_pandas_date",
     "determine_date_frequency",
     "sort_pandas_date",
+    "build_table_rows",
+    "drop_null_axis_rows",
+    "format_table_value",
+    "format_table_values",
+    "pivot_series_columns",
+    "sort_by_date_parts",
+    "sort_by_unique_keys",
+    "to_json_list",
     "file_to_df",
     "read_dataframe",
     "remove_null_x_axis",
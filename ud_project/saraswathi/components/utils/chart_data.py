@@ -0,0 +1,306 @@
+import datetime
+import decimal
+from typing import Any, Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Inferred dtypes of object columns which cannot hold decimals
+DECIMAL_FREE_INFERRED_DTYPES = [
+    "empty",
+    "string",
+    "bytes",
+    "integer",
+    "floating",
+    "mixed-integer-float",
+    "boolean",
+    "complex",
+    "datetime64",
+    "datetime",
+    "date",
+    "timedelta64",
+    "timedelta",
+    "time",
+    "period",
+    "interval",
+]
+
+
+def to_json_list(column: pd.Series) -> list:
+    """Convert a chart data column to a list of JSON serializable values.
+
+    Same values as converting every `decimal.Decimal` of `column.values.tolist()` to
+    a float. Numerical columns and object columns which cannot hold decimals are
+    returned without looping over the rows in Python.
+
+    Args:
+        column (pd.Series): chart data column
+
+    Returns:
+        list: values of the column, with decimals converted to floats
+    """
+    if column.dtype != object:
+        return column.values.tolist()
+
+    inferred_dtype = pd.api.types.infer_dtype(column, skipna=True)
+
+    if inferred_dtype in DECIMAL_FREE_INFERRED_DTYPES:
+        return column.values.tolist()
+
+    if inferred_dtype == "decimal":
+        try:
+            return list(map(float, column.values))
+        except TypeError:
+            # None values
+            pass
+
+    return [
+        float(val) if isinstance(val, decimal.Decimal) else val
+        for val in column.values.tolist()
+    ]
+
+
+def sort_by_unique_keys(
+    chart_data: pd.DataFrame,
+    column_name: str,
+    key: Callable[[Any], Any],
+) -> pd.DataFrame:
+    """Sort chart data by the key of a column, computing the key once per unique value.
+
+    Same order as `chart_data.sort_values(by=column_name, key=lambda x: x.apply(key))`,
+    rows with equal keys keep their order. Raises the exception of `key` if a value
+    cannot be keyed.
+
+    Args:
+        chart_data (pd.DataFrame): chart data
+        column_name (str): column to sort by
+        key (Callable[[Any], Any]): function returning the sort key of a value
+
+    Returns:
+        pd.DataFrame: sorted chart data
+    """
+    codes, uniques = pd.factorize(chart_data[column_name], use_na_sentinel=False)
+    unique_keys = [key(unique) for unique in uniques]
+
+    unique_ranks = np.empty(len(unique_keys), dtype=np.int64)
+    rank = -1
+    previous_key: Any = None
+    for unique_idx in sorted(range(len(unique_keys)), key=unique_keys.__getitem__):
+        if rank == -1 or unique_keys[unique_idx] != previous_key:
+            rank += 1
+            previous_key = unique_keys[unique_idx]
+        unique_ranks[unique_idx] = rank
+
+    return chart_data.iloc[np.argsort(unique_ranks[codes], kind="stable")]
+
+
+def sort_by_date_parts(chart_data: pd.DataFrame, column_name: str) -> pd.DataFrame:
+    """Sort chart data by the integer parts of "YYYY", "YYYY-MM" or "YYYY-MM-DD" values.
+
+    The number of parts is taken from the first value, other columns are sorted by
+    value.
+
+    Args:
+        chart_data (pd.DataFrame): chart data
+        column_name (str): column to sort by
+
+    Returns:
+        pd.DataFrame: sorted chart data
+    """
+    try:
+        n_parts = len(chart_data[column_name][0].split("-"))
+
+        if n_parts not in [1, 2, 3]:
+            return chart_data.sort_values(by=column_name, ascending=True)
+
+        def date_parts(date: str) -> tuple:
+            parts = date.split("-")
+            return tuple(int(parts[part_idx]) for part_idx in range(n_parts))
+
+        return sort_by_unique_keys(chart_data, column_name, date_parts)
+    except Exception:
+        return chart_data.sort_values(by=column_name, ascending=True)
+
+
+def pivot_series_columns(
+    chart_data: pd.DataFrame,
+    xAxis_column_name: str,
+    series_column_name: str,
+    yAxis_column_names: List[str],
+    convert_xAxis_decimal: bool = True,
+) -> pd.DataFrame:
+    """Pivot the series of the chart data into one column per Y-Axis and series.
+
+    The pivoted columns are named `{yAxis_column_name}_{series}`, missing numerical
+    values are filled with 0 and other missing values with "null".
+
+    Args:
+        chart_data (pd.DataFrame): chart data
+        xAxis_column_name (str): X-Axis column, the index of the pivot
+        series_column_name (str): series column
+        yAxis_column_names (List[str]): Y-Axis columns to pivot
+        convert_xAxis_decimal (bool, optional): convert decimal X-Axis values to
+            floats. Defaults to True.
+
+    Returns:
+        pd.DataFrame: pivoted chart data
+    """
+    pivot_data = chart_data.pivot_table(
+        index=xAxis_column_name,
+        columns=series_column_name,
+        values=yAxis_column_names,
+    )
+    pivot_data = pivot_data.reset_index()
+
+    new_chart_columns = [
+        pd.Series(
+            to_json_list(pivot_data[xAxis_column_name])
+            if convert_xAxis_decimal
+            else pivot_data[xAxis_column_name].values.tolist(),
+            name=xAxis_column_name,
+        )
+    ]
+
+    for yAxis_column_name in yAxis_column_names:
+        yAxis_pivot_table = pivot_data[yAxis_column_name]
+        for yAxis_pivot_column in list(yAxis_pivot_table.columns):
+            pivot_column = yAxis_pivot_table[yAxis_pivot_column]
+            new_column_name = f"{yAxis_column_name}_{yAxis_pivot_column}"
+
+            # float64/int64 columns keep their dtype through a list, skip the list
+            if pivot_column.dtype in [np.float64, np.int64]:
+                new_chart_columns.append(
+                    pivot_column.reset_index(drop=True).rename(new_column_name)
+                )
+            else:
+                new_chart_columns.append(
+                    pd.Series(to_json_list(pivot_column), name=new_column_name)
+                )
+
+    new_chart_data = pd.concat(new_chart_columns, axis=1)
+
+    return new_chart_data.fillna(
+        {
+            col: (0 if new_chart_data[col].dtype in [np.float64, np.int64] else "null")
+            for col in new_chart_data.columns
+        },
+    )
+
+
+def drop_null_axis_rows(
+    chart_data: pd.DataFrame,
+    chart_axis: dict,
+    axis_name: str,
+) -> pd.DataFrame:
+    """Drop the rows of the chart data with a null value in an axis column, in place.
+
+    The axis column is the `axis_name` column (e.g. "xAxis" or "series") if the
+    chart data has one, else the `{axis_name}_column` column of the chart axis.
+
+    Args:
+        chart_data (pd.DataFrame): chart data
+        chart_axis (dict): chart axis, with the `{axis_name}_column` column name
+        axis_name (str): axis of the column, e.g. "xAxis" or "series"
+
+    Returns:
+        pd.DataFrame: chart data without null axis values
+    """
+    axis_column_key = f"{axis_name}_column"
+
+    if axis_name in chart_data.columns:
+        chart_data.dropna(subset=[axis_name], inplace=True)
+    elif (
+        axis_column_key in chart_axis
+        and isinstance(chart_axis[axis_column_key], str)
+        and chart_axis[axis_column_key] in chart_data.columns
+    ):
+        chart_data.dropna(subset=[chart_axis[axis_column_key]], inplace=True)
+
+    return chart_data
+
+
+def format_table_value(value: Any, decimals: Optional[int] = 6) -> Any:
+    """Format a table chart cell.
+
+    Integers are kept, floats and decimals are rounded to `decimals` decimal
+    places (floats kept and decimals converted to floats if None), non-null dates
+    are formatted as "MM/DD/YYYY" and other values, nulls included, are converted
+    to strings.
+
+    Args:
+        value (Any): cell value
+        decimals (Optional[int], optional): decimal places of the numbers.
+            Defaults to 6.
+
+    Returns:
+        Any: formatted value
+    """
+    try:
+        if isinstance(value, int):
+            return value
+        if isinstance(value, float):
+            return value if decimals is None else round(value, decimals)
+        if isinstance(value, decimal.Decimal):
+            return float(value) if decimals is None else round(float(value), decimals)
+        if isinstance(value, (datetime.date, datetime.datetime)) and not pd.isnull(
+            value
+        ):
+            return value.strftime("%m/%d/%Y")
+        return str(value)
+    except Exception:
+        return str(value)
+
+
+def format_table_values(values: np.ndarray, decimals: Optional[int] = 6) -> list:
+    """Format the cells of a table chart column with `format_table_value`.
+
+    Integer and boolean columns are returned as they are, float columns are only
+    rounded, without checking the type of every value.
+
+    Args:
+        values (np.ndarray): column of `chart_data.values`, so that the values have
+            the types of the cells of `chart_data.values.tolist()`
+        decimals (Optional[int], optional): decimal places of the numbers.
+            Defaults to 6.
+
+    Returns:
+        list: formatted values
+    """
+    if values.dtype.kind in "iub":
+        return values.tolist()
+
+    if values.dtype.kind == "f":
+        if decimals is None:
+            return values.tolist()
+        return [round(value, decimals) for value in values.tolist()]
+
+    return [format_table_value(value, decimals) for value in values.tolist()]
+
+
+def build_table_rows(
+    chart_data: pd.DataFrame,
+    table_column_names: List[str],
+    decimals: Optional[int] = 6,
+) -> List[dict]:
+    """Build the rows of a table chart, formatting the chart data column by column.
+
+    Args:
+        chart_data (pd.DataFrame): chart data
+        table_column_names (List[str]): display names of the first columns of the
+            chart data, one per column
+        decimals (Optional[int], optional): decimal places of the numbers.
+            Defaults to 6.
+
+    Returns:
+        List[dict]: one dict per row, from display name to formatted value
+    """
+    if not table_column_names:
+        return [{} for _ in range(len(chart_data))]
+
+    values = chart_data.values
+    table_columns = [
+        format_table_values(values[:, column_idx], decimals)
+        for column_idx in range(len(table_column_names))
+    ]
+
+    return [dict(zip(table_column_names, row)) for row in zip(*table_columns)]
@@ -3,6 +3,8 @@ import re
 
 import pandas as pd
 
+from .chart_data import drop_null_axis_rows, sort_by_unique_keys
+
 logger = logging.getLogger("saraswati-agent")
 
 
@@ -23,32 +25,14 @@ def remove_null_x_axis(
     :return: The function `remove_null_x_axis` is returning the modified `chart_data` DataFrame after
     removing any rows where the x-axis values are null or missing.
     """
-    if "xAxis" in chart_data.columns:
-        chart_data.dropna(subset=["xAxis"], inplace=True)
-    elif (
-        "xAxis_column" in chart_axis
-        and isinstance(chart_axis["xAxis_column"], str)
-        and chart_axis["xAxis_column"] in chart_data.columns
-    ):
-        chart_data.dropna(subset=[chart_axis["xAxis_column"]], inplace=True)
-
-    return chart_data
+    return drop_null_axis_rows(chart_data, chart_axis, "xAxis")
 
 
 def remove_null_series(
     chart_data: pd.DataFrame,
     chart_axis: dict,
 ) -> pd.DataFrame:
-    if "series" in chart_data.columns:
-        chart_data.dropna(subset=["xAxis"], inplace=True)
-    elif (
-        "series_column" in chart_axis
-        and isinstance(chart_axis["series_column"], str)
-        and chart_axis["series_column"] in chart_data.columns
-    ):
-        chart_data.dropna(subset=[chart_axis["series_column"]], inplace=True)
-
-    return chart_data
+    return drop_null_axis_rows(chart_data, chart_axis, "series")
 
 
 def determine_date_frequency(date_series: pd.Series):
@@ -108,7 +92,7 @@ def sort_pandas_date(df: pd.DataFrame, date_column_name: str) -> pd.DataFrame:
         return (0, 0, 0)
 
     try:
-        df = df.sort_values(by=date_column_name, key=lambda x: x.apply(parse_date))
+        df = sort_by_unique_keys(df, date_column_name, parse_date)
     except Exception:
         pass
 
@@ -150,7 +134,7 @@ def detect_and_sort_pandas_date(df: pd.DataFrame, date_column_name: str) -> tupl
         raise RuntimeError("Not Date!")
 
     try:
-        df = df.sort_values(by=date_column_name, key=lambda x: x.apply(parse_date))
+        df = sort_by_unique_keys(df, date_column_name, parse_date)
         return df, True  # Return the sorted DataFrame and True if sorting is successful
     except Exception:
         return df, False  # Return the original DataFrame and False if sorting fails
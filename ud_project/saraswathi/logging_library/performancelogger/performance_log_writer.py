@@ -0,0 +1,182 @@
+"""Module to write performance logs to the application database"""
+
+import atexit
+import os
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+
+from .performance_log_dto import PerformanceLog
+from ..configuration.configuration_manager import ConfigurationManager
+
+# "sync" writes every log when the block starts and ends, "async" buffers complete
+# logs and bulk-inserts them from a background thread, "disabled" skips logging
+PERFORMANCE_LOG_MODES = ("sync", "async", "disabled")
+
+
+class PerformanceLogWriter:
+    """Process-wide writer of performance logs.
+
+    In async mode complete log rows are kept in a bounded ring buffer and a daemon
+    thread bulk-inserts them every `flush_interval` seconds, or as soon as
+    `batch_size` rows are buffered. When the buffer is full the oldest rows are
+    dropped and counted, so logging never blocks the request path.
+    """
+
+    def __init__(
+        self,
+        mode: str = "sync",
+        buffer_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 2.0,
+    ):
+        if mode not in PERFORMANCE_LOG_MODES:
+            raise ValueError(
+                f"Performance log mode must be one of {PERFORMANCE_LOG_MODES}, got {mode}"
+            )
+        if buffer_size <= 0 or batch_size <= 0:
+            raise ValueError("buffer_size and batch_size must be positive integers")
+
+        self.mode = mode
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._engine: Optional[Engine] = None
+        self._engine_lock = threading.Lock()
+
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+        self.written: int = 0
+        self.dropped: int = 0
+        self.failed: int = 0
+        self.flushes: int = 0
+
+    @property
+    def engine(self) -> Engine:
+        """Shared engine of the application database, created on first use."""
+        if self._engine is None:
+            with self._engine_lock:
+                if self._engine is None:
+                    db_configuration = ConfigurationManager.database_configurations[
+                        "application_database"
+                    ]
+                    self._engine = create_engine(
+                        db_configuration.get_connection_string(),
+                        pool_pre_ping=True,
+                        pool_recycle=1800,
+                    )
+
+        return self._engine
+
+    def submit(self, performance_log: Dict[str, Any]) -> None:
+        """Buffer a complete performance log row to be bulk-inserted."""
+        with self._buffer_lock:
+            if len(self._buffer) >= self.buffer_size:
+                self._buffer.popleft()
+                self.dropped += 1
+
+            self._buffer.append(performance_log)
+            buffered = len(self._buffer)
+
+        self._start_flusher()
+
+        if buffered >= self.batch_size:
+            self._wakeup.set()
+
+    def _start_flusher(self) -> None:
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+
+        with self._engine_lock:
+            if self._flusher is None or not self._flusher.is_alive():
+                self._stopped.clear()
+                self._flusher = threading.Thread(
+                    target=self._run_flusher,
+                    name="performance-log-flusher",
+                    daemon=True,
+                )
+                self._flusher.start()
+
+    def _run_flusher(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self) -> int:
+        """Bulk-insert every buffered performance log.
+
+        Returns:
+            int: number of written performance logs
+        """
+        written = 0
+
+        with self._flush_lock:
+            while True:
+                with self._buffer_lock:
+                    batch: List[Dict[str, Any]] = [
+                        self._buffer.popleft()
+                        for _ in range(min(self.batch_size, len(self._buffer)))
+                    ]
+
+                if not batch:
+                    break
+
+                try:
+                    with self.engine.begin() as connection:
+                        connection.execute(insert(PerformanceLog), batch)
+                except Exception as e:
+                    self.failed += len(batch)
+                    print(f"Performance Log Flush Error: {e}")
+                    break
+
+                written += len(batch)
+                self.written += len(batch)
+                self.flushes += 1
+
+        return written
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the background flusher and write the remaining performance logs."""
+        self._stopped.set()
+        self._wakeup.set()
+
+        if self._flusher is not None:
+            self._flusher.join(timeout)
+            self._flusher = None
+
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the buffer size and the written/dropped counters."""
+        with self._buffer_lock:
+            buffered = len(self._buffer)
+
+        return {
+            "mode": self.mode,
+            "buffered": buffered,
+            "buffer_size": self.buffer_size,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "flushes": self.flushes,
+        }
+
+
+performance_log_writer = PerformanceLogWriter(
+    mode=os.getenv("PERFORMANCE_LOG_MODE", "sync").lower(),
+    buffer_size=int(os.getenv("PERFORMANCE_LOG_BUFFER_SIZE", "10000")),
+    batch_size=int(os.getenv("PERFORMANCE_LOG_BATCH_SIZE", "500")),
+    flush_interval=float(os.getenv("PERFORMANCE_LOG_FLUSH_INTERVAL", "2.0")),
+)
+
+atexit.register(performance_log_writer.shutdown)
@@ -2,13 +2,13 @@
 
 from typing import Optional, Union
 import functools
-import inspect
+import sys
 from datetime import datetime
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import Session
 
 from .performance_log_dto import PerformanceLog
+from .performance_log_writer import performance_log_writer
 from ..configuration.configuration_manager import ConfigurationManager
 
 
@@ -21,26 +21,26 @@ class PerformanceLogger:
 
     def __init__(self, session_id: Optional[str] = None):
         self.session_id = session_id
-
-        stack = inspect.stack()
-        self.caller_function = stack[1].function  # The function that called __enter__
-        self.caller_module = stack[
-            1
-        ].filename  # The file from where the function is called
+        self.mode = performance_log_writer.mode
+
+        if self.mode == "disabled":
+            return
+
+        # Only the caller frame is needed, inspect.stack() would read the source
+        # context of every frame in the stack
+        frame = sys._getframe(1)
+        # The function that called __enter__
+        self.caller_function = frame.f_code.co_name
+        self.caller_module = (
+            frame.f_code.co_filename
+        )  # The file from where the function is called
         self.caller_class = None
 
         self.service_name = ConfigurationManager.app_settings["service_name"]
 
         # If it's a class method, we can retrieve the class name
-        if "self" in stack[1].frame.f_locals:
-            self.caller_class = stack[1].frame.f_locals["self"].__class__.__name__
-
-        self.__db_configuration__ = ConfigurationManager.database_configurations[
-            "application_database"
-        ]
-        engine = create_engine(self.__db_configuration__.get_connection_string())
-
-        self.db_session: Session = sessionmaker(bind=engine)()
+        if "self" in frame.f_code.co_varnames and "self" in frame.f_locals:
+            self.caller_class = frame.f_locals["self"].__class__.__name__
 
     def log_performance(self, func):
         """method to be used as a decorator on functions which require logging"""
@@ -55,14 +55,38 @@ class PerformanceLogger:
         return wrapper
 
     def __enter__(self):
+        if self.mode == "disabled":
+            return
+
         self.__start_time__ = datetime.now()
-        self.__log_start_time__()
+        if self.mode == "sync":
+            self.__log_start_time__()
 
     def __exit__(self, exc_type, exc_value, traceback):
+        if self.mode == "disabled":
+            return
+
         self.__end_time__ = datetime.now()
-        self.__log_end_time__()
+        if self.mode == "sync":
+            self.__log_end_time__()
+        else:
+            performance_log_writer.submit(
+                {
+                    "session_id": self.session_id,
+                    "function_name": self.caller_function,
+                    "class_name": self.caller_class,
+                    "module_name": self.caller_module,
+                    "start_time": self.__start_time__,
+                    "end_time": self.__end_time__,
+                    "duration": (
+                        self.__end_time__ - self.__start_time__
+                    ).total_seconds(),
+                    "service_name": self.service_name,
+                }
+            )
 
     def __log_start_time__(self):
+        self.db_session = Session(bind=performance_log_writer.engine)
         self.__performance_log__ = PerformanceLog(
             session_id=self.session_id,
             function_name=self.caller_function,
@@ -85,3 +109,4 @@ class PerformanceLogger:
         # Commit the update to the database
         if self.db_session:
             self.db_session.commit()  # Commit the update transaction
+            self.db_session.close()
@@ -18,16 +18,24 @@ from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
+from components.executor import dispose_connection_pools
+from logging_library.performancelogger.performance_log_writer import (
+    performance_log_writer,
+)
 from modules.api_logging_and_modules.log_api import router as log_api_router
 from modules.api_logging_and_modules.log_api_modules import (
     setup_modules as api_logging_setup_modules,
 )
-from modules.chart_feedback.chart_feedback import router as chart_feedback_router
+from modules.chart_feedback.chart_feedback import (
+    close_feedback_clients,
+    router as chart_feedback_router,
+)
 from modules.chart_feedback.chart_feedback_modules import (
     setup_modules as chart_feedback_setup_modules,
 )
 from modules.query_generator_executor import router as query_generator_executor_router
 from modules.chart import router as chart_router
+from modules.summary_cache import router as summary_cache_router
 
 warnings.filterwarnings(
     "ignore",
@@ -46,6 +54,9 @@ async def lifespan(app: FastAPI):
     api_logging_setup_modules()
     chart_feedback_setup_modules()
     yield
+    performance_log_writer.shutdown()
+    close_feedback_clients()
+    dispose_connection_pools()
 
 
 TAGS_METADATA: List[dict] = [
@@ -65,6 +76,10 @@ TAGS_METADATA: List[dict] = [
         "name": "SQL",
         "description": "Facilitates dynamic SQL query generation and execution for data analysis and visualization.",
     },
+    {
+        "name": "Cache",
+        "description": "Inspects and invalidates the cached table summaries used for chart generation.",
+    },
 ]
 
 
@@ -96,6 +111,7 @@ app.include_router(log_api_router, prefix="/log", tags=["Log"])
 app.include_router(chart_feedback_router, prefix="/feedback", tags=["Feedback"])
 app.include_router(query_generator_executor_router, prefix="/sql", tags=["SQL"])
 app.include_router(chart_router, prefix="", tags=["Chart"])
+app.include_router(summary_cache_router, prefix="/cache", tags=["Cache"])
 
 
 @app.get("/healthz", response_class=JSONResponse)
@@ -1,11 +1,13 @@
 import ast
 import json
+import os
 import random
 import requests
 import time
 import traceback
 import logging
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from fastapi import APIRouter, Body
 from fastapi.responses import StreamingResponse, Response, JSONResponse
@@ -86,6 +88,8 @@ code_level_logger_name: str = get_env_variable(
     "CODE_LEVEL_LOGGER_NAME", "CODE LEVEL LOGGER NAME is not provided!"
 )
 
+chart_generation_max_workers: int = int(os.getenv("CHART_GENERATION_MAX_WORKERS", "3"))
+
 llama70b_client = OpenAI(
     base_url=mixtral_8x7b_llm_url, api_key=mixtral_8x7b_llm_api_key
 )
@@ -600,6 +604,141 @@ def generate_beautiful_table(
     return chart_json
 
 
+def generate_UPS_SSE_d3(
+    user_query: str,
+    main_questions: List[dict],
+    data_summary: DataSummary,
+    user_dimensions: dict,
+    user_aggregations: list,
+    client_id: str,
+    user_id: str,
+    database_name: str,
+    table_name: str,
+    preprocessing_inference_time: float,
+    logging_url: str,
+    session_id: str,
+    code_level_logger: logging.Logger,
+):
+    """Generate the visual of every story question and stream each one as an SSE result.
+
+    The per-question pipelines run concurrently on a thread pool bounded by
+    `CHART_GENERATION_MAX_WORKERS` (1 runs them one at a time). Finished visuals are
+    released in question order, as soon as every earlier question is done, so the
+    visual numbering, the duplicate chart data check and the 6 visual cap stay the
+    same as in a sequential run. Questions not started once the cap is reached are
+    cancelled.
+
+    :return: the last streamed UPS result, returned through `yield from`.
+    """
+    UPS_chart_data_history: list = []
+    Last_UPS: list = []
+    visual_idx: int = 1
+
+    def generate_single_up(ups_idx: int, story_question: dict):
+        start_single_up = perf_counter()
+        result = generate_single_up_SSE_d3(
+            user_query,
+            story_question,
+            data_summary,
+            user_dimensions,
+            user_aggregations,
+            data_summary.database_properties,
+            ups_idx,
+            client_id,
+            user_id,
+            database_name,
+            table_name,
+            logging_url,
+            session_id,
+            code_level_logger,
+        )
+        return result, perf_counter() - start_single_up
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, chart_generation_max_workers),
+        thread_name_prefix=f"saraswati-{session_id}",
+    )
+
+    try:
+        futures = [
+            executor.submit(generate_single_up, ups_idx, story_question.copy())
+            for ups_idx, story_question in enumerate(main_questions, start=1)
+        ]
+
+        for story_question, future in zip(main_questions, futures):
+            chart_id = story_question["chart_id"]
+            try:
+                result, single_up_inference_time = future.result()
+
+                if result != []:
+                    # Arrange and clean up the result before adding to UPS_chart_data_history
+                    arranged_result = []
+                    for result_dict in result:
+                        edited_result_dict = result_dict.copy()
+                        edited_result_dict["Chart_Name"] = f"Visual {visual_idx}"
+                        if "Aggregated_Table_JSON" in edited_result_dict.keys():
+                            edited_result_dict["Aggregated_Table_JSON"][
+                                "Chart_Name"
+                            ] = f"Visual {visual_idx}"
+
+                        arranged_result.append(edited_result_dict)
+
+                    cleaned_result = remove_unused_keys_UPS(arranged_result)
+
+                    # Drop Visual if it has duplicate chart data
+                    for cleaned_result_data in cleaned_result:
+                        if (
+                            "Chart_Data" in cleaned_result_data.keys()
+                            and cleaned_result_data["Chart_Data"]
+                            in UPS_chart_data_history
+                        ):
+                            continue
+
+                    # Add Chart Data to UPS history for duplicate charts removal
+                    for cleaned_result_data in cleaned_result:
+                        if "Chart_Data" in cleaned_result_data.keys():
+                            UPS_chart_data_history.append(
+                                cleaned_result_data["Chart_Data"]
+                            )
+
+                    # Set latest result to Last UPS
+                    Last_UPS = cleaned_result
+
+                    # Stream the cleaned result immediately as a JSON object with a message.
+                    data = {
+                        "type": "result",
+                        "message": f"Result {visual_idx}",
+                        "result": cleaned_result,
+                    }
+                    yield json.dumps({"data": data}) + "\r\n"
+
+                    visual_idx += 1
+                    single_up_total_inference_time = (
+                        single_up_inference_time + preprocessing_inference_time
+                    )
+
+                    logging_url_chart = logging_url + "chart"
+                    log_entry_data = {
+                        "chart_id": chart_id,
+                        "total_inference_time": single_up_total_inference_time,
+                        "status": "Success",
+                    }
+                    requests.post(
+                        logging_url_chart, json=log_entry_data, verify=False
+                    ).json()
+            except Exception:
+                # Handle exceptions and continue processing other callbacks.
+                print(traceback.format_exc())
+                continue
+            if visual_idx >= 7:
+                break
+    finally:
+        # Skip the remaining questions once the cap is reached or the client is gone
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return Last_UPS
+
+
 def GraphUpsSummary_SSE_d3(
     user_query: str,
     database_identifier: str,
@@ -696,111 +835,27 @@ def GraphUpsSummary_SSE_d3(
     # }
     # yield json.dumps({"data": data}) + "\r\n"
 
-    UPS_chart_data_history: list = []
-    Last_UPS: list = []
-    visual_idx: int = 1
-
     data = {
         "type": "info",
         "message": random.choice(START_CHART_GENERATION_MESSAGE_TEMPLATES),
     }
     yield json.dumps({"data": data}) + "\r\n"
 
-    for ups_idx, story_question in enumerate(
+    Last_UPS: list = yield from generate_UPS_SSE_d3(
+        user_query,
         story_narrative_question.main_questions,
-        start=1,
-    ):
-        chart_id = story_question["chart_id"]
-        start_single_up = perf_counter()
-        try:
-            result = generate_single_up_SSE_d3(
-                user_query,
-                story_question.copy(),
-                data_summary,
-                user_dimensions,
-                user_aggregations,
-                data_summary.database_properties,
-                ups_idx,
-                client_id,
-                user_id,
-                database_name,
-                table_name,
-                logging_url,
-                session_id,
-                code_level_logger,
-            )
-
-            if result != []:
-                # Arrange and clean up the result before adding to UPS_chart_data_history
-                arranged_result = []
-                for result_dict in result:
-                    edited_result_dict = result_dict.copy()
-                    edited_result_dict["Chart_Name"] = f"Visual {visual_idx}"
-                    if "Aggregated_Table_JSON" in edited_result_dict.keys():
-                        edited_result_dict["Aggregated_Table_JSON"]["Chart_Name"] = (
-                            f"Visual {visual_idx}"
-                        )
-
-                    arranged_result.append(edited_result_dict)
-
-                cleaned_result = remove_unused_keys_UPS(arranged_result)
-
-                # Drop Visual if it has duplicate chart data
-                for cleaned_result_data in cleaned_result:
-                    if (
-                        "Chart_Data" in cleaned_result_data.keys()
-                        and cleaned_result_data["Chart_Data"] in UPS_chart_data_history
-                    ):
-                        continue
-
-                # Add Chart Data to UPS history for duplicate charts removal
-                for cleaned_result_data in cleaned_result:
-                    if "Chart_Data" in cleaned_result_data.keys():
-                        UPS_chart_data_history.append(cleaned_result_data["Chart_Data"])
-
-                # Set latest result to Last UPS
-                Last_UPS = cleaned_result
-
-                # Stream the cleaned result immediately as a JSON object with a message.
-                data = {
-                    "type": "result",
-                    "message": f"Result {visual_idx}",
-                    "result": cleaned_result,
-                }
-                yield json.dumps({"data": data}) + "\r\n"
-
-                # data = {
-                #     "type": "info",
-                #     "message": random.choice(CHART_GENERATION_MESSAGE_TEMPLATES).format(
-                #         visual_idx=visual_idx
-                #     ),
-                # }
-                # yield json.dumps({"data": data}) + "\r\n"
-
-                visual_idx += 1
-                single_up_inference_time = perf_counter() - start_single_up
-                single_up_total_inference_time = (
-                    single_up_inference_time
-                    + narrative_inference_time
-                    + summary_inference_time
-                )
-
-                logging_url_chart = logging_url + "chart"
-                log_entry_data = {
-                    "chart_id": chart_id,
-                    "total_inference_time": single_up_total_inference_time,
-                    "status": "Success",
-                }
-                requests.post(
-                    logging_url_chart, json=log_entry_data, verify=False
-                ).json()
-        except Exception:
-            # Handle exceptions and continue processing other callbacks.
-            print(traceback.format_exc())
-            # logger.error(traceback.format_exc())
-            continue
-        if visual_idx >= 7:
-            break
+        data_summary,
+        user_dimensions,
+        user_aggregations,
+        client_id,
+        user_id,
+        database_name,
+        table_name,
+        narrative_inference_time + summary_inference_time,
+        logging_url,
+        session_id,
+        code_level_logger,
+    )
 
     # data = {
     #     "type": "info",
@@ -914,112 +969,27 @@ def GraphUpsSummary_SSE_Joined_Table_d3(
     # }
     # yield json.dumps({"data": data}) + "\r\n"
 
-    UPS_chart_data_history: list = []
-    Last_UPS: list = []
-    visual_idx: int = 1
-
     data = {
         "type": "info",
         "message": random.choice(START_CHART_GENERATION_MESSAGE_TEMPLATES),
     }
     yield json.dumps({"data": data}) + "\r\n"
 
-    for ups_idx, story_question in enumerate(
+    Last_UPS: list = yield from generate_UPS_SSE_d3(
+        user_query,
         story_narrative_question.main_questions,
-        start=1,
-    ):
-        chart_id = story_question["chart_id"]
-        start_single_up = perf_counter()
-        try:
-            result = generate_single_up_SSE_d3(
-                user_query,
-                story_question.copy(),
-                data_summary,
-                user_dimensions,
-                user_aggregations,
-                data_summary.database_properties,
-                ups_idx,
-                client_id,
-                user_id,
-                database_name,
-                table_name,
-                logging_url,
-                session_id,
-                code_level_logger,
-            )
-
-            if result != []:
-                # Arrange and clean up the result before adding to UPS_chart_data_history
-                arranged_result = []
-                for result_dict in result:
-                    edited_result_dict = result_dict.copy()
-                    edited_result_dict["Chart_Name"] = f"Visual {visual_idx}"
-                    if "Aggregated_Table_JSON" in edited_result_dict.keys():
-                        edited_result_dict["Aggregated_Table_JSON"]["Chart_Name"] = (
-                            f"Visual {visual_idx}"
-                        )
-
-                    arranged_result.append(edited_result_dict)
-
-                cleaned_result = remove_unused_keys_UPS(arranged_result)
-
-                # Drop Visual if it has duplicate chart data
-                for cleaned_result_data in cleaned_result:
-                    if (
-                        "Chart_Data" in cleaned_result_data.keys()
-                        and cleaned_result_data["Chart_Data"] in UPS_chart_data_history
-                    ):
-                        continue
-
-                # Add Chart Data to UPS history for duplicate charts removal
-                for cleaned_result_data in cleaned_result:
-                    if "Chart_Data" in cleaned_result_data.keys():
-                        UPS_chart_data_history.append(cleaned_result_data["Chart_Data"])
-
-                # Set latest result to Last UPS
-                Last_UPS = cleaned_result
-
-                # Stream the cleaned result immediately as a JSON object with a message.
-                data = {
-                    "type": "result",
-                    "message": f"Result {visual_idx}",
-                    "result": cleaned_result,
-                }
-                yield json.dumps({"data": data}) + "\r\n"
-
-                # data = {
-                #     "type": "info",
-                #     "message": random.choice(CHART_GENERATION_MESSAGE_TEMPLATES).format(
-                #         visual_idx=visual_idx
-                #     ),
-                # }
-                # yield json.dumps({"data": data}) + "\r\n"
-
-                visual_idx += 1
-                single_up_inference_time = perf_counter() - start_single_up
-                single_up_total_inference_time = (
-                    single_up_inference_time
-                    + narrative_inference_time
-                    + summary_inference_time
-                )
-
-                logging_url_chart = logging_url + "chart"
-                log_entry_data = {
-                    "chart_id": chart_id,
-                    "total_inference_time": single_up_total_inference_time,
-                    "status": "Success",
-                }
-                requests.post(
-                    logging_url_chart, json=log_entry_data, verify=False
-                ).json()
-
-        except Exception:
-            # Handle exceptions and continue processing other callbacks.
-            print(traceback.format_exc())
-            # logger.error(traceback.format_exc())
-            continue
-        if visual_idx >= 7:
-            break
+        data_summary,
+        user_dimensions,
+        user_aggregations,
+        client_id,
+        user_id,
+        database_name,
+        table_name,
+        narrative_inference_time + summary_inference_time,
+        logging_url,
+        session_id,
+        code_level_logger,
+    )
 
     # data = {
     #     "type": "info",
@@ -1,9 +1,11 @@
 import json
 import requests
-import ast
+import threading
 import traceback
 import os
 
+import numpy as np
+
 from fastapi.responses import JSONResponse
 from fastapi import Body
 from fastapi import Response, APIRouter
@@ -12,6 +14,8 @@ from qdrant_client import QdrantClient
 from pymongo import MongoClient
 from dotenv import load_dotenv
 from datetime import datetime
+from typing import Dict, List, Optional
+from components.sql_cache import generated_sql_cache
 
 load_dotenv()
 
@@ -61,9 +65,104 @@ if qdrant_host == "":
 if qdrant_api_key == "":
     raise ValueError("Qdrant api key is not valid!")
 
+feedback_qdrant_user_query_collection: str = os.getenv(
+    "FEEDBACK_QDRANT_USER_QUERY_COLLECTION", ""
+)
+
+if feedback_qdrant_user_query_collection == "":
+    raise ValueError("Feedback Qdrant user query collection is not valid!")
+
+feedback_qdrant_question_collection: str = os.getenv(
+    "FEEDBACK_QDRANT_QUESTION_COLLECTION", ""
+)
+
+if feedback_qdrant_question_collection == "":
+    raise ValueError("Feedback Qdrant question collection is not valid!")
+
 # Initialize feedback form template path
 feedback_form_file_path: str = str(Path(__file__).parent / "feedback_template.json")
 
+# Timeout of the embedding requests in seconds
+embedding_timeout: float = float(os.getenv("EMBEDDING_TIMEOUT", "30"))
+
+# Process-lifetime clients shared by the feedback searches
+embedding_session = requests.Session()
+
+_feedback_clients_lock = threading.Lock()
+_mongo_db_client: Optional[MongoClient] = None
+_qdrant_db_client: Optional[QdrantClient] = None
+
+
+def get_mongo_db_client() -> MongoClient:
+    """Get the MongoDB client shared by the feedback searches"""
+    global _mongo_db_client
+
+    if _mongo_db_client is None:
+        with _feedback_clients_lock:
+            if _mongo_db_client is None:
+                _mongo_db_client = MongoClient(mongodb_url)
+
+    return _mongo_db_client
+
+
+def get_qdrant_db_client() -> QdrantClient:
+    """Get the Qdrant client shared by the feedback searches"""
+    global _qdrant_db_client
+
+    if _qdrant_db_client is None:
+        with _feedback_clients_lock:
+            if _qdrant_db_client is None:
+                _qdrant_db_client = QdrantClient(
+                    url=qdrant_host, api_key=qdrant_api_key
+                )
+
+    return _qdrant_db_client
+
+
+def close_feedback_clients() -> None:
+    """Close the clients shared by the feedback searches"""
+    global _mongo_db_client, _qdrant_db_client
+
+    with _feedback_clients_lock:
+        if _mongo_db_client is not None:
+            _mongo_db_client.close()
+            _mongo_db_client = None
+
+        if _qdrant_db_client is not None:
+            _qdrant_db_client.close()
+            _qdrant_db_client = None
+
+    embedding_session.close()
+
+
+def decode_embedding(response: requests.Response) -> List[float]:
+    """Decode the embedding vector returned by the embedding service.
+
+    Args:
+        response (requests.Response): response of the embedding service, either a
+            JSON list or little-endian float32 bytes (`application/octet-stream`)
+
+    Returns:
+        List[float]: embedding vector
+    """
+    if response.headers.get("Content-Type", "").startswith("application/octet-stream"):
+        return np.frombuffer(response.content, dtype="<f4").tolist()
+
+    return json.loads(response.content)
+
+
+def get_embedding(text: str) -> List[float]:
+    """Embed the text with the embedding service"""
+    response = embedding_session.get(
+        embedding_url,
+        params={"promt": text, "model_name": os.getenv("EMBEDDING_MODEL_NAME")},
+        verify=False,
+        timeout=embedding_timeout,
+    )
+    response.raise_for_status()
+
+    return decode_embedding(response)
+
 
 def load_feedback_template():
     # Loading the Feedback Json Template
@@ -143,6 +242,10 @@ def _save_feedback(chart_feedback: dict) -> None:
             upsert=True,
         )
 
+        # Stop serving the cached SQL query of a chart marked as bad
+        if like == "False":
+            generated_sql_cache.invalidate_chart(chart_id)
+
     except Exception as e:
         print("\n=================================================")
         print(f"Feedback Save Error: MongoDB Upsertion Error {e}")
@@ -167,27 +270,15 @@ def _save_feedback(chart_feedback: dict) -> None:
     user_query = result.get("user_query")
     question = result.get("question")
 
-    embed_user_query = requests.get(
-        embedding_url,
-        params={"promt": user_query, "model_name": os.getenv("EMBEDDING_MODEL_NAME")},
-        verify=False,
-    )
-
-    embedded_user_query = ast.literal_eval(embed_user_query.content.decode("utf-8"))
-
-    embed_question = requests.get(
-        embedding_url,
-        params={"promt": question, "model_name": os.getenv("EMBEDDING_MODEL_NAME")},
-        verify=False,
-    )
-    embedded_question = ast.literal_eval(embed_question.content.decode("utf-8"))
+    embedded_user_query = get_embedding(user_query)
+    embedded_question = get_embedding(question)
 
     # Define payload
     payload = {"chart_id": chart_id}
 
     # Define Qdrant collection names
-    qdrant_user_query_collection = os.getenv("FEEDBACK_QDRANT_USER_QUERY_COLLECTION")
-    qdrant_question_collection = os.getenv("FEEDBACK_QDRANT_QUESTION_COLLECTION")
+    qdrant_user_query_collection = feedback_qdrant_user_query_collection
+    qdrant_question_collection = feedback_qdrant_question_collection
 
     try:
         # Ensure Qdrant collections exist
@@ -277,187 +368,122 @@ def process_chart(input_dict: dict):
     return output_dict
 
 
-# Get the charts from the DB
-def get_chart_feedback_mongodb(chart_id: str):
-    # Connect to MongoDB server
-    mongo_db_client = MongoClient(mongodb_url)
+def get_chart_feedbacks_mongodb(chart_ids: List[str]) -> Dict[str, dict]:
+    """Get the charts and their feedbacks with one `$in` query per collection.
 
-    # OPEN Connection : Access a specific database in MONGODB
-    feedback_mongo_db = mongo_db_client[feedback_mongodb_database]
-    chart_logging_mongo_db = mongo_db_client[chart_logging_mongodb_database]
-
-    # Query chart feedback MongoDB collection for user query
-    # check if collection exists
-    if feedback_mongodb_collection not in feedback_mongo_db.list_collection_names():
-        print(f"Mongo DB collection, {feedback_mongodb_collection} not found")
-    else:
-        chart_feedback_collection = feedback_mongo_db[feedback_mongodb_collection]
-        chart_feedback_result = chart_feedback_collection.find_one(
-            {"chart_id": chart_id}, {"_id": 0}
-        )
+    Args:
+        chart_ids (List[str]): chart ids of the charts to get
 
-        if chart_feedback_result:
-            # preprocess the result
-            processed_chart_feedback_result = process_chart(chart_feedback_result)
+    Returns:
+        Dict[str, dict]: chart merged with its processed feedback, by chart id.
+            Charts without a feedback or a logged chart are left out.
+    """
+    if not chart_ids:
+        return {}
 
-    # Query chart MongoDB for whole chart
-    # check if collection exists
-    if (
+    mongo_db_client = get_mongo_db_client()
+    chart_feedback_collection = mongo_db_client[feedback_mongodb_database][
+        feedback_mongodb_collection
+    ]
+    chart_mongodb_collection = mongo_db_client[chart_logging_mongodb_database][
         chart_logging_mongodb_collection
-        not in chart_logging_mongo_db.list_collection_names()
-    ):
-        print(f"Mongo DB collection, {chart_logging_mongodb_collection} not found")
-    else:
-        chart_mongodb_collection = chart_logging_mongo_db[
-            chart_logging_mongodb_collection
-        ]
-        chart_result = chart_mongodb_collection.find_one(
-            {"chart_id": chart_id}, {"_id": 0}
-        )
-
-    # making the results one
-    final_processed_chart = {**chart_result, **processed_chart_feedback_result}
+    ]
 
-    mongo_db_client.close()
-    return final_processed_chart
+    processed_chart_feedback_results: Dict[str, dict] = {}
+    for chart_feedback_result in chart_feedback_collection.find(
+        {"chart_id": {"$in": chart_ids}}, {"_id": 0}
+    ):
+        chart_id = chart_feedback_result.get("chart_id")
+        if chart_id in processed_chart_feedback_results:
+            continue
+
+        # If the feedback is incomplete, skip the chart
+        try:
+            processed_chart_feedback_results[chart_id] = process_chart(
+                chart_feedback_result
+            )
+        except Exception:
+            continue
 
+    if not processed_chart_feedback_results:
+        return {}
 
-def search_user_query(user_query: str, top_n: int = 10):
-    # OPEN Connection : QDrant
-    qdrant_db_client = QdrantClient(url=qdrant_host, api_key=qdrant_api_key)
+    final_processed_charts: Dict[str, dict] = {}
+    for chart_result in chart_mongodb_collection.find(
+        {"chart_id": {"$in": list(processed_chart_feedback_results)}}, {"_id": 0}
+    ):
+        chart_id = chart_result["chart_id"]
+        if chart_id not in final_processed_charts:
+            # making the results one
+            final_processed_charts[chart_id] = {
+                **chart_result,
+                **processed_chart_feedback_results[chart_id],
+            }
 
-    qdrant_user_query_collection = os.getenv("FEEDBACK_QDRANT_USER_QUERY_COLLECTION")
+    return final_processed_charts
 
-    # embed the user_query
-    embed_user_query = requests.get(
-        embedding_url,
-        params={"promt": user_query, "model_name": os.getenv("EMBEDDING_MODEL_NAME")},
-        verify=False,
-    )
-    embedded_user_query = ast.literal_eval(embed_user_query.content.decode("utf-8"))
 
-    # to gather all the results in a list
-    qdrant_query_result_list = []
+# Get the charts from the DB
+def get_chart_feedback_mongodb(chart_id: str):
+    return get_chart_feedbacks_mongodb([chart_id])[chart_id]
 
-    try:
-        # Check if the collection exists
-        if not qdrant_db_client.collection_exists(qdrant_user_query_collection):
-            print(f"Qdrant Collection '{qdrant_user_query_collection}' not found")
-        else:
-            # Query the Qdrant collection
-            qdrant_user_query_results = qdrant_db_client.search(
-                collection_name=qdrant_user_query_collection,
-                query_vector=embedded_user_query,
-                limit=top_n,  # maximum results we want
-            )
 
-            for item in qdrant_user_query_results:
-                qdrant_query_result_list.append(item.payload)
+def _search_feedback(
+    text: str, qdrant_collection: str, top_n: int, search_name: str
+) -> List[str]:
+    # embed the text
+    embedded_text = get_embedding(text)
 
-    except Exception as e:
-        print("\n=================================================")
-        print(f"User Query Search: Qdrant querying error {e}")
-        print(traceback.format_exc())
-        print("=================================================\n")
+    # to gather the chart ids in the order of similarity
+    chart_ids: List[str] = []
 
-    # querying the mongo db to get the chart
     try:
-        chart_feedback_list = []
-        # check if results from qdrant are empty
-        for result in qdrant_query_result_list:
-            # get the chart ids from the list
-            mongo_db_chart_id = result["chart_id"]
-
-            # If chart data is not found, skip the chart
-            try:
-                final_processed_chart_data = get_chart_feedback_mongodb(
-                    mongo_db_chart_id
-                )
-            except Exception:
-                continue
-
-            final_processed_chart = json.dumps(final_processed_chart_data)
-            chart_feedback_list.append(final_processed_chart)
+        # Query the Qdrant collection
+        qdrant_results = get_qdrant_db_client().search(
+            collection_name=qdrant_collection,
+            query_vector=embedded_text,
+            limit=top_n,  # maximum results we want
+            with_payload=["chart_id"],
+        )
 
-        return chart_feedback_list
+        chart_ids = [item.payload["chart_id"] for item in qdrant_results]
 
     except Exception as e:
         print("\n=================================================")
-        print(f"User Query Search: Qdrant querying error {e}")
+        print(f"{search_name}: Qdrant querying error {e}")
         print(traceback.format_exc())
         print("=================================================\n")
 
-    # Close connections
-    qdrant_db_client.close()
-
-
-def search_question(question: str, top_n: int = 10):
-    # OPEN Connection : QDrant
-    qdrant_db_client = QdrantClient(url=qdrant_host, api_key=qdrant_api_key)
-
-    qdrant_question_collection = os.getenv("FEEDBACK_QDRANT_QUESTION_COLLECTION")
-
-    # embed the question
-    embed_question = requests.get(
-        embedding_url,
-        params={"promt": question, "model_name": os.getenv("EMBEDDING_MODEL_NAME")},
-        verify=False,
-    )
-    embedded_question = ast.literal_eval(embed_question.content.decode("utf-8"))
-
-    # to gather all the results in a list
-    qdrant_question_list = []
+    # querying the mongo db to get the charts
+    chart_feedback_list: List[str] = []
 
     try:
-        # Check if the collection exists
-        if not qdrant_db_client.collection_exists(qdrant_question_collection):
-            print(f"Qdrant Collection '{qdrant_question_collection}' not found")
-        else:
-            # Query the Qdrant collection
-            qdrant_question_results = qdrant_db_client.search(
-                collection_name=qdrant_question_collection,
-                query_vector=embedded_question,
-                limit=top_n,  # maximum results we want
-            )
+        final_processed_charts = get_chart_feedbacks_mongodb(chart_ids)
 
-            for item in qdrant_question_results:
-                qdrant_question_list.append(item.payload)
+        # If chart data is not found, skip the chart
+        for chart_id in chart_ids:
+            if chart_id in final_processed_charts:
+                chart_feedback_list.append(json.dumps(final_processed_charts[chart_id]))
 
     except Exception as e:
         print("\n=================================================")
-        print(f"Question Search: Qdrant querying error {e}")
+        print(f"{search_name}: MongoDB querying error {e}")
         print(traceback.format_exc())
         print("=================================================\n")
 
-    # querying the mongo db to get the chart
-    try:
-        chart_feedback_list = []
-        # check if results from qdrant are empty
-        for result in qdrant_question_list:
-            # get the chart ids from the list
-            mongo_db_chart_id = result["chart_id"]
-
-            # If chart data is not found, skip the chart
-            try:
-                final_processed_chart_data = get_chart_feedback_mongodb(
-                    mongo_db_chart_id
-                )
-            except Exception:
-                continue
+    return chart_feedback_list
 
-            final_processed_chart = json.dumps(final_processed_chart_data)
-            chart_feedback_list.append(final_processed_chart)
 
-        return chart_feedback_list
+def search_user_query(user_query: str, top_n: int = 10):
+    return _search_feedback(
+        user_query, feedback_qdrant_user_query_collection, top_n, "User Query Search"
+    )
 
-    except Exception as e:
-        print("\n=================================================")
-        print(f"Question Search: Qdrant querying error {e}")
-        print(traceback.format_exc())
-        print("=================================================\n")
 
-    # Close connections
-    qdrant_db_client.close()
+def search_question(question: str, top_n: int = 10):
+    return _search_feedback(
+        question, feedback_qdrant_question_collection, top_n, "Question Search"
+    )
 
 
 ############################################### FAST API ROUTING ##########################################
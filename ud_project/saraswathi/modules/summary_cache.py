@@ -0,0 +1,63 @@
+from typing import Optional
+from fastapi import APIRouter
+from pydantic import BaseModel
+
+from components.sql_cache import generated_sql_cache
+from components.summary_cache import data_summary_cache
+
+router = APIRouter()
+
+
+class SummaryCacheInvalidation(BaseModel):
+    database_identifier: Optional[str] = None
+    database_name: Optional[str] = None
+    table_name: Optional[str] = None
+
+
+class GeneratedSQLCacheInvalidation(SummaryCacheInvalidation):
+    chart_id: Optional[str] = None
+
+
+@router.get("/data-summary/stats")
+def get_data_summary_cache_stats():
+    """Return the size and the hit/miss counters of the DataSummary cache."""
+    return data_summary_cache.stats()
+
+
+@router.post("/data-summary/invalidate")
+def invalidate_data_summary_cache(invalidation: SummaryCacheInvalidation):
+    """Invalidate cached DataSummary objects after the table or column metadata of
+    the vector database has been re-upserted. Fields left empty match any value.
+    """
+    invalidated_entries = data_summary_cache.invalidate(
+        database_identifier=invalidation.database_identifier,
+        database_name=invalidation.database_name,
+        table_name=invalidation.table_name,
+    )
+
+    return {"status": "Success", "invalidated_entries": invalidated_entries}
+
+
+@router.get("/generated-sql/stats")
+def get_generated_sql_cache_stats():
+    """Return the size and the hit/miss counters of the generated SQL cache."""
+    return generated_sql_cache.stats()
+
+
+@router.post("/generated-sql/invalidate")
+def invalidate_generated_sql_cache(invalidation: GeneratedSQLCacheInvalidation):
+    """Invalidate the cached SQL query of a chart, or every cached SQL query matching
+    the given table coordinates. Fields left empty match any value.
+    """
+    if invalidation.chart_id is not None:
+        invalidated_entries = int(
+            generated_sql_cache.invalidate_chart(invalidation.chart_id)
+        )
+    else:
+        invalidated_entries = generated_sql_cache.invalidate(
+            database_identifier=invalidation.database_identifier,
+            database_name=invalidation.database_name,
+            table_name=invalidation.table_name,
+        )
+
+    return {"status": "Success", "invalidated_entries": invalidated_entries}
@@ -0,0 +1,114 @@
+import json
+import time
+
+from unittest.mock import MagicMock, patch
+from modules.chart import generate_UPS_SSE_d3
+
+
+def fake_single_up(
+    user_query,
+    story_question,
+    data_summary,
+    filters,
+    aggregations,
+    database_properties,
+    ups_idx,
+    *args,
+):
+    # Later questions finish first to exercise out-of-order completion
+    time.sleep(0.05 * (10 - ups_idx))
+
+    if story_question["main_title"] == "failed":
+        raise RuntimeError("Chart generation failed!")
+
+    return [
+        {
+            "Chart_Name": "",
+            "Chart_Type": "bar_chart",
+            "Chart_Title": story_question["main_title"],
+            "Chart_Data": [ups_idx],
+        }
+    ]
+
+
+def run_generate_UPS(main_questions: list, max_workers: int) -> tuple:
+    data_summary = MagicMock(database_properties={})
+    streamed: list = []
+
+    with patch(
+        "modules.chart.generate_single_up_SSE_d3", side_effect=fake_single_up
+    ), patch("modules.chart.requests.post"), patch(
+        "modules.chart.remove_unused_keys_UPS", side_effect=lambda result: result
+    ), patch("modules.chart.chart_generation_max_workers", max_workers):
+        generator = generate_UPS_SSE_d3(
+            "user query",
+            main_questions,
+            data_summary,
+            {},
+            [],
+            "client_id",
+            "user_id",
+            "database_name",
+            "table_name",
+            0.0,
+            "http://mock_logging_url/",
+            "161a3eb9-bd2e-40c1-9ad3-c35159113b37",
+            MagicMock(),
+        )
+        try:
+            while True:
+                streamed.append(json.loads(next(generator))["data"])
+        except StopIteration as stop:
+            last_ups = stop.value
+
+    return streamed, last_ups
+
+
+def make_questions(titles: list) -> list:
+    return [
+        {"chart_id": f"chart_{idx}", "main_title": title}
+        for idx, title in enumerate(titles)
+    ]
+
+
+def test_generate_UPS_streams_in_question_order():
+    main_questions = make_questions(["q1", "failed", "q3", "q4"])
+
+    start = time.perf_counter()
+    streamed, last_ups = run_generate_UPS(main_questions, max_workers=4)
+    elapsed = time.perf_counter() - start
+
+    assert [data["message"] for data in streamed] == [
+        "Result 1",
+        "Result 2",
+        "Result 3",
+    ]
+    assert [data["result"][0]["Chart_Title"] for data in streamed] == [
+        "q1",
+        "q3",
+        "q4",
+    ]
+    assert [data["result"][0]["Chart_Name"] for data in streamed] == [
+        "Visual 1",
+        "Visual 2",
+        "Visual 3",
+    ]
+    assert last_ups[0]["Chart_Title"] == "q4"
+    # Sequential generation would take 0.45s + 0.4s + 0.35s + 0.3s
+    assert elapsed < 1.0
+
+
+def test_generate_UPS_caps_visuals_deterministically():
+    main_questions = make_questions([f"q{idx}" for idx in range(1, 10)])
+
+    parallel_streamed, parallel_last_ups = run_generate_UPS(
+        main_questions, max_workers=4
+    )
+    sequential_streamed, sequential_last_ups = run_generate_UPS(
+        main_questions, max_workers=1
+    )
+
+    assert len(parallel_streamed) == 6
+    assert parallel_streamed == sequential_streamed
+    assert parallel_last_ups == sequential_last_ups
+    assert parallel_last_ups[0]["Chart_Title"] == "q6"
@@ -0,0 +1,121 @@
+import datetime
+import decimal
+
+import numpy as np
+import pandas as pd
+
+from components.utils import (
+    build_table_rows,
+    format_table_value,
+    pivot_series_columns,
+    remove_null_series,
+    remove_null_x_axis,
+    sort_by_date_parts,
+    sort_pandas_date,
+    to_json_list,
+)
+
+
+def test_to_json_list_converts_decimals():
+    assert to_json_list(pd.Series([1.5, 2.0])) == [1.5, 2.0]
+    assert to_json_list(
+        pd.Series([decimal.Decimal("1.5"), None, decimal.Decimal("2")])
+    ) == [1.5, None, 2.0]
+    assert to_json_list(pd.Series([1, "a", decimal.Decimal("3")])) == [1, "a", 3.0]
+    assert to_json_list(pd.Series(["2020", None])) == ["2020", None]
+
+
+def test_sort_by_date_parts():
+    chart_data = pd.DataFrame(
+        {"xAxis": ["2020-10", "2020-2", "2019-12", "2020-2"], "yAxis": [1, 2, 3, 4]}
+    )
+
+    assert sort_by_date_parts(chart_data, "xAxis")["yAxis"].tolist() == [3, 2, 4, 1]
+    assert sort_pandas_date(
+        pd.DataFrame({"xAxis": ["2021-Q1", "2020-Q4", "2020-Q1"]}), "xAxis"
+    )["xAxis"].tolist() == ["2020-Q1", "2020-Q4", "2021-Q1"]
+
+    # Values which are not dates are sorted by value
+    chart_data = pd.DataFrame({"xAxis": ["b", "a", "c"]})
+    assert sort_by_date_parts(chart_data, "xAxis")["xAxis"].tolist() == [
+        "a",
+        "b",
+        "c",
+    ]
+
+
+def test_pivot_series_columns():
+    chart_data = pd.DataFrame(
+        {
+            "xAxis": [decimal.Decimal("1"), decimal.Decimal("1"), decimal.Decimal("2")],
+            "series": ["A", "B", "A"],
+            "yAxis": [1.0, 2.0, 3.0],
+        }
+    )
+
+    pivot_data = pivot_series_columns(chart_data, "xAxis", "series", ["yAxis"])
+
+    assert pivot_data.columns.tolist() == ["xAxis", "yAxis_A", "yAxis_B"]
+    assert pivot_data["xAxis"].tolist() == [1.0, 2.0]
+    assert pivot_data["yAxis_A"].tolist() == [1.0, 3.0]
+    assert pivot_data["yAxis_B"].tolist() == [2.0, 0]
+
+    pivot_data = pivot_series_columns(
+        chart_data, "xAxis", "series", ["yAxis"], convert_xAxis_decimal=False
+    )
+
+    assert pivot_data["xAxis"].tolist() == [decimal.Decimal("1"), decimal.Decimal("2")]
+
+
+def test_format_table_value():
+    assert format_table_value(3) == 3
+    assert format_table_value(1.23456789) == 1.234568
+    assert format_table_value(decimal.Decimal("1.23456789")) == 1.234568
+    assert format_table_value(decimal.Decimal("1.23456789"), None) == 1.23456789
+    assert format_table_value(datetime.date(2024, 2, 1)) == "02/01/2024"
+    assert format_table_value(pd.NaT) == "NaT"
+    assert format_table_value(None) == "None"
+
+
+def test_build_table_rows():
+    chart_data = pd.DataFrame(
+        {
+            "xAxis": pd.to_datetime(["2024-01-31", None]),
+            "yAxis": [decimal.Decimal("1.1234567"), decimal.Decimal("2")],
+            "yAxis2": [0.1234567, np.nan],
+            "count": [1, 2],
+        }
+    )
+
+    rows = build_table_rows(chart_data, ["Date", "Amount", "Share", "Count"])
+
+    assert rows[0] == {
+        "Date": "01/31/2024",
+        "Amount": 1.123457,
+        "Share": 0.123457,
+        "Count": 1,
+    }
+    assert rows[1]["Date"] == "NaT"
+    assert np.isnan(rows[1]["Share"])
+    assert build_table_rows(chart_data[["count"]], ["Count"]) == [
+        {"Count": 1},
+        {"Count": 2},
+    ]
+    assert build_table_rows(chart_data[["yAxis2"]], ["Share"], None)[0] == {
+        "Share": 0.1234567
+    }
+
+
+def test_remove_null_axis_rows():
+    chart_data = pd.DataFrame(
+        {"xAxis": ["a", None, "c"], "series": ["A", "B", None], "yAxis": [1, 2, 3]}
+    )
+
+    remove_null_x_axis(chart_data, {})
+    assert chart_data["yAxis"].tolist() == [1, 3]
+    remove_null_series(chart_data, {})
+    assert chart_data["yAxis"].tolist() == [1]
+
+    chart_data = pd.DataFrame({"month": ["a", None], "region": [None, "B"]})
+    remove_null_series(chart_data, {"series_column": "region"})
+    assert chart_data["month"].tolist() == [None]
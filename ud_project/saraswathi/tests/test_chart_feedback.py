@@ -1,3 +1,4 @@
+import json
 import os
 import pytest
 import qdrant_client
@@ -7,6 +8,7 @@ from unittest.mock import MagicMock, patch
 from mongomock import MongoClient as MockMongoClient
 from dotenv import load_dotenv
 from main import app
+from modules.chart_feedback import chart_feedback
 
 import warnings
 
@@ -182,18 +184,18 @@ def test_get_feedback_by_id():
 def test_search_user_query():
     """Test retrieving a chart list by query."""
     # Mock external dependencies
+    mock_mongo_db_client = MockMongoClient()
+
     with patch(
-        "modules.chart_feedback.chart_feedback.requests.get"
+        "modules.chart_feedback.chart_feedback.embedding_session.get"
     ) as mock_embedding_request, patch(
-        "modules.chart_feedback.chart_feedback.QdrantClient"
-    ) as MockQdrantClient, patch(
-        "modules.chart_feedback.chart_feedback.get_chart_feedback_mongodb"
-    ) as mock_get_chart_feedback, patch(
-        "modules.chart_feedback.chart_feedback.os.getenv"
-    ) as mock_getenv:
+        "modules.chart_feedback.chart_feedback.get_qdrant_db_client"
+    ) as mock_get_qdrant_db_client, patch(
+        "modules.chart_feedback.chart_feedback.get_mongo_db_client",
+        return_value=mock_mongo_db_client,
+    ), patch("modules.chart_feedback.chart_feedback.os.getenv") as mock_getenv:
         # Mock environment variables
         mock_getenv.side_effect = lambda var, default=None: {
-            "FEEDBACK_QDRANT_USER_QUERY_COLLECTION": "test_collection",
             "EMBEDDING_MODEL_NAME": "test_model",
         }.get(var, default)
 
@@ -202,21 +204,36 @@ def test_search_user_query():
 
         # Mock embedding request
         mock_embedding_response = MagicMock()
+        mock_embedding_response.headers = {"Content-Type": "application/json"}
         mock_embedding_response.content = str([0.1, 0.2, 0.3]).encode("utf-8")
         mock_embedding_request.return_value = mock_embedding_response
 
         # Mock Qdrant Client
-        mock_qdrant_client = MockQdrantClient.return_value
-        mock_qdrant_client.collection_exists.return_value = True
-        mock_search_result = MagicMock()
-        mock_search_result.payload = {"chart_id": "test_chart_1"}
-        mock_qdrant_client.search.return_value = [mock_search_result]
-
-        # Mock MongoDB chart feedback
-        mock_get_chart_feedback.return_value = {
-            "chart_id": "test_chart_1",
-            "feedback": "Sample feedback",
-        }
+        mock_qdrant_client = mock_get_qdrant_db_client.return_value
+        mock_search_results = []
+        for chart_id in ["test_chart_1", "test_chart_2", "test_chart_3"]:
+            mock_search_result = MagicMock()
+            mock_search_result.payload = {"chart_id": chart_id}
+            mock_search_results.append(mock_search_result)
+        mock_qdrant_client.search.return_value = mock_search_results
+
+        # Mock MongoDB charts and feedbacks, test_chart_2 has no feedback
+        mock_mongo_db_client[chart_feedback.feedback_mongodb_database][
+            chart_feedback.feedback_mongodb_collection
+        ].insert_many(
+            [
+                {"chart_id": chart_id, "like": "True", "feedback": {}}
+                for chart_id in ["test_chart_3", "test_chart_1"]
+            ]
+        )
+        mock_mongo_db_client[chart_feedback.chart_logging_mongodb_database][
+            chart_feedback.chart_logging_mongodb_collection
+        ].insert_many(
+            [
+                {"chart_id": chart_id, "question": "Test question"}
+                for chart_id in ["test_chart_1", "test_chart_2", "test_chart_3"]
+            ]
+        )
 
         # Make the request using path parameter
         response = client.get(f"/feedback/search/user_query/{test_user_query}")
@@ -233,24 +250,31 @@ def test_search_user_query():
 
         # Check that results is a list
         assert isinstance(results, list), "Results should be a list"
-        assert len(results) > 0, "Results list should not be empty"
+        assert [json.loads(result)["chart_id"] for result in results] == [
+            "test_chart_1",
+            "test_chart_3",
+        ]
+        assert (
+            mock_qdrant_client.search.call_args.kwargs["collection_name"]
+            == chart_feedback.feedback_qdrant_user_query_collection
+        )
 
 
 def test_search_question():
     """Test retrieving a chart list by question."""
     # Mock external dependencies
+    mock_mongo_db_client = MockMongoClient()
+
     with patch(
-        "modules.chart_feedback.chart_feedback.requests.get"
+        "modules.chart_feedback.chart_feedback.embedding_session.get"
     ) as mock_embedding_request, patch(
-        "modules.chart_feedback.chart_feedback.QdrantClient"
-    ) as MockQdrantClient, patch(
-        "modules.chart_feedback.chart_feedback.get_chart_feedback_mongodb"
-    ) as mock_get_chart_feedback, patch(
-        "modules.chart_feedback.chart_feedback.os.getenv"
-    ) as mock_getenv:
+        "modules.chart_feedback.chart_feedback.get_qdrant_db_client"
+    ) as mock_get_qdrant_db_client, patch(
+        "modules.chart_feedback.chart_feedback.get_mongo_db_client",
+        return_value=mock_mongo_db_client,
+    ), patch("modules.chart_feedback.chart_feedback.os.getenv") as mock_getenv:
         # Mock environment variables
         mock_getenv.side_effect = lambda var, default=None: {
-            "FEEDBACK_QDRANT_QUESTION_COLLECTION": "test_collection",
             "EMBEDDING_MODEL_NAME": "test_model",
         }.get(var, default)
 
@@ -259,21 +283,36 @@ def test_search_question():
 
         # Mock embedding request
         mock_embedding_response = MagicMock()
+        mock_embedding_response.headers = {"Content-Type": "application/json"}
         mock_embedding_response.content = str([0.1, 0.2, 0.3]).encode("utf-8")
         mock_embedding_request.return_value = mock_embedding_response
 
         # Mock Qdrant Client
-        mock_qdrant_client = MockQdrantClient.return_value
-        mock_qdrant_client.collection_exists.return_value = True
-        mock_search_result = MagicMock()
-        mock_search_result.payload = {"chart_id": "test_chart_1"}
-        mock_qdrant_client.search.return_value = [mock_search_result]
-
-        # Mock MongoDB chart feedback
-        mock_get_chart_feedback.return_value = {
-            "chart_id": "test_chart_1",
-            "feedback": "Sample feedback",
-        }
+        mock_qdrant_client = mock_get_qdrant_db_client.return_value
+        mock_search_results = []
+        for chart_id in ["test_chart_1", "test_chart_2", "test_chart_3"]:
+            mock_search_result = MagicMock()
+            mock_search_result.payload = {"chart_id": chart_id}
+            mock_search_results.append(mock_search_result)
+        mock_qdrant_client.search.return_value = mock_search_results
+
+        # Mock MongoDB charts and feedbacks, test_chart_2 has no feedback
+        mock_mongo_db_client[chart_feedback.feedback_mongodb_database][
+            chart_feedback.feedback_mongodb_collection
+        ].insert_many(
+            [
+                {"chart_id": chart_id, "like": "True", "feedback": {}}
+                for chart_id in ["test_chart_3", "test_chart_1"]
+            ]
+        )
+        mock_mongo_db_client[chart_feedback.chart_logging_mongodb_database][
+            chart_feedback.chart_logging_mongodb_collection
+        ].insert_many(
+            [
+                {"chart_id": chart_id, "question": "Test question"}
+                for chart_id in ["test_chart_1", "test_chart_2", "test_chart_3"]
+            ]
+        )
 
         # Make the request using path parameter
         response = client.get(f"/feedback/search/question/{test_question}")
@@ -290,4 +329,11 @@ def test_search_question():
 
         # Check that results is a list
         assert isinstance(results, list), "Results should be a list"
-        assert len(results) > 0, "Results list should not be empty"
+        assert [json.loads(result)["chart_id"] for result in results] == [
+            "test_chart_1",
+            "test_chart_3",
+        ]
+        assert (
+            mock_qdrant_client.search.call_args.kwargs["collection_name"]
+            == chart_feedback.feedback_qdrant_question_collection
+        )
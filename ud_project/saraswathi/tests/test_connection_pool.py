@@ -0,0 +1,63 @@
+import sqlite3
+
+from components.executor import (
+    dispose_connection_pools,
+    get_connection_pool_status,
+    get_pooled_engine,
+    run_sql_query_only,
+)
+
+
+def create_sqlite_database(sqlite_path: str):
+    conn = sqlite3.connect(sqlite_path)
+    conn.execute("CREATE TABLE sales (region TEXT, amount INTEGER)")
+    conn.executemany(
+        "INSERT INTO sales VALUES (?, ?)",
+        [("north", 10), ("south", 20), ("north", 30)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_get_pooled_engine_is_shared_per_database(tmp_path):
+    dispose_connection_pools()
+
+    engine = get_pooled_engine("SQLite", sqlite_path=str(tmp_path / "a.db"))
+
+    assert engine is get_pooled_engine("sqlite", sqlite_path=str(tmp_path / "a.db"))
+    assert engine is not get_pooled_engine("sqlite", sqlite_path=str(tmp_path / "b.db"))
+    assert len(get_connection_pool_status()) == 2
+
+    dispose_connection_pools()
+    assert get_connection_pool_status() == []
+
+
+def test_run_sql_query_only_reuses_pooled_connection(tmp_path):
+    dispose_connection_pools()
+    sqlite_path = str(tmp_path / "sales.db")
+    create_sqlite_database(sqlite_path)
+
+    for _ in range(3):
+        chart_data = run_sql_query_only(
+            "SELECT region, SUM(amount) AS total FROM sales GROUP BY region ORDER BY region",
+            {"sqlite_path": sqlite_path},
+            "SQLite",
+        )
+
+        assert chart_data["region"].tolist() == ["north", "south"]
+        assert chart_data["total"].tolist() == [40, 20]
+
+    pool = get_pooled_engine("sqlite", sqlite_path=sqlite_path).pool
+    assert pool.checkedout() == 0
+    assert pool.checkedin() == 1
+
+    # Failed queries return an empty DataFrame and give the connection back
+    chart_data = run_sql_query_only(
+        "SELECT missing_column FROM sales",
+        {"sqlite_path": sqlite_path},
+        "SQLite",
+    )
+    assert chart_data.empty
+    assert pool.checkedout() == 0
+
+    dispose_connection_pools()
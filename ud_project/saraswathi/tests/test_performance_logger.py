@@ -0,0 +1,69 @@
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.pool import StaticPool
+
+from logging_library.performancelogger.performance_log_dto import Base, PerformanceLog
+from logging_library.performancelogger.performance_log_writer import (
+    PerformanceLogWriter,
+)
+from logging_library.performancelogger.performance_logger import PerformanceLogger
+
+
+class Caller:
+    def run(self, session_id):
+        with PerformanceLogger(session_id):
+            pass
+
+
+def test_performance_logs_are_buffered_and_bulk_inserted(monkeypatch):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+
+    writer = PerformanceLogWriter(
+        mode="async", buffer_size=3, batch_size=10, flush_interval=60
+    )
+    writer._engine = engine
+    monkeypatch.setattr(
+        "logging_library.performancelogger.performance_logger.performance_log_writer",
+        writer,
+    )
+
+    for session_id in range(4):
+        Caller().run(session_id)
+    writer.shutdown()
+
+    with engine.connect() as connection:
+        assert connection.execute(select(func.count(PerformanceLog.id))).scalar() == 3
+        performance_log = connection.execute(select(PerformanceLog)).first()
+
+    # The oldest log is dropped when the ring buffer is full
+    assert performance_log.session_id == 1
+    assert performance_log.function_name == "run"
+    assert performance_log.class_name == "Caller"
+    assert performance_log.module_name == __file__
+    assert performance_log.duration >= 0
+    assert writer.stats() == {
+        "mode": "async",
+        "buffered": 0,
+        "buffer_size": 3,
+        "written": 3,
+        "dropped": 1,
+        "failed": 0,
+        "flushes": 1,
+    }
+
+
+def test_disabled_performance_logger_is_a_no_op(monkeypatch):
+    writer = PerformanceLogWriter(mode="disabled")
+    monkeypatch.setattr(
+        "logging_library.performancelogger.performance_logger.performance_log_writer",
+        writer,
+    )
+
+    Caller().run(1)
+
+    assert writer.stats()["buffered"] == 0
+    assert writer._engine is None
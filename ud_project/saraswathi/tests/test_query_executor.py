@@ -0,0 +1,125 @@
+import sqlite3
+
+from components.executor import dispose_connection_pools, get_pooled_engine
+from components.executor.query_executor import (
+    execute_sqlite_query,
+    fetch_dataframe,
+    get_max_result_rows,
+)
+
+
+def create_sqlite_database(sqlite_path: str, row_count: int):
+    conn = sqlite3.connect(sqlite_path)
+    conn.execute("CREATE TABLE sales (region TEXT, amount REAL)")
+    conn.executemany(
+        "INSERT INTO sales VALUES (?, ?)",
+        [(f"region_{idx}", float(idx)) for idx in range(row_count)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_execute_sqlite_query_streams_rows_in_batches(tmp_path, monkeypatch):
+    dispose_connection_pools()
+    sqlite_path = str(tmp_path / "sales.db")
+    create_sqlite_database(sqlite_path, 25)
+    monkeypatch.setattr("components.executor.query_executor.SQL_FETCH_BATCH_SIZE", 4)
+
+    queried_df, error = execute_sqlite_query(
+        sqlite_path=sqlite_path,
+        sql_query="SELECT region, amount FROM sales ORDER BY amount",
+    )
+
+    assert error == ""
+    assert queried_df.columns.tolist() == ["region", "amount"]
+    assert len(queried_df) == 25
+    assert queried_df["amount"].dtype == "float64"
+    assert queried_df["amount"].tolist() == [float(idx) for idx in range(25)]
+
+    dispose_connection_pools()
+
+
+def test_execute_sqlite_query_row_cap_and_error(tmp_path):
+    dispose_connection_pools()
+    sqlite_path = str(tmp_path / "sales.db")
+    create_sqlite_database(sqlite_path, 25)
+
+    queried_df, error = execute_sqlite_query(
+        sqlite_path=sqlite_path,
+        sql_query="SELECT region, amount FROM sales ORDER BY amount",
+        max_rows=10,
+    )
+
+    assert error == ""
+    assert queried_df["region"].tolist() == [f"region_{idx}" for idx in range(10)]
+
+    queried_df, error = execute_sqlite_query(
+        sqlite_path=sqlite_path,
+        sql_query="SELECT missing_column FROM sales",
+    )
+
+    assert queried_df.empty
+    assert isinstance(error, sqlite3.OperationalError)
+    assert get_pooled_engine("sqlite", sqlite_path=sqlite_path).pool.checkedout() == 0
+
+    dispose_connection_pools()
+
+
+def test_fetch_dataframe_keeps_columns_of_empty_result():
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.execute("SELECT 1 AS xAxis, 2 AS yAxis WHERE 1 = 0")
+
+    queried_df = fetch_dataframe(cursor)
+
+    assert queried_df.empty
+    assert queried_df.columns.tolist() == ["xAxis", "yAxis"]
+    conn.close()
+
+
+def test_get_max_result_rows(monkeypatch):
+    monkeypatch.setattr(
+        "components.executor.query_executor.CHART_TYPE_MAX_ROWS",
+        {"pie_chart": 100, "scatterplot_chart": 1000, "card_chart": 0},
+    )
+
+    assert get_max_result_rows() is None
+    assert get_max_result_rows("line_chart") is None
+    assert get_max_result_rows("card_chart") is None
+    assert get_max_result_rows("pie_chart") == 100
+    assert get_max_result_rows("scatterplot_chart") == 1000
+
+
+def test_fetch_dataframe_flags_truncated_result(caplog):
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE sales (amount REAL)")
+    conn.executemany("INSERT INTO sales VALUES (?)", [(idx,) for idx in range(10)])
+
+    with caplog.at_level("WARNING"):
+        truncated_df = fetch_dataframe(conn.execute("SELECT amount FROM sales"), 5)
+    complete_df = fetch_dataframe(conn.execute("SELECT amount FROM sales"), 10)
+    uncapped_df = fetch_dataframe(conn.execute("SELECT amount FROM sales"))
+
+    assert len(truncated_df) == 5
+    assert truncated_df.attrs["truncated"] is True
+    assert "truncated to 5 rows" in caplog.text
+    assert len(complete_df) == 10
+    assert complete_df.attrs["truncated"] is False
+    assert uncapped_df.attrs["truncated"] is False
+    conn.close()
+
+
+def test_fetch_dataframe_infers_dtypes_across_batches(monkeypatch):
+    monkeypatch.setattr("components.executor.query_executor.SQL_FETCH_BATCH_SIZE", 2)
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE sales (idx INTEGER, region TEXT, amount REAL)")
+    rows = [(0, "region_0", None), (1, "region_1", None)]
+    rows += [(idx, f"region_{idx}", float(idx)) for idx in range(2, 5)]
+    conn.executemany("INSERT INTO sales VALUES (?, ?, ?)", rows)
+
+    queried_df = fetch_dataframe(conn.execute("SELECT * FROM sales ORDER BY idx"))
+
+    assert queried_df.dtypes.tolist() == ["int64", "object", "float64"]
+    assert queried_df["amount"].isnull().tolist() == [True, True, False, False, False]
+    assert queried_df["region"].tolist() == [f"region_{idx}" for idx in range(5)]
+    assert queried_df.index.tolist() == list(range(5))
+    conn.close()
@@ -5,6 +5,7 @@ import pandas as pd
 
 from unittest.mock import MagicMock, patch
 from components.summarizer import summarize
+from components.summary_cache import data_summary_cache
 from qdrant_client import QdrantClient
 from components.datamodel import DataSummary
 from vector_db_utils.table import get_table_info
@@ -112,6 +113,14 @@ def test_query_generator_executor_invalid_input():
             )
 
 
+@pytest.fixture(autouse=True)
+def clear_data_summary_cache():
+    """Fixture to isolate the summarize tests from the shared DataSummary cache"""
+    data_summary_cache.clear()
+    yield
+    data_summary_cache.clear()
+
+
 @pytest.fixture
 def mock_qdrant_client():
     """Fixture to mock QdrantClient"""
@@ -469,17 +478,15 @@ def test_execute_sql_query_valid(mock_data):
     processed_data_mock = MagicMock()
     processed_data_mock.empty = False
 
-    def mock_exec(code, local_vars):
-        local_vars["processed_data"] = processed_data_mock
-        local_vars["chart_data"] = mock_return_data_execute_sql["chart_data"]
+    mock_query_executor = MagicMock(return_value=(processed_data_mock, ""))
 
     with patch(
         "components.executor.mysql.execute_mysql_mariadb",
         return_value=mock_return_data_execute_sql,
-    ), patch(
-        "components.executor.template.code_executor_template",
-        {"mysql": "dummy_code_template"},
-    ), patch("builtins.exec", side_effect=mock_exec):
+    ), patch.dict(
+        "components.executor.query_executor.sql_query_executors",
+        {"mysql": mock_query_executor},
+    ):
         result = execute_sql_query(
             llama70b_client=mock_data["mock_llama70b_client"],
             data_summary=mock_data["mock_data_summary"],
@@ -518,9 +525,7 @@ def test_execute_sql_query_empty_data(mock_data, capsys):
     processed_data_empty_mock = MagicMock()
     processed_data_empty_mock.empty = True
 
-    def mock_exec_empty_processed_data(code, local_vars):
-        local_vars["processed_data"] = processed_data_empty_mock
-        local_vars["chart_data"] = mock_return_data_execute_sql["chart_data"]
+    mock_query_executor = MagicMock(return_value=(processed_data_empty_mock, ""))
 
     with patch(
         "components.executor.mysql.fix_sql_query",
@@ -528,10 +533,10 @@ def test_execute_sql_query_empty_data(mock_data, capsys):
     ) as mock_fix_sql_query, patch(
         "components.executor.mysql.execute_mysql_mariadb",
         return_value=mock_return_data_execute_sql,
-    ), patch(
-        "components.executor.template.code_executor_template",
-        {"mysql": "dummy_code_template"},
-    ), patch("builtins.exec", side_effect=mock_exec_empty_processed_data):
+    ), patch.dict(
+        "components.executor.query_executor.sql_query_executors",
+        {"mysql": mock_query_executor},
+    ):
         result_empty = execute_sql_query(
             llama70b_client=mock_data["mock_llama70b_client"],
             data_summary=mock_data["mock_data_summary"],
@@ -0,0 +1,138 @@
+import logging
+
+from unittest.mock import MagicMock, patch
+from components.datamodel import DataSummary
+from components.sql_cache import GeneratedSQLCache, build_sql_cache_key
+from components.sql_query import _generate_sql
+
+
+def make_data_summary(database_schema_sql: str = "CREATE TABLE test_table;"):
+    return DataSummary(
+        database_schema_sql=database_schema_sql,
+        table_description="test_table_description",
+        column_description_dict={"column1": "Column 1 description"},
+        column_sample_dict={"column1": ["value1", "value2"]},
+        sql_library="MySQL",
+        database_properties={"db_tag": "test_db_tag", "database_type": "MySQL"},
+        column_name_list=["column1"],
+        column_display_name_dict={"column1": "Column 1 Display Name"},
+        column_data_tribes={"column1": "tribe1"},
+        column_n_unique_value_dict={"column1": 10},
+        column_sql_data_types={"column1": "INTEGER"},
+        table_join_sql_query="",
+    )
+
+
+def make_key(
+    data_summary: DataSummary,
+    question: str = "What is the total sales?",
+    chart_axis: dict = {"xAxis_column": "column1"},
+):
+    return build_sql_cache_key(
+        data_summary,
+        "bar_chart",
+        chart_axis,
+        {},
+        [],
+        "test_db",
+        "test_table",
+        question,
+        "Total Sales",
+    )
+
+
+def test_sql_cache_key_normalization():
+    data_summary = make_data_summary()
+
+    assert make_key(data_summary) == make_key(
+        data_summary, "  what is the   TOTAL sales ? "
+    )
+    assert make_key(data_summary) != make_key(data_summary, "What is the total cost?")
+    assert make_key(data_summary) != make_key(
+        data_summary, chart_axis={"xAxis_column": "column2"}
+    )
+    assert make_key(data_summary) != make_key(
+        make_data_summary("CREATE TABLE test_table (column1 INT);")
+    )
+
+
+def test_sql_cache_hit_miss_and_delete():
+    cache = GeneratedSQLCache(max_size=4, ttl=60)
+    key = make_key(make_data_summary())
+
+    assert cache.get(key) is None
+
+    cache.set(key, "SELECT 1;", "SELECT 1 raw;")
+
+    assert cache.get(key) == ("SELECT 1;", "SELECT 1 raw;")
+    assert cache.delete(key)
+    assert cache.get(key) is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["invalidations"] == 1
+
+
+def test_sql_cache_schema_fingerprint_eviction():
+    cache = GeneratedSQLCache(max_size=4, ttl=60)
+    old_key = make_key(make_data_summary())
+    new_key = make_key(make_data_summary("CREATE TABLE test_table (column1 INT);"))
+
+    cache.set(old_key, "SELECT 1;", "SELECT 1;")
+
+    assert cache.get(new_key) is None
+    assert cache.stats()["schema_evictions"] == 1
+    assert cache.stats()["size"] == 0
+
+
+def test_sql_cache_invalidate_chart():
+    cache = GeneratedSQLCache(max_size=4, ttl=60)
+    key = make_key(make_data_summary())
+
+    cache.set(key, "SELECT 1;", "SELECT 1;", chart_id=1)
+    cache.get(key, chart_id=2)
+
+    assert cache.invalidate_chart(2)
+    assert cache.get(key) is None
+    assert not cache.invalidate_chart(1)
+
+
+def test_generate_sql_served_from_cache(monkeypatch):
+    cache = GeneratedSQLCache(max_size=4, ttl=60)
+    data_summary = make_data_summary()
+    monkeypatch.setattr("components.sql_query.generated_sql_cache", cache)
+
+    cache.set(
+        make_key(data_summary),
+        "SELECT column1 FROM test_table;",
+        "SELECT column1 FROM test_table;",
+    )
+    llama70b_client = MagicMock()
+
+    with patch("components.sql_query.requests.post") as mock_post:
+        mock_post.return_value.json.return_value = {"chart_id": 42}
+
+        sql_query, sql_query_raw = _generate_sql(
+            llama70b_client,
+            data_summary,
+            1,
+            "bar_chart",
+            {"xAxis_column": "column1"},
+            {},
+            [],
+            "test_db",
+            "test_table",
+            "http://logging/",
+            logging.getLogger(__name__),
+            "What is the total sales?",
+            "Total Sales",
+        )
+
+    assert sql_query == "SELECT column1 FROM test_table;"
+    assert sql_query_raw == "SELECT column1 FROM test_table;"
+    llama70b_client.chat.completions.create.assert_not_called()
+    mock_post.assert_called_once()
+
+    # Negative feedback on the served chart evicts the cached SQL query
+    assert cache.invalidate_chart(42)
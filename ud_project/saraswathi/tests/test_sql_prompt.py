@@ -0,0 +1,45 @@
+import copy
+import logging
+
+from collections import OrderedDict
+
+from components.sql_query import build_sql_prompt_bundle, get_sql_prompt_bundle
+from tests.test_sql_cache import make_data_summary
+
+
+def test_sql_prompt_bundle_is_shared_per_table(monkeypatch):
+    monkeypatch.setattr("components.sql_query._sql_prompt_bundles", OrderedDict())
+    logger = logging.getLogger(__name__)
+    data_summary = make_data_summary()
+
+    prompt_bundle = get_sql_prompt_bundle(data_summary, "db", "test_table", logger)
+
+    assert prompt_bundle == build_sql_prompt_bundle(
+        data_summary, "db", "test_table", logger
+    )
+    assert (
+        prompt_bundle.table_instruction == "USE db.test_table as the source table name."
+    )
+    assert "CREATE TABLE test_table;" in prompt_bundle.schema_prompt
+    assert "- column1 (Display Name: Column 1 Display Name)" in (
+        prompt_bundle.schema_prompt
+    )
+
+    # Copies of the same DataSummary reuse the bundle, a changed table does not
+    assert (
+        get_sql_prompt_bundle(copy.deepcopy(data_summary), "db", "test_table", logger)
+        is prompt_bundle
+    )
+    assert (
+        get_sql_prompt_bundle(data_summary, "db", "other_table", logger)
+        is not prompt_bundle
+    )
+    assert (
+        get_sql_prompt_bundle(
+            make_data_summary("CREATE TABLE test_table (column1 INT);"),
+            "db",
+            "test_table",
+            logger,
+        )
+        is not prompt_bundle
+    )
@@ -0,0 +1,135 @@
+import json
+
+from components.datamodel import DataSummary
+from components.summarizer import get_database_properties
+from components.summary_cache import DataSummaryCache, build_summary_cache_key
+
+
+def make_data_summary(table_description: str = "test_table_description"):
+    return DataSummary(
+        database_schema_sql="CREATE TABLE test_table;",
+        table_description=table_description,
+        column_description_dict={"column1": "Column 1 description"},
+        column_sample_dict={"column1": ["value1", "value2"]},
+        sql_library="MySQL",
+        database_properties={"db_tag": "test_db_tag", "database_type": "MySQL"},
+        column_name_list=["column1"],
+        column_display_name_dict={"column1": "Column 1 Display Name"},
+        column_data_tribes={"column1": "tribe1"},
+        column_n_unique_value_dict={"column1": 10},
+        column_sql_data_types={"column1": "INTEGER"},
+        table_join_sql_query="",
+    )
+
+
+def test_data_summary_cache_hit_and_miss():
+    cache = DataSummaryCache(max_size=4, ttl=60)
+    key = build_summary_cache_key("label1", "db", "table", "tables", "columns")
+
+    assert cache.get(key) is None
+
+    cache.set(key, make_data_summary())
+    cached_data_summary = cache.get(key)
+
+    assert isinstance(cached_data_summary, DataSummary)
+    assert cached_data_summary.table_description == "test_table_description"
+
+    # Mutating a served copy must not leak into the cache
+    cached_data_summary.column_sample_dict["column1"].append("value3")
+    assert cache.get(key).column_sample_dict == {"column1": ["value1", "value2"]}
+
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+
+
+def test_data_summary_cache_lru_eviction():
+    cache = DataSummaryCache(max_size=2, ttl=60)
+    keys = [
+        build_summary_cache_key("label1", "db", f"table_{idx}", "tables", "columns")
+        for idx in range(3)
+    ]
+
+    cache.set(keys[0], make_data_summary())
+    cache.set(keys[1], make_data_summary())
+    cache.get(keys[0])
+    cache.set(keys[2], make_data_summary())
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_data_summary_cache_ttl_expiry(monkeypatch):
+    cache = DataSummaryCache(max_size=2, ttl=10)
+    key = build_summary_cache_key("label1", "db", "table", "tables", "columns")
+    now = [1000.0]
+    monkeypatch.setattr("components.summary_cache.time.monotonic", lambda: now[0])
+
+    cache.set(key, make_data_summary())
+    now[0] += 11
+
+    assert cache.get(key) is None
+
+
+def test_data_summary_cache_invalidate():
+    cache = DataSummaryCache(max_size=4, ttl=60)
+    key_1 = build_summary_cache_key("label1", "db", "table_1", "tables", "columns")
+    key_2 = build_summary_cache_key("label1", "db", "table_2", "tables", "columns")
+
+    cache.set(key_1, make_data_summary())
+    cache.set(key_2, make_data_summary())
+
+    assert cache.invalidate(database_identifier="label1", table_name="table_1") == 1
+    assert cache.get(key_1) is None
+    assert cache.get(key_2) is not None
+
+    assert cache.invalidate() == 1
+    assert cache.get(key_2) is None
+
+
+def test_data_summary_cache_disk_tier(tmp_path):
+    key = build_summary_cache_key("label1", "db", "table", "tables", "columns")
+
+    DataSummaryCache(max_size=4, ttl=60, cache_dir=str(tmp_path)).set(
+        key, make_data_summary("from disk")
+    )
+    cache = DataSummaryCache(max_size=4, ttl=60, cache_dir=str(tmp_path))
+
+    assert cache.get(key).table_description == "from disk"
+    assert cache.stats()["disk_hits"] == 1
+
+    cache.invalidate(table_name="table")
+    assert (
+        DataSummaryCache(max_size=4, ttl=60, cache_dir=str(tmp_path)).get(key) is None
+    )
+
+
+def test_data_summary_cache_disabled():
+    cache = DataSummaryCache(max_size=4, ttl=0)
+    key = build_summary_cache_key("label1", "db", "table", "tables", "columns")
+
+    cache.set(key, make_data_summary())
+
+    assert cache.get(key) is None
+
+
+def test_get_database_properties(monkeypatch):
+    monkeypatch.setenv(
+        "CLIENT_DB",
+        json.dumps([{"db_tag": "label1", "database_type": "MySQL"}]),
+    )
+
+    assert get_database_properties("label1") == {
+        "db_tag": "label1",
+        "database_type": "MySQL",
+    }
+    assert get_database_properties("label2") == {}
+
+    monkeypatch.setenv(
+        "CLIENT_DB",
+        json.dumps([{"db_tag": "label2", "database_type": "PostgreSQL"}]),
+    )
+
+    assert get_database_properties("label2")["database_type"] == "PostgreSQL"
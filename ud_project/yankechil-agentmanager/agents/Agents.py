@@ -3,6 +3,7 @@ from typing import Any, Dict
 import requests
 from dotenv import load_dotenv
 
+from agents.agentTransport import AGENT_HEALTH_CHECK_TIMEOUT, get_agent_transport
 from agents.baseAgent import BaseAgent
 from log_mongo import logger
 
@@ -27,7 +28,9 @@ def check_connection(url: str) -> bool:
     :return: True if connection is successful, False otherwise
     """
     try:
-        response = requests.get(url)
+        response = get_agent_transport(url).request(
+            "GET", timeout=AGENT_HEALTH_CHECK_TIMEOUT
+        )
         response.raise_for_status()
         return True
     except requests.exceptions.ConnectionError as e:
@@ -49,7 +52,12 @@ class SummaryAgent(BaseAgent):
         """Perform a basic health check for the agent."""
         try:
             headers = {"Content-Type": "application/json"}
-            response = requests.post(self.url, json={"text": "This video is very good"}, headers=headers)
+            response = self.transport.request(
+                "POST",
+                json={"text": "This video is very good"},
+                headers=headers,
+                timeout=AGENT_HEALTH_CHECK_TIMEOUT,
+            )
             if response.status_code == 200:
                 return {"status": "healthy"}
             return {"status": "unhealthy"}
@@ -68,7 +76,9 @@ class SentimentAgent(BaseAgent):
     def health_check(self) -> Dict[str, Any]:
         """Perform a basic health check for the agent."""
         try:
-            response = requests.get(self.url, params={"text": "Happy day"})
+            response = self.transport.request(
+                "GET", params={"text": "Happy day"}, timeout=AGENT_HEALTH_CHECK_TIMEOUT
+            )
             if response.status_code == 200:
                 return {"status": "healthy"}
             return {"status": "unhealthy"}
@@ -87,7 +97,9 @@ class CategoryAgent(BaseAgent):
     def health_check(self) -> Dict[str, Any]:
         """Perform a basic health check for the agent."""
         try:
-            response = requests.get(self.url, params={"text": "I like royal family"})
+            response = self.transport.request(
+                "GET", params={"text": "I like royal family"}, timeout=AGENT_HEALTH_CHECK_TIMEOUT
+            )
             if response.status_code == 200:
                 return {"status": "healthy"}
             return {"status": "unhealthy"}
@@ -107,11 +119,12 @@ class LawRegulatedAgent(BaseAgent):
         """Perform a basic health check for the agent."""
         try:
             headers = {"Content-Type": "application/json"}
-            response = requests.post(
-                self.url,
+            response = self.transport.request(
+                "POST",
                 json={"document_ids": ["Penal_Code.json.law_document.extraction.test", 
                                     "akta-15-akta-hasutan-1948.v1.en.law_document"], "text": "This is video summary"},
                 headers=headers,
+                timeout=AGENT_HEALTH_CHECK_TIMEOUT,
             )
             if response.status_code == 200:
                 return {"status": "healthy"}
@@ -131,7 +144,9 @@ class JustificationAgent(BaseAgent):
     def health_check(self) -> Dict[str, Any]:
         """Perform a basic health check for the agent."""
         try:
-            response = requests.get(self.url, params={"text": "none"})
+            response = self.transport.request(
+                "GET", params={"text": "none"}, timeout=AGENT_HEALTH_CHECK_TIMEOUT
+            )
             if response.status_code == 200:
                 return {"status": "healthy"}
             return {"status": "unhealthy"}
@@ -150,7 +165,9 @@ class CommentRiskAgent(BaseAgent):
     def health_check(self) -> Dict[str, Any]:
         """Perform a basic health check for the agent."""
         try:
-            response = requests.get(self.url, params={"text": "none"})
+            response = self.transport.request(
+                "GET", params={"text": "none"}, timeout=AGENT_HEALTH_CHECK_TIMEOUT
+            )
             if response.status_code == 200:
                 return {"status": "healthy"}
             return {"status": "unhealthy"}
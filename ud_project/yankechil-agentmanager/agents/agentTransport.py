@@ -0,0 +1,175 @@
+import atexit
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from log_mongo import logger
+
+load_dotenv()
+
+# Timeouts of the agent requests (in seconds)
+AGENT_CONNECT_TIMEOUT = float(os.getenv("AGENT_CONNECT_TIMEOUT", "5"))
+AGENT_READ_TIMEOUT = float(os.getenv("AGENT_READ_TIMEOUT", "120"))
+AGENT_HEALTH_CHECK_TIMEOUT = float(os.getenv("AGENT_HEALTH_CHECK_TIMEOUT", "30"))
+# Retries of failed connections and 502/503/504 responses, with exponential
+# backoff. Read timeouts are not retried, the agent may still be processing the
+# request and a retry would wait AGENT_READ_TIMEOUT again
+AGENT_MAX_RETRIES = int(os.getenv("AGENT_MAX_RETRIES", "2"))
+AGENT_RETRY_BACKOFF = float(os.getenv("AGENT_RETRY_BACKOFF", "0.5"))
+# Maximum number of concurrent requests sent to each agent endpoint
+AGENT_MAX_CONCURRENCY = int(os.getenv("AGENT_MAX_CONCURRENCY", "8"))
+# Consecutive failures opening the circuit, and seconds before trying again
+AGENT_CIRCUIT_FAILURES = int(os.getenv("AGENT_CIRCUIT_FAILURES", "5"))
+AGENT_CIRCUIT_RESET_TIMEOUT = float(os.getenv("AGENT_CIRCUIT_RESET_TIMEOUT", "30"))
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised when an agent is not called because its circuit is open."""
+
+
+class AgentTransport:
+    """HTTP transport shared by all the callers of one agent URL.
+
+    Keeps the connections alive in a pool, applies the timeouts and retries,
+    bounds the number of in-flight requests and stops calling the agent for a
+    while after consecutive failures (circuit breaker).
+    """
+
+    def __init__(
+        self,
+        url: str,
+        timeout: Tuple[float, float] = (AGENT_CONNECT_TIMEOUT, AGENT_READ_TIMEOUT),
+        max_retries: int = AGENT_MAX_RETRIES,
+        backoff_factor: float = AGENT_RETRY_BACKOFF,
+        max_concurrency: int = AGENT_MAX_CONCURRENCY,
+        failure_threshold: int = AGENT_CIRCUIT_FAILURES,
+        reset_timeout: float = AGENT_CIRCUIT_RESET_TIMEOUT,
+    ):
+        self.url = url
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=0,
+            status=max_retries,
+            other=0,
+            backoff_factor=backoff_factor,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=None,  # The agents only run inference, retry POST too
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max_concurrency,
+            max_retries=retry,
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.limiter = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_running = False
+
+    def _before_request(self):
+        """Raise CircuitOpenError if the agent should not be called now."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if time.monotonic() - self._opened_at < self.reset_timeout or self._trial_running:
+                raise CircuitOpenError(f"Circuit open for {self.url}")
+            # Half-open: let one request through to check if the agent is back
+            self._trial_running = True
+
+    def _record_result(self, success: bool):
+        with self._lock:
+            self._trial_running = False
+            if success:
+                self._failures = 0
+                self._opened_at = None
+                return
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.error(
+                        f"Circuit opened for {self.url} after {self._failures} failures",
+                    )
+                self._opened_at = time.monotonic()
+
+    def request(
+        self,
+        method: str,
+        params: Dict = None,
+        json: Dict = None,
+        headers: Dict = None,
+        timeout: Optional[float] = None,
+    ) -> requests.Response:
+        """Send a request to the agent URL.
+
+        :param method: HTTP method ('GET', 'POST', etc.)
+        :param params: Query parameters of the request
+        :param json: JSON body of the request
+        :param headers: Optional headers for the request
+        :param timeout: Timeout overriding the transport timeout
+        :return: Response of the agent
+        :raises requests.RequestException: On connection errors, timeouts and
+            when the circuit is open
+        """
+        self._before_request()
+        try:
+            with self.limiter:
+                response = self.session.request(
+                    method,
+                    self.url,
+                    params=params,
+                    json=json,
+                    headers=headers,
+                    timeout=timeout or self.timeout,
+                )
+        except requests.RequestException:
+            self._record_result(False)
+            raise
+
+        self._record_result(response.status_code < 500)
+        return response
+
+    def close(self):
+        self.session.close()
+
+
+_transports: Dict[str, AgentTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_agent_transport(url: str) -> AgentTransport:
+    """Get the transport shared by all the agents calling url."""
+    with _transports_lock:
+        transport = _transports.get(url)
+        if transport is None:
+            transport = AgentTransport(url)
+            _transports[url] = transport
+        return transport
+
+
+def close_agent_transports():
+    """Close the sessions of all the agent transports."""
+    with _transports_lock:
+        for transport in _transports.values():
+            transport.close()
+        _transports.clear()
+
+
+# Close the pooled connections on shutdown, of the API and of the workers alike
+atexit.register(close_agent_transports)
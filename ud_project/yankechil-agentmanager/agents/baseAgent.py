@@ -2,6 +2,7 @@ from typing import Any, Dict
 
 import requests
 
+from agents.agentTransport import AgentTransport, get_agent_transport
 from log_mongo import logger
 
 
@@ -12,6 +13,11 @@ class BaseAgent:
         self.name = name
         self.url = url
 
+    @property
+    def transport(self) -> AgentTransport:
+        """Transport shared by all the agents calling the same URL."""
+        return get_agent_transport(self.url)
+
     def execute(
         self,
         params: Dict,
@@ -28,15 +34,11 @@ class BaseAgent:
             headers = {"Content-Type": "application/json"}
 
         try:
-            if method.upper() == "POST":
-                response = requests.post(self.url, json=params, headers=headers)
-            elif method.upper() == "GET":
-                response = requests.get(self.url, params=params, headers=headers)
+            if method.upper() == "GET":
+                response = self.transport.request("GET", params=params, headers=headers)
             else:
-                # Add support for other HTTP methods if needed
-                response = requests.request(
+                response = self.transport.request(
                     method.upper(),
-                    self.url,
                     json=params,
                     headers=headers,
                 )
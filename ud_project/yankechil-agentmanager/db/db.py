@@ -1,13 +1,26 @@
 import sys
 
 sys.stdout.reconfigure(encoding="utf-8")
+import json
 import os
+import time
+from datetime import datetime
 
 import pandas as pd
 from dotenv import load_dotenv
-from sqlalchemy import Column, create_engine
+from sqlalchemy import (
+    Column,
+    DateTime,
+    String,
+    Text,
+    bindparam,
+    create_engine,
+    insert,
+    inspect,
+    select,
+    text,
+)
 from sqlalchemy.engine.reflection import Inspector
-from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -25,9 +38,56 @@ if not mysql_database:
     logger.error("mysql_database not found")
 
 
+# Number of rows per DataFrame chunk of read_table_in_chunks
+read_chunk_size = int(os.getenv("READ_CHUNK_SIZE", "1000"))
+
+# Maximum number of rows and of bound parameters in one bulk INSERT
+insert_batch_max_rows = int(os.getenv("INSERT_BATCH_MAX_ROWS", "1000"))
+insert_batch_max_params = int(os.getenv("INSERT_BATCH_MAX_PARAMS", "30000"))
+
+
+def get_insert_batch_size(n_rows: int, n_columns: int) -> int:
+    """Get the number of rows inserted per statement and commit.
+
+    All the rows go in one batch as long as the batch stays under
+    insert_batch_max_rows rows and insert_batch_max_params bound parameters.
+
+    Args:
+        n_rows (int): Number of rows to insert.
+        n_columns (int): Number of columns of each row.
+
+    Returns:
+        int: The batch size.
+
+    """
+    max_rows = min(
+        insert_batch_max_rows,
+        insert_batch_max_params // max(n_columns, 1),
+    )
+    return max(1, min(n_rows, max_rows))
+
+
 # Assuming a shared base class for all dynamic schemas
 Base = declarative_base()
 
+
+class PipelineWatermarkSchema(Base):
+    """Last key_id read by each pipeline, to resume reading the source table."""
+
+    __tablename__ = os.getenv("table_name_watermarks", "pipeline_watermarks")
+
+    pipeline_name = Column(String(255), primary_key=True)
+    last_key = Column(Text, nullable=True)  # JSON encoded key_id value
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+def _is_missing(value):
+    """Check if value is a NaN/NaT scalar to be stored as NULL."""
+    try:
+        return value is not None and not isinstance(value, (str, bytes)) and bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
 class Database:
     def __init__(self, db_url: str, output_schemas: list, input_schemas: list = None):
         self.engine = create_engine(
@@ -189,6 +249,8 @@ class Database:
         order_by: str = "id",
     ) -> pd.DataFrame:
         """Get data from the source table in batches, ensuring a consistent order.
+        LIMIT/OFFSET slows down as the offset grows, read_table_in_chunks
+        reads large tables with keyset pagination instead.
 
         Args:
             table_source_name (str): Name of the source table to fetch data from.
@@ -217,70 +279,147 @@ class Database:
             logger.error(f"Error fetching data from {table_source_name}: {e}")
             return pd.DataFrame()  # Return empty DataFrame if an error occurs
 
-    def get_new_rows(self, key_id, table_target_name: str, table_source_name: str):
-        """Fetch new rows from table_source_name that do not exist in table_target_name.
-        If the target table does not exist or is empty, fetch all rows from the source table.
+    def read_table_in_chunks(
+        self,
+        table_source_name: str,
+        key_id: str = "id",
+        chunk_size: int = None,
+        start_after=None,
+        conditions: list = None,
+        params: dict = None,
+        pipeline_name: str = None,
+    ):
+        """Read the rows of the source table in chunks ordered by key_id.
+
+        Each chunk is fetched with keyset pagination (key_id > last key of the
+        previous chunk), so the cost of a chunk does not grow with the number
+        of rows already read and only one chunk is held in memory.
+
+        Args:
+            table_source_name (str): Name of the source table to fetch data from.
+            key_id (str): Unique column to paginate on.
+            chunk_size (int): Number of rows per chunk. Defaults to READ_CHUNK_SIZE.
+            start_after: Read the rows with a key_id greater than this value.
+                Defaults to the watermark of pipeline_name.
+            conditions (list): SQL conditions of the WHERE clause, joined by AND.
+            params (dict): Values of the conditions parameters, lists and tuples
+                are expanded for IN conditions.
+            pipeline_name (str): If given, the last key_id of each chunk is
+                saved as the watermark of the pipeline once the chunk is processed.
+
+        Yields:
+            pd.DataFrame: The next chunk of at most chunk_size rows.
+
+        """
+        chunk_size = chunk_size or read_chunk_size
+        conditions = list(conditions or [])
+        params = dict(params or {})
+
+        if start_after is None and pipeline_name is not None:
+            start_after = self.get_watermark(pipeline_name)
+
+        # Lists and tuples are expanded for IN conditions
+        expanding = [
+            bindparam(name, expanding=True)
+            for name, value in params.items()
+            if isinstance(value, (list, tuple))
+        ]
+
+        logger.info(
+            f"Reading table: {table_source_name}, chunk size: {chunk_size}, "
+            f"start after {key_id}: {start_after}",
+        )
+        while True:
+            query_conditions = list(conditions)
+            query_params = {**params, "chunk_size": chunk_size}
+            if start_after is not None:
+                query_conditions.append(f"{key_id} > :last_key")
+                query_params["last_key"] = start_after
+            where = " AND ".join(query_conditions) or "1 = 1"
+
+            query = text(f"""
+                SELECT *
+                FROM {table_source_name}
+                WHERE {where}
+                ORDER BY {key_id} ASC
+                LIMIT :chunk_size
+            """).bindparams(*expanding)
+            chunk = pd.read_sql(query, self.engine, params=query_params)
+            if chunk.empty:
+                break
+
+            yield chunk
+
+            start_after = chunk[key_id].iloc[-1]
+            if hasattr(start_after, "item"):
+                # numpy scalar to a Python value for the query and the watermark
+                start_after = start_after.item()
+            if pipeline_name is not None:
+                self.set_watermark(pipeline_name, start_after)
+            if len(chunk) < chunk_size:
+                break
+
+    def get_watermark(self, pipeline_name: str):
+        """Get the last key_id saved for the pipeline, None if there is none."""
+        watermark = self.session.get(PipelineWatermarkSchema, pipeline_name)
+        if watermark is None or watermark.last_key is None:
+            return None
+        return json.loads(watermark.last_key)
+
+    def set_watermark(self, pipeline_name: str, last_key):
+        """Save the last key_id processed by the pipeline."""
+        try:
+            self.session.merge(
+                PipelineWatermarkSchema(
+                    pipeline_name=pipeline_name,
+                    last_key=json.dumps(last_key, default=str),
+                    updated_at=datetime.now(),
+                )
+            )
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to save the watermark of {pipeline_name}: {e}")
+
+    def get_new_rows(
+        self,
+        key_id,
+        table_target_name: str,
+        table_source_name: str,
+        chunk_size: int = None,
+    ):
+        """Read the new rows of table_source_name that are not yet in table_target_name.
+        The rows with a key_id greater than the last key_id of the target table are
+        read in chunks, all rows if the target table does not exist or is empty.
 
         Args:
             key_id (str): Column name used to identify rows uniquely.
             table_target_name (str): Name of the target table.
             table_source_name (str): Name of the source table.
+            chunk_size (int): Number of rows per chunk. Defaults to READ_CHUNK_SIZE.
 
-        Returns:
-            pd.DataFrame: A DataFrame containing new rows from the source table.
+        Yields:
+            pd.DataFrame: The next chunk of new rows from the source table.
 
         """
         try:
-            # Check if the target table exists
-            table_exists_query = f"""
-                SELECT COUNT(*) 
-                FROM information_schema.tables 
-                WHERE table_name = '{table_target_name}'
-            """
-            table_exists_df = pd.read_sql_query(table_exists_query, self.engine)
-            if table_exists_df.iloc[0, 0] == 0:
+            max_id = None
+            if inspect(self.engine).has_table(table_target_name):
+                with self.engine.connect() as connection:
+                    max_id = connection.execute(
+                        text(f"SELECT MAX({key_id}) FROM {table_target_name}")
+                    ).scalar()
+            else:
                 print(
                     f"Target table '{table_target_name}' does not exist. Fetching all rows from source table.",
                 )
-                all_rows_query = f"SELECT * FROM {table_source_name}"
-                return pd.read_sql_query(all_rows_query, self.engine)
 
-            # Check if the target table is empty
-            table_empty_query = f"SELECT COUNT(*) AS row_count FROM {table_target_name}"
-            table_empty_df = pd.read_sql_query(table_empty_query, self.engine)
-            if table_empty_df["row_count"].iloc[0] == 0:
-                print(
-                    f"Target table '{table_target_name}' is empty. Fetching all rows from source table.",
-                )
-                all_rows_query = f"SELECT * FROM {table_source_name}"
-                return pd.read_sql_query(all_rows_query, self.engine)
-
-            # Query to get the maximum id from the target table
-            max_id_query = f"SELECT MAX({key_id}) AS max_id FROM {table_target_name}"
-            max_id_df = pd.read_sql_query(max_id_query, self.engine)
-            max_id = (
-                max_id_df["max_id"].iloc[0]
-                if not max_id_df["max_id"].isnull().iloc[0]
-                else None
+            yield from self.read_table_in_chunks(
+                table_source_name, key_id, chunk_size, start_after=max_id
             )
 
-            # Fetch new rows from the source table
-            if max_id is None:
-                print(
-                    "No valid max ID found in the target table. Fetching all rows from source table.",
-                )
-                new_rows_query = f"SELECT * FROM {table_source_name}"
-            else:
-                new_rows_query = (
-                    f"SELECT * FROM {table_source_name} WHERE {key_id} > '{max_id}'"
-                )
-
-            new_rows_df = pd.read_sql_query(new_rows_query, self.engine)
-            return new_rows_df
-
         except Exception as e:
             print(f"An error occurred: {e}")
-            return pd.DataFrame()
 
     def insert_data(self, table_name: str, data: pd.DataFrame):
         """Insert data into a table."""
@@ -310,38 +449,123 @@ class Database:
 
     def insert_row_by_row(self, key_id, schema, table_row, i):
         """Insert a single row from a DataFrame into the database."""
-        try:
-            row_dict = table_row.to_dict()
-            # Check if a row with the same unique attributes already exists
-            existing_row = (
-                self.session.query(schema)
-                .filter_by(
-                    **{key: row_dict[key] for key in [key_id]},
-                )  # key_id is unique column name
-                .first()
+        stats = self.insert_rows_in_batches(key_id, schema, [table_row])
+        if stats["written"]:
+            logger.info(f"Row {i} inserted successfully.")
+        elif stats["skipped"]:
+            logger.error(f"Duplicate row found, skipping insertion: row {i}")
+        else:
+            logger.error(f"Failed to insert row {i}")
+
+    def insert_rows_in_batches(self, key_id, schema, rows, batch_size=None):
+        """Insert rows into the table of schema, skipping the rows whose key_id
+        already exists.
+
+        Each batch costs one keyed query on the existing keys, one bulk INSERT
+        and one commit. A failed batch is retried in halves down to single
+        rows, so that only the failing rows are counted as failed.
+
+        Args:
+            key_id (str): Unique column used to detect duplicate rows.
+            schema: SQLAlchemy table schema of the target table.
+            rows (list or pd.DataFrame): Rows as dicts or pandas Series.
+            batch_size (int): Rows per batch. Defaults to get_insert_batch_size.
+
+        Returns:
+            dict: Rows written, skipped and failed, with the written/skipped
+                rows per second.
+
+        """
+        start_time = time.perf_counter()
+        table = schema.__table__
+
+        if isinstance(rows, pd.DataFrame):
+            rows = rows.to_dict("records")
+        else:
+            rows = [row.to_dict() if isinstance(row, pd.Series) else dict(row) for row in rows]
+
+        # Keep the columns of the table only, replace NaN with None for SQL
+        # compatibility, the first row of each key_id wins
+        rows_by_key = {}
+        for row in rows:
+            row = {
+                column: (None if _is_missing(value) else value)
+                for column, value in row.items()
+                if column in table.c
+            }
+            rows_by_key.setdefault(row.get(key_id), row)
+        skipped = len(rows) - len(rows_by_key)
+
+        rows = list(rows_by_key.values())
+        if batch_size is None:
+            batch_size = get_insert_batch_size(len(rows), len(table.c))
+
+        written = 0
+        failed = 0
+        for i in range(0, len(rows), batch_size):
+            batch_written, batch_skipped, batch_failed = self._insert_new_rows(
+                table, key_id, rows[i : i + batch_size]
             )
-            if not existing_row:
-                # # Convert row to a dictionary and insert it into the table schema
-                table_row = schema(**row_dict)
+            written += batch_written
+            skipped += batch_skipped
+            failed += batch_failed
+            if batch_failed:
+                logger.error(
+                    f"Failed to insert {batch_failed} rows of batch {i // batch_size + 1}"
+                )
+
+        elapsed_time = max(time.perf_counter() - start_time, 1e-9)
+        stats = {
+            "written": written,
+            "skipped": skipped,
+            "failed": failed,
+            "seconds": elapsed_time,
+            "written_per_second": written / elapsed_time,
+            "skipped_per_second": skipped / elapsed_time,
+        }
+        logger.info(
+            f"Inserted into {table.name}: {written} written "
+            f"({stats['written_per_second']:.1f} rows/s), {skipped} skipped "
+            f"({stats['skipped_per_second']:.1f} rows/s), {failed} failed "
+            f"in {elapsed_time:.3f}s",
+        )
+        return stats
 
-                # Add the new row to the session
-                self.session.add(table_row)
+    def _insert_new_rows(self, table, key_id, rows):
+        """Insert the rows whose key_id does not exist yet in one transaction.
 
-                # Commit the changes (this happens for each row)
-                self.session.commit()
-                logger.info(f"Row {i} inserted successfully.")
-            else:
-                logger.error(f"Duplicate row found, skipping insertion: {row_dict}")
+        A failed transaction is retried in two halves, down to single rows,
+        so that a failing row (e.g. inserted meanwhile by another writer)
+        only fails itself and not the rest of its batch.
 
-        except IntegrityError as e:
-            # Handle integrity errors (e.g., primary key violations)
-            self.session.rollback()  # Rollback the transaction to maintain consistency
-            logger.error(f"Integrity error inserting row {i}: {e}")
+        Returns:
+            tuple: Rows written, skipped and failed.
 
+        """
+        key_column = table.c[key_id]
+        try:
+            existing_keys = set(
+                self.session.execute(
+                    select(key_column).where(
+                        key_column.in_([row[key_id] for row in rows])
+                    )
+                ).scalars()
+            )
+            new_rows = [row for row in rows if row[key_id] not in existing_keys]
+            if new_rows:
+                self.session.execute(insert(table), new_rows)
+            self.session.commit()
+            return len(new_rows), len(rows) - len(new_rows), 0
         except Exception as e:
-            # Handle other exceptions
             self.session.rollback()  # Ensure session consistency by rolling back
-            logger.error(f"Failed to insert row {i}: {e}")
+            if len(rows) == 1:
+                logger.error(f"Failed to insert row {rows[0][key_id]}: {e}")
+                return 0, 0, 1
+
+        middle = len(rows) // 2
+        first = self._insert_new_rows(table, key_id, rows[:middle])
+        second = self._insert_new_rows(table, key_id, rows[middle:])
+        return tuple(a + b for a, b in zip(first, second))
 
     def get_new_rows_by_id(
         self,
@@ -547,13 +771,11 @@ class Database:
     ):
         """Insert new rows asynchronously into the target table based on `key_id`."""
         try:
-            new_rows_df = self.get_new_rows(
+            for new_rows_df in self.get_new_rows(
                 key_id,
                 table_target_name,
                 table_source_name,
-            )
-
-            if not new_rows_df.empty:
+            ):
                 logger.info(
                     f"Found {new_rows_df.shape[0]} new rows to insert into {table_target_name}",
                 )
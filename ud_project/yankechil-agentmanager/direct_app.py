@@ -205,18 +205,6 @@ async def trigger_crawler_api_to_fill_data(end_date):
     logger.info("Other API has been triggered to fill the missing data.")
 
 
-async def load_data(db, table_name):
-    """Load necessary CSV data."""
-    try:
-        # # Load input data
-        df = db.get_data_from_table(table_name)[:]
-        # df = pd.read_csv("comments_table.csv")
-        return df
-    except Exception as e:
-        logger.error(f"Error loading data: {e}")
-        raise
-
-
 class CustomProcessorException(Exception):
     """Base class for all custom processor exceptions."""
 
@@ -290,13 +278,6 @@ async def run_async_direct_processor_v0(table_config):
             ]
         )
 
-        df = db.get_new_rows(
-            key_id,
-            table_config.table_target_name,
-            table_config.table_source_name,
-        )
-        pipeline = DataProcessorPipeline_v00(agentsprocess, db, df)
-
         # Log the agent health status
         logger.info("Agent Health Status: %s", health_status)
         # If any agent is unhealthy, stop execution or raise an error
@@ -304,8 +285,14 @@ async def run_async_direct_processor_v0(table_config):
             logger.error("One or more agents are unavailable. Terminating the process.")
             raise SystemExit("Agent health check failed. Process terminated.")
 
-        # Run pipeline
-        pipeline.run_all_agents_pipeline(key_id)
+        # Run the pipeline on the new rows chunk by chunk
+        for df in db.get_new_rows(
+            key_id,
+            table_config.table_target_name,
+            table_config.table_source_name,
+        ):
+            pipeline = DataProcessorPipeline_v00(agentsprocess, db, df)
+            pipeline.run_all_agents_pipeline(key_id)
 
     except Exception as e:
         logger.error(f"Error in run_async_direct_processor_v0: {e}")
@@ -1,6 +1,5 @@
 import asyncio
 import os
-import pandas as pd
 from typing import Dict, List
 from urllib.parse import quote_plus
 
@@ -304,46 +303,28 @@ async def run_async_direct_processor_v0(table_config):
             logger.error("One or more agents are unavailable. Terminating the process.")
             raise SystemExit("Agent health check failed. Process terminated.")
 
-        # Track the last processed key_id
-        with db.engine.connect() as connection:
-            result = connection.execute(
-                text(
-                    f"SELECT COALESCE(MAX({key_id}), '') FROM {table_config.table_target_name}"
-                )
-            )
-            last_processed_id = result.scalar()
-
-        # Get the total row count of the source table
-        total_rows_query = text(
-            f"SELECT COUNT(*) AS total_rows FROM {table_config.table_source_name}"
+        # Resume after the last key_id read by this pipeline, or after the last
+        # key_id of the target table on the first run
+        pipeline_name = (
+            f"direct_batch:{table_config.table_source_name}:{table_config.table_target_name}"
         )
-        total_rows_df = pd.read_sql(total_rows_query, db.engine)
-        total_rows = total_rows_df["total_rows"].iloc[0]
-        logger.info(f"Total rows in source table: {total_rows}")
+        last_processed_id = db.get_watermark(pipeline_name)
+        if last_processed_id is None:
+            with db.engine.connect() as connection:
+                result = connection.execute(
+                    text(f"SELECT MAX({key_id}) FROM {table_config.table_target_name}")
+                )
+                last_processed_id = result.scalar()
 
         processed_rows = 0  # Counter for processed rows
-        while True:
-            # Fetch the next batch of rows
-            query = text(f"""
-                SELECT *
-                FROM {table_config.table_source_name}
-                WHERE {key_id} > :last_processed_id
-                ORDER BY {key_id} ASC
-                LIMIT :batch_size;
-            """)
-            batch_df = pd.read_sql(
-                query,
-                db.engine,
-                params={
-                    "last_processed_id": last_processed_id,
-                    "batch_size": batch_size,
-                },
-            )
-
-            if batch_df.empty:
-                logger.info("No more new data to process.")
-                break
-
+        # Fetch the rows by batches, the watermark is saved after each batch
+        for batch_df in db.read_table_in_chunks(
+            table_config.table_source_name,
+            key_id,
+            batch_size,
+            start_after=last_processed_id,
+            pipeline_name=pipeline_name,
+        ):
             # Log batch details
             logger.info(f"Processing batch with size {len(batch_df)}.")
 
@@ -352,20 +333,10 @@ async def run_async_direct_processor_v0(table_config):
             
             pipeline.run_all_agents_pipeline_batch(key_id, batch_df, batch_size_store)
 
-            # Update the last processed ID
-            last_processed_id = batch_df[key_id].max()
-
             # Increment processed rows counter
             processed_rows += len(batch_df)
 
-            # Safety check: Break if processed rows exceed total rows
-            if processed_rows > total_rows:
-                logger.error(
-                    f"Processed rows ({processed_rows}) exceed total rows ({total_rows}). Terminating."
-                )
-                raise RuntimeError(
-                    "Infinite loop detected: Processed rows exceeded total source table rows."
-                )
+        logger.info(f"No more new data to process, {processed_rows} rows processed.")
 
     except Exception as e:
         logger.error(f"Error in run_async_direct_processor_v0: {e}")
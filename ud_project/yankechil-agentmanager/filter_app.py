@@ -3,9 +3,11 @@ import os
 from typing import Dict, List
 from urllib.parse import quote_plus
 
+import pandas as pd
 import requests
 from dotenv import load_dotenv
 from pydantic import BaseModel
+from sqlalchemy import bindparam, text
 
 from agents.Agents import (
     AgentsNameV0,
@@ -24,8 +26,8 @@ from processing.pipeline_direct import DataProcessorPipeline_v00
 from processing.pipeline_filter import (
     DataProcessorPipeline_v01,
     apply_filters,
-    filter_by_date,
-    validate_columns,
+    get_available_category_and_subcategory_id,
+    get_sql_filters,
 )
 from schema.output_schemas import (
     AnalysisTableSchema,
@@ -233,31 +235,10 @@ async def trigger_crawler_api_to_fill_data(end_date):
     logger.info("Other API has been triggered to fill the missing data.")
 
 
-async def load_data(db, table_name):
-    """Load necessary CSV data."""
-    try:
-        # # Load input data
-        df = db.get_data_from_table(table_name)[:]
-        # df = pd.read_csv("comments_table.csv")
-        return df
-    except Exception as e:
-        logger.error(f"Error loading data: {e}")
-        raise
-
-
 async def load_all_data(db):
-    """Load necessary CSV data."""
+    """Load the category and subcategory tables."""
     try:
         # Load input data
-        df_unbiased = db.get_data_from_table(preprocessed_unbiased_table_name)[:]
-        if df_unbiased.empty:
-            logger.error(f"{preprocessed_unbiased_table_name} is empty.")
-        df_mapped = db.get_data_from_table(mapped_table_name)
-        if df_mapped.empty:
-            logger.error(f"{mapped_table_name} is empty.")
-        df_comments = db.get_data_from_table(comments_table_name)[:]
-        if df_comments.empty:
-            logger.error(f"{comments_table_name} is empty.")
         df_category = db.get_data_from_table(category_table_name)
         if df_category.empty:
             logger.error(f"{category_table_name} is empty.")
@@ -265,18 +246,28 @@ async def load_all_data(db):
         if df_sub_category.empty:
             logger.error(f"{sub_category_table_name} is empty.")
 
-        # df_mapped = pd.read_csv("mapped_cat_sub.csv")
-        # df_unbiased = pd.read_csv("preprocessed_unbiased.csv")[:]  # Limit for testing
-        # df_comments = pd.read_csv("comments.csv")[:]
         # df_category = pd.read_csv("category.csv")
         # df_sub_category = pd.read_csv("sub_category.csv")
 
-        return df_mapped, df_unbiased, df_comments, df_sub_category, df_category
+        return df_sub_category, df_category
     except Exception as e:
         logger.error(f"Error loading data: {e}")
         raise
 
 
+def read_mapped_rows(db, unbiased_ids):
+    """Read the mapped rows of the unbiased rows of a chunk."""
+    if not unbiased_ids:
+        return pd.DataFrame()
+
+    query = text(f"""
+        SELECT *
+        FROM {mapped_table_name}
+        WHERE preprocessed_unbiased_id IN :unbiased_ids
+    """).bindparams(bindparam("unbiased_ids", expanding=True))
+    return pd.read_sql(query, db.engine, params={"unbiased_ids": unbiased_ids})
+
+
 async def run_filtering_pipeline_for_analysis(
     agentsprocess,
     db,
@@ -334,6 +325,94 @@ async def run_filtering_pipeline_for_comments_v0(
     logger.info("Pipeline_v0 processing comments data completed.")
 
 
+async def process_unbiased_and_mapped_tables(db, config, agentsprocess):
+    """Process the unbiased rows of the config in chunks with their mapped rows.
+
+    Returns:
+        int: Number of unbiased rows processed.
+
+    """
+    # Load static data once
+    df_sub_category, df_category = await load_all_data(db)
+
+    # Filter by dates, category and subcategory in the query
+    logger.info("Filtering data by date range...")
+    post_date_unbiased_column_name = "video_posted_timestamp"
+    conditions, params = get_sql_filters(config, post_date_unbiased_column_name)
+    filter_category = config.category or config.subcategory
+    if filter_category:
+        logger.info("Applying category and subcategory filters...")
+        category_filter, subcategory_filter = get_available_category_and_subcategory_id(
+            config, df_category, df_sub_category
+        )
+        conditions.append(f"""video_id IN (
+            SELECT video_id
+            FROM {mapped_table_name}
+            WHERE category_id IN :category_ids AND sub_category_id IN :sub_category_ids
+        )""")
+        params["category_ids"] = [int(id_) for id_ in category_filter]
+        params["sub_category_ids"] = [int(id_) for id_ in subcategory_filter]
+
+    processed_rows = 0
+    for df_unbiased in db.read_table_in_chunks(
+        preprocessed_unbiased_table_name,
+        "id",
+        conditions=conditions,
+        params=params,
+    ):
+        df_mapped = read_mapped_rows(db, df_unbiased["id"].tolist())
+
+        # Keep the mapped rows of the category and subcategory
+        if filter_category and not df_mapped.empty:
+            df_unbiased, df_mapped = apply_filters(
+                df_unbiased, df_mapped, df_sub_category, df_category, config
+            )
+
+        if df_unbiased.empty or df_mapped.empty:
+            logger.info("Filtered data is empty for this chunk. Skipping...")
+            continue
+
+        logger.info(f"Processing {len(df_unbiased)} rows from the unbiased table.")
+        await run_filtering_pipeline_for_analysis(
+            agentsprocess, db, df_unbiased, df_mapped, config
+        )
+        processed_rows += len(df_unbiased)
+
+    return processed_rows
+
+
+async def process_comments_table(comments_db, config, agentsprocess):
+    """Process the comments of the config in chunks.
+
+    Returns:
+        int: Number of comments processed.
+
+    """
+    equal_columns = {}
+    if config.category or config.subcategory:
+        equal_columns["category"] = config.category
+        equal_columns["subcategory"] = config.subcategory
+    post_date_comments_column_name = "comment_posted_timestamp"
+    conditions, params = get_sql_filters(
+        config, post_date_comments_column_name, equal_columns
+    )
+
+    processed_rows = 0
+    for df_comments in comments_db.read_table_in_chunks(
+        comments_table_name,
+        "id",
+        conditions=conditions,
+        params=params,
+    ):
+        logger.info(f"Processing {len(df_comments)} rows from the comments table.")
+        await run_filtering_pipeline_for_comments(
+            agentsprocess, comments_db, df_comments, config
+        )
+        processed_rows += len(df_comments)
+
+    return processed_rows
+
+
 async def run_async_filtered_processor(config):
     # List of output schemas (tables for storing results)
     output_schemas = [AnalysisTableSchema, MappedTableSchemaOut]
@@ -367,119 +446,22 @@ async def run_async_filtered_processor(config):
         raise SystemExit("Agent health check failed. Process terminated.")
 
     try:
-        # Load data
-        (
-            df_mapped,
-            df_unbiased,
-            df_comments,
-            df_sub_category,
-            df_category,
-        ) = await load_all_data(db)
-
-        post_date_unbiased_column_name = "video_posted_timestamp"
-        post_date_comments_column_name = "comment_posted_timestamp"
-        agent_builder_name = config.agent_builder_name
-        risk_levels = config.risk_levels
-
-        print(df_mapped.head())
-        print(df_unbiased.head())
-        print(df_comments.head())
-        print(df_category.head())
-        print(df_sub_category.head())
-
-        # Validate columns
-        logger.info("Validating columns...")
-        validate_columns(
-            df_unbiased,
-            df_comments,
-            post_date_unbiased_column_name,
-            post_date_comments_column_name,
-            agent_builder_name,
+        # Read and process the tables chunk by chunk, both pipelines concurrently
+        processed_unbiased, processed_comments = await asyncio.gather(
+            process_unbiased_and_mapped_tables(db, config, agentsprocess),
+            process_comments_table(comments_db, config, agentsprocess),
+        )
+        logger.info(
+            f"Processed {processed_unbiased} unbiased rows and "
+            f"{processed_comments} comments."
         )
-
-        # Filter by dates
-        logger.info("Filtering data by date range...")
-        if not config.start_date and not config.end_date:
-            filtered_unbiased = df_unbiased
-            filtered_comments = df_comments
-        else:
-            filtered_unbiased = filter_by_date(
-                df_unbiased,
-                config,
-                post_date_unbiased_column_name,
-            )
-            filtered_comments = filter_by_date(
-                df_comments,
-                config,
-                post_date_comments_column_name,
-            )
-
-        print(filtered_unbiased.empty)
-        print(df_mapped.empty)
-
-        # Raise the custom exception
-        if filtered_unbiased.empty:
-            logger.warning("No data found after filtering!")
-            logger.info("Triggering crawler to update data.")
-            raise NoDataFoundException
-
-        # Apply category and subcategory filters
-        logger.info("Applying category and subcategory filters...")
-        if not config.category and not config.subcategory:
-            filtered_unbiased = filtered_unbiased
-            filtered_mapped = df_mapped
-            filtered_comments = filtered_comments
-        else:
-            filtered_unbiased, filtered_mapped = apply_filters(
-                filtered_unbiased,
-                df_mapped,
-                df_sub_category,
-                df_category,
-                config,
-            )
-            filtered_comments = filtered_comments[
-                (df_comments["category"] == config.category)
-                & (df_comments["subcategory"] == config.subcategory)
-            ]
-
-        print(filtered_unbiased.empty)
-        print(filtered_mapped.empty)
-        print(filtered_comments.empty)
-        print("^^^^^^^^^^^^^^^^^^^^")
-        unbiased_unique_video_ids = len(df_unbiased["video_id"].unique())
-        print(unbiased_unique_video_ids)
-        mapped_unique_video_ids = len(df_mapped["video_id"].unique())
-        print(mapped_unique_video_ids)
-        print(len(filtered_unbiased))
-        print(len(filtered_mapped))
-        print(len(filtered_comments))
-        print("^^^^^^^^^^^^^^^^^^^^")
 
         # Raise the custom exception
-        if filtered_unbiased.empty or filtered_mapped.empty:
+        if not processed_unbiased:
             logger.warning("No data found after filtering!")
             logger.info("Triggering crawler to update data.")
             raise NoDataFoundException
 
-        comment_key_id = "comment_mongodb_id"
-
-        # Run pipeline concurrently (you can uncomment the second pipeline when it's needed)
-        await asyncio.gather(
-            run_filtering_pipeline_for_analysis(
-                agentsprocess,
-                db,
-                filtered_unbiased,
-                filtered_mapped,
-                config,
-            ),
-            run_filtering_pipeline_for_comments(
-                agentsprocess,
-                comments_db,
-                filtered_comments,
-                config,
-            ),
-        )
-
     except Exception as e:
         logger.error(f"Error in run_async_filtered_processor: {e}")
         raise  # Re-raise the exception to propagate it to process_status
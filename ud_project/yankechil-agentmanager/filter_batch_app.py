@@ -3,7 +3,6 @@ import os
 import pandas as pd
 from typing import Dict, List
 import asyncio
-from sqlalchemy import text
 
 from urllib.parse import quote_plus
 
@@ -28,7 +27,8 @@ from processing.pipeline_direct import DataProcessorPipeline_v00
 from processing.pipeline_filter import (
     DataProcessorPipeline_v01,
     apply_filters,
-    filter_by_date,
+    get_available_category_and_subcategory_id,
+    get_sql_filters,
 )
 from schema.output_schemas import (
     AnalysisTableSchema,
@@ -330,63 +330,30 @@ async def run_filtering_pipeline_for_comments_v0(
 async def process_comments_table(
     comments_db, comments_table_name, config, batch_size, agentsprocess
 ):
-    offset_comments = 0
     any_data_processed = False
 
-    # Get the total length of the comments table
-    with comments_db.engine.connect() as connection:
-        total_comments_query = text(f"SELECT COUNT(*) FROM {comments_table_name}")
-        total_comments_length = connection.execute(total_comments_query).scalar()
-    logger.info(f"Total rows in comments table: {total_comments_length}")
-
-    while offset_comments < total_comments_length:
-        # while True:
-        df_comments = comments_db.get_batch_data_from_table(
-            comments_table_name, batch_size, offset_comments
-        )
-
-        if df_comments.empty:
-            logger.info("No more comments data to process.")
-            break
-
-        offset_comments += len(df_comments)
+    # Filter by agent name, dates, category and subcategory in the query
+    logger.info("Filtering by agent name from the comments table.")
+    logger.debug(f"agent name: {config.agent_builder_name}")
+    equal_columns = {"agent_name": config.agent_builder_name}
+    if config.category and config.subcategory:
+        logger.info("Filtering by category and subcategory from the comments table.")
+        equal_columns["category"] = config.category
+        equal_columns["subcategory"] = config.subcategory
+    post_date_comments_column_name = "comment_posted_timestamp"
+    conditions, params = get_sql_filters(
+        config, post_date_comments_column_name, equal_columns
+    )
 
+    for df_comments in comments_db.read_table_in_chunks(
+        comments_table_name,
+        "id",
+        batch_size,
+        conditions=conditions,
+        params=params,
+    ):
         logger.info(f"Processing {len(df_comments)} rows from the comments table.")
 
-        # Filter the DataFrame by agent name
-        logger.info("Filtering by agent name from the comments table.")
-        df_comments = df_comments[df_comments['agent_name'] == config.agent_builder_name]
-        logger.info(f"Filtering by agent name has {len(df_comments)} rows from the comments table.")
-        logger.debug(f"agent name: {config.agent_builder_name}")
-
-        # Filter by dates
-        post_date_comments_column_name = "comment_posted_timestamp"
-        if config.start_date or config.end_date:
-            logger.info("Filtering by date from the comments table.")
-            df_comments = filter_by_date(
-                df_comments, config, post_date_comments_column_name
-            )
-            logger.info(f"Filtering by date has {len(df_comments)} rows from the comments table.")
-
-
-        # Apply category and subcategory filters
-        if config.category and config.subcategory:
-            logger.info("Filtering by category and subcategory from the comments table.")
-            df_comments = df_comments[
-                (df_comments["category"] == config.category)
-                & (df_comments["subcategory"] == config.subcategory)
-            ]
-            logger.info(f"Filtering by category has {len(df_comments)} rows from the comments table.")
-
-
-        # print("^^^^^^^^^^1^^^^^^^^^^")
-        # print("len comments", len(df_comments))
-        # print("^^^^^^^^^1^^^^^^^^^^^")
-
-        if df_comments.empty:
-            logger.info("Filtered comments are empty for this batch. Skipping...")
-            continue
-
         # Process the filtered comments
         await run_filtering_pipeline_for_comments(
             agentsprocess, comments_db, df_comments, config
@@ -408,24 +375,41 @@ async def process_unbiased_and_mapped_tables(
     batch_size,
     agentsprocess,
 ):
-    offset_unbiased = 0
     any_data_processed = False  # Flag to track if any data was processed
 
 
     # Load static data once
     df_sub_category, df_category = await load_all_data(db)
 
-    while True:
-        df_unbiased = db.get_batch_data_from_table(
-            preprocessed_unbiased_table_name, batch_size, offset_unbiased
+    # Filter by agent name, dates, category and subcategory in the query
+    logger.info("Filtering by agent name from the unbiased table.")
+    logger.debug(f"agent name: {config.agent_builder_name}")
+    post_date_unbiased_column_name = "video_posted_timestamp"
+    conditions, params = get_sql_filters(
+        config,
+        post_date_unbiased_column_name,
+        {"agent_name": config.agent_builder_name},
+    )
+    if config.category and config.subcategory:
+        logger.info("Filtering by category and subcategory from the unbiased table.")
+        category_filter, subcategory_filter = get_available_category_and_subcategory_id(
+            config, df_category, df_sub_category
         )
-
-        if df_unbiased.empty:
-            logger.info("No more data in the unbiased table.")
-            break
-
-        offset_unbiased += len(df_unbiased)
-
+        conditions.append(f"""video_id IN (
+            SELECT video_id
+            FROM {mapped_table_name}
+            WHERE category_id IN :category_ids AND sub_category_id IN :sub_category_ids
+        )""")
+        params["category_ids"] = [int(id_) for id_ in category_filter]
+        params["sub_category_ids"] = [int(id_) for id_ in subcategory_filter]
+
+    for df_unbiased in db.read_table_in_chunks(
+        preprocessed_unbiased_table_name,
+        "id",
+        batch_size,
+        conditions=conditions,
+        params=params,
+    ):
         # Fetch mapped data using IDs from the unbiased table
         unbiased_ids = df_unbiased["id"].tolist()
         if unbiased_ids:
@@ -442,36 +426,13 @@ async def process_unbiased_and_mapped_tables(
             logger.warning("No mapped data found for the current batch.")
             continue
 
-        # Filter the DataFrame by agent name
-        logger.info("Filtering by agent name from the unbiased table.")
-        df_unbiased = df_unbiased[df_unbiased['agent_name'] == config.agent_builder_name]
-        logger.info(f"Filtering by agent name has {len(df_unbiased)} rows from the unbiased table.")
-        logger.debug(f"agent name: {config.agent_builder_name}")
-
-        # Filter by dates
-        post_date_unbiased_column_name = "video_posted_timestamp"
-        if config.start_date or config.end_date:
-            logger.info("Filtering by date from the unbiased table.")
-            df_unbiased = filter_by_date(
-                df_unbiased, config, post_date_unbiased_column_name
-            )
-            logger.info(f"Filtering by date has {len(df_unbiased)} rows from the unbiased table.")
-
-
-        # Apply category and subcategory filters
+        # Keep the mapped rows of the category and subcategory
         if config.category and config.subcategory:
-            logger.info("Filtering by category and subcategory from the unbiased table.")
             df_unbiased, df_mapped = apply_filters(
                 df_unbiased, df_mapped, df_sub_category, df_category, config
             )
             logger.info(f"Filtering by category has {len(df_unbiased)} rows from the unbiased table.")
 
-
-        print("^^^^^^^^^^0^^^^^^^^^^")
-        print("len unbiased", len(df_unbiased))
-        print("len mapped", len(df_mapped))
-        print("^^^^^^^^^0^^^^^^^^^^^")
-
         if df_unbiased.empty or df_mapped.empty:
             logger.info("Filtered data is empty for this batch. Skipping...")
             continue
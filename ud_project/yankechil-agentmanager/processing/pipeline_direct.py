@@ -1,5 +1,10 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from agents.agentTransport import AGENT_MAX_CONCURRENCY
+from agents.Agents import AgentsNameV0
 from config.config_num import Num
 from config.config_risk_samples import risk_levels_general, risk_levels_sample
 from log_mongo import logger
@@ -8,6 +13,26 @@ from schema.output_schemas import (
     TikTokTableSchemaOut,
 )
 
+# Maximum number of rows processed at the same time by the batch pipeline
+PIPELINE_MAX_ROWS_IN_FLIGHT = int(os.getenv("PIPELINE_MAX_ROWS_IN_FLIGHT", "32"))
+
+# Columns written by run_all_agents_pipeline_batch
+BATCH_OUTPUT_COLUMNS = [
+    Num.CATEGORY,
+    Num.SUBCATEGORY,
+    Num.SENTIMENT,
+    Num.SENTIMENT_SCORE,
+    Num.API_SENTIMENT,
+    Num.API_SENTIMENT_SCORE,
+    Num.ENGLISH_JUSTIFICATION,
+    Num.MALAY_JUSTIFICATION,
+    Num.RISK_STATUS,
+    Num.IRRELEVANT_SCORE,
+    Num.LAW_REGULATED_OUT,
+    Num.TIMESTAMP,
+    Num.PROCESS_TIME,
+]
+
 
 def get_risk_levels(category, subcategory, risk_levels_dict):
     """Extract the list of risk levels for a given category and subcategory.
@@ -536,6 +561,16 @@ class DataProcessorPipeline_v01:
         self.agentsprocess = agentsprocess
         self.db = db
         self.config = config
+        # Bound the in-flight requests of each agent endpoint
+        self.agent_limiters = {
+            agent_name: threading.BoundedSemaphore(AGENT_MAX_CONCURRENCY)
+            for agent_name in [
+                AgentsNameV0.category,
+                AgentsNameV0.sentiment,
+                AgentsNameV0.justification,
+                AgentsNameV0.law_regulated,
+            ]
+        }
 
     def process_summary(self, input_text):
         data = self.agentsprocess.get_summary_output(input_text)
@@ -833,101 +868,174 @@ class DataProcessorPipeline_v01:
         logger.info("Preproceed all agents pipeline completed.")
 
 
-    def run_all_agents_pipeline_batch(self, key_id, df, batch_size=100):
-        try:
-            rows_to_insert = []  # List to accumulate rows for batch insertion
-            
-            for index, row in df.iterrows():
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                start_time = datetime.now()
+    def _call_agent(self, agent_name, process_fn, input_text):
+        """Run a process_* step while holding the concurrency slot of its agent."""
+        with self.agent_limiters[agent_name]:
+            return process_fn(input_text)
 
-                # Processing steps for Category and Subcategory
-                try:
-                    input_text = str(df.loc[index, Num.VIDEO_SUMMARY])
-                    category, subcategory = self.process_category(input_text)
-                    category = category if category is not None else "None"
-                    subcategory = subcategory if subcategory is not None else "None"
-                    df.loc[index, Num.CATEGORY] = str(category)
-                    df.loc[index, Num.SUBCATEGORY] = str(subcategory)
-                except Exception as e:
-                    logger.error(f"Error in process_category_v0: {e!s}")
-                    df.loc[index, Num.CATEGORY] = "API server error"
-                    df.loc[index, Num.SUBCATEGORY] = "API server error"
+    def _process_row_agents(self, row, sentiment_executor):
+        """Run the agents of one row following their dependencies.
 
-                # Processing steps for Sentiment
-                try:
-                    input_text = str(df.loc[index, Num.VIDEO_SUMMARY])
-                    sentiment, sentiment_score, api_sentiment, api_sentiment_score = self.process_sentiment(input_text)
-                    df.loc[index, Num.SENTIMENT] = str(sentiment if sentiment else "None")
-                    df.loc[index, Num.SENTIMENT_SCORE] = float(sentiment_score if sentiment_score else 0.0)
-                    df.loc[index, Num.API_SENTIMENT] = str(api_sentiment if api_sentiment else "None")
-                    df.loc[index, Num.API_SENTIMENT_SCORE] = float(api_sentiment_score if api_sentiment_score else 0.0)
-                except Exception as e:
-                    logger.error(f"Error in process_sentiment_v0: {e!s}")
-                    df.loc[index, Num.SENTIMENT] = "API server error"
-                    df.loc[index, Num.SENTIMENT_SCORE] = 0.0
-                    df.loc[index, Num.API_SENTIMENT] = "API server error"
-                    df.loc[index, Num.API_SENTIMENT_SCORE] = 0.0
+        Category and sentiment are independent and run in parallel, the
+        justification starts as soon as the category is ready and the law as
+        soon as the justification is ready. A step whose input failed is
+        marked as "API server error" instead of using stale values.
 
-                # Processing steps for Risk Level, Justification, and Law
-                try:
-                    risk_levels = risk_levels_sample  # Define the risk levels sample
-                    risk_level = str(get_risk_levels(category, subcategory, risk_levels))
-                    input_text = "\n".join([str(df.loc[index, Num.VIDEO_SUMMARY]), str(category), str(subcategory), str(risk_level)])
-                    
-                    eng_justification, malay_justification, risk_status, irrelevant_score = self.process_justification(input_text)
-
-                    # Assign values and handle missing/None values
-                    eng_justification = eng_justification if eng_justification is not None else "None"
-                    malay_justification = malay_justification if malay_justification is not None else "None"
-                    risk_status = risk_status if risk_status is not None else "None"
-                    irrelevant_score = irrelevant_score if irrelevant_score is not None else "None"
+        Returns:
+            dict: The output columns of the row.
+        """
+        start_time = datetime.now()
+        output = {Num.TIMESTAMP: start_time.strftime("%Y-%m-%d %H:%M:%S")}
 
-                    df.loc[index, Num.ENGLISH_JUSTIFICATION] = str(eng_justification)
-                    df.loc[index, Num.MALAY_JUSTIFICATION] = str(malay_justification)
-                    df.loc[index, Num.RISK_STATUS] = str(risk_status)
-                    df.loc[index, Num.IRRELEVANT_SCORE] = str(irrelevant_score)
-                except Exception as e:
-                    logger.error(f"Error in process_justification_v0: {e!s}")
-                    df.loc[index, Num.ENGLISH_JUSTIFICATION] = "API server error"
-                    df.loc[index, Num.MALAY_JUSTIFICATION] = "API server error"
-                    df.loc[index, Num.RISK_STATUS] = "API server error"
-                    df.loc[index, Num.IRRELEVANT_SCORE] = "API server error"
+        sentiment_future = sentiment_executor.submit(
+            self._call_agent,
+            AgentsNameV0.sentiment,
+            self.process_sentiment,
+            str(row[Num.VIDEO_SUMMARY]),
+        )
 
-                # Processing steps for Law Regulation
-                try:
-                    input_text = "\n".join([
-                        str(subcategory),
-                        str(df.loc[index, Num.VIDEO_SUMMARY]),
-                        str(df.loc[index, Num.VIDEO_DESCRIPTION]),
-                        str(df.loc[index, Num.TRANSCRIPTION]),
-                        str(risk_status),
-                        str(eng_justification),
-                    ])
-                    law = self.process_law(input_text)
-                    law = law if law is not None else "None"
-                    df.loc[index, Num.LAW_REGULATED_OUT] = str(law)
-                except Exception as e:
-                    logger.error(f"Error in process_law_v0: {e!s}")
-                    df.loc[index, Num.LAW_REGULATED_OUT] = "API server error"
+        # Processing steps for Category and Subcategory
+        category_ok = False
+        try:
+            category, subcategory = self._call_agent(
+                AgentsNameV0.category,
+                self.process_category,
+                str(row[Num.VIDEO_SUMMARY]),
+            )
+            category = category if category is not None else "None"
+            subcategory = subcategory if subcategory is not None else "None"
+            output[Num.CATEGORY] = str(category)
+            output[Num.SUBCATEGORY] = str(subcategory)
+            category_ok = True
+        except Exception as e:
+            logger.error(f"Error in process_category_v0: {e!s}")
+            output[Num.CATEGORY] = "API server error"
+            output[Num.SUBCATEGORY] = "API server error"
 
-                # Adding timestamp and processing time
-                df.loc[index, Num.TIMESTAMP] = timestamp
-                processing_time = (datetime.now() - start_time).total_seconds()
-                df.loc[index, Num.PROCESS_TIME] = processing_time
+        # Processing steps for Risk Level and Justification, needs the category
+        justification_ok = False
+        try:
+            if not category_ok:
+                raise RuntimeError("category is not available")
+            risk_level = str(get_risk_levels(category, subcategory, risk_levels_sample))
+            input_text = "\n".join(
+                [str(row[Num.VIDEO_SUMMARY]), str(category), str(subcategory), risk_level]
+            )
+            eng_justification, malay_justification, risk_status, irrelevant_score = (
+                self._call_agent(
+                    AgentsNameV0.justification, self.process_justification, input_text
+                )
+            )
+            output[Num.ENGLISH_JUSTIFICATION] = str(
+                eng_justification if eng_justification is not None else "None"
+            )
+            output[Num.MALAY_JUSTIFICATION] = str(
+                malay_justification if malay_justification is not None else "None"
+            )
+            output[Num.RISK_STATUS] = str(
+                risk_status if risk_status is not None else "None"
+            )
+            output[Num.IRRELEVANT_SCORE] = str(
+                irrelevant_score if irrelevant_score is not None else "None"
+            )
+            justification_ok = True
+        except Exception as e:
+            logger.error(f"Error in process_justification_v0: {e!s}")
+            output[Num.ENGLISH_JUSTIFICATION] = "API server error"
+            output[Num.MALAY_JUSTIFICATION] = "API server error"
+            output[Num.RISK_STATUS] = "API server error"
+            output[Num.IRRELEVANT_SCORE] = "API server error"
+
+        # Processing steps for Law Regulation, needs the category and justification
+        try:
+            if not justification_ok:
+                raise RuntimeError("justification is not available")
+            input_text = "\n".join(
+                [
+                    str(subcategory),
+                    str(row[Num.VIDEO_SUMMARY]),
+                    str(row[Num.VIDEO_DESCRIPTION]),
+                    str(row[Num.TRANSCRIPTION]),
+                    output[Num.RISK_STATUS],
+                    output[Num.ENGLISH_JUSTIFICATION],
+                ]
+            )
+            law = self._call_agent(
+                AgentsNameV0.law_regulated, self.process_law, input_text
+            )
+            output[Num.LAW_REGULATED_OUT] = str(law if law is not None else "None")
+        except Exception as e:
+            logger.error(f"Error in process_law_v0: {e!s}")
+            output[Num.LAW_REGULATED_OUT] = "API server error"
+
+        # Processing steps for Sentiment, ran alongside the steps above
+        try:
+            sentiment, sentiment_score, api_sentiment, api_sentiment_score = (
+                sentiment_future.result()
+            )
+            output[Num.SENTIMENT] = str(sentiment if sentiment else "None")
+            output[Num.SENTIMENT_SCORE] = float(sentiment_score if sentiment_score else 0.0)
+            output[Num.API_SENTIMENT] = str(api_sentiment if api_sentiment else "None")
+            output[Num.API_SENTIMENT_SCORE] = float(
+                api_sentiment_score if api_sentiment_score else 0.0
+            )
+        except Exception as e:
+            logger.error(f"Error in process_sentiment_v0: {e!s}")
+            output[Num.SENTIMENT] = "API server error"
+            output[Num.SENTIMENT_SCORE] = 0.0
+            output[Num.API_SENTIMENT] = "API server error"
+            output[Num.API_SENTIMENT_SCORE] = 0.0
 
-                # Append processed row to the list of rows to insert
-                table_row = df.loc[index]
-                rows_to_insert.append(table_row)
+        output[Num.PROCESS_TIME] = (datetime.now() - start_time).total_seconds()
+        return output
 
-                # Check if we've reached the batch size
-                if len(rows_to_insert) >= batch_size:
-                    self.insert_batch(key_id, rows_to_insert, schema=TikTokTableSchemaOut)
-                    rows_to_insert.clear()  # Clear the list for the next batch
+    def run_all_agents_pipeline_batch(self, key_id, df, batch_size=100):
+        """Run all agents on the rows of df concurrently and insert them by batches.
+
+        Up to PIPELINE_MAX_ROWS_IN_FLIGHT rows are processed at the same time,
+        each agent endpoint receiving at most AGENT_MAX_CONCURRENCY requests.
+        The outputs are collected into one list per column, written to df and
+        inserted every batch_size rows, in the order of df.
+        """
+        output_buffers = {column: [] for column in BATCH_OUTPUT_COLUMNS}
+        inserted_rows = 0
+
+        def insert_completed_rows(end):
+            # Write the completed rows of the buffers to the df slice at once
+            batch_df = df.iloc[inserted_rows:end].copy()
+            for column, values in output_buffers.items():
+                batch_df[column] = values[inserted_rows:end]
+            rows_to_insert = [table_row for _, table_row in batch_df.iterrows()]
+            self.insert_batch(key_id, rows_to_insert, schema=TikTokTableSchemaOut)
+
+        try:
+            records = df.to_dict("records")
+            with ThreadPoolExecutor(
+                max_workers=PIPELINE_MAX_ROWS_IN_FLIGHT
+            ) as row_executor, ThreadPoolExecutor(
+                max_workers=AGENT_MAX_CONCURRENCY
+            ) as sentiment_executor:
+                # map keeps the order of df while running the rows concurrently
+                outputs = row_executor.map(
+                    lambda row: self._process_row_agents(row, sentiment_executor),
+                    records,
+                )
+                for output in outputs:
+                    for column, values in output_buffers.items():
+                        values.append(output[column])
+
+                    # Check if we've reached the batch size
+                    if len(output_buffers[Num.TIMESTAMP]) - inserted_rows >= batch_size:
+                        insert_completed_rows(len(output_buffers[Num.TIMESTAMP]))
+                        inserted_rows = len(output_buffers[Num.TIMESTAMP])
 
             # After the loop, insert any remaining rows
-            if rows_to_insert:
-                self.insert_batch(key_id, rows_to_insert, schema=TikTokTableSchemaOut)
+            if len(output_buffers[Num.TIMESTAMP]) > inserted_rows:
+                insert_completed_rows(len(output_buffers[Num.TIMESTAMP]))
+                inserted_rows = len(output_buffers[Num.TIMESTAMP])
+
+            for column, values in output_buffers.items():
+                df[column] = values
 
         except Exception as e:
             logger.exception("Error during pipeline execution")
@@ -941,21 +1049,8 @@ class DataProcessorPipeline_v01:
 
     def insert_batch(self, key_id, rows, schema):
         try:
-            # Assuming `self.db.insert_row_by_row` requires `key_id`, `schema`, and an additional index `i`
-            for i, row in enumerate(rows):
-                # Add additional checks or column filtering if needed
-                existing_record = (
-                    self.db.session.query(schema)
-                    .filter(getattr(schema, key_id) == row[key_id])
-                    .first()
-                )
-
-                if existing_record:
-                    logger.info(f"Duplicate row found, skipping insertion: {row}")
-                else:
-                    # Insert the row, passing the index `i` along with the other arguments
-                    self.db.insert_row_by_row(key_id, schema, row, i)
-                    logger.info(f"Row {i} inserted successfully in batch.")
+            # Rows already in the table are skipped by a single keyed query
+            self.db.insert_rows_in_batches(key_id, schema, rows)
         except Exception as e:
             logger.exception("Error in batch insertion")
             print(f"Error in batch insertion: {e!s}")
\ No newline at end of file
@@ -5,8 +5,10 @@ from datetime import datetime
 import pandas as pd
 from sqlalchemy import func, inspect
 
+from agents.agentTransport import AGENT_MAX_CONCURRENCY
 from config.config_num import Num
 from config.config_risk_samples import risk_levels_general, risk_levels_sample
+from db.db import get_insert_batch_size
 
 # from urllib.parse import quote_plus
 # from sqlalchemy.orm import sessionmaker
@@ -52,6 +54,58 @@ def validate_columns(
         raise ValueError(f"Dataframe must contain {post_date_comments_column_name}.")
 
 
+def get_date_range(config):
+    """Get the start_date and end_date of the config as timestamps.
+
+    The end_date is moved to the last second of its day to include the full day.
+
+    Returns:
+        tuple: start_date and end_date, None if not provided.
+
+    """
+    # Extract start_date and end_date from config
+    start_date = pd.to_datetime(config.start_date) if config.start_date else None
+    end_date = pd.to_datetime(config.end_date) if config.end_date else None
+
+    # Adjust end_date to include the full day if provided
+    if end_date:
+        end_date = end_date + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+
+    return start_date, end_date
+
+
+def get_sql_filters(config, post_date_column_name, equal_columns=None):
+    """Get the SQL conditions of the date range of the config and of equal columns.
+
+    Same rows as filter_by_date, applied by the database when reading the table.
+
+    Args:
+        config (object): The configuration object containing start_date and end_date.
+        post_date_column_name (str): The name of the date column to filter.
+        equal_columns (dict): Values required for other columns.
+
+    Returns:
+        tuple: The list of conditions and the dictionary of their parameters.
+
+    """
+    conditions = []
+    params = {}
+
+    start_date, end_date = get_date_range(config)
+    if start_date:
+        conditions.append(f"{post_date_column_name} >= :start_date")
+        params["start_date"] = start_date.to_pydatetime()
+    if end_date:
+        conditions.append(f"{post_date_column_name} <= :end_date")
+        params["end_date"] = end_date.to_pydatetime()
+
+    for column, value in (equal_columns or {}).items():
+        conditions.append(f"{column} = :{column}")
+        params[column] = value
+
+    return conditions, params
+
+
 def filter_by_date(df, config, post_date_column_name):
     """Filter data based on start_date and end_date provided in the config.
 
@@ -74,13 +128,7 @@ def filter_by_date(df, config, post_date_column_name):
             errors="coerce",
         )
 
-    # Extract start_date and end_date from config
-    start_date = pd.to_datetime(config.start_date) if config.start_date else None
-    end_date = pd.to_datetime(config.end_date) if config.end_date else None
-
-    # Adjust end_date to include the full day if provided
-    if end_date:
-        end_date = end_date + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+    start_date, end_date = get_date_range(config)
 
     # Filter by start_date
     if start_date:
@@ -239,8 +287,31 @@ def remove_quotes(value):
     return value
 
 
-def insert_data_in_batches(session, table, data, batch_size=5):
-    """Insert data into a table in batches. Converts ORM objects to dictionaries if necessary."""
+def _insert_batch(session, table, batch):
+    """Insert a batch in one transaction, retrying a failed one in two halves down
+    to single rows, so that a failing row does not lose the rest of its batch.
+    Returns the number of rows that failed.
+    """
+    try:
+        session.bulk_insert_mappings(table, batch)  # Perform bulk insert
+        session.commit()  # Commit the batch
+        return 0
+    except Exception as e:
+        session.rollback()  # Rollback in case of error
+        if len(batch) == 1:
+            logger.error(f"Error inserting a row into {table.__tablename__}: {e}")
+            return 1
+
+    middle = len(batch) // 2
+    return _insert_batch(session, table, batch[:middle]) + _insert_batch(
+        session, table, batch[middle:]
+    )
+
+
+def insert_data_in_batches(session, table, data, batch_size=None):
+    """Insert data into a table in batches. Converts ORM objects to dictionaries if necessary.
+    The batch size defaults to get_insert_batch_size of the number of rows.
+    """
     if not isinstance(data, list):
         raise ValueError("Input data must be a list")
 
@@ -251,20 +322,28 @@ def insert_data_in_batches(session, table, data, batch_size=5):
             for obj in data
         ]
 
+    if batch_size is None:
+        batch_size = get_insert_batch_size(len(data), len(table.__table__.columns))
+
     # Process and insert the data in batches
     for i in range(0, len(data), batch_size):
         batch = data[i : i + batch_size]
-        try:
-            session.bulk_insert_mappings(table, batch)  # Perform bulk insert
-            session.commit()  # Commit the batch
+        failed = _insert_batch(session, table, batch)
+        if failed:
+            logger.error(
+                f"Failed to insert {failed} of {len(batch)} records of batch {i // batch_size + 1} into {table.__tablename__}",
+            )
+        else:
             logger.info(
                 f"Inserted batch {i // batch_size + 1} ({len(batch)} records) into {table.__tablename__}",
             )
-        except Exception as e:
-            logger.error(
-                f"Error inserting batch {i // batch_size + 1} into {table.__tablename__}: {e}",
-            )
-            session.rollback()  # Rollback in case of error
+
+
+# Shared by the calls of get_justification_with_timeout, exiting a per-call
+# executor waited for the request and defeated the timeout
+justification_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=AGENT_MAX_CONCURRENCY,
+)
 
 
 def get_justification_with_timeout(
@@ -274,14 +353,13 @@ def get_justification_with_timeout(
 ):  # Adjust the timeout as needed
     try:
         # Run the function with a timeout
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(
-                self.agentsprocess.get_justification_risk_output,
-                input_text,
-            )
-            # Wait for the result with a timeout
-            data = future.result(timeout=timeout)
-            return data
+        future = justification_executor.submit(
+            self.agentsprocess.get_justification_risk_output,
+            input_text,
+        )
+        # Wait for the result with a timeout
+        data = future.result(timeout=timeout)
+        return data
     except concurrent.futures.TimeoutError:
         # If timeout occurs, log the event and return None
         logger.warning(
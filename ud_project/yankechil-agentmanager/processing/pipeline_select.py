@@ -1,5 +1,6 @@
 
 from config.config_num import Num
+from db.db import get_insert_batch_size
 from log_mongo import logger
 
 
@@ -157,9 +158,10 @@ class DataProcessorPipeline_v00:
         return eng_justification, malay_justification, risk_status, irrelevant_score
 
    
-    def insert_data_in_batches(self, session, table_name, data, batch_size=5):
+    def insert_data_in_batches(self, session, table_name, data, batch_size=None):
         """
         Insert data into a table in batches. Converts ORM objects to dictionaries if necessary.
+        The batch size defaults to get_insert_batch_size of the number of rows.
         """
         from sqlalchemy import Table
 
@@ -174,6 +176,9 @@ class DataProcessorPipeline_v00:
             if not isinstance(data, list):
                 raise ValueError("Input data must be a list")
 
+            if batch_size is None:
+                batch_size = get_insert_batch_size(len(data), len(table.columns))
+
             # Split data into batches
             for i in range(0, len(data), batch_size):
                 batch = data[i:i + batch_size]
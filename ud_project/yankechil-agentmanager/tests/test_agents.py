@@ -11,9 +11,18 @@ from agents.Agents import (
     SentimentAgent,
     SummaryAgent,
 )
+from agents.agentTransport import close_agent_transports
 from agents.baseAgent import BaseAgent
 
 
+@pytest.fixture(autouse=True)
+def reset_transports():
+    """Start each test with new transports and closed circuits."""
+    close_agent_transports()
+    yield
+    close_agent_transports()
+
+
 # Test the health_check method for each agent
 @pytest.mark.parametrize(
     "agent_class, url, expected_status",
@@ -27,12 +36,8 @@ from agents.baseAgent import BaseAgent
     ],
 )
 def test_health_check_success(agent_class, url, expected_status):
-    # Mock the response of requests.post or requests.get to simulate a successful health check
-    with mock.patch(
-        "requests.post"
-        if agent_class in [SummaryAgent, LawRegulatedAgent]
-        else "requests.get",
-    ) as mock_request:
+    # Mock the response of the agent session request to simulate a successful health check
+    with mock.patch("requests.Session.request") as mock_request:
         mock_response = mock.Mock()
         mock_response.status_code = 200
         mock_request.return_value = mock_response
@@ -63,12 +68,8 @@ def test_health_check_success(agent_class, url, expected_status):
     ],
 )
 def test_health_check_failure(agent_class, url, expected_status):
-    # Mock the response of requests.post or requests.get to simulate an unsuccessful health check
-    with mock.patch(
-        "requests.post"
-        if agent_class in [SummaryAgent, LawRegulatedAgent]
-        else "requests.get",
-    ) as mock_request:
+    # Mock the response of the agent session request to simulate an unsuccessful health check
+    with mock.patch("requests.Session.request") as mock_request:
         mock_response = mock.Mock()
         mock_response.status_code = 500  # Simulate server error
         mock_request.return_value = mock_response
@@ -100,12 +101,8 @@ def test_health_check_failure(agent_class, url, expected_status):
     ],
 )
 def test_health_check_exception(agent_class, url, expected_status):
-    # Mock the response of requests.post or requests.get to simulate an exception
-    with mock.patch(
-        "requests.post"
-        if agent_class in [SummaryAgent, LawRegulatedAgent]
-        else "requests.get",
-    ) as mock_request:
+    # Mock the response of the agent session request to simulate an exception
+    with mock.patch("requests.Session.request") as mock_request:
         mock_request.side_effect = requests.exceptions.RequestException(
             "Connection failed",
         )
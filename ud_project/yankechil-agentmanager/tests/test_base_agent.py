@@ -1,11 +1,28 @@
 from unittest import mock
 
+import pytest
 import requests
 from requests.models import Response
 
+from agents.agentTransport import (
+    AGENT_CONNECT_TIMEOUT,
+    AGENT_READ_TIMEOUT,
+    AgentTransport,
+    close_agent_transports,
+)
 from agents.baseAgent import BaseAgent
 from log_mongo import logger
 
+TIMEOUT = (AGENT_CONNECT_TIMEOUT, AGENT_READ_TIMEOUT)
+
+
+@pytest.fixture(autouse=True)
+def reset_transports():
+    """Start each test with new transports and closed circuits."""
+    close_agent_transports()
+    yield
+    close_agent_transports()
+
 
 # Test for initialization of the BaseAgent
 def test_base_agent_initialization():
@@ -14,8 +31,8 @@ def test_base_agent_initialization():
     assert agent.url == "http://example.com"
 
 
-# Mocking requests.get for GET method in BaseAgent
-@mock.patch("requests.get")
+# Mocking the session request for GET method in BaseAgent
+@mock.patch("requests.Session.request")
 def test_execute_get_success(mock_get):
     mock_get.return_value.status_code = 200
     mock_get.return_value.json.return_value = {"key": "value"}
@@ -25,19 +42,22 @@ def test_execute_get_success(mock_get):
 
     result = agent.execute(params=params, method="GET")
 
-    # Assert that the requests.get was called with the expected parameters
+    # Assert that the session request was called with the expected parameters
     mock_get.assert_called_once_with(
+        "GET",
         "http://example.com",
         params=params,
+        json=None,
         headers={"Content-Type": "application/json"},
+        timeout=TIMEOUT,
     )
 
     # Assert that the result is as expected
     assert result == {"key": "value"}
 
 
-# Mocking requests.post for POST method in BaseAgent
-@mock.patch("requests.post")
+# Mocking the session request for POST method in BaseAgent
+@mock.patch("requests.Session.request")
 def test_execute_post_success(mock_post):
     mock_post.return_value.status_code = 200
     mock_post.return_value.json.return_value = {"key": "value"}
@@ -47,19 +67,22 @@ def test_execute_post_success(mock_post):
 
     result = agent.execute(params=params, method="POST")
 
-    # Assert that the requests.post was called with the expected parameters
+    # Assert that the session request was called with the expected parameters
     mock_post.assert_called_once_with(
+        "POST",
         "http://example.com",
+        params=None,
         json=params,
         headers={"Content-Type": "application/json"},
+        timeout=TIMEOUT,
     )
 
     # Assert that the result is as expected
     assert result == {"key": "value"}
 
 
-# Mocking requests.get for failure case
-@mock.patch("requests.get")
+# Mocking the session request for failure case
+@mock.patch("requests.Session.request")
 def test_execute_get_failure(mock_get):
     # Simulate a failure in the request (e.g., request exception)
     mock_get.side_effect = requests.exceptions.RequestException("Request failed")
@@ -70,11 +93,14 @@ def test_execute_get_failure(mock_get):
     # Call the execute method with GET
     result = agent.execute(params=params, method="GET")
 
-    # Verify that the requests.get was called with the expected arguments
+    # Verify that the session request was called with the expected arguments
     mock_get.assert_called_once_with(
+        "GET",
         "http://example.com",
         params=params,
+        json=None,
         headers={"Content-Type": "application/json"},
+        timeout=TIMEOUT,
     )
 
     # Assert that the result contains the error message
@@ -82,8 +108,8 @@ def test_execute_get_failure(mock_get):
 
 
 @mock.patch(
-    "requests.post",
-)  # Mocking requests.post in the context where it's used (i.e., in BaseAgent)
+    "requests.Session.request",
+)  # Mocking the session request in the context where it's used (i.e., in BaseAgent)
 def test_execute_post_failure(mock_post):
     # Simulate a failure in the POST request
     mock_post.side_effect = requests.exceptions.RequestException("Request failed")
@@ -95,11 +121,14 @@ def test_execute_post_failure(mock_post):
     # Call the execute method with POST
     result = agent.execute(params=params, method="POST")
 
-    # Assert that requests.post was called with the correct arguments
+    # Assert that the session request was called with the correct arguments
     mock_post.assert_called_once_with(
+        "POST",
         "http://example.com",
+        params=None,
         json=params,
         headers={"Content-Type": "application/json"},
+        timeout=TIMEOUT,
     )
 
     # Assert that the result contains the error message
@@ -112,11 +141,12 @@ def test_execute_logging_on_failure():
 
     # Mocking requests.get to simulate a failed request
     mock_response = mock.Mock(spec=Response)
+    mock_response.status_code = 500
     mock_response.raise_for_status.side_effect = requests.exceptions.RequestException(
         "Request failed",
     )
 
-    with mock.patch("requests.get", return_value=mock_response):
+    with mock.patch("requests.Session.request", return_value=mock_response):
         with mock.patch.object(logger, "error") as mock_logger_error:
             result = agent.execute(params={"key": "value"}, method="GET")
             mock_logger_error.assert_called_once_with(
@@ -125,8 +155,8 @@ def test_execute_logging_on_failure():
 
 
 @mock.patch(
-    "requests.request",
-)  # Mocking requests.request in the context where it's used (i.e., in BaseAgent)
+    "requests.Session.request",
+)  # Mocking the session request in the context where it's used (i.e., in BaseAgent)
 def test_execute_invalid_method(mock_request):
     # Simulate an invalid method (using `requests.request` directly)
     mock_request.return_value.status_code = 400
@@ -139,13 +169,52 @@ def test_execute_invalid_method(mock_request):
     # Call the execute method with an invalid HTTP method
     result = agent.execute(params=params, method="INVALID")
 
-    # Assert that requests.request was called with the invalid method
+    # Assert that the session request was called with the invalid method
     mock_request.assert_called_once_with(
         "INVALID",
         "http://example.com",
+        params=None,
         json=params,
         headers={"Content-Type": "application/json"},
+        timeout=TIMEOUT,
     )
 
     # Assert that the result contains the error message
     assert result == {"error": "Method not supported"}
+
+
+# Test the circuit breaker stops calling a failing agent
+def test_transport_circuit_breaker():
+    transport = AgentTransport(
+        "http://example.com", failure_threshold=2, reset_timeout=60
+    )
+
+    with mock.patch(
+        "requests.Session.request",
+        side_effect=requests.exceptions.ConnectionError("Connection failed"),
+    ) as mock_request:
+        for _ in range(2):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                transport.request("GET")
+
+        # The circuit is open, the agent is not called anymore
+        with pytest.raises(requests.RequestException, match="Circuit open"):
+            transport.request("GET")
+        assert mock_request.call_count == 2
+
+    # After the reset timeout, one successful request closes the circuit
+    transport.reset_timeout = 0
+    with mock.patch("requests.Session.request") as mock_request:
+        mock_request.return_value.status_code = 200
+        assert transport.request("GET").status_code == 200
+        assert transport.request("GET").status_code == 200
+
+
+# Test read timeouts are not retried, connection errors and 502/503/504 are
+def test_transport_retries():
+    transport = AgentTransport("http://example.com", max_retries=2)
+    retry = transport.session.get_adapter("http://example.com").max_retries
+
+    assert (retry.connect, retry.read, retry.status) == (2, 0, 2)
+    assert retry.is_retry("POST", 503)
+    assert not retry.is_retry("POST", 500)
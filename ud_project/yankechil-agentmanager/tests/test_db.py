@@ -86,3 +86,130 @@ def test_fetch_data_from_source(mock_read_sql_query, mock_database):
     assert (
         result.shape[0] == 3
     )  # This should work because `read_sql_query.return_value` is a real DataFrame
+
+
+def test_insert_rows_in_batches_skips_duplicates():
+    """Test insert_rows_in_batches against an in-memory SQLite table."""
+    from sqlalchemy import Column, Integer, String, create_engine
+    from sqlalchemy.orm import declarative_base, sessionmaker
+
+    TestBase = declarative_base()
+
+    class ItemSchema(TestBase):
+        __tablename__ = "items"
+        _id = Column(String(50), primary_key=True)
+        count = Column(Integer, nullable=True)
+
+    engine = create_engine("sqlite:///:memory:")
+    TestBase.metadata.create_all(engine)
+    database = Database.__new__(Database)
+    database.engine = engine
+    database.session = sessionmaker(bind=engine)()
+
+    stats = database.insert_rows_in_batches(
+        "_id", ItemSchema, pd.DataFrame({"_id": ["a", "b"], "count": [1, 2]})
+    )
+    assert (stats["written"], stats["skipped"], stats["failed"]) == (2, 0, 0)
+
+    # Rows already in the table, repeated rows and extra columns are skipped
+    rows = pd.DataFrame(
+        {
+            "_id": ["a", "c", "c", "d", "e"],
+            "count": [1, 3, 3, None, 5],
+            "name": ["x", "y", "y", "z", "w"],
+        }
+    )
+    stats = database.insert_rows_in_batches(
+        "_id", ItemSchema, [row for _, row in rows.iterrows()], batch_size=2
+    )
+    assert (stats["written"], stats["skipped"], stats["failed"]) == (3, 2, 0)
+    assert stats["written_per_second"] > 0
+
+    stored = dict(database.session.query(ItemSchema._id, ItemSchema.count).all())
+    assert stored == {"a": 1, "b": 2, "c": 3, "d": None, "e": 5}
+
+
+def test_insert_rows_in_batches_isolates_failing_row():
+    """Test a row failing inside a batch does not lose the other rows of the batch."""
+    from sqlalchemy import Column, String, create_engine
+    from sqlalchemy.orm import declarative_base, sessionmaker
+
+    TestBase = declarative_base()
+
+    class ItemSchema(TestBase):
+        __tablename__ = "items"
+        _id = Column(String(50), primary_key=True)
+        code = Column(String(50), unique=True)
+
+    engine = create_engine("sqlite:///:memory:")
+    TestBase.metadata.create_all(engine)
+    database = Database.__new__(Database)
+    database.engine = engine
+    database.session = sessionmaker(bind=engine)()
+    database.insert_rows_in_batches(
+        "_id", ItemSchema, pd.DataFrame({"_id": ["a"], "code": ["x"]})
+    )
+
+    # "c" duplicates the unique code of "a", failing the INSERT of its batch
+    rows = pd.DataFrame({"_id": ["b", "c", "d", "e"], "code": ["y", "x", "z", "w"]})
+    stats = database.insert_rows_in_batches("_id", ItemSchema, rows, batch_size=4)
+
+    assert (stats["written"], stats["skipped"], stats["failed"]) == (3, 0, 1)
+    stored = dict(database.session.query(ItemSchema._id, ItemSchema.code).all())
+    assert stored == {"a": "x", "b": "y", "d": "z", "e": "w"}
+
+
+def test_read_table_in_chunks_resumes_from_watermark():
+    """Test read_table_in_chunks keyset pagination, filters and watermarks."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from db.db import PipelineWatermarkSchema
+
+    engine = create_engine("sqlite:///:memory:")
+    PipelineWatermarkSchema.__table__.create(engine)
+    pd.DataFrame(
+        {
+            "id": range(1, 11),
+            "agent_name": ["a", "b"] * 5,
+            "posted": pd.date_range("2024-01-01", periods=10, freq="D"),
+        }
+    ).to_sql("source", engine, index=False)
+    database = Database.__new__(Database)
+    database.engine = engine
+    database.session = sessionmaker(bind=engine)()
+
+    chunks = database.read_table_in_chunks(
+        "source",
+        "id",
+        chunk_size=2,
+        conditions=["agent_name IN :agent_names", "posted >= :start_date"],
+        params={"agent_names": ["a"], "start_date": "2024-01-03"},
+        pipeline_name="test",
+    )
+    assert next(chunks)["id"].tolist() == [3, 5]
+    # The watermark is saved once the chunk is processed
+    assert database.get_watermark("test") is None
+    assert next(chunks)["id"].tolist() == [7, 9]
+    assert database.get_watermark("test") == 5
+
+    chunks = list(database.read_table_in_chunks("source", "id", pipeline_name="test"))
+    assert [chunk["id"].tolist() for chunk in chunks] == [[6, 7, 8, 9, 10]]
+    assert database.get_watermark("test") == 10
+
+
+def test_get_new_rows_yields_chunks_after_target_max_key():
+    """Test get_new_rows reads the rows missing from the target table in chunks."""
+    from sqlalchemy import create_engine
+
+    engine = create_engine("sqlite:///:memory:")
+    pd.DataFrame({"id": range(1, 8)}).to_sql("source", engine, index=False)
+    database = Database.__new__(Database)
+    database.engine = engine
+
+    chunks = database.get_new_rows("id", "target", "source", chunk_size=3)
+    assert next(chunks)["id"].tolist() == [1, 2, 3]
+
+    pd.DataFrame({"id": [1, 2, 3, 4]}).to_sql("target", engine, index=False)
+    chunks = database.get_new_rows("id", "target", "source", chunk_size=2)
+    assert [chunk["id"].tolist() for chunk in chunks] == [[5, 6], [7]]
@@ -0,0 +1,133 @@
+import os
+import sys
+
+# Get the absolute path of the current file
+current_file_path = os.path.abspath(__file__)
+# Get the directory path of the current file
+current_dir_path = os.path.dirname(current_file_path)
+# Get the parent directory path
+parent_dir_path = os.path.dirname(current_dir_path)
+# Add the parent directory path to the sys.path
+sys.path.insert(0, parent_dir_path)
+
+# The table schemas need table names to be mapped
+for i in range(1, 5):
+    os.environ.setdefault(f"table_name_output_{i}", f"output_table_{i}")
+for i in range(1, 7):
+    os.environ.setdefault(f"table_name_input_{i}", f"input_table_{i}")
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from config.config_num import Num
+from processing import pipeline_direct
+from processing.pipeline_direct import DataProcessorPipeline_v01
+
+
+def summary_of(input_text):
+    return input_text.split("\n")[0]
+
+
+@pytest.fixture
+def pipeline():
+    """Pipeline with mocked agents, the later rows answering first."""
+    pipeline = DataProcessorPipeline_v01(agentsprocess=MagicMock(), db=MagicMock())
+
+    def process_category(input_text):
+        row_id = int(input_text.split("_")[1])
+        time.sleep(0.02 * (5 - row_id))
+        if input_text == "summary_2":
+            raise RuntimeError("Category agent failed")
+        return f"category_{row_id}", f"subcategory_{row_id}"
+
+    pipeline.process_category = process_category
+    pipeline.process_sentiment = lambda input_text: (input_text, 0.5, "api", 0.1)
+    pipeline.process_justification = lambda input_text: (
+        f"justification of {summary_of(input_text)}",
+        "justifikasi",
+        "high",
+        "0.1",
+    )
+    pipeline.process_law = lambda input_text: "law"
+    pipeline.insert_batch = MagicMock()
+    return pipeline
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "_id": [f"id_{i}" for i in range(5)],
+            Num.VIDEO_SUMMARY: [f"summary_{i}" for i in range(5)],
+            Num.VIDEO_DESCRIPTION: ["description"] * 5,
+            Num.TRANSCRIPTION: ["transcription"] * 5,
+        }
+    )
+
+
+def test_run_all_agents_pipeline_batch_keeps_row_order(pipeline, df):
+    """Test the outputs are mapped to their rows and inserted in the order of df."""
+    pipeline.run_all_agents_pipeline_batch("_id", df, batch_size=2)
+
+    expected_categories = [
+        "category_0",
+        "category_1",
+        "API server error",
+        "category_3",
+        "category_4",
+    ]
+    assert df[Num.CATEGORY].tolist() == expected_categories
+    assert df[Num.SENTIMENT].tolist() == df[Num.VIDEO_SUMMARY].tolist()
+    assert df.loc[4, Num.ENGLISH_JUSTIFICATION] == "justification of summary_4"
+
+    inserted_rows = [
+        row for call in pipeline.insert_batch.call_args_list for row in call.args[1]
+    ]
+    assert [len(call.args[1]) for call in pipeline.insert_batch.call_args_list] == [
+        2,
+        2,
+        1,
+    ]
+    assert [row["_id"] for row in inserted_rows] == df["_id"].tolist()
+    assert [row[Num.CATEGORY] for row in inserted_rows] == expected_categories
+
+
+def test_run_all_agents_pipeline_batch_isolates_failed_row(pipeline, df):
+    """Test a failed agent only marks the steps of its row that depend on it."""
+    pipeline.run_all_agents_pipeline_batch("_id", df)
+
+    failed_row = df.loc[2]
+    assert failed_row[Num.SUBCATEGORY] == "API server error"
+    assert failed_row[Num.RISK_STATUS] == "API server error"
+    assert failed_row[Num.LAW_REGULATED_OUT] == "API server error"
+    # The sentiment does not depend on the category
+    assert failed_row[Num.SENTIMENT] == "summary_2"
+
+    siblings = df.drop(index=2)
+    assert (siblings[Num.RISK_STATUS] == "high").all()
+    assert (siblings[Num.LAW_REGULATED_OUT] == "law").all()
+
+
+def test_run_all_agents_pipeline_batch_shuts_down_executors(pipeline, df):
+    """Test the executors are shut down, also when processing a row raises."""
+    executors = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            executors.append(self)
+
+    with patch.object(pipeline_direct, "ThreadPoolExecutor", RecordingExecutor):
+        pipeline.run_all_agents_pipeline_batch("_id", df)
+        with patch.object(
+            pipeline, "_process_row_agents", side_effect=RuntimeError("Row failed")
+        ):
+            pipeline.run_all_agents_pipeline_batch("_id", df.copy())
+
+    assert len(executors) == 4
+    assert all(executor._shutdown for executor in executors)
+    assert pipeline.db.session.close.call_count == 2